@@ -0,0 +1,257 @@
+"""
+Public API to use gitlint from python code, without going through the gitlint CLI.
+
+    from gitlint.api import Linter
+    from gitlint.config import LintConfigBuilder
+
+    config_builder = LintConfigBuilder()
+    config_builder.set_from_config_file(".gitlint")
+    config_builder.set_config_from_string_list(["title-max-length.line-length=80"])
+    linter = Linter(config_builder)
+
+    for result in linter.lint_messages(["WIP: my commit message", {"message": "Fix typo", "sha": "..."}]):
+        for violation in result.violations:
+            print(result.commit.sha, violation.line_nr, violation.rule_id, violation.message)
+
+    for result in linter.lint_range("/path/to/repo", "main..my-branch"):
+        ...
+
+Config is built once when creating the `Linter`, after which it can be used to lint any number of commits.
+All `lint_*` methods return lazy iterators: commits are only linted (and for `lint_range`, only retrieved from git)
+when iterating over the results. The API never writes to stdout or stderr, gitlint's log messages (e.g. deprecation
+warnings) are only emitted when the calling application configures logging for the `gitlint` logger.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import (
+    Any,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from gitlint.config import LintConfig, LintConfigBuilder, LintConfigError
+from gitlint.directory_config import DirectoryConfigResolver
+from gitlint.git import (
+    COMMIT_TYPE_TITLE_PREFIXES,
+    LOG_FIELDS,
+    GitCommit,
+    GitContext,
+    RevisionFilter,
+    iter_prefetched,
+)
+from gitlint.lint import GitLinter
+from gitlint.observers import Observer, active_observers
+from gitlint.rules import IgnoreByAuthorName, IgnoreByTitle, RuleViolation
+
+# Library convention: don't emit log messages unless the application using the library configures logging
+logging.getLogger("gitlint").addHandler(logging.NullHandler())
+
+
+@dataclass
+class LintResult:
+    """The result of linting a single commit."""
+
+    commit: GitCommit
+    violations: List[RuleViolation]
+
+
+def _plain_substring(pattern: str) -> Optional[str]:
+    """Returns the string that a regex pattern consisting of a plain string (optionally anchored with ^) matches,
+    None for other patterns."""
+    substring = pattern[1:] if pattern.startswith("^") else pattern
+    if not substring or substring != substring.rstrip() or any(char in ".^$*+?{}[]\\|()" for char in substring):
+        return None
+    return substring
+
+
+class LintRevisionFilter(RevisionFilter):
+    """Skips the commits that a `Linter` ignores altogether (see `GitLinter.ignores()`) while walking revisions:
+    merge commits (by git itself, unless directory configs or configuration rules may enable linting them) and other
+    special commits that are configured to be ignored, as well as commits for which ignore-by-title (I1) with a plain
+    string regex or ignore-by-author-name (I4) ignore all rules.
+    With directory configs, commits are only skipped when all of their configs ignore them."""
+
+    def __init__(self, linter: "Linter"):
+        self.linter = linter
+        config = linter.config
+        configuration_rules = GitLinter(config).configuration_rules
+        # Directory configs, as well as configuration rules that may modify ignore-merge-commits (including those
+        # that don't declare their modified options), can enable linting merge commits, in which case git can't skip
+        # them all
+        self.no_merges = (
+            config.ignore_merge_commits
+            and not linter.directory_configs
+            and all(
+                rule.modified_options is not None and "ignore-merge-commits" not in rule.modified_options
+                for rule in configuration_rules
+            )
+        )
+        # Otherwise, merge commits are checked per commit
+        self.checks_merges = config.ignore_merge_commits and not self.no_merges
+        self.required_fields = LOG_FIELDS | linter.config_fields
+        self.title_prefixes = tuple(
+            prefix
+            for commit_type, prefix in COMMIT_TYPE_TITLE_PREFIXES.items()
+            if getattr(config, f"ignore_{commit_type}_commits")
+        )
+        self.title_substrings = []
+        self.author_name_regexes = []
+        for rule in configuration_rules:
+            if not isinstance(rule, (IgnoreByTitle, IgnoreByAuthorName)):
+                continue
+            regex = rule.options["regex"].value
+            if not regex or rule.options["ignore"].value != "all":
+                continue
+            if isinstance(rule, IgnoreByTitle):
+                # The title is the start of the subject, so titles can only match plain string patterns when the
+                # subject contains that string. Other patterns aren't checked upfront.
+                substring = _plain_substring(regex.pattern)
+                if substring:
+                    self.title_substrings.append(substring)
+            elif isinstance(rule, IgnoreByAuthorName):
+                self.author_name_regexes.append(regex)
+        self.checks_subjects = bool(self.title_prefixes or self.title_substrings or self.author_name_regexes)
+
+    def may_skip(self, author_name, subject):
+        return (
+            subject.startswith(self.title_prefixes)
+            or any(substring in subject for substring in self.title_substrings)
+            or any(regex.search(author_name) for regex in self.author_name_regexes)
+        )
+
+    def skip(self, commit):
+        return all(GitLinter(config).ignores(commit) for config in self.linter.commit_configs(commit))
+
+
+class Linter:
+    """Lints commits and commit messages using a given config (gitlint's default config if none is passed).
+
+    When the config enables directory configs (the directory-configs general option), the configs of the directories
+    that commits change files in are built from the config builder: either pass a `LintConfigBuilder` as `config`, or
+    pass the builder that `config` was built with as `config_builder`. Options set in `config_overrides` take
+    precedence over directory config files."""
+
+    def __init__(
+        self,
+        config: Union[LintConfig, LintConfigBuilder, None] = None,
+        config_builder: Optional[LintConfigBuilder] = None,
+        config_overrides: Optional[LintConfigBuilder] = None,
+    ):
+        if isinstance(config, LintConfigBuilder):
+            config_builder = config
+            config = config.build()
+        self.config: LintConfig = config or LintConfig()
+
+        self.directory_configs: Optional[DirectoryConfigResolver] = None
+        if self.config.directory_configs:
+            if config_builder is None:
+                raise LintConfigError("The 'directory-configs' option requires the config builder of the config.")
+            self.directory_configs = DirectoryConfigResolver(config_builder, config_overrides, self.config)
+
+    @property
+    def config_fields(self) -> FrozenSet[str]:
+        """The commit fields (gitlint.git.COMMIT_FIELD_*) required to determine the configs of commits."""
+        return self.directory_configs.required_fields if self.directory_configs else frozenset()
+
+    @property
+    def required_fields(self) -> FrozenSet[str]:
+        """The commit fields (gitlint.git.COMMIT_FIELD_*) required to lint commits. Fields that are only required by
+        directory configs aren't included, those are retrieved lazily."""
+        return GitLinter(self.config).required_fields | self.config_fields
+
+    def commit_config(self, commit: GitCommit, config: Optional[LintConfig] = None) -> LintConfig:
+        """Returns the config to lint the given commit with: a copy of the given config (the linter's config by
+        default) with the commit specific config (if any) applied on top. The commit specific config can only set
+        the ignore general option (gitlint-ignore), so only that option is copied, the rest is shared."""
+        config_builder = LintConfigBuilder()
+        config_builder.set_config_from_commit(commit)
+        return config_builder.build((config or self.config).copy(["ignore"]))
+
+    def commit_configs(self, commit: GitCommit) -> List[LintConfig]:
+        """Returns the configs to lint the given commit with (see `commit_config()`). This is a single config, unless
+        directory configs are enabled and the commit changes files in directories with different configs."""
+        configs = self.directory_configs.resolve(commit) if self.directory_configs else [self.config]
+        return [self.commit_config(commit, config) for config in configs]
+
+    def revision_filter(self) -> LintRevisionFilter:
+        """Returns a revision filter that skips the commits this linter ignores altogether, so that their data isn't
+        retrieved from git. Linting the remaining commits yields the same violations as linting all commits."""
+        return LintRevisionFilter(self)
+
+    def lint_commit(
+        self,
+        commit: GitCommit,
+        max_violations: Optional[int] = None,
+        observers: Optional[Sequence[Observer]] = None,
+    ) -> LintResult:
+        """Lints a single commit. At most max_violations violations are returned (defaults to the fail-fast general
+        option, 0 means no maximum). The given observers are notified (by default: the observers that are active in
+        the current context, see `gitlint.observers`)."""
+        linters = [GitLinter(config) for config in self.commit_configs(commit)]
+        return LintResult(commit, GitLinter.lint_combined(linters, commit, max_violations, observers))
+
+    def lint_commits(self, commits: Iterable[GitCommit]) -> Iterator[LintResult]:
+        """Lints the given commits, lazily yielding a result per commit."""
+        observers = active_observers()
+        for commit in commits:
+            yield self.lint_commit(commit, observers=observers)
+
+    def lint_messages(
+        self, messages: Iterable[Union[str, Mapping[str, Any]]], repository_path: Optional[str] = None
+    ) -> Iterator[LintResult]:
+        """Lints commit messages, lazily yielding a result per message. Messages are either strings, or mappings with
+        a 'message' key and optionally other commit attributes (e.g. 'sha', 'author_name', 'author_email').
+        Repository information that is required to parse messages (the comment char) is retrieved from the repository
+        at `repository_path` (or the current working directory), once for all messages."""
+        gitcontext = GitContext(repository_path=repository_path)
+        for message in messages:
+            if isinstance(message, str):
+                commit = gitcontext.commit_from_msg(message)
+            else:
+                attributes = dict(message)
+                commit = gitcontext.commit_from_msg(attributes.pop("message"), **attributes)
+            yield self.lint_commit(commit, observers=gitcontext.observers)
+
+    def lint_tags(self, repository_path: str, patterns: Optional[Sequence[str]] = None) -> Iterator[LintResult]:
+        """Lints the messages of the annotated tags of the repository at `repository_path` (only the tags matching
+        `patterns` if specified, e.g. 'v1.*'), lazily yielding a result per tag. The commit of every result is a
+        `gitlint.git.GitTag`, with the tagger as author. All tags are retrieved from git using a single git call."""
+        return self.lint_commits(GitContext.from_tags(repository_path, patterns).commits)
+
+    def lint_bundle(self, bundle_path: str, repository_path: Optional[str] = None) -> Iterator[LintResult]:
+        """Lints the commits in the git bundle at `bundle_path` (except for its prerequisites), newest first, lazily
+        yielding a result per commit. The bundle is read directly, without a repository (`repository_path` is only
+        used to look up the commentchar). Commits in bundles don't have changed files, see `gitlint.bundle`."""
+        from gitlint.bundle import bundle_context
+
+        return self.lint_commits(bundle_context(bundle_path, repository_path).commits)
+
+    def lint_range(
+        self,
+        repository_path: str,
+        refspec: Optional[str] = None,
+        paths: Optional[Sequence[str]] = None,
+        first_parent: bool = False,
+    ) -> Iterator[LintResult]:
+        """Lints the commits in the given refspec (e.g. 'main..my-branch', the last commit if not specified) of the
+        repository at `repository_path`, lazily yielding a result per commit. The data required by the enabled rules is
+        retrieved from git in batches of commits. Commits that are ignored altogether (e.g. merge commits) are skipped
+        while walking the refspec, no results are returned for those.
+        The refspec can be limited to the commits that modify files matching `paths` (pathspecs relative to
+        `repository_path`) and/or to the first-parent history using `first_parent`.
+        Raises a `gitlint.git.GitContextError` when the commits can't be retrieved from the repository."""
+        gitcontext = GitContext.from_local_repository(
+            repository_path,
+            refspec=refspec,
+            revision_filter=self.revision_filter(),
+            paths=paths,
+            first_parent=first_parent,
+        )
+        return self.lint_commits(iter_prefetched(gitcontext.commits, self.required_fields))
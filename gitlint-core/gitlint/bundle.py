@@ -0,0 +1,424 @@
+"""
+Reading the commits in git bundles (used by `gitlint bundle`) without cloning or unbundling them: the bundle header is
+parsed to find the bundle's prerequisites and refs, after which the packfile that follows it is read in place.
+
+The bundle file is memory-mapped and every object in the pack is inflated once to find where the next object starts,
+but only commits are kept: trees, blobs and tags are skipped without being stored or resolved. Commits that are stored
+as deltas are resolved against their base commit, which is either earlier in the pack (offset deltas) or referenced by
+its object id (ref deltas, which can also point to objects outside of the pack in the thin packs that bundles contain).
+Nothing is written to disk and no git repository or git object database is required.
+
+Memory usage is proportional to the total (inflated) size of the bundle's commits, not to the size of the bundle: the
+pages of the memory-mapped file are loaded and evicted by the OS and other objects are inflated in chunks of at most
+INFLATE_CHUNK_SIZE. The commits themselves are all kept, as later deltas can refer to any of them and the order they're
+linted in (like `git log`) is only known once all commits have been read.
+"""
+
+import codecs
+import contextlib
+import hashlib
+import heapq
+import mmap
+import re
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+from gitlint.git import GitCommit, GitCommitMessage, GitContext, GitContextError
+
+BUNDLE_SIGNATURES = {b"# v2 git bundle\n": 2, b"# v3 git bundle\n": 3}
+OBJECT_FORMATS = {"sha1": hashlib.sha1, "sha256": hashlib.sha256}
+DEFAULT_OBJECT_FORMAT = "sha1"
+PACK_SIGNATURE = b"PACK"
+PACK_VERSIONS = (2, 3)
+PACK_HEADER_SIZE = 12
+OBJ_COMMIT = 1
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+INFLATE_CHUNK_SIZE = 64 * 1024
+# 'Name <email> 1678448096 +0100' identity lines in commit headers
+IDENTITY = re.compile(rb"^(.*?) ?<(.*)> (\d+) ([+-])(\d{2})(\d{2})$")
+DEFAULT_ENCODING = "utf-8"
+
+
+class GitBundleError(GitContextError):
+    pass
+
+
+@dataclass
+class BundleCommit(GitCommit):
+    """A commit read from a git bundle. Unlike for commits created from just a message, its parents are known, so
+    merge commits are recognized by their parents instead of by their title."""
+
+    @property
+    def is_merge_commit(self) -> bool:
+        return len(self.parents) > 1
+
+
+@dataclass
+class PackEntry:
+    """An object in a packfile whose type isn't known yet: a delta whose base hasn't been resolved."""
+
+    # Offset of the object's header and of its compressed data in the pack
+    offset: int
+    data_offset: int
+    # Offset of the base object (offset deltas) or object id of the base object (ref deltas)
+    base: Union[int, bytes]
+
+
+@dataclass
+class GitBundle:
+    """The header of a git bundle: its prerequisites (the commits the bundle's commits are based on, which aren't part
+    of the bundle) and refs, by object id."""
+
+    path: str
+    version: int = 2
+    object_format: str = DEFAULT_OBJECT_FORMAT
+    prerequisites: List[str] = field(default_factory=list)
+    refs: Dict[str, str] = field(default_factory=dict)
+    # Offset of the packfile in the bundle, i.e. the size of the header
+    pack_offset: int = 0
+
+    @staticmethod
+    def from_path(bundle_path: str) -> "GitBundle":
+        """Parses the header of the bundle at `bundle_path`."""
+        bundle = GitBundle(bundle_path)
+        with open(bundle_path, "rb") as bundle_file:
+            signature = bundle_file.readline()
+            if signature not in BUNDLE_SIGNATURES:
+                raise GitBundleError(f"{bundle_path} is not a git bundle.")
+            bundle.version = BUNDLE_SIGNATURES[signature]
+
+            for raw_line in iter(bundle_file.readline, b""):
+                line = raw_line.decode(DEFAULT_ENCODING, "replace").rstrip("\n")
+                if not line:
+                    break
+                if line.startswith("@") and bundle.version == 3:  # noqa: PLR2004 (Magic value used in comparison)
+                    bundle._set_capability(line[1:])
+                elif line.startswith("-"):
+                    bundle.prerequisites.append(bundle._object_id(line[1:].split(" ", 1)[0]))
+                else:
+                    object_id, _, ref = line.partition(" ")
+                    bundle.refs[ref] = bundle._object_id(object_id)
+            else:
+                raise GitBundleError(f"{bundle_path} is not a git bundle: it doesn't contain a packfile.")
+            bundle.pack_offset = bundle_file.tell()
+        return bundle
+
+    def _set_capability(self, capability: str) -> None:
+        name, _, value = capability.partition("=")
+        if name == "object-format" and value in OBJECT_FORMATS:
+            self.object_format = value
+        # Filtered bundles (e.g. 'blob:none') contain all of their commits, the filter doesn't matter for linting
+        elif name != "filter":
+            raise GitBundleError(f"Bundle {self.path} requires the unsupported capability '{capability}'.")
+
+    def _object_id(self, object_id: str) -> str:
+        object_id_length = OBJECT_FORMATS[self.object_format]().digest_size * 2
+        if not re.match(f"^[0-9a-f]{{{object_id_length}}}$", object_id):
+            raise GitBundleError(f"Bundle {self.path} contains an invalid object id: '{object_id}'.")
+        return object_id
+
+    def raw_commits(self) -> Dict[str, bytes]:
+        """Reads the (uncompressed, undeltified) commit objects in the bundle's packfile, by object id in pack order."""
+        with open(self.path, "rb") as bundle_file, mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return PackReader(self, data).commits()
+
+
+class PackReader:
+    """Reads the commits in the packfile of a (memory-mapped) bundle, see the module docstring. Offsets are offsets in
+    the bundle file, the packfile starts at the bundle's `pack_offset`."""
+
+    def __init__(self, bundle: GitBundle, data: mmap.mmap):
+        self.bundle = bundle
+        self.pack = data
+        self.hash = OBJECT_FORMATS[bundle.object_format]
+        # The (resolved) contents and object ids of the commits in the pack by offset, and their offsets by object id
+        self._commits: Dict[int, bytes] = {}
+        self._object_ids: Dict[int, bytes] = {}
+        self._commit_offsets: Dict[bytes, int] = {}
+
+    def _error(self, problem: str) -> GitBundleError:
+        return GitBundleError(f"Bundle {self.bundle.path} {problem}.")
+
+    def commits(self) -> Dict[str, bytes]:
+        start = self.bundle.pack_offset
+        header = self.pack[start : start + PACK_HEADER_SIZE]
+        if len(header) < PACK_HEADER_SIZE or header[:4] != PACK_SIGNATURE:
+            raise self._error("doesn't contain a packfile")
+        version = int.from_bytes(header[4:8], "big")
+        if version not in PACK_VERSIONS:
+            raise self._error(f"contains an unsupported packfile version ({version})")
+
+        # Object types by offset, None for deltas whose base hasn't been resolved yet
+        types: Dict[int, Optional[int]] = {}
+        unresolved: List[PackEntry] = []
+        offset = start + PACK_HEADER_SIZE
+        for _ in range(int.from_bytes(header[8:12], "big")):
+            object_type: Optional[int]
+            object_type, size, base, data_offset = self._read_entry_header(offset)
+            if object_type == OBJ_OFS_DELTA:
+                if not isinstance(base, int) or base not in types:
+                    raise self._error(f"contains a delta with an invalid base at offset {offset}")
+                object_type = types[base]
+            elif object_type == OBJ_REF_DELTA:
+                object_type = None
+
+            # Objects have to be inflated to know where the next object starts, but only commits are kept
+            contents, next_offset = self._inflate(data_offset, keep=object_type == OBJ_COMMIT)
+            types[offset] = object_type
+            if object_type is None and base is not None:
+                unresolved.append(PackEntry(offset, data_offset, base))
+            elif object_type == OBJ_COMMIT:
+                if len(contents) != size:
+                    raise self._error(f"contains a corrupt object at offset {offset}")
+                # Commits with a (resolved) base are offset deltas against an earlier commit
+                self._add_commit(
+                    offset, self._apply_delta(self._commits[base], contents) if isinstance(base, int) else contents
+                )
+            offset = next_offset
+
+        self._resolve_ref_deltas(unresolved)
+        return {self._object_ids[offset].hex(): self._commits[offset] for offset in sorted(self._commits)}
+
+    def _add_commit(self, offset: int, contents: bytes) -> None:
+        object_id = self.hash(b"commit %d\0" % len(contents) + contents).digest()
+        self._commits[offset] = contents
+        self._object_ids[offset] = object_id
+        self._commit_offsets[object_id] = offset
+
+    def _resolve_ref_deltas(self, unresolved: List[PackEntry]) -> None:
+        """Resolves the deltas whose base is a commit. The base of a ref delta can be any object in or outside of the
+        pack, its type (and hence the type of the delta) is only known once the commit it refers to has been read."""
+        while unresolved:
+            resolvable = []
+            for entry in unresolved:
+                base = entry.base if isinstance(entry.base, int) else self._commit_offsets.get(entry.base)
+                if base in self._commits:
+                    resolvable.append((entry, base))
+            if not resolvable:
+                break
+            for entry, base in resolvable:
+                delta, _ = self._inflate(entry.data_offset, keep=True)
+                self._add_commit(entry.offset, self._apply_delta(self._commits[base], delta))
+            unresolved = [entry for entry in unresolved if entry.offset not in self._commits]
+
+        prerequisites = {bytes.fromhex(object_id) for object_id in self.bundle.prerequisites}
+        for entry in unresolved:
+            # Deltas always have the same type as their base, so deltas against prerequisites are commits
+            if isinstance(entry.base, bytes) and entry.base in prerequisites:
+                raise self._error(
+                    f"contains a commit that is stored as a delta against prerequisite {entry.base.hex()}, "
+                    "which can't be read without a repository that contains the prerequisite"
+                )
+        # Any other unresolved deltas are trees, blobs or tags
+
+    def _read_entry_header(self, offset: int) -> Tuple[int, int, Union[int, bytes, None], int]:
+        """Parses the header of the object at the given offset: returns the object type, the size of its (inflated)
+        data, its delta base (offset or object id, None for regular objects) and the offset of its data."""
+        pos = offset
+        try:
+            byte = self.pack[pos]
+            object_type, size, shift = (byte >> 4) & 0x7, byte & 0xF, 4
+            while byte & 0x80:
+                pos += 1
+                byte = self.pack[pos]
+                size |= (byte & 0x7F) << shift
+                shift += 7
+            pos += 1
+
+            base: Union[int, bytes, None] = None
+            if object_type == OBJ_OFS_DELTA:
+                byte = self.pack[pos]
+                base_distance = byte & 0x7F
+                while byte & 0x80:
+                    pos += 1
+                    byte = self.pack[pos]
+                    base_distance = ((base_distance + 1) << 7) | (byte & 0x7F)
+                pos += 1
+                base = offset - base_distance
+            elif object_type == OBJ_REF_DELTA:
+                object_id_size = self.hash().digest_size
+                base = bytes(self.pack[pos : pos + object_id_size])
+                pos += object_id_size
+        except IndexError:
+            raise self._error("is truncated") from None
+        return object_type, size, base, pos
+
+    def _inflate(self, offset: int, keep: bool) -> Tuple[bytes, int]:
+        """Inflates the zlib stream at the given offset in chunks, returns its contents (if `keep`, empty otherwise)
+        and the offset right after the stream."""
+        decompressor = zlib.decompressobj()
+        chunks = []
+        pending = b""
+        try:
+            while not decompressor.eof:
+                if not pending:
+                    pending = self.pack[offset : offset + INFLATE_CHUNK_SIZE]
+                    offset += len(pending)
+                    if not pending:
+                        raise self._error("is truncated")
+                # Limiting the output size keeps memory usage bounded when skipping large blobs
+                chunk = decompressor.decompress(pending, INFLATE_CHUNK_SIZE)
+                pending = decompressor.unconsumed_tail
+                if keep:
+                    chunks.append(chunk)
+        except zlib.error as e:
+            raise self._error(f"contains a corrupt object: {e}") from e
+        return b"".join(chunks), offset - len(pending) - len(decompressor.unused_data)
+
+    def _apply_delta(self, base: bytes, delta: bytes) -> bytes:
+        """Applies a git delta (a sequence of copy-from-base and insert instructions) to the given base object."""
+        try:
+            return self._apply_delta_instructions(base, delta)
+        except IndexError:
+            raise self._error("contains a truncated delta") from None
+
+    def _apply_delta_instructions(self, base: bytes, delta: bytes) -> bytes:
+        pos, base_size = _delta_size(delta, 0)
+        pos, result_size = _delta_size(delta, pos)
+        if base_size != len(base):
+            raise self._error("contains a delta that doesn't match its base")
+
+        result = bytearray()
+        while pos < len(delta):
+            instruction = delta[pos]
+            pos += 1
+            if instruction & 0x80:  # Copy from base: offset and size bytes are only present when their bit is set
+                copy_offset = copy_size = 0
+                for i in range(4):
+                    if instruction & (1 << i):
+                        copy_offset |= delta[pos] << (8 * i)
+                        pos += 1
+                for i in range(3):
+                    if instruction & (0x10 << i):
+                        copy_size |= delta[pos] << (8 * i)
+                        pos += 1
+                result += base[copy_offset : copy_offset + (copy_size or 0x10000)]
+            elif instruction:  # Insert the next `instruction` bytes
+                result += delta[pos : pos + instruction]
+                pos += instruction
+            else:
+                raise self._error("contains a corrupt delta")
+
+        if len(result) != result_size:
+            raise self._error("contains a delta that doesn't match its base")
+        return bytes(result)
+
+
+def _delta_size(delta: bytes, pos: int) -> Tuple[int, int]:
+    """Parses a size (little-endian base 128) in a delta, returns the position after it and the size."""
+    size = shift = 0
+    while True:
+        byte = delta[pos]
+        pos += 1
+        size |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return pos, size
+
+
+def _parse_identity(value: bytes, encoding: str) -> Tuple[str, str, Optional[datetime]]:
+    match = IDENTITY.match(value)
+    if not match:
+        return value.decode(encoding, "replace"), "", None
+    name, email, timestamp, sign, hours, minutes = match.groups()
+    offset = timedelta(hours=int(hours), minutes=int(minutes)) * (-1 if sign == b"-" else 1)
+    date = datetime.fromtimestamp(int(timestamp), timezone(offset))
+    return name.decode(encoding, "replace"), email.decode(encoding, "replace"), date
+
+
+def _parse_commit(context: GitContext, sha: str, contents: bytes) -> Tuple[GitCommit, Optional[datetime]]:
+    """Parses a raw commit object, returns the commit and its committer date."""
+    header, _, message = contents.partition(b"\n\n")
+    encoding = DEFAULT_ENCODING
+    fields: Dict[bytes, List[bytes]] = {}
+    for line in header.split(b"\n"):
+        # Lines starting with a space continue multi-line headers like 'gpgsig', which aren't used
+        if not line.startswith(b" "):
+            key, _, value = line.partition(b" ")
+            fields.setdefault(key, []).append(value)
+    if b"encoding" in fields:
+        # Unknown encodings are ignored, the message is decoded as UTF-8 instead
+        with contextlib.suppress(LookupError, UnicodeDecodeError):
+            encoding = codecs.lookup(fields[b"encoding"][0].decode("ascii")).name
+
+    author_name, author_email, date = _parse_identity(fields.get(b"author", [b""])[0], encoding)
+    commit_date = _parse_identity(fields.get(b"committer", [b""])[0], encoding)[2]
+    commit = BundleCommit(
+        context=context,
+        message=GitCommitMessage.from_full_message(context, message.decode(encoding, "replace")),
+        sha=sha,
+        date=date,
+        author_name=author_name,
+        author_email=author_email,
+        parents=[parent.decode("ascii") for parent in fields.get(b"parent", [])],
+    )
+    return commit, commit_date
+
+
+def _branches(bundle: GitBundle, commits: Dict[str, GitCommit]) -> Iterator[Tuple[str, GitCommit]]:
+    """Yields (branch, commit) for every commit in the bundle that is reachable from a branch in the bundle's refs."""
+    for ref, object_id in bundle.refs.items():
+        if not ref.startswith("refs/heads/"):
+            continue
+        visited = set()
+        pending = [object_id]
+        while pending:
+            sha = pending.pop()
+            if sha in visited or sha not in commits:
+                continue
+            visited.add(sha)
+            yield ref[len("refs/heads/") :], commits[sha]
+            pending.extend(commits[sha].parents)
+
+
+def _log_order(commits: Dict[str, GitCommit], commit_dates: Dict[str, Optional[datetime]]) -> Iterator[GitCommit]:
+    """Yields the given commits in the order of `git log`: newest commits first (by committer date), but never before
+    any of their children. Commits with the same date are yielded in pack order."""
+    children = dict.fromkeys(commits, 0)
+    for commit in commits.values():
+        for parent in commit.parents:
+            if parent in children:
+                children[parent] += 1
+
+    def key(sha: str) -> Tuple[float, int, str]:
+        commit_date = commit_dates[sha]
+        return -(commit_date.timestamp() if commit_date else 0), pack_order[sha], sha
+
+    pack_order = {sha: i for i, sha in enumerate(commits)}
+    heap = [key(sha) for sha, child_count in children.items() if child_count == 0]
+    heapq.heapify(heap)
+    while heap:
+        sha = heapq.heappop(heap)[-1]
+        yield commits[sha]
+        for parent in commits[sha].parents:
+            if parent in children:
+                children[parent] -= 1
+                if children[parent] == 0:
+                    heapq.heappush(heap, key(parent))
+
+
+def bundle_context(bundle_path: str, repository_path: Optional[str] = None) -> GitContext:
+    """Returns a git context with the commits in the git bundle at `bundle_path` (except for its prerequisites),
+    newest first. Commits contain their message, author, date, parents and the branches in the bundle that contain
+    them, changed files aren't available: the trees they'd be compared against are usually not part of the bundle.
+    The `repository_path` (if any) is only used to look up the commentchar."""
+    bundle = GitBundle.from_path(bundle_path)
+    context = GitContext(repository_path=repository_path)
+    prerequisites = set(bundle.prerequisites)
+    commits: Dict[str, GitCommit] = {}
+    commit_dates: Dict[str, Optional[datetime]] = {}
+    for sha, contents in bundle.raw_commits().items():
+        if sha not in prerequisites:
+            commits[sha], commit_dates[sha] = _parse_commit(context, sha, contents)
+
+    for branch, commit in _branches(bundle, commits):
+        if branch not in commit.branches:
+            commit.branches.append(branch)
+    for commit in commits.values():
+        commit.branches.sort()
+
+    context.commits = list(_log_order(commits, commit_dates))
+    return context
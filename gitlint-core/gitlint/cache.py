@@ -1,5 +1,12 @@
+import os
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from gitlint.observers import Observer, active_observers
+from gitlint.utils import FILE_ENCODING
 
 
 @dataclass
@@ -8,12 +15,31 @@ class PropertyCache:
 
     _cache: Dict[str, Any] = field(init=False, default_factory=dict)
 
+    @property
+    def _cache_observers(self) -> Sequence[Observer]:
+        """The observers that are notified of cache lookups. Subclasses return the observers of the lint run they're
+        part of (e.g. those of their git context), by default the observers active in the current context are used."""
+        return active_observers()
+
     def _try_cache(self, cache_key, cache_populate_func):
         """Tries to get a value from the cache identified by `cache_key`.
         If no value is found in the cache, do a function call to `cache_populate_func` to populate the cache
         and then return the value from the cache."""
-        if cache_key not in self._cache:
+        observers = self._cache_observers
+        if not observers:
+            if cache_key not in self._cache:
+                cache_populate_func()
+            return self._cache[cache_key]
+
+        hit = cache_key in self._cache
+        for observer in observers:
+            observer.on_cache_lookup(cache_key, hit)
+        if not hit:
+            start = time.perf_counter()
             cache_populate_func()
+            duration = time.perf_counter() - start
+            for observer in observers:
+                observer.on_cache_populate(cache_key, duration)
         return self._cache[cache_key]
 
 
@@ -56,3 +82,46 @@ def cache(original_func: Optional[Callable[[Any], Any]] = None, cachekey: Option
         return cache_decorator(original_func)
 
     return cache_decorator
+
+
+class ResourceCache:
+    """Cache for structures derived from files on disk (sets, dicts, indexes, ...).
+    Values are keyed by file path and parse function, and are invalidated when the file's modification time or size
+    changes. This allows rules to parse e.g. a configuration file once, instead of once for every commit they validate.
+    """
+
+    def __init__(self) -> None:
+        self._cache: Dict[Tuple[str, Callable[[str], Any]], Tuple[Tuple[int, int], Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, path: Union[str, Path], parse_func: Callable[[str], Any]) -> Any:
+        """Returns `parse_func(<file content>)` for the file at `path`, only reading and parsing the file again when
+        it has changed since the last call. Raises FileNotFoundError when the file doesn't exist."""
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        file_version = (stat.st_mtime_ns, stat.st_size)
+        cache_key = (path, parse_func)
+
+        cached = self._cache.get(cache_key)
+        if cached and cached[0] == file_version:
+            return cached[1]
+
+        with self._lock:
+            value = parse_func(Path(path).read_text(FILE_ENCODING))
+            self._cache[cache_key] = (file_version, value)
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+# Process-wide resource cache shared by all rules
+RESOURCE_CACHE = ResourceCache()
+
+
+def load_resource(path: Union[str, Path], parse_func: Callable[[str], Any]) -> Any:
+    """Loads a file and parses it using `parse_func`, caching the result until the file changes on disk.
+    `parse_func` should be a module-level function or classmethod so that it's stable across calls (it's part of the
+    cache key) and should return a value that is not modified by its callers (e.g. a frozenset or tuple)."""
+    return RESOURCE_CACHE.load(path, parse_func)
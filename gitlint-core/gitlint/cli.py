@@ -1,17 +1,19 @@
-import copy
+import contextlib
 import logging
 import os
 import platform
 import stat
 import sys
+import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 import click
 
 import gitlint
 from gitlint import hooks
+from gitlint.api import Linter
 from gitlint.config import (
     LintConfig,
     LintConfigBuilder,
@@ -21,10 +23,22 @@ from gitlint.config import (
 from gitlint.deprecation import DEPRECATED_LOG_FORMAT
 from gitlint.deprecation import LOG as DEPRECATED_LOG
 from gitlint.exception import GitlintError
-from gitlint.git import GitContext, GitContextError, git_version
+from gitlint.git import (
+    LOG_FIELDS,
+    GitContext,
+    GitContextError,
+    git_dirs,
+    git_refs,
+    git_version,
+    iter_prefetched,
+)
 from gitlint.lint import GitLinter
+from gitlint.observers import PrometheusTextfileObserver, active_observers, observe
+from gitlint.profiling import Profiler
+from gitlint.progress import ProgressObserver
 from gitlint.shell import shell
-from gitlint.utils import LOG_FORMAT
+from gitlint.stats import RunStats
+from gitlint.utils import LOG_FORMAT, LazyStr
 
 # Error codes
 GITLINT_SUCCESS = 0
@@ -37,6 +51,11 @@ DEFAULT_CONFIG_FILE = ".gitlint"
 # -n: disable swap files. This fixes a vim error on windows (E303: Unable to open swap file for <path>)
 DEFAULT_COMMIT_MSG_EDITOR = "vim -n"
 
+# Input formats supported by `gitlint batch` and the commit metadata that can be passed alongside messages ('jsonl')
+BATCH_FORMATS = ("nul", "jsonl", "mbox")
+BATCH_RECORD_ATTRIBUTES = ("sha", "author_name", "author_email")
+STDIN_CHUNK_SIZE = 64 * 1024
+
 # Since we use the return code to denote the amount of errors, we need to change the default click usage error code
 click.UsageError.exit_code = USAGE_ERROR_CODE
 
@@ -70,29 +89,33 @@ def setup_logging() -> None:
 
 
 def log_system_info():
-    LOG.debug("Platform: %s", platform.platform())
+    LOG.debug("Platform: %s", LazyStr(platform.platform))
     LOG.debug("Python version: %s", sys.version)
-    LOG.debug("Git version: %s", git_version())
+    LOG.debug("Git version: %s", LazyStr(git_version))
     LOG.debug("Gitlint version: %s", gitlint.__version__)
     LOG.debug("TERMINAL_ENCODING: %s", gitlint.utils.TERMINAL_ENCODING)
     LOG.debug("FILE_ENCODING: %s", gitlint.utils.FILE_ENCODING)
 
 
-def build_config(
+def build_config(  # noqa: PLR0912 (too many branches)
     target,
     config_path,
     c,
     extra_path,
     ignore,
     contrib,
+    plugins,
     ignore_stdin,
     staged,
+    mailmap,
     fail_without_commits,
+    fail_fast,
     verbose,
     silent,
     debug,
 ):
-    """Creates a LintConfig object based on a set of commandline parameters."""
+    """Creates a LintConfig object based on a set of commandline parameters. Returns the config, its builder and a
+    builder with just the options that were set via the commandline."""
     config_builder = LintConfigBuilder()
     # Config precedence:
     # First, load default config or config from configfile
@@ -101,42 +124,54 @@ def build_config(
     elif os.path.exists(DEFAULT_CONFIG_FILE):
         config_builder.set_from_config_file(DEFAULT_CONFIG_FILE)
 
-    # Then process any commandline configuration flags
-    config_builder.set_config_from_string_list(c)
+    # Then process any commandline configuration flags. These are also collected separately, as they take precedence
+    # over per-directory config files as well (see gitlint.directory_config).
+    config_overrides = LintConfigBuilder()
+    config_overrides.set_config_from_string_list(c)
 
     # Finally, overwrite with any convenience commandline flags
     if ignore:
-        config_builder.set_option("general", "ignore", ignore)
+        config_overrides.set_option("general", "ignore", ignore)
 
     if contrib:
-        config_builder.set_option("general", "contrib", contrib)
+        config_overrides.set_option("general", "contrib", contrib)
+
+    if plugins:
+        config_overrides.set_option("general", "plugins", plugins)
 
     if ignore_stdin:
-        config_builder.set_option("general", "ignore-stdin", ignore_stdin)
+        config_overrides.set_option("general", "ignore-stdin", ignore_stdin)
 
     if silent:
-        config_builder.set_option("general", "verbosity", 0)
+        config_overrides.set_option("general", "verbosity", 0)
     elif verbose > 0:
-        config_builder.set_option("general", "verbosity", verbose)
+        config_overrides.set_option("general", "verbosity", verbose)
 
     if extra_path:
-        config_builder.set_option("general", "extra-path", extra_path)
+        config_overrides.set_option("general", "extra-path", extra_path)
 
     if target:
-        config_builder.set_option("general", "target", target)
+        config_overrides.set_option("general", "target", target)
 
     if debug:
-        config_builder.set_option("general", "debug", debug)
+        config_overrides.set_option("general", "debug", debug)
 
     if staged:
-        config_builder.set_option("general", "staged", staged)
+        config_overrides.set_option("general", "staged", staged)
+
+    if mailmap:
+        config_overrides.set_option("general", "mailmap", mailmap)
 
     if fail_without_commits:
-        config_builder.set_option("general", "fail-without-commits", fail_without_commits)
+        config_overrides.set_option("general", "fail-without-commits", fail_without_commits)
+
+    if fail_fast:
+        config_overrides.set_option("general", "fail-fast", fail_fast)
 
+    config_builder.set_config_from_builder(config_overrides)
     config = config_builder.build()
 
-    return config, config_builder
+    return config, config_builder, config_overrides
 
 
 def get_stdin_data():
@@ -171,7 +206,86 @@ def get_stdin_data():
     return False
 
 
-def build_git_context(lint_config, msg_filename, commit_hash, refspec):
+def decode_stdin_message(message, record_nr):
+    try:
+        return message.decode(gitlint.utils.TERMINAL_ENCODING)
+    except UnicodeDecodeError as e:
+        raise GitLintUsageError(
+            f"Message {record_nr} of stdin is not valid {e.encoding} ({e.reason} at position {e.start})."
+        ) from e
+
+
+def iter_stdin_records(stream, input_format):  # noqa: PLR0912 (too many branches)
+    """Generator that parses commit message records from a binary stream, yielding every record as soon as it has
+    been read (i.e. without waiting for the entire stream). Records are dicts with a 'message' key and optional
+    commit metadata keys (see BATCH_RECORD_ATTRIBUTES). Supported input formats:
+     - nul: commit messages separated by NUL characters (e.g. the output of `git log -z --format=%B`)
+     - jsonl: one JSON object per line, e.g. {"message": "Fix typo", "sha": "...", "author_email": "..."}
+     - mbox: patches in an mbox stream (e.g. the output of `git format-patch --stdout`), see gitlint.mbox. Records
+       also contain the date and changed files stats of the patches.
+    """
+    if input_format == "mbox":
+        from gitlint.mbox import iter_mbox_records
+
+        yield from iter_mbox_records(stream)
+        return
+
+    if input_format == "nul":
+        record_nr = 0
+        remainder = b""
+        for chunk in iter(lambda: stream.read1(STDIN_CHUNK_SIZE), b""):
+            *messages, remainder = (remainder + chunk).split(b"\0")
+            for message in messages:
+                if message:
+                    record_nr += 1
+                    yield {"message": decode_stdin_message(message, record_nr)}
+        if remainder:
+            yield {"message": decode_stdin_message(remainder, record_nr + 1)}
+        return
+
+    import json
+
+    for line_nr, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as e:
+            raise GitLintUsageError(f"Invalid JSON on line {line_nr} of stdin: {e}") from e
+
+        if not isinstance(record, dict) or not isinstance(record.get("message"), str):
+            raise GitLintUsageError(f"Line {line_nr} of stdin must be a JSON object with a 'message' string.")
+        for attribute in BATCH_RECORD_ATTRIBUTES:
+            if not isinstance(record.get(attribute, ""), (str, type(None))):
+                raise GitLintUsageError(f"Line {line_nr} of stdin: '{attribute}' must be a string.")
+
+        # Other keys are ignored, so tools can pass through their own bookkeeping data
+        yield {key: record[key] for key in ("message", *BATCH_RECORD_ATTRIBUTES) if key in record}
+
+
+def read_manifest(manifest_path, default_refspec=None):
+    """Reads the repositories to lint from a manifest file, one repository per line: its path (relative to the
+    directory of the manifest) optionally followed by the range of commits to lint in it (`default_refspec` if not
+    specified). Empty lines and lines starting with '#' are ignored."""
+    from gitlint.repos import RepositoryTarget
+
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_path))
+    targets = []
+    with open(manifest_path, encoding=gitlint.utils.FILE_ENCODING) as manifest:
+        for line_nr, line in enumerate(manifest, start=1):
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            if len(fields) > 2:  # noqa: PLR2004 (Magic value used in comparison)
+                raise GitLintUsageError(f"Line {line_nr} of {manifest_path} must be '<repository> [<range>]'.")
+            path = os.path.join(manifest_dir, fields[0])
+            if not os.path.isdir(path):
+                raise GitLintUsageError(f"Line {line_nr} of {manifest_path}: '{fields[0]}' is not a directory.")
+            targets.append(RepositoryTarget(os.path.realpath(path), fields[1] if len(fields) > 1 else default_refspec))
+    return targets
+
+
+def build_git_context(lint_config, msg_filename, commit_hash, refspec, paths=(), first_parent=False, linter=None):
     """Builds a git context based on passed parameters and order of precedence"""
 
     # Determine which GitContext method to use if a custom message is passed
@@ -180,7 +294,7 @@ def build_git_context(lint_config, msg_filename, commit_hash, refspec):
         LOG.debug("Fetching additional meta-data from staged commit")
 
         def from_commit_msg(message):
-            return GitContext.from_staged_commit(message, lint_config.target)
+            return GitContext.from_staged_commit(message, lint_config.target, lint_config.mailmap)
 
     # Order of precedence:
     # 1. Any data specified via --msg-filename
@@ -209,14 +323,26 @@ def build_git_context(lint_config, msg_filename, commit_hash, refspec):
     if commit_hash and refspec:
         raise GitLintUsageError("--commit and --commits are mutually exclusive, use one or the other.")
 
+    if (paths or first_parent) and (not refspec or "," in refspec):
+        raise GitLintUsageError("--path and --first-parent can only be used with a range of commits (--commits).")
+
     # 3.1 Linting a range of commits
     if refspec:
         # 3.1.1 Not real refspec, but comma-separated list of commit hashes
         if "," in refspec:
             commit_hashes = [hash.strip() for hash in refspec.split(",") if hash]
             return GitContext.from_local_repository(lint_config.target, commit_hashes=commit_hashes)
-        # 3.1.2 Real refspec
-        return GitContext.from_local_repository(lint_config.target, refspec=refspec)
+        # 3.1.2 Real refspec. Commits that would be ignored altogether (e.g. merge commits) are skipped while walking
+        # the refspec, so their data is never retrieved from git.
+        # Paths and first-parent are evaluated by git while walking the refspec as well.
+        revision_filter = (linter or Linter(lint_config)).revision_filter()
+        return GitContext.from_local_repository(
+            lint_config.target,
+            refspec=refspec,
+            revision_filter=revision_filter,
+            paths=paths,
+            first_parent=first_parent,
+        )
 
     # 3.2 Linting a specific commit
     if commit_hash:
@@ -239,16 +365,93 @@ def handle_gitlint_error(ctx, exc):
         ctx.exit(CONFIG_ERROR_CODE)
 
 
+def validate_output_path(_ctx, param, value):
+    """Click callback for options naming a file that gitlint writes when it's done (profiling data, metrics,
+    recordings): checks that the file can be created before anything is linted, instead of failing afterwards."""
+    if value is not None:
+        directory = os.path.dirname(os.path.abspath(value))
+        if not os.path.isdir(directory):
+            raise click.BadParameter(f"Directory '{directory}' does not exist.", param=param)
+        if not os.access(directory, os.W_OK):
+            raise click.BadParameter(f"Directory '{directory}' is not writable.", param=param)
+    return value
+
+
+def start_profiling(ctx, profile_output):
+    """Activates a profiler for the remainder of the gitlint invocation. When the click context is closed, the profile
+    report is printed to stderr and the profiling data is written to `profile_output` (if specified)."""
+    profiler = Profiler()
+    python_profiler = None
+    if profile_output and not profile_output.endswith(".json"):
+        import cProfile
+
+        python_profiler = cProfile.Profile()
+
+    def stop_profiling():
+        click.echo(profiler.report(), err=True)
+        if python_profiler:
+            python_profiler.disable()
+            python_profiler.dump_stats(profile_output)
+        elif profile_output:
+            profiler.dump_json(profile_output)
+
+    # Click closes context resources in reverse order: the profiler is deactivated before the report is printed
+    ctx.call_on_close(stop_profiling)
+    ctx.with_resource(profiler.activate())
+    if python_profiler:
+        python_profiler.enable()
+
+
+def start_stats(ctx):
+    """Starts collecting run statistics for the remainder of the gitlint invocation. When the click context is closed,
+    the statistics are printed to stderr."""
+    run_stats = RunStats()
+    ctx.call_on_close(lambda: click.echo(run_stats.report(), err=True))
+    ctx.with_resource(run_stats.activate())
+
+
+def start_prometheus_textfile(ctx, path):
+    """Collects metrics for the remainder of the gitlint invocation, which are written to the given file in the
+    Prometheus text format when the click context is closed."""
+    observer = PrometheusTextfileObserver(path)
+    ctx.call_on_close(observer.write)
+    ctx.with_resource(observe(observer))
+
+
+def start_git_recording(ctx, path):
+    """Records all git calls for the remainder of the gitlint invocation, the recording is written to the given file
+    when the click context is closed."""
+    from gitlint.recording import GitRecorder, use_git_backend
+
+    recorder = GitRecorder()
+    ctx.call_on_close(lambda: recorder.save(path))
+    ctx.with_resource(use_git_backend(recorder))
+
+
+def start_git_replay(ctx, path):
+    """Serves all git calls for the remainder of the gitlint invocation from the recording in the given file."""
+    from gitlint.recording import GitReplayer, use_git_backend
+
+    ctx.with_resource(use_git_backend(GitReplayer.load(path)))
+
+
 @dataclass
 class ContextObj:
     """Simple class to hold data that is passed between Click commands via the Click context."""
 
     config: LintConfig
     config_builder: LintConfigBuilder
+    linter: Linter
     commit_hash: str
     refspec: str
     msg_filename: Optional[Path] = None
     gitcontext: Optional[GitContext] = None
+    progress: bool = False
+    paths: Tuple[str, ...] = ()
+    first_parent: bool = False
+    recurse_submodules: bool = False
+    config_path: Optional[str] = None
+    config_overrides: Optional[LintConfigBuilder] = None
 
 
 # fmt: off
@@ -266,12 +469,21 @@ class ContextObj:
 @click.option("--commit", envvar="GITLINT_COMMIT", default=None, help="Hash (SHA) of specific commit to lint.")
 @click.option("--commits", envvar="GITLINT_COMMITS", default=None,
               help="The range of commits (refspec or comma-separated hashes) to lint. [default: HEAD]")
+@click.option("--path", "paths", envvar="GITLINT_PATHS", multiple=True, metavar="PATHSPEC",
+              help="Only lint commits in the --commits range that modify files matching this pathspec (relative to " +
+                   "the target repository). Can be used multiple times.")
+@click.option("--first-parent", envvar="GITLINT_FIRST_PARENT", is_flag=True,
+              help="Only lint commits in the --commits range that are on the first-parent history.")
+@click.option("--recurse-submodules", envvar="GITLINT_RECURSE_SUBMODULES", is_flag=True,
+              help="Also lint the submodule commits pulled in by submodule updates in the --commits range.")
 @click.option("-e", "--extra-path", envvar="GITLINT_EXTRA_PATH",
               help="Path to a directory or python module with extra user-defined rules",
               type=click.Path(exists=True, resolve_path=True, readable=True))
 @click.option("--ignore", envvar="GITLINT_IGNORE", default="", help="Ignore rules (comma-separated by id or name).")
 @click.option("--contrib", envvar="GITLINT_CONTRIB", default="",
               help="Contrib rules to enable (comma-separated by id or name).")
+@click.option("--plugins", envvar="GITLINT_PLUGINS", default="",
+              help="Plugin rules to enable (comma-separated by id or name).")
 @click.option("--msg-filename", type=click.Path(exists=True, dir_okay=False, path_type=Path),
               help="Path to a file containing a commit-msg.")
 @click.option("--ignore-stdin", envvar="GITLINT_IGNORE_STDIN", is_flag=True,
@@ -279,25 +491,61 @@ class ContextObj:
 @click.option("--staged", envvar="GITLINT_STAGED", is_flag=True,
               help="Attempt smart guesses about meta info (like author name, email, branch, changed files, etc) " +
                    "for staged commits.")
+@click.option("--mailmap", envvar="GITLINT_MAILMAP", is_flag=True,
+              help="Resolve the author of staged commits using the repository's mailmap.")
 @click.option("--fail-without-commits", envvar="GITLINT_FAIL_WITHOUT_COMMITS", is_flag=True,
               help="Hard fail when the target commit range is empty.")
+@click.option("--fail-fast", envvar="GITLINT_FAIL_FAST", type=click.IntRange(min=1), is_flag=False, flag_value=1,
+              default=None, metavar="[N]",
+              help="Stop linting after N violations [default N: 1], applying the cheapest rules first. " +
+                   "Use --fail-fast=N when followed by a command.")
 @click.option("-v", "--verbose", envvar="GITLINT_VERBOSITY", count=True, default=0,
               help="Verbosity, use multiple times for more verbose output (e.g.: -v, -vv, -vvv). [default: -vvv]", )
 @click.option("-s", "--silent", envvar="GITLINT_SILENT", is_flag=True,
               help="Silent mode (no output). Takes precedence over -v, -vv, -vvv.")
 @click.option("-d", "--debug", envvar="GITLINT_DEBUG", help="Enable debugging output.", is_flag=True)
+@click.option("--profile", envvar="GITLINT_PROFILE", is_flag=True,
+              help="Print timing statistics per rule and git fetch to stderr.")
+@click.option("--profile-output", envvar="GITLINT_PROFILE_OUTPUT", type=click.Path(dir_okay=False, writable=True),
+              callback=validate_output_path,
+              help="Write profiling data to a file (implies --profile): JSON for '.json' files, pstats otherwise.")
+@click.option("--stats", envvar="GITLINT_STATS", is_flag=True,
+              help="Print git call, cache and throughput statistics to stderr.")
+@click.option("--progress", envvar="GITLINT_PROGRESS", is_flag=True,
+              help="Show progress on stderr when linting multiple commits (only when stderr is a terminal).")
+@click.option("--prometheus-textfile", envvar="GITLINT_PROMETHEUS_TEXTFILE",
+              type=click.Path(dir_okay=False, writable=True), callback=validate_output_path,
+              help="Write metrics to a file in the Prometheus text format "
+                   "(e.g. for the node_exporter textfile collector).")
+@click.option("--git-record", envvar="GITLINT_GIT_RECORD", type=click.Path(dir_okay=False, writable=True),
+              callback=validate_output_path,
+              help="Record all git calls and their output to a file, for use with --git-replay.")
+@click.option("--git-replay", envvar="GITLINT_GIT_REPLAY", type=click.Path(exists=True, dir_okay=False, readable=True),
+              help="Serve all git calls from a file written by --git-record, without running git (for benchmarks).")
 @click.version_option(version=gitlint.__version__)
 @click.pass_context
 def cli(
-        ctx, target, config, c, commit, commits, extra_path, ignore, contrib,
-        msg_filename, ignore_stdin, staged, fail_without_commits, verbose,
-        silent, debug,
+        ctx, target, config, c, commit, commits, paths, first_parent, recurse_submodules, extra_path, ignore, contrib,
+        plugins, msg_filename, ignore_stdin, staged, mailmap, fail_without_commits, fail_fast, verbose, silent, debug,
+        profile, profile_output, stats, progress, prometheus_textfile, git_record, git_replay,
 ):
     """ Git lint tool, checks your git commit messages for styling issues
 
         Documentation: https://jorisroovers.github.io/gitlint
     """
     try:
+        if git_record and git_replay:
+            raise GitLintUsageError("--git-record and --git-replay can't be used together.")
+        if git_record:
+            start_git_recording(ctx, git_record)
+        if git_replay:
+            start_git_replay(ctx, git_replay)
+        if profile or profile_output:
+            start_profiling(ctx, profile_output)
+        if stats:
+            start_stats(ctx)
+        if prometheus_textfile:
+            start_prometheus_textfile(ctx, prometheus_textfile)
         if debug:
             logging.getLogger("gitlint").setLevel(logging.DEBUG)
             DEPRECATED_LOG.setLevel(logging.DEBUG)
@@ -307,11 +555,18 @@ def cli(
 
         # Get the lint config from the commandline parameters and
         # store it in the context (click allows storing an arbitrary object in ctx.obj).
-        config, config_builder = build_config(target, config, c, extra_path, ignore, contrib, ignore_stdin,
-                                              staged, fail_without_commits, verbose, silent, debug)
+        config_path = config
+        config, config_builder, config_overrides = build_config(target, config_path, c, extra_path, ignore, contrib,
+                                                                plugins, ignore_stdin, staged, mailmap,
+                                                                fail_without_commits, fail_fast, verbose, silent,
+                                                                debug)
         LOG.debug("Configuration\n%s", config)
 
-        ctx.obj = ContextObj(config, config_builder, commit, commits, msg_filename)
+        # The linter is shared by all commits, so that e.g. directory configs are only built once
+        linter = Linter(config, config_builder, config_overrides)
+        ctx.obj = ContextObj(config, config_builder, linter, commit, commits, msg_filename, progress=progress,
+                             paths=paths, first_parent=first_parent, recurse_submodules=recurse_submodules,
+                             config_path=config_path, config_overrides=config_overrides)
 
         # If no subcommand is specified, then just lint
         if ctx.invoked_subcommand is None:
@@ -331,7 +586,12 @@ def lint(ctx):
     commit_hash = ctx.obj.commit_hash
     msg_filename = ctx.obj.msg_filename
 
-    gitcontext = build_git_context(lint_config, msg_filename, commit_hash, refspec)
+    if ctx.obj.recurse_submodules and (not refspec or "," in refspec):
+        raise GitLintUsageError("--recurse-submodules can only be used with a range of commits (--commits).")
+
+    gitcontext = build_git_context(
+        lint_config, msg_filename, commit_hash, refspec, ctx.obj.paths, ctx.obj.first_parent, ctx.obj.linter
+    )
     # Set gitcontext in the click context, so we can use it in command that are ran after this
     # in particular, this is used by run-hook
     ctx.obj.gitcontext = gitcontext
@@ -343,54 +603,207 @@ def lint(ctx):
     # This behavior can be overridden by using the --fail-without-commits flag.
     if number_of_commits == 0:
         LOG.debug('No commits in range "%s"', refspec)
-        if lint_config.fail_without_commits:
+        # Commits that were skipped because they're ignored anyway do count as commits in the range
+        if lint_config.fail_without_commits and not gitcontext.skipped_commits:
             raise GitLintUsageError(f'No commits in range "{refspec}"')
-        ctx.exit(GITLINT_SUCCESS)
+        exit_code = GITLINT_SUCCESS
+    else:
+        exit_code = lint_commits(ctx, gitcontext.commits)
+
+    # Submodule updates are determined separately: commits that were skipped while walking the range can still
+    # update submodules
+    if ctx.obj.recurse_submodules:
+        exit_code = lint_submodules(ctx, exit_code)
+
+    LOG.debug("Exit Code = %s", exit_code)
+    ctx.exit(exit_code)
+
 
+def lint_submodules(ctx, exit_code):
+    """Lints the commits that the submodule updates in the --commits range pull in (i.e. old..new in every updated
+    submodule), concurrently. Submodule violations are printed after (and added to) the superproject violations
+    (`exit_code`). Returns the resulting exit code."""
+    from gitlint.repos import LinterCache, lint_repositories, submodule_targets
+
+    targets = submodule_targets(
+        ctx.obj.config.target, ctx.obj.refspec, paths=ctx.obj.paths, first_parent=ctx.obj.first_parent
+    )
+    LOG.debug("Linting %d updated submodule(s)", len(targets))
+
+    # Git commands in a submodule that isn't checked out (an empty directory) would run against the superproject
+    error_code = GITLINT_SUCCESS
+    checked_out_targets = []
+    for target in targets:
+        if os.path.exists(os.path.join(target.path, ".git")):
+            checked_out_targets.append(target)
+        else:
+            click.echo(f"gitlint: submodule {target.name} is not checked out, can't lint {target.refspec}", err=True)
+            error_code = GIT_CONTEXT_ERROR_CODE
+
+    # Submodules are linted using their own .gitlint file, unless a config file is passed using --config
+    linters = LinterCache(ctx.obj.config_overrides, ctx.obj.config_path)
+    results = lint_repositories(checked_out_targets, linters)
+    violations, submodule_error_code = print_repository_results(results, "Submodule", first_violation=exit_code == 0)
+    error_code = max(error_code, submodule_error_code)
+    return error_code or min(MAX_VIOLATION_ERROR_CODE, exit_code + violations)
+
+
+def lint_commits(ctx, commits, time_budget=None, accept_unlinted=False):
+    """Lints a list of commits, prints their violations and returns the corresponding exit code.
+    When a time budget (in seconds) is passed, commits that haven't been linted when the budget is exceeded are
+    skipped: they count as violations (so that e.g. a push is rejected), unless `accept_unlinted` is set. In fail-fast
+    mode, commits are skipped once the maximum number of violations is reached."""
+    number_of_commits = len(commits)
     LOG.debug("Linting %d commit(s)", number_of_commits)
-    general_config_builder = ctx.obj.config_builder
-    last_commit = gitcontext.commits[-1]
+    last_commit = commits[-1]
+    deadline = time.monotonic() + time_budget if time_budget is not None else None
+    fail_fast = ctx.obj.config.fail_fast
+
+    # Retrieve the data that the enabled rules need for many commits at once. In fail-fast mode, data that's only
+    # needed by more expensive rules (like the changed files) is retrieved lazily, as it's often not needed at all.
+    prefetch_fields = ctx.obj.linter.required_fields
+    if fail_fast:
+        prefetch_fields &= LOG_FIELDS | ctx.obj.linter.config_fields
+
+    progress = None
+    if ctx.obj.progress and number_of_commits > 1 and ProgressObserver.is_supported():
+        progress = ProgressObserver(number_of_commits)
 
     # Let's get linting!
     first_violation = True
     exit_code = GITLINT_SUCCESS
-    for commit in gitcontext.commits:
-        # Build a config_builder taking into account the commit specific config (if any)
-        config_builder = general_config_builder.clone()
-        config_builder.set_config_from_commit(commit)
-
-        # Create a deepcopy from the original config, so we have a unique config object per commit
-        # This is important for configuration rules to be able to modifying the config on a per commit basis
-        commit_config = config_builder.build(copy.deepcopy(lint_config))
-
-        # Actually do the linting
-        linter = GitLinter(commit_config)
-        violations = linter.lint(commit)
-        # exit code equals the total number of violations in all commits
-        exit_code += len(violations)
-        if violations:
-            # Display the commit hash & new lines intelligently
-            if number_of_commits > 1 and commit.sha:
-                commit_separator = "\n" if not first_violation or commit is last_commit else ""
-                linter.display.e(f"{commit_separator}Commit {commit.sha[:10]}:")
-            linter.print_violations(violations)
-            first_violation = False
+    with observe(progress) if progress else contextlib.nullcontext():
+        observers = active_observers()
+        for i, commit in enumerate(iter_prefetched(commits, prefetch_fields, deadline)):
+            if deadline is not None and time.monotonic() > deadline:
+                skipped = number_of_commits - i
+                LOG.debug("Time budget of %ss exceeded, skipping %d commit(s)", time_budget, skipped)
+                if progress:
+                    progress.clear()
+                if accept_unlinted:
+                    message = f"skipped {skipped} commit(s)"
+                else:
+                    message = f"{skipped} commit(s) not linted, counting them as violations"
+                    exit_code += skipped
+                click.echo(f"gitlint: time budget of {time_budget}s exceeded, {message}.", err=True)
+                break
+
+            if fail_fast and exit_code >= fail_fast:
+                skipped = number_of_commits - i
+                LOG.debug("Fail-fast limit of %d violation(s) reached, skipping %d commit(s)", fail_fast, skipped)
+                if progress:
+                    progress.clear()
+                click.echo(f"gitlint: stopped after {exit_code} violation(s), skipped {skipped} commit(s).", err=True)
+                break
+
+            linter, violations = lint_commit(ctx, commit, fail_fast - exit_code if fail_fast else None, observers)
+            # exit code equals the total number of violations in all commits
+            exit_code += len(violations)
+            if violations:
+                # Make room for the violations, the progress line is redrawn on its next refresh
+                if progress:
+                    progress.clear()
+                # Display the commit hash & new lines intelligently
+                if number_of_commits > 1 and commit.sha:
+                    commit_separator = "\n" if not first_violation or commit is last_commit else ""
+                    linter.display.e(f"{commit_separator}Commit {commit.sha[:10]}:")
+                linter.print_violations(violations)
+                first_violation = False
+
+        if progress:
+            progress.clear()
 
     # cap actual max exit code because bash doesn't like exit codes larger than 255:
     # http://tldp.org/LDP/abs/html/exitcodes.html
-    exit_code = min(MAX_VIOLATION_ERROR_CODE, exit_code)
+    return min(MAX_VIOLATION_ERROR_CODE, exit_code)
+
+
+def lint_commit(ctx, commit, max_violations=None, observers=None):
+    """Lints a single commit, taking into account the commit specific and directory configs (if any).
+    Returns a linter to print the violations with and the violations found (at most max_violations, if passed).
+    Callers that lint many commits pass the active observers, so those are only looked up once."""
+    result = ctx.obj.linter.lint_commit(commit, max_violations, observers)
+    return GitLinter(ctx.obj.config), result.violations
+
+
+def parse_ref_updates(ref_updates_str):
+    """Parses the ref updates that git passes on stdin to pre-receive hooks ('<old-sha> <new-sha> <ref>' lines) and
+    pre-push hooks ('<local-ref> <local-sha> <remote-ref> <remote-sha>' lines) into tuples of their fields.
+    Splitting on whitespace is safe, since ref names can't contain whitespace."""
+    return [tuple(line.split()) for line in ref_updates_str.splitlines() if line.strip()]
+
+
+def is_null_sha(sha):
+    """Git uses an all-zero object name to indicate a ref that is being created or deleted"""
+    return set(sha) == {"0"}
+
+
+@cli.command("pre-receive")
+@click.option(
+    "--time-budget",
+    envvar="GITLINT_TIME_BUDGET",
+    type=click.FloatRange(min=0, min_open=True),
+    help="Maximum time in seconds to spend linting. Commits that are not linted within this time are rejected.",
+)
+@click.option(
+    "--accept-unlinted",
+    envvar="GITLINT_ACCEPT_UNLINTED",
+    is_flag=True,
+    help="Accept commits that are not linted within the --time-budget, instead of rejecting the push.",
+)
+@click.pass_context
+def pre_receive(ctx, time_budget, accept_unlinted):
+    """Lints commits introduced by a push (pre-receive hook)."""
+    lint_config = ctx.obj.config
+
+    # New commits are those reachable from any updated ref, but not from any existing ref. Deleted refs don't
+    # introduce any new commits.
+    ref_updates = parse_ref_updates(sys.stdin.read())
+    new_revisions = list(dict.fromkeys(new for _, new, _ in ref_updates if not is_null_sha(new)))
+    LOG.debug("pre-receive: new revisions %s", new_revisions)
+
+    try:
+        gitcontext = GitContext.from_new_revisions(
+            lint_config.target, new_revisions, revision_filter=ctx.obj.linter.revision_filter()
+        )
+        ctx.obj.gitcontext = gitcontext
+
+        if not gitcontext.commits:
+            LOG.debug("pre-receive: no new commits")
+            ctx.exit(GITLINT_SUCCESS)
+
+        exit_code = lint_commits(ctx, gitcontext.commits, time_budget, accept_unlinted)
+    except GitlintError as e:
+        handle_gitlint_error(ctx, e)
+
     LOG.debug("Exit Code = %s", exit_code)
     ctx.exit(exit_code)
 
 
+# Maps the supported hook types to their (install, uninstall, hook path) GitHookInstaller methods
+HOOK_TYPES = {
+    "commit-msg": ("install_commit_msg_hook", "uninstall_commit_msg_hook", "commit_msg_hook_path"),
+    "pre-push": ("install_pre_push_hook", "uninstall_pre_push_hook", "pre_push_hook_path"),
+}
+
+
 @cli.command("install-hook")
+@click.option(
+    "--type",
+    "hook_type",
+    type=click.Choice(list(HOOK_TYPES)),
+    default="commit-msg",
+    show_default=True,
+    help="Type of git hook to install.",
+)
 @click.pass_context
-def install_hook(ctx):
-    """Install gitlint as a git commit-msg hook."""
+def install_hook(ctx, hook_type):
+    """Install gitlint as a git commit-msg (or pre-push) hook."""
+    install_method, _, hook_path_method = HOOK_TYPES[hook_type]
     try:
-        hooks.GitHookInstaller.install_commit_msg_hook(ctx.obj.config)
-        hook_path = hooks.GitHookInstaller.commit_msg_hook_path(ctx.obj.config)
-        click.echo(f"Successfully installed gitlint commit-msg hook in {hook_path}")
+        getattr(hooks.GitHookInstaller, install_method)(ctx.obj.config)
+        hook_path = getattr(hooks.GitHookInstaller, hook_path_method)(ctx.obj.config)
+        click.echo(f"Successfully installed gitlint {hook_type} hook in {hook_path}")
         ctx.exit(GITLINT_SUCCESS)
     except hooks.GitHookInstallerError as e:
         click.echo(e, err=True)
@@ -398,19 +811,330 @@ def install_hook(ctx):
 
 
 @cli.command("uninstall-hook")
+@click.option(
+    "--type",
+    "hook_type",
+    type=click.Choice(list(HOOK_TYPES)),
+    default="commit-msg",
+    show_default=True,
+    help="Type of git hook to uninstall.",
+)
 @click.pass_context
-def uninstall_hook(ctx):
-    """Uninstall gitlint commit-msg hook."""
+def uninstall_hook(ctx, hook_type):
+    """Uninstall gitlint commit-msg (or pre-push) hook."""
+    _, uninstall_method, hook_path_method = HOOK_TYPES[hook_type]
     try:
-        hooks.GitHookInstaller.uninstall_commit_msg_hook(ctx.obj.config)
-        hook_path = hooks.GitHookInstaller.commit_msg_hook_path(ctx.obj.config)
-        click.echo(f"Successfully uninstalled gitlint commit-msg hook from {hook_path}")
+        getattr(hooks.GitHookInstaller, uninstall_method)(ctx.obj.config)
+        hook_path = getattr(hooks.GitHookInstaller, hook_path_method)(ctx.obj.config)
+        click.echo(f"Successfully uninstalled gitlint {hook_type} hook from {hook_path}")
         ctx.exit(GITLINT_SUCCESS)
     except hooks.GitHookInstallerError as e:
         click.echo(e, err=True)
         ctx.exit(GIT_CONTEXT_ERROR_CODE)
 
 
+@cli.command("pre-push")
+@click.argument("remote", required=False)
+@click.argument("url", required=False)
+@click.pass_context
+def pre_push(ctx, remote, url):
+    """Lints commits that are about to be pushed (pre-push hook)."""
+    lint_config = ctx.obj.config
+    LOG.debug("pre-push: pushing to %s (%s)", remote, url)
+
+    # Only lint commits that are pushed for the first time, i.e. commits that are not reachable from any
+    # remote-tracking branch. Deleted refs don't push any commits.
+    ref_updates = parse_ref_updates(sys.stdin.read())
+    local_revisions = list(dict.fromkeys(local for _, local, _, _ in ref_updates if not is_null_sha(local)))
+    LOG.debug("pre-push: local revisions %s", local_revisions)
+
+    try:
+        gitcontext = GitContext.from_new_revisions(
+            lint_config.target, local_revisions, ["--remotes"], revision_filter=ctx.obj.linter.revision_filter()
+        )
+        ctx.obj.gitcontext = gitcontext
+
+        if not gitcontext.commits:
+            LOG.debug("pre-push: no new commits")
+            ctx.exit(GITLINT_SUCCESS)
+
+        exit_code = lint_commits(ctx, gitcontext.commits)
+    except GitlintError as e:
+        handle_gitlint_error(ctx, e)
+
+    LOG.debug("Exit Code = %s", exit_code)
+    ctx.exit(exit_code)
+
+
+@cli.command("watch")
+@click.option(
+    "--debounce",
+    type=click.FloatRange(min=0),
+    default=0.5,
+    show_default=True,
+    help="Time in seconds to wait for more ref updates, so that bursts of updates (e.g. rebases) are linted together.",
+)
+@click.option(
+    "--poll-interval",
+    type=click.FloatRange(min=0, min_open=True),
+    default=1.0,
+    show_default=True,
+    help="Time in seconds between checks for ref updates when polling.",
+)
+@click.option("--poll", is_flag=True, help="Poll for ref updates instead of using inotify.")
+@click.pass_context
+def watch(ctx, debounce, poll_interval, poll):
+    """Lints new commits whenever refs are updated."""
+    from gitlint.watch import RefWatcher
+
+    lint_config = ctx.obj.config
+    try:
+        git_dir, common_dir = git_dirs(lint_config.target)
+        refs = git_refs(lint_config.target)
+    except GitlintError as e:
+        handle_gitlint_error(ctx, e)
+
+    watcher = RefWatcher(git_dir, common_dir, debounce, poll_interval, use_inotify=not poll)
+    click.echo(f"gitlint: watching {lint_config.target} for new commits ({watcher.mode}), press Ctrl+C to stop.")
+
+    try:
+        while True:
+            watcher.wait()
+            try:
+                new_refs = git_refs(lint_config.target)
+                updated_refs = [ref for ref, sha in new_refs.items() if refs.get(ref) != sha]
+                if not updated_refs:
+                    continue
+                LOG.debug("watch: updated refs %s", updated_refs)
+
+                # Only lint commits that weren't reachable from any ref before the update (i.e. old..new for every
+                # updated ref), using a single rev-list call. Old refs are passed as negative revisions on stdin.
+                revisions = [new_refs[ref] for ref in updated_refs] + [f"^{sha}" for sha in refs.values()]
+                refs = new_refs
+                gitcontext = GitContext.from_new_revisions(
+                    lint_config.target,
+                    list(dict.fromkeys(revisions)),
+                    [],
+                    revision_filter=ctx.obj.linter.revision_filter(),
+                )
+                if not gitcontext.commits:
+                    continue
+
+                click.echo(f"gitlint: {len(gitcontext.commits)} new commit(s) in {', '.join(updated_refs)}")
+                exit_code = lint_commits(ctx, gitcontext.commits)
+                if exit_code == GITLINT_SUCCESS:
+                    click.echo("gitlint: " + click.style("OK", fg="green") + " (no violations)")
+            except GitContextError as e:
+                # Don't stop watching on git errors, e.g. refs pointing to objects that were just garbage collected
+                click.echo(e, err=True)
+    except KeyboardInterrupt:
+        LOG.debug("watch: stopped")
+    finally:
+        watcher.close()
+
+    ctx.exit(GITLINT_SUCCESS)
+
+
+@cli.command("batch")
+@click.option(
+    "--format",
+    "input_format",
+    type=click.Choice(BATCH_FORMATS),
+    default="nul",
+    show_default=True,
+    help="Format of the stdin stream: NUL-separated commit messages, JSON lines or an mbox with patches.",
+)
+@click.pass_context
+def batch(ctx, input_format):
+    """Lints a stream of commit messages read from stdin."""
+    # All records share a single git context, so repository information like the commentchar is only looked up once.
+    # Commits aren't kept around after they've been linted, so memory usage doesn't grow with the size of the stream.
+    gitcontext = GitContext(repository_path=ctx.obj.config.target)
+    exit_code = GITLINT_SUCCESS
+    first_violation = True
+    number_of_records = 0
+    fail_fast = ctx.obj.config.fail_fast
+    try:
+        for number_of_records, record in enumerate(iter_stdin_records(sys.stdin.buffer, input_format), start=1):
+            if fail_fast and exit_code >= fail_fast:
+                LOG.debug("Fail-fast limit of %d violation(s) reached, not reading further records", fail_fast)
+                click.echo(f"gitlint: stopped after {exit_code} violation(s).", err=True)
+                break
+            commit = gitcontext.commit_from_msg(record.pop("message"), **record)
+            max_violations = fail_fast - exit_code if fail_fast else None
+            linter, violations = lint_commit(ctx, commit, max_violations, gitcontext.observers)
+            exit_code += len(violations)
+            if violations:
+                record_separator = "" if first_violation else "\n"
+                record_name = f"Commit {commit.sha[:10]}" if commit.sha else f"Record {number_of_records}"
+                linter.display.e(f"{record_separator}{record_name}:")
+                linter.print_violations(violations)
+                first_violation = False
+
+        LOG.debug("Linted %d record(s)", number_of_records)
+        if number_of_records == 0 and ctx.obj.config.fail_without_commits:
+            raise GitLintUsageError("No commit messages on stdin")
+    except GitlintError as e:
+        handle_gitlint_error(ctx, e)
+
+    ctx.exit(min(MAX_VIOLATION_ERROR_CODE, exit_code))
+
+
+@cli.command("tags")
+@click.argument("patterns", nargs=-1, metavar="[PATTERN]...")
+@click.pass_context
+def tags(ctx, patterns):
+    """Lints the messages of annotated tags.
+
+    Only the tags matching one of the PATTERNs (e.g. 'v1.*') are linted, if specified.
+    """
+    exit_code = GITLINT_SUCCESS
+    first_violation = True
+    fail_fast = ctx.obj.config.fail_fast
+    try:
+        # All tags are retrieved using a single git call, no matter how many tags there are
+        gitcontext = GitContext.from_tags(ctx.obj.config.target, patterns)
+        LOG.debug("Linting %d annotated tag(s)", len(gitcontext.commits))
+        if not gitcontext.commits and ctx.obj.config.fail_without_commits:
+            raise GitLintUsageError("No annotated tags to lint")
+
+        for i, tag in enumerate(gitcontext.commits):
+            if fail_fast and exit_code >= fail_fast:
+                skipped = len(gitcontext.commits) - i
+                LOG.debug("Fail-fast limit of %d violation(s) reached, skipping %d tag(s)", fail_fast, skipped)
+                click.echo(f"gitlint: stopped after {exit_code} violation(s), skipped {skipped} tag(s).", err=True)
+                break
+            max_violations = fail_fast - exit_code if fail_fast else None
+            linter, violations = lint_commit(ctx, tag, max_violations, gitcontext.observers)
+            exit_code += len(violations)
+            if violations:
+                tag_separator = "" if first_violation else "\n"
+                linter.display.e(f"{tag_separator}Tag {tag.name}:")
+                linter.print_violations(violations)
+                first_violation = False
+    except GitlintError as e:
+        handle_gitlint_error(ctx, e)
+
+    ctx.exit(min(MAX_VIOLATION_ERROR_CODE, exit_code))
+
+
+@cli.command("bundle")
+@click.argument("bundle_path", metavar="BUNDLE", type=click.Path(exists=True, dir_okay=False, readable=True))
+@click.pass_context
+def bundle(ctx, bundle_path):
+    """Lints the commits in a git bundle, without a repository.
+
+    The bundle's prerequisites aren't part of the bundle and aren't linted.
+    """
+    from gitlint.bundle import bundle_context
+
+    exit_code = GITLINT_SUCCESS
+    first_violation = True
+    fail_fast = ctx.obj.config.fail_fast
+    try:
+        # The bundle is read directly, the only git call is the one for the commentchar
+        gitcontext = bundle_context(bundle_path, ctx.obj.config.target)
+        LOG.debug("Linting %d commit(s) in bundle %s", len(gitcontext.commits), bundle_path)
+        if not gitcontext.commits and ctx.obj.config.fail_without_commits:
+            raise GitLintUsageError(f"No commits in bundle {bundle_path}")
+
+        for i, commit in enumerate(gitcontext.commits):
+            if fail_fast and exit_code >= fail_fast:
+                skipped = len(gitcontext.commits) - i
+                LOG.debug("Fail-fast limit of %d violation(s) reached, skipping %d commit(s)", fail_fast, skipped)
+                click.echo(f"gitlint: stopped after {exit_code} violation(s), skipped {skipped} commit(s).", err=True)
+                break
+            max_violations = fail_fast - exit_code if fail_fast else None
+            linter, violations = lint_commit(ctx, commit, max_violations, gitcontext.observers)
+            exit_code += len(violations)
+            if violations:
+                commit_separator = "" if first_violation else "\n"
+                linter.display.e(f"{commit_separator}Commit {commit.sha[:10]}:")
+                linter.print_violations(violations)
+                first_violation = False
+    except GitlintError as e:
+        handle_gitlint_error(ctx, e)
+
+    ctx.exit(min(MAX_VIOLATION_ERROR_CODE, exit_code))
+
+
+@cli.command("repos")
+@click.argument("repositories", nargs=-1, type=click.Path(exists=True, file_okay=False, resolve_path=True))
+@click.option(
+    "--manifest",
+    type=click.Path(exists=True, dir_okay=False, readable=True),
+    help="File that lists repositories to lint, one per line: '<repository> [<range>]'.",
+)
+@click.option(
+    "-j",
+    "--jobs",
+    type=click.IntRange(min=1),
+    default=4,
+    show_default=True,
+    help="Number of repositories to lint concurrently.",
+)
+@click.pass_context
+def repos(ctx, repositories, manifest, jobs):
+    """Lints commits in multiple repositories."""
+    from gitlint.repos import LinterCache, RepositoryTarget, lint_repositories
+
+    # Repositories are linted with --commits as range (the last commit if not specified), unless the manifest
+    # specifies a range for them
+    refspec = ctx.obj.refspec
+    targets = [RepositoryTarget(repository, refspec) for repository in repositories]
+    try:
+        if manifest:
+            targets.extend(read_manifest(manifest, refspec))
+        if not targets:
+            raise GitLintUsageError("No repositories to lint, pass repository paths and/or a --manifest.")
+    except GitlintError as e:
+        handle_gitlint_error(ctx, e)
+
+    # Every repository is linted using its own .gitlint file, unless a config file is passed using --config
+    linters = LinterCache(ctx.obj.config_overrides, ctx.obj.config_path)
+    exit_code, error_code = print_repository_results(lint_repositories(targets, linters, jobs), "Repository")
+    LOG.debug("Linted %d repositories", len(targets))
+    # Errors take precedence over violations, as not all commits could be linted
+    ctx.exit(error_code or min(MAX_VIOLATION_ERROR_CODE, exit_code))
+
+
+def print_repository_results(results, heading, first_violation=True):
+    """Prints the violations of the given repository results (see gitlint.repos), grouped per repository under the
+    given heading (e.g. 'Repository <path>:'). Errors are printed to stderr.
+    Returns the total number of violations and the exit code of the most severe error (0 if there are no errors)."""
+    violations = 0
+    error_code = GITLINT_SUCCESS
+    for result in results:
+        name = result.target.name or result.target.path
+        if result.error:
+            LOG.debug("Linting %s failed: %s", name, result.error)
+            error_code = max(error_code, error_exit_code(result.error))
+            click.echo(f"gitlint: {name}: {result.error}", err=True)
+
+        violating_results = [lint_result for lint_result in result.results if lint_result.violations]
+        if not violating_results:
+            continue
+        linter = GitLinter(result.linter.config)
+        repository_separator = "" if first_violation else "\n"
+        linter.display.e(f"{repository_separator}{heading} {name}:")
+        for i, lint_result in enumerate(violating_results):
+            commit_separator = "\n" if i > 0 else ""
+            linter.display.e(f"{commit_separator}Commit {lint_result.commit.sha[:10]}:")
+            linter.print_violations(lint_result.violations)
+            violations += len(lint_result.violations)
+        first_violation = False
+    return violations, error_code
+
+
+def error_exit_code(exc):
+    """Returns the exit code for the given error, as used by handle_gitlint_error"""
+    if isinstance(exc, GitContextError):
+        return GIT_CONTEXT_ERROR_CODE
+    if isinstance(exc, LintConfigError):
+        return CONFIG_ERROR_CODE
+    return USAGE_ERROR_CODE
+
+
 @cli.command("run-hook")
 @click.pass_context
 def run_hook(ctx):
@@ -6,7 +6,7 @@ from collections import OrderedDict
 from configparser import ConfigParser
 from configparser import Error as ConfigParserError
 from dataclasses import dataclass, field
-from typing import ClassVar, Optional
+from typing import Any, ClassVar, Dict, Iterable, Optional, Type
 from typing import OrderedDict as OrderedDictType
 
 from gitlint import (
@@ -16,6 +16,7 @@ from gitlint import (
 )
 from gitlint.contrib import rules as contrib_rules
 from gitlint.exception import GitlintError
+from gitlint.git import GitCommit
 from gitlint.utils import FILE_ENCODING
 
 
@@ -36,6 +37,12 @@ class LintConfigError(GitlintError):
     pass
 
 
+# Policies for combining per-directory configs when a commit changes files in directories with different configs:
+# - common: use the config of the deepest directory that contains all changed files
+# - all: lint the commit with the config of every directory it changes files in
+DIRECTORY_CONFIG_MERGE_POLICIES = ("common", "all")
+
+
 class LintConfig:
     """Class representing gitlint configuration.
     Contains active config as well as number of methods to easily get/set the config.
@@ -66,7 +73,7 @@ class LintConfig:
         rules.AuthorValidEmail,
     )
 
-    def __init__(self):
+    def __init__(self) -> None:
         self.rules = RuleCollection(self.default_rule_classes)
         self._verbosity = options.IntOption("verbosity", 3, "Verbosity")
         self._ignore_merge_commits = options.BoolOption("ignore-merge-commits", True, "Ignore merge commits")
@@ -82,16 +89,26 @@ class LintConfig:
         self._target = options.PathOption("target", os.path.realpath(os.getcwd()), target_description)
         self._ignore = options.ListOption("ignore", [], "List of rule-ids to ignore")
         self._contrib = options.ListOption("contrib", [], "List of contrib-rules to enable")
-        self._config_path = None
+        self._plugins = options.ListOption("plugins", [], "List of plugin rules to enable")
+        self._config_path: Optional[str] = None
         ignore_stdin_description = "Ignore any stdin data. Useful for running in CI server."
         self._ignore_stdin = options.BoolOption("ignore-stdin", False, ignore_stdin_description)
         self._staged = options.BoolOption("staged", False, "Read staged commit meta-info from the local repository.")
+        mailmap_description = "Resolve the author of staged commits using the repository's mailmap."
+        self._mailmap = options.BoolOption("mailmap", False, mailmap_description)
         self._fail_without_commits = options.BoolOption(
             "fail-without-commits", False, "Hard fail when the target commit range is empty"
         )
         self._regex_style_search = options.BoolOption(
             "regex-style-search", True, "Use `search` instead of `match` semantics for regex rules"
         )
+        self._fail_fast = options.IntOption("fail-fast", 0, "Stop linting after this many violations (0: disabled)")
+        self._directory_configs = options.BoolOption(
+            "directory-configs", False, "Apply .gitlint files in the directories of the files changed by a commit"
+        )
+        self._directory_config_merge = options.StrOption(
+            "directory-config-merge", "common", "How to combine the configs of multiple directories (common or all)"
+        )
 
     @property
     def target(self):
@@ -195,6 +212,15 @@ class LintConfig:
     def staged(self, value):
         return self._staged.set(value)
 
+    @property
+    def mailmap(self):
+        return self._mailmap.value
+
+    @mailmap.setter
+    @handle_option_error
+    def mailmap(self, value):
+        return self._mailmap.set(value)
+
     @property
     def fail_without_commits(self):
         return self._fail_without_commits.value
@@ -204,6 +230,37 @@ class LintConfig:
     def fail_without_commits(self, value):
         return self._fail_without_commits.set(value)
 
+    @property
+    def fail_fast(self):
+        return self._fail_fast.value
+
+    @fail_fast.setter
+    @handle_option_error
+    def fail_fast(self, value):
+        return self._fail_fast.set(value)
+
+    @property
+    def directory_configs(self):
+        return self._directory_configs.value
+
+    @directory_configs.setter
+    @handle_option_error
+    def directory_configs(self, value):
+        return self._directory_configs.set(value)
+
+    @property
+    def directory_config_merge(self):
+        return self._directory_config_merge.value
+
+    @directory_config_merge.setter
+    def directory_config_merge(self, value):
+        if value not in DIRECTORY_CONFIG_MERGE_POLICIES:
+            policies = ", ".join(DIRECTORY_CONFIG_MERGE_POLICIES)
+            raise LintConfigError(
+                f"Option 'directory-config-merge' must be one of: {policies} (current value: '{value}')"
+            )
+        self._directory_config_merge.set(value)
+
     @property
     def regex_style_search(self):
         return self._regex_style_search.value
@@ -266,7 +323,33 @@ class LintConfig:
         except (options.RuleOptionError, rules.UserRuleError) as e:
             raise LintConfigError(str(e)) from e
 
-    def _get_option(self, rule_name_or_id, option_name):
+    @property
+    def plugins(self):
+        return self._plugins.value
+
+    @plugins.setter
+    def plugins(self, value):
+        try:
+            self._plugins.set(value)
+
+            # Make sure we unload any previously loaded plugin rules when re-setting the value
+            self.rules.delete_rules_by_attr("is_plugin", True)
+
+            # Only the entry point metadata is read here, rule modules are only imported for rules that are enabled
+            rule_entry_points = rule_finder.find_rule_entry_points()
+
+            for rule_id_or_name in self.plugins:
+                rule_entry_point = next((ep for ep in rule_entry_points if ep.matches(rule_id_or_name)), None)
+                if not rule_entry_point:
+                    raise LintConfigError(f"No plugin rule with id or name '{rule_id_or_name}' found.")
+
+                rule_class = rule_entry_point.load()
+                self.rules.add_rule(rule_class, rule_class.id, {"is_plugin": True})
+
+        except (options.RuleOptionError, rules.UserRuleError) as e:
+            raise LintConfigError(str(e)) from e
+
+    def _get_option(self, rule_name_or_id: str, option_name: str) -> options.RuleOption:
         rule = self.rules.find_rule(rule_name_or_id)
         if not rule:
             raise LintConfigError(f"No such rule '{rule_name_or_id}'")
@@ -283,7 +366,7 @@ class LintConfig:
         option = self._get_option(rule_name_or_id, option_name)
         return option.value
 
-    def set_rule_option(self, rule_name_or_id, option_name, option_value):
+    def set_rule_option(self, rule_name_or_id: str, option_name: str, option_value: Any) -> None:
         """Attempts to set a given value for a given option for a given rule.
         LintConfigErrors will be raised if the rule or option don't exist or if the value is invalid."""
         option = self._get_option(rule_name_or_id, option_name)
@@ -293,7 +376,7 @@ class LintConfig:
             msg = f"'{option_value}' is not a valid value for option '{rule_name_or_id}.{option_name}'. {e}."
             raise LintConfigError(msg) from e
 
-    def set_general_option(self, option_name, option_value):
+    def set_general_option(self, option_name: str, option_value: Any) -> None:
         attr_name = option_name.replace("-", "_")
         # only allow setting general options that exist and don't start with an underscore
         if not hasattr(self, attr_name) or attr_name[0] == "_":
@@ -302,12 +385,28 @@ class LintConfig:
         # else
         setattr(self, attr_name, option_value)
 
+    def copy(self, general_options: Optional[Iterable[str]] = None) -> "LintConfig":
+        """Returns a copy of this config. When a list of general option names (e.g. ["ignore"]) is passed, only those
+        options are copied and everything else (including the rules) is shared with this config. That's much cheaper
+        than a full copy, but only safe when just those general options of the copy will be modified."""
+        if general_options is None:
+            return copy.deepcopy(self)
+        config = copy.copy(self)
+        for option_name in general_options:
+            attr_name = "_" + option_name.replace("-", "_")
+            setattr(config, attr_name, copy.deepcopy(getattr(self, attr_name)))
+        return config
+
     def __eq__(self, other):
         return (
             isinstance(other, LintConfig)
             and self.contrib == other.contrib
+            and self.plugins == other.plugins
             and self.debug == other.debug
+            and self.directory_configs == other.directory_configs
+            and self.directory_config_merge == other.directory_config_merge
             and self.extra_path == other.extra_path
+            and self.fail_fast == other.fail_fast
             and self.fail_without_commits == other.fail_without_commits
             and self.ignore == other.ignore
             and self.ignore_fixup_amend_commits == other.ignore_fixup_amend_commits
@@ -319,6 +418,7 @@ class LintConfig:
             and self.regex_style_search == other.regex_style_search
             and self.rules == other.rules
             and self.staged == other.staged
+            and self.mailmap == other.mailmap
             and self.target == other.target
             and self.verbosity == other.verbosity
             and self._config_path == other._config_path
@@ -331,6 +431,7 @@ class LintConfig:
             "[GENERAL]\n"
             f"extra-path: {self.extra_path}\n"
             f"contrib: {self.contrib}\n"
+            f"plugins: {self.plugins}\n"
             f"ignore: {','.join(self.ignore)}\n"
             f"ignore-merge-commits: {self.ignore_merge_commits}\n"
             f"ignore-fixup-commits: {self.ignore_fixup_commits}\n"
@@ -339,7 +440,11 @@ class LintConfig:
             f"ignore-revert-commits: {self.ignore_revert_commits}\n"
             f"ignore-stdin: {self.ignore_stdin}\n"
             f"staged: {self.staged}\n"
+            f"mailmap: {self.mailmap}\n"
             f"fail-without-commits: {self.fail_without_commits}\n"
+            f"fail-fast: {self.fail_fast}\n"
+            f"directory-configs: {self.directory_configs}\n"
+            f"directory-config-merge: {self.directory_config_merge}\n"
             f"regex-style-search: {self.regex_style_search}\n"
             f"verbosity: {self.verbosity}\n"
             f"debug: {self.debug}\n"
@@ -352,7 +457,10 @@ class LintConfig:
             f"{self.__class__.__name__}("
             f"contrib={self.contrib!r}, "
             f"debug={self.debug!r}, "
+            f"directory_config_merge={self.directory_config_merge!r}, "
+            f"directory_configs={self.directory_configs!r}, "
             f"extra_path={self.extra_path!r}, "
+            f"fail_fast={self.fail_fast!r}, "
             f"fail_without_commits={self.fail_without_commits!r}, "
             f"ignore={self.ignore!r}, "
             f"ignore_fixup_amend_commits={self.ignore_fixup_amend_commits!r}, "
@@ -361,6 +469,8 @@ class LintConfig:
             f"ignore_revert_commits={self.ignore_revert_commits!r}, "
             f"ignore_squash_commits={self.ignore_squash_commits!r}, "
             f"ignore_stdin={self.ignore_stdin!r}, "
+            f"mailmap={self.mailmap!r}, "
+            f"plugins={self.plugins!r}, "
             f"regex_style_search={self.regex_style_search!r}, "
             f"staged={self.staged!r}, "
             f"target={self.target!r}, "
@@ -371,20 +481,24 @@ class LintConfig:
 class RuleCollection:
     """Class representing an ordered list of rules. Methods are provided to easily retrieve, add or delete rules."""
 
-    def __init__(self, rule_classes=None, rule_attrs=None):
+    def __init__(
+        self,
+        rule_classes: Optional[Iterable[Type[rules.Rule]]] = None,
+        rule_attrs: Optional[Dict[str, Any]] = None,
+    ) -> None:
         # Use an ordered dict so that the order in which rules are applied is always the same
-        self._rules = OrderedDict()
+        self._rules: OrderedDictType[str, rules.Rule] = OrderedDict()
         if rule_classes:
             self.add_rules(rule_classes, rule_attrs)
 
-    def find_rule(self, rule_id_or_name):
+    def find_rule(self, rule_id_or_name: str) -> Optional[rules.Rule]:
         rule = self._rules.get(rule_id_or_name)
         # if not found, try finding rule by name
         if not rule:
             rule = next((rule for rule in self._rules.values() if rule.name == rule_id_or_name), None)
         return rule
 
-    def add_rule(self, rule_class, rule_id, rule_attrs=None):
+    def add_rule(self, rule_class: Type[rules.Rule], rule_id: str, rule_attrs: Optional[Dict[str, Any]] = None) -> None:
         """Instantiates and adds a rule to RuleCollection.
         Note: There can be multiple instantiations of the same rule_class in the RuleCollection, as long as the
         rule_id is unique.
@@ -394,13 +508,12 @@ class RuleCollection:
         :param rule_attrs dictionary of attributes to set on the instantiated rule obj
         """
         rule_obj = rule_class()
-        rule_obj.id = rule_id
-        if rule_attrs:
-            for key, val in rule_attrs.items():
-                setattr(rule_obj, key, val)
+        # The rule id (like the name of named rules) is a class attribute that's overridden per rule instance
+        for key, val in {"id": rule_id, **(rule_attrs or {})}.items():
+            setattr(rule_obj, key, val)
         self._rules[rule_obj.id] = rule_obj
 
-    def add_rules(self, rule_classes, rule_attrs=None):
+    def add_rules(self, rule_classes: Iterable[Type[rules.Rule]], rule_attrs: Optional[Dict[str, Any]] = None) -> None:
         """Convenience method to add multiple rules at once based on a list of rule classes."""
         for rule_class in rule_classes:
             self.add_rule(rule_class, rule_class.id, rule_attrs)
@@ -454,12 +567,12 @@ class LintConfigBuilder:
     _config_blueprint: OrderedDictType[str, OrderedDictType[str, str]] = field(init=False, default_factory=OrderedDict)
     _config_path: Optional[str] = field(init=False, default=None)
 
-    def set_option(self, section, option_name, option_value):
+    def set_option(self, section: str, option_name: str, option_value: str) -> None:
         if section not in self._config_blueprint:
             self._config_blueprint[section] = OrderedDict()
         self._config_blueprint[section][option_name] = option_value
 
-    def set_config_from_commit(self, commit):
+    def set_config_from_commit(self, commit: GitCommit) -> None:
         """Given a git commit, applies config specified in the commit message.
         Supported:
          - gitlint-ignore: all
@@ -470,6 +583,12 @@ class LintConfigBuilder:
             if matches and len(matches.groups()) == 1:
                 self.set_option("general", "ignore", matches.group(1))
 
+    def set_config_from_builder(self, builder: "LintConfigBuilder") -> None:
+        """Applies the options that were set on another builder, overriding options that were already set."""
+        for section_name, section_dict in builder._config_blueprint.items():
+            for option_name, option_value in section_dict.items():
+                self.set_option(section_name, option_name, option_value)
+
     def set_config_from_string_list(self, config_options):
         """Given a list of config options of the form "<rule>.<option>=<value>", parses out the correct rule and option
         and sets the value accordingly in this factory object."""
@@ -485,7 +604,7 @@ class LintConfigBuilder:
                     f"'{config_option}' is an invalid configuration option. Use '<rule>.<option>=<value>'"
                 ) from e
 
-    def set_from_config_file(self, filename):
+    def set_from_config_file(self, filename: str) -> None:
         """Loads lint config from an ini-style config file"""
         if not os.path.exists(filename):
             raise LintConfigError(f"Invalid file path: {filename}")
@@ -503,7 +622,7 @@ class LintConfigBuilder:
         except ConfigParserError as e:
             raise LintConfigError(str(e)) from e
 
-    def _add_named_rule(self, config, qualified_rule_name):
+    def _add_named_rule(self, config: LintConfig, qualified_rule_name: str) -> str:
         """Adds a Named Rule to a given LintConfig object.
         IMPORTANT: This method does *NOT* overwrite existing Named Rules with the same canonical id.
         """
@@ -537,7 +656,7 @@ class LintConfigBuilder:
 
         return canonical_id
 
-    def build(self, config=None):
+    def build(self, config: Optional[LintConfig] = None) -> LintConfig:
         """Build a real LintConfig object by normalizing and validating the options that were previously set on this
         factory."""
         # If we are passed a config object, then rebuild that object instead of building a new lintconfig object from
@@ -545,7 +664,9 @@ class LintConfigBuilder:
         if not config:
             config = LintConfig()
 
-        config._config_path = self._config_path
+        # Don't reset the config path when rebuilding a config using a builder that wasn't loaded from a config file
+        if self._config_path:
+            config._config_path = self._config_path
 
         # Set general options first as this might change the behavior or validity of the other options
         general_section = self._config_blueprint.get("general")
@@ -567,7 +688,7 @@ class LintConfigBuilder:
 
         return config
 
-    def clone(self):
+    def clone(self) -> "LintConfigBuilder":
         """Creates an exact copy of a LintConfigBuilder."""
         builder = LintConfigBuilder()
         builder._config_blueprint = copy.deepcopy(self._config_blueprint)
@@ -1,9 +1,10 @@
 import re
 from pathlib import Path
-from typing import Set, Tuple
+from typing import FrozenSet, Tuple
 
-from gitlint.git import GitContext
-from gitlint.rules import CommitRule, RuleViolation
+from gitlint.cache import load_resource
+from gitlint.git import COMMIT_FIELD_AUTHOR, GitContext
+from gitlint.rules import RULE_COST_MESSAGE, CommitRule, RuleViolation
 
 
 class AllowedAuthors(CommitRule):
@@ -15,24 +16,27 @@ class AllowedAuthors(CommitRule):
     name = "contrib-allowed-authors"
 
     id = "CC3"
+    required_fields = frozenset([COMMIT_FIELD_AUTHOR])
+    cost = RULE_COST_MESSAGE
 
     @classmethod
-    def _read_authors_from_file(cls, git_ctx: GitContext) -> Tuple[Set[str], str]:
+    def _parse_authors(cls, authors_file_content: str) -> FrozenSet[Tuple[str, str]]:
+        return frozenset(re.findall(cls.parse_authors, authors_file_content))
+
+    @classmethod
+    def _read_authors_from_file(cls, git_ctx: GitContext) -> Tuple[FrozenSet[Tuple[str, str]], str]:
         for file_name in cls.authors_file_names:
             if git_ctx.repository_path:
                 path = Path(git_ctx.repository_path) / file_name
             else:
                 path = Path(file_name)
-            if path.exists():
-                authors_file = path
-                break
-        else:
-            raise FileNotFoundError("No AUTHORS file found!")
-
-        authors_file_content = authors_file.read_text("utf-8")
-        authors = re.findall(cls.parse_authors, authors_file_content)
+            try:
+                # The (name, email) index is only rebuilt when the AUTHORS file changes on disk
+                return load_resource(path, cls._parse_authors), path.name
+            except FileNotFoundError:
+                continue
 
-        return set(authors), authors_file.name
+        raise FileNotFoundError("No AUTHORS file found!")
 
     def validate(self, commit):
         registered_authors, authors_file_name = AllowedAuthors._read_authors_from_file(commit.message.context)
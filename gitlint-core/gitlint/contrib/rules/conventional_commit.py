@@ -1,7 +1,8 @@
 import re
 
+from gitlint.git import COMMIT_FIELD_MESSAGE
 from gitlint.options import ListOption
-from gitlint.rules import CommitMessageTitle, LineRule, RuleViolation
+from gitlint.rules import RULE_COST_MESSAGE, CommitMessageTitle, LineRule, RuleViolation
 
 RULE_REGEX = re.compile(r"([^(]+?)(\([^)]+?\))?!?: .+")
 
@@ -11,6 +12,8 @@ class ConventionalCommit(LineRule):
 
     name = "contrib-title-conventional-commits"
     id = "CT1"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     target = CommitMessageTitle
 
     options_spec = [
@@ -1,4 +1,5 @@
-from gitlint.rules import CommitRule, RuleViolation
+from gitlint.git import COMMIT_FIELD_MESSAGE
+from gitlint.rules import RULE_COST_MESSAGE, CommitRule, RuleViolation
 
 
 class DisallowCleanupCommits(CommitRule):
@@ -8,6 +9,8 @@ class DisallowCleanupCommits(CommitRule):
 
     name = "contrib-disallow-cleanup-commits"
     id = "CC2"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
 
     def validate(self, commit):
         if commit.is_fixup_commit:
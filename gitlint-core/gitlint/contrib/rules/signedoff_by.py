@@ -1,4 +1,5 @@
-from gitlint.rules import CommitRule, RuleViolation
+from gitlint.git import COMMIT_FIELD_MESSAGE
+from gitlint.rules import RULE_COST_MESSAGE, CommitRule, RuleViolation
 
 
 class SignedOffBy(CommitRule):
@@ -8,6 +9,8 @@ class SignedOffBy(CommitRule):
 
     name = "contrib-body-requires-signed-off-by"
     id = "CC1"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
 
     def validate(self, commit):
         for line in commit.message.body:
@@ -1,5 +1,12 @@
 import logging
-from typing import ClassVar, Optional, Set
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, ClassVar, Iterator, Optional, Set
+
+if TYPE_CHECKING:
+    # Only imported for type checking, as the config module imports this module
+    from gitlint.config import LintConfig
 
 LOG = logging.getLogger("gitlint.deprecated")
 DEPRECATED_LOG_FORMAT = "%(levelname)s: %(message)s"
@@ -8,19 +15,32 @@ DEPRECATED_LOG_FORMAT = "%(levelname)s: %(message)s"
 class Deprecation:
     """Singleton class that handles deprecation warnings and behavior."""
 
-    # LintConfig class that is used to determine deprecation behavior
-    config: ClassVar[Optional[object]] = None
+    # LintConfig that is used to determine deprecation behavior. This is a context variable (set using `use_config`)
+    # rather than a class attribute, so that linters with different configs can run concurrently (e.g. in threads).
+    _config: ClassVar[ContextVar[Optional["LintConfig"]]] = ContextVar("gitlint_deprecation_config", default=None)
 
     # Set of warning messages that have already been logged, to prevent duplicate warnings
     warning_msgs: ClassVar[Set[str]] = set()
+    _warning_msgs_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def use_config(cls, config: Optional["LintConfig"]) -> Iterator[None]:
+        """Context manager that sets the LintConfig that determines deprecation behavior in the current context."""
+        token = cls._config.set(config)
+        try:
+            yield
+        finally:
+            cls._config.reset(token)
 
     @classmethod
     def get_regex_method(cls, rule, regex_option):
         """Returns the regex method to be used for a given rule based on general.regex-style-search option.
         Logs a warning if the deprecated re.match method is returned."""
 
-        # if general.regex-style-search is set, just return re.search
-        if cls.config.regex_style_search:
+        # if general.regex-style-search is set (the default when no config is set), just return re.search
+        config = cls._config.get()
+        if config is None or config.regex_style_search:
             return regex_option.value.search
 
         warning_msg = (
@@ -32,9 +52,11 @@ class Deprecation:
         )
 
         # Only log warnings once
-        if warning_msg not in cls.warning_msgs:
+        with cls._warning_msgs_lock:
+            is_new_warning = warning_msg not in cls.warning_msgs
+            cls.warning_msgs.add(warning_msg)
+        if is_new_warning:
             log = logging.getLogger("gitlint.deprecated.regex_style_search")
             log.warning(warning_msg)
-        cls.warning_msgs.add(warning_msg)
 
         return regex_option.value.match
@@ -0,0 +1,129 @@
+"""
+Per-directory configuration for monorepos (the `directory-configs` general option): subdirectories of a repository can
+contain their own `.gitlint` file, which applies to commits that change files in that directory (or below it).
+
+The config for a directory is built from the regular config, with the `.gitlint` files of the directory and its parent
+directories applied on top of it (from the top-level directory down, so the nearest config file wins). Command-line
+flags still take precedence over all config files. When a commit changes files in directories with different configs,
+the `directory-config-merge` policy determines which configs are used (see `DirectoryConfigResolver.resolve()`).
+
+Resolving the config of a directory requires a file system lookup for the directory and each of its parents, and
+building a config is relatively expensive. `DirectoryConfigResolver` caches both, so every directory is only looked
+up once and every config is only built once per resolver, no matter how many commits touch them.
+"""
+
+import os
+import posixpath
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from gitlint.config import LintConfig, LintConfigBuilder
+from gitlint.git import COMMIT_FIELD_CHANGED_FILES, GitCommit
+
+DIRECTORY_CONFIG_FILE = ".gitlint"
+
+
+class PathTrie:
+    """Trie of the directories of a set of (slash-separated, relative) file paths, keyed by path component.
+    Commits often change many files in the same few directories, the trie ensures every directory is only visited once.
+    """
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "PathTrie"] = {}
+        # Whether one of the paths is a file directly in this directory
+        self.has_files = False
+
+    @classmethod
+    def from_paths(cls, paths: Iterable[str]) -> "PathTrie":
+        root = cls()
+        for path in paths:
+            node = root
+            for part in path.split("/")[:-1]:
+                node = node.children.setdefault(part, cls())
+            node.has_files = True
+        return root
+
+    def common_directory(self) -> str:
+        """Returns the deepest directory that contains all paths ('' for the top-level directory)."""
+        parts = []
+        node = self
+        while len(node.children) == 1 and not node.has_files:
+            part, node = next(iter(node.children.items()))
+            parts.append(part)
+        return "/".join(parts)
+
+    def directories(self, prefix: str = "") -> Iterator[str]:
+        """Yields the directories that directly contain one of the paths, in sorted order."""
+        if self.has_files:
+            yield prefix
+        for part, child in sorted(self.children.items()):
+            yield from child.directories(posixpath.join(prefix, part))
+
+
+class DirectoryConfigResolver:
+    """Resolves the configs to lint commits with, based on the `.gitlint` files in the directories of the files they
+    change. `config_builder` is the builder of the regular config, `overrides` are the options in it that take
+    precedence over directory config files (typically the ones set via the command-line).
+    Config files are looked up relative to the config's target, directory lookups and configs are cached."""
+
+    # The commit fields that are used to resolve the config of a commit
+    required_fields = frozenset([COMMIT_FIELD_CHANGED_FILES])
+
+    def __init__(
+        self,
+        config_builder: LintConfigBuilder,
+        overrides: Optional[LintConfigBuilder] = None,
+        config: Optional[LintConfig] = None,
+    ):
+        self.overrides = overrides
+        # The regular config, which is built from the config builder unless it's passed
+        self.config = config or config_builder.build()
+        # The nearest directory with a config file (or '' for the regular config), by directory
+        self._config_dirs: Dict[str, str] = {"": ""}
+        self._builders: Dict[str, LintConfigBuilder] = {"": config_builder}
+        self._configs: Dict[str, LintConfig] = {"": self.config}
+
+    def config_directory(self, directory: str) -> str:
+        """Returns the nearest directory with a config file: the given directory or one of its parents, '' if none of
+        them contain a config file. The config file of the top-level directory is the regular config file."""
+        config_dir = self._config_dirs.get(directory)
+        if config_dir is None:
+            if os.path.isfile(os.path.join(self.config.target, directory, DIRECTORY_CONFIG_FILE)):
+                config_dir = directory
+            else:
+                config_dir = self.config_directory(posixpath.dirname(directory))
+            self._config_dirs[directory] = config_dir
+        return config_dir
+
+    def _builder(self, config_dir: str) -> LintConfigBuilder:
+        builder = self._builders.get(config_dir)
+        if builder is None:
+            builder = self._builder(self.config_directory(posixpath.dirname(config_dir))).clone()
+            builder.set_from_config_file(os.path.join(self.config.target, config_dir, DIRECTORY_CONFIG_FILE))
+            if self.overrides:
+                builder.set_config_from_builder(self.overrides)
+            self._builders[config_dir] = builder
+        return builder
+
+    def directory_config(self, directory: str) -> LintConfig:
+        """Returns the config for the given directory (relative to the target, '' for the top-level directory)."""
+        config_dir = self.config_directory(directory)
+        config = self._configs.get(config_dir)
+        if config is None:
+            config = self._configs[config_dir] = self._builder(config_dir).build()
+        return config
+
+    def resolve(self, commit: GitCommit) -> List[LintConfig]:
+        """Returns the configs to lint the given commit with, according to the `directory-config-merge` policy:
+        - common: the config of the deepest directory that contains all of the commit's changed files
+        - all: the distinct configs of all directories the commit changes files in
+        Commits without changed files are linted using the regular config."""
+        trie = PathTrie.from_paths(commit.changed_files)
+        if self.config.directory_config_merge == "common":
+            return [self.directory_config(trie.common_directory())]
+
+        configs: List[LintConfig] = []
+        for directory in trie.directories():
+            config = self.directory_config(directory)
+            if not any(config is resolved for resolved in configs):
+                configs.append(config)
+        return configs or [self.config]
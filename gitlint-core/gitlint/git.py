@@ -1,15 +1,31 @@
+import copy
 import logging
 import os
-from dataclasses import dataclass, field
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
 import arrow
 
 from gitlint import shell as sh
 from gitlint.cache import PropertyCache, cache
 from gitlint.exception import GitlintError
+from gitlint.observers import Observer, active_observers
 
 # import exceptions separately, this makes it a little easier to mock them out in the unit tests
 from gitlint.shell import CommandNotFound, ErrorReturnCode
@@ -18,13 +34,88 @@ from gitlint.shell import CommandNotFound, ErrorReturnCode
 # We should fix this at some point :-)
 GIT_TIMEFORMAT = "YYYY-MM-DD HH:mm:ss Z"
 
+# Maximum number of identities passed to a single `git check-mailmap` call, keeps us well below command-line limits
+MAILMAP_BATCH_SIZE = 500
+
+# Commit fields that rules can declare they require (see `Rule.required_fields`). Fields that are required to lint a
+# range of commits are retrieved for many commits at once, see `GitContext.prefetch()`.
+COMMIT_FIELD_MESSAGE = "message"
+COMMIT_FIELD_AUTHOR = "author"
+COMMIT_FIELD_DATE = "date"
+COMMIT_FIELD_PARENTS = "parents"
+COMMIT_FIELD_CHANGED_FILES = "changed_files"
+COMMIT_FIELD_CHANGED_FILES_STATS = "changed_files_stats"
+COMMIT_FIELD_BRANCHES = "branches"
+
+# Fields that are retrieved together, using a single `git log` call
+LOG_FIELDS = frozenset([COMMIT_FIELD_MESSAGE, COMMIT_FIELD_AUTHOR, COMMIT_FIELD_DATE, COMMIT_FIELD_PARENTS])
+
+# Format used to retrieve the LOG_FIELDS of a commit using `git log`
+LOG_FORMAT = "%aN%x00%aE%x00%ai%x00%P%n%B"
+
+# Maximum number of commits for which fields are retrieved using a single git call
+PREFETCH_BATCH_SIZE = 500
+
+# Title prefixes of special commits, by commit type (merge commits are determined by their parents instead)
+COMMIT_TYPE_TITLE_PREFIXES = {
+    "fixup": "fixup!",
+    "squash": "squash!",
+    "fixup_amend": "amend!",
+    "revert": "Revert",
+}
+
+# Format used to retrieve the author name and subject of commits while walking revisions using `git rev-list`
+REV_LIST_FORMAT = "%x00%aN%x00%s"
+
+# Format used to retrieve annotated tags using `git for-each-ref`: NUL-terminated fields, records are terminated by an
+# additional newline. Lightweight tags (objecttype 'commit') don't have a tagger or message of their own.
+TAG_FORMAT = (
+    "%(refname:strip=2)%00%(objecttype)%00%(objectname)%00%(taggername)%00%(taggeremail)%00%(taggerdate:iso)%00"
+    "%(contents)%00%(contents:signature)%00"
+)
+TAG_FORMAT_FIELDS = 8
+
+# File mode git uses for submodule commits ("gitlinks") in trees
+GITLINK_MODE = "160000"
+
 LOG = logging.getLogger(__name__)
 
+# Function that runs git commands for `_git` in the current context, `gitlint.shell.git` if not set. Used to record and
+# replay git calls, see `gitlint.recording`.
+GIT_BACKEND: "ContextVar[Optional[Callable[..., sh.ShResult]]]" = ContextVar("gitlint_git_backend", default=None)
+
 
 class GitContextError(GitlintError):
     """Exception indicating there is an issue with the git context"""
 
 
+class RevisionFilter:
+    """Skips commits while walking revisions (`git rev-list`), before their data is retrieved from git.
+    Merge commits are skipped by git itself when `no_merges` is set. Other commits are skipped in two steps, so that
+    cheap checks can be used without affecting which commits are linted:
+    - `may_skip()` is called for every commit, with its author name and subject (`%aN` and `%s` in `git log`
+      formats). Note that the subject is the commit's first paragraph, joined into a single line. When
+      `checks_merges` is set, merge commits may be skipped as well.
+    - `skip()` is called for the commits that may be skipped, with their `required_fields` (by default the message,
+      author, date and parents) retrieved in bulk, and determines whether they're actually skipped.
+    The base class doesn't skip any commits."""
+
+    # Skip merge commits (`git rev-list --no-merges`)
+    no_merges: bool = False
+    # Whether may_skip() is used, if not the author names and subjects of commits aren't retrieved
+    checks_subjects: bool = False
+    # Whether merge commits may be skipped (`skip()` is called for them), for when git can't skip them all
+    checks_merges: bool = False
+    # Commit fields (COMMIT_FIELD_*) that are retrieved in bulk for the commits that may be skipped
+    required_fields: FrozenSet[str] = LOG_FIELDS
+
+    def may_skip(self, _author_name: str, _subject: str) -> bool:
+        return False
+
+    def skip(self, _commit: "GitCommit") -> bool:
+        return False
+
+
 class GitNotInstalledError(GitContextError):
     def __init__(self):
         super().__init__(
@@ -46,7 +137,7 @@ def _git(*command_parts: str, **kwargs: Any) -> Union[str, sh.ShResult]:
     git_kwargs.update(kwargs)
     try:
         LOG.debug(command_parts)
-        result = sh.git(*command_parts, **git_kwargs)
+        result = (GIT_BACKEND.get() or sh.git)(*command_parts, **git_kwargs)
         # If we reach this point and the result has an exit_code that is larger than 0, this means that we didn't
         # get an exception (which is the default sh behavior for non-zero exit codes) and so the user is expecting
         # a non-zero exit code -> just return the entire result
@@ -92,13 +183,84 @@ def git_hooks_dir(repository_path: str) -> str:
     return os.path.realpath(os.path.join(repository_path, hooks_dir))
 
 
-def _parse_git_changed_file_stats(changed_files_stats_raw):
+def git_dirs(repository_path: str) -> Tuple[str, str]:
+    """Determine the absolute git dir and common git dir (these differ for worktrees) for a given repository"""
+    git_dir, common_dir = str(_git("rev-parse", "--git-dir", "--git-common-dir", _cwd=repository_path)).split("\n")[:2]
+    return os.path.realpath(os.path.join(repository_path, git_dir)), os.path.realpath(
+        os.path.join(repository_path, common_dir)
+    )
+
+
+def git_refs(repository_path: str) -> Dict[str, str]:
+    """Returns a dict of all refs (including HEAD) in the given repository, mapping ref names to object names."""
+    result = _git("show-ref", "--head", _cwd=repository_path, _ok_code=[0, 1])
+    # git show-ref returns exit code 1 if there are no refs at all (i.e. empty repository)
+    if hasattr(result, "exit_code") and result.exit_code == 1:
+        return {}
+    refs = {}
+    for line in str(result).splitlines():
+        sha, ref = line.split(" ", 1)
+        refs[ref] = sha
+    return refs
+
+
+def git_submodule_updates(
+    repository_path: str, refspec: str, paths: Optional[Sequence[str]] = None, first_parent: bool = False
+) -> Dict[str, Tuple[str, str]]:
+    """Returns the submodules whose commit changed in `refspec`, mapping their paths to the (old, new) commit of the
+    submodule before and after the range. All submodule updates in the range are determined using a single
+    `git log --raw` call (taking into account the same `paths` and `first_parent` as `from_local_repository`).
+    Merge commits are compared to each of their parents (only the first parent with `first_parent`), so that submodule
+    updates that are merged in are included. For submodules that were added in the range, the old commit is the
+    commit they were added with. Submodules that were removed in the range are not included."""
+    # git doesn't show the changes of merge commits without -m. Topological order ensures commits are listed after
+    # all of their children, also when their commit dates are equal.
+    log_args = ["-z", "--format=", "--raw", "-m", "--topo-order", "--no-abbrev", "--no-renames"]
+    if first_parent:
+        log_args.append("--first-parent")
+    log_args.append(refspec)
+    if paths:
+        log_args.extend(["--", *paths])
+    tokens = iter(str(_git("log", *log_args, _cwd=repository_path)).split("\0"))
+
+    # Raw entries are ':<old mode> <new mode> <old sha> <new sha> <status>' followed by the path (NUL-separated),
+    # newest commit first: the first entry for a path has the new commit, the last entry has the old commit.
+    newest: Dict[str, Tuple[str, str]] = {}
+    oldest: Dict[str, str] = {}
+    for token in tokens:
+        entry = token.strip()
+        if not entry:  # Commits are separated by newlines
+            continue
+        fields = entry[1:].split()
+        path = next(tokens, None)
+        if not entry.startswith(":") or len(fields) != 5 or not path:  # noqa: PLR2004 (Magic value)
+            raise GitContextError(f"Unexpected output of 'git log --raw' in {repository_path}: '{entry}'")
+        old_mode, new_mode, old_sha, new_sha = fields[:4]
+        if GITLINK_MODE in (old_mode, new_mode):
+            newest.setdefault(path, (new_mode, new_sha))
+            oldest[path] = old_sha if old_mode == GITLINK_MODE else new_sha
+
+    return {
+        path: (oldest[path], new_sha)
+        for path, (new_mode, new_sha) in newest.items()
+        if new_mode == GITLINK_MODE and oldest[path] != new_sha
+    }
+
+
+def _parse_mailmap_contact(contact: str) -> Tuple[str, str]:
+    """Parses a contact as returned by `git check-mailmap` ("Name <email>" or "<email>") into a (name, email) tuple"""
+    name, _, email = contact.rpartition("<")
+    return name[:-1] if name.endswith(" ") else name, email[:-1]
+
+
+def _parse_git_changed_file_stats(changed_files_stats_raw: str) -> Dict[str, "GitChangedFileStats"]:
     """Parse the output of git diff --numstat and return a dict of:
     dict[filename: GitChangedFileStats(filename, additions, deletions)]"""
     changed_files_stats_lines = changed_files_stats_raw.split("\n")
-    changed_files_stats = {}
+    changed_files_stats: Dict[str, GitChangedFileStats] = {}
     for line in changed_files_stats_lines[:-1]:  # drop last empty line
-        line_stats = line.split()
+        # Split on tabs only, file names can contain spaces
+        line_stats = line.split("\t", 2)
 
         # If the file is binary, numstat will show "-"
         # See https://git-scm.com/docs/git-diff#Documentation/git-diff.txt---numstat
@@ -111,6 +273,28 @@ def _parse_git_changed_file_stats(changed_files_stats_raw):
     return changed_files_stats
 
 
+def _parse_log(context: "GitContext", raw_log: str) -> Dict[str, Any]:
+    """Parses the output of `git log --pretty=<LOG_FORMAT>` for a single commit into LocalGitCommit cache entries"""
+    header, _, commit_msg = raw_log.partition("\n")
+    name, email, date, parents = header.split("\x00")
+
+    commit_parents = [] if parents == "" else parents.split(" ")
+
+    # "YYYY-MM-DD HH:mm:ss Z" -> ISO 8601-like format
+    # Use arrow for datetime parsing, because apparently python is quirky around ISO-8601 dates:
+    # http://stackoverflow.com/a/30696682/381010
+    commit_date = arrow.get(date, GIT_TIMEFORMAT).datetime
+
+    return {
+        "message": GitCommitMessage.from_full_message(context, commit_msg),
+        "author_name": name,
+        "author_email": email,
+        "date": commit_date,
+        "parents": commit_parents,
+        "is_merge_commit": len(commit_parents) > 1,
+    }
+
+
 @dataclass
 class GitContext(PropertyCache):
     """Class representing the git context in which gitlint is operating: a data object storing information about
@@ -119,6 +303,16 @@ class GitContext(PropertyCache):
 
     commits: List["GitCommit"] = field(init=False, default_factory=list)
     repository_path: Optional[str] = None
+    # Number of commits that were skipped while walking revisions, see RevisionFilter
+    skipped_commits: int = field(init=False, default=0)
+    _mailmap: Dict[Tuple[str, str], Tuple[str, str]] = field(init=False, default_factory=dict, repr=False)
+    # Observers that are notified when data of this context and its commits is retrieved from git: the observers
+    # that were active when the context was created, so they're only looked up once for all commits
+    observers: Tuple[Observer, ...] = field(init=False, default_factory=active_observers, repr=False, compare=False)
+
+    @property
+    def _cache_observers(self) -> Sequence[Observer]:
+        return self.observers
 
     @property
     @cache
@@ -135,53 +329,103 @@ class GitContext(PropertyCache):
             current_branch = _git("branch", "--show-current", _cwd=self.repository_path).strip()
         return current_branch
 
+    def canonical_identities(self, identities: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Tuple[str, str]]:
+        """Resolves (name, email) identities to their canonical (name, email) according to the repository's mailmap.
+        Results are memoized per identity, unknown identities are resolved in batches (one `git check-mailmap` call
+        per batch) so resolving the authors of a large commit range only costs a handful of git calls in total."""
+        identities = list(identities)
+        unresolved = list(dict.fromkeys(identity for identity in identities if identity not in self._mailmap))
+        for i in range(0, len(unresolved), MAILMAP_BATCH_SIZE):
+            batch = unresolved[i : i + MAILMAP_BATCH_SIZE]
+            contacts = [f"{name} <{email}>" if name else f"<{email}>" for name, email in batch]
+            resolved = str(_git("check-mailmap", *contacts, _cwd=self.repository_path)).split("\n")
+            for identity, contact in zip(batch, resolved):
+                self._mailmap[identity] = _parse_mailmap_contact(contact)
+
+        return {identity: self._mailmap[identity] for identity in identities}
+
+    def canonical_identity(self, name: str, email: str) -> Tuple[str, str]:
+        """Resolves a single (name, email) identity using the repository's mailmap. See `canonical_identities`."""
+        return self.canonical_identities([(name, email)])[(name, email)]
+
+    def commit_from_msg(self, commit_msg_str: str, **kwargs: Any) -> "GitCommit":
+        """Creates a commit in this context based on a commit message, without adding it to `commits`.
+        Additional commit attributes (sha, author_name, author_email, ...) can be passed as keyword arguments.
+        :param commit_msg_str: Full git commit message.
+        """
+        commit_msg_obj = GitCommitMessage.from_full_message(self, commit_msg_str)
+        return GitCommit(self, commit_msg_obj, **kwargs)
+
     @staticmethod
     def from_commit_msg(commit_msg_str):
         """Determines git context based on a commit message.
         :param commit_msg_str: Full git commit message.
         """
         context = GitContext()
-        commit_msg_obj = GitCommitMessage.from_full_message(context, commit_msg_str)
-        commit = GitCommit(context, commit_msg_obj)
-        context.commits.append(commit)
+        context.commits.append(context.commit_from_msg(commit_msg_str))
         return context
 
     @staticmethod
-    def from_staged_commit(commit_msg_str, repository_path):
+    def from_staged_commit(commit_msg_str, repository_path, mailmap=False):
         """Determines git context based on a commit message that is a staged commit for a local git repository.
         :param commit_msg_str: Full git commit message.
         :param repository_path: Path to the git repository to retrieve the context from
+        :param mailmap: Resolve the author (from the git config) using the repository's mailmap
         """
         context = GitContext(repository_path=repository_path)
         commit_msg_obj = GitCommitMessage.from_full_message(context, commit_msg_str)
-        commit = StagedLocalGitCommit(context, commit_msg_obj)
+        commit = StagedLocalGitCommit(context, commit_msg_obj, mailmap)
         context.commits.append(commit)
         return context
 
     @staticmethod
-    def from_local_repository(repository_path, refspec=None, commit_hashes=None):
+    def from_local_repository(
+        repository_path: str,
+        refspec: Optional[str] = None,
+        commit_hashes: Optional[Sequence[str]] = None,
+        revision_filter: Optional[RevisionFilter] = None,
+        paths: Optional[Sequence[str]] = None,
+        first_parent: bool = False,
+    ) -> "GitContext":
         """Retrieves the git context from a local git repository.
         :param repository_path: Path to the git repository to retrieve the context from
         :param refspec: The commit(s) to retrieve (mutually exclusive with `commit_hash`)
         :param commit_hash: Hash of the commit to retrieve (mutually exclusive with `refspec`)
+        :param revision_filter: RevisionFilter that determines which commits in `refspec` are skipped
+        :param paths: Only retrieve the commits in `refspec` that modify files matching these pathspecs (relative to
+            `repository_path`)
+        :param first_parent: Only retrieve the commits in `refspec` that are on the first-parent history
+        Paths and first-parent are evaluated by git while walking the refspec (`git rev-list`), they are not supported
+        in combination with `commit_hashes` or when falling back to the last commit.
         """
 
         context = GitContext(repository_path=repository_path)
 
         if refspec:
-            sha_list = _git("rev-list", refspec, _cwd=repository_path).split()
-        elif commit_hashes:  # One or more commit hashes, just pass it to `git log -1`
+            rev_list_args = ["--first-parent"] if first_parent else []
+            rev_list_args.append(refspec)
+            if paths:
+                rev_list_args.extend(["--", *paths])
+            context._walk_revisions(rev_list_args, revision_filter)
+            return context
+
+        if paths or first_parent:
+            raise GitContextError("Paths and first-parent can only be used when retrieving a range of commits.")
+
+        if commit_hashes:  # One or more commit hashes, just pass it to `git log -1`
             # Even though we have already been passed the commit hash, we ask git to retrieve this hash and
             # return it to us. This way we verify that the passed hash is a valid hash for the target repo and we
             # also convert it to the full hash format (we might have been passed a short hash).
             sha_list = []
             for commit_hash in commit_hashes:
-                sha_list.append(_git("log", "-1", commit_hash, "--pretty=%H", _cwd=repository_path).replace("\n", ""))
+                sha_list.append(
+                    str(_git("log", "-1", commit_hash, "--pretty=%H", _cwd=repository_path)).replace("\n", "")
+                )
         else:  # If no refspec is defined, fallback to the last commit on the current branch
             # We tried many things here e.g.: defaulting to e.g. HEAD or HEAD^... (incl. dealing with
             # repos that only have a single commit - HEAD^... doesn't work there), but then we still get into
             # problems with e.g. merge commits. Easiest solution is just taking the SHA from `git log -1`.
-            sha_list = [_git("log", "-1", "--pretty=%H", _cwd=repository_path).replace("\n", "")]
+            sha_list = [str(_git("log", "-1", "--pretty=%H", _cwd=repository_path)).replace("\n", "")]
 
         for sha in sha_list:
             commit = LocalGitCommit(context, sha)
@@ -189,6 +433,189 @@ class GitContext(PropertyCache):
 
         return context
 
+    @staticmethod
+    def from_new_revisions(repository_path, revisions, excluded_revisions=("--all",), revision_filter=None):
+        """Retrieves the git context for all commits that are reachable from the passed revisions, but not from the
+        excluded revisions. All commits are determined using a single `git rev-list --stdin --not <excluded>` call,
+        commits that are reachable from multiple revisions are only included once.
+        :param repository_path: Path to the git repository to retrieve the context from
+        :param revisions: Revisions (e.g. commit hashes) to list commits from
+        :param excluded_revisions: Revision arguments to exclude commits from (e.g. `--all`, `--remotes=origin`)
+        :param revision_filter: RevisionFilter that determines which of the new commits are skipped
+        """
+        context = GitContext(repository_path=repository_path)
+        if not revisions:
+            return context
+
+        stdin = "".join(f"{revision}\n" for revision in revisions)
+        excluded_args = ["--not", *excluded_revisions] if excluded_revisions else []
+        context._walk_revisions(["--stdin", *excluded_args], revision_filter, _in=stdin)
+        return context
+
+    @staticmethod
+    def from_tags(repository_path: str, patterns: Optional[Sequence[str]] = None) -> "GitContext":
+        """Retrieves the git context for the annotated tags in a local git repository, wrapped as `GitTag` commits.
+        All tags (name, tagger and message) are retrieved using a single `git for-each-ref` call, in refname order.
+        Lightweight tags are skipped, they don't have a message of their own.
+        :param repository_path: Path to the git repository to retrieve the tags from
+        :param patterns: Only retrieve tags whose name matches one of these `git for-each-ref` patterns (e.g. 'v1.*'),
+            all tags if not specified
+        """
+        context = GitContext(repository_path=repository_path)
+        ref_patterns = [f"refs/tags/{pattern}" for pattern in patterns] if patterns else ["refs/tags"]
+        raw_tags = str(_git("for-each-ref", f"--format={TAG_FORMAT}", *ref_patterns, _cwd=repository_path))
+
+        fields = raw_tags.split("\0")
+        for start in range(0, len(fields) - 1, TAG_FORMAT_FIELDS):
+            record = fields[start : start + TAG_FORMAT_FIELDS]
+            name, object_type, sha, tagger_name, tagger_email, date, contents, signature = record
+            if object_type != "tag":
+                continue
+            if signature and contents.endswith(signature):
+                contents = contents[: -len(signature)]
+            tag = GitTag(
+                context=context,
+                # Every record is terminated by a newline, which ends up in front of the next record's name
+                name=name.lstrip("\n"),
+                message=GitCommitMessage.from_full_message(context, contents),
+                sha=sha,
+                date=arrow.get(date, GIT_TIMEFORMAT).datetime if date else None,
+                author_name=tagger_name,
+                author_email=tagger_email.strip("<>"),
+            )
+            context.commits.append(tag)
+        return context
+
+    def _walk_revisions(
+        self, rev_list_args: Sequence[str], revision_filter: Optional[RevisionFilter], **kwargs: Any
+    ) -> None:
+        """Adds the commits listed by `git rev-list <rev_list_args>` to this context, except for the ones that are
+        skipped by the revision filter."""
+        if revision_filter is None:
+            revision_filter = RevisionFilter()
+        options = ["--no-merges"] if revision_filter.no_merges else []
+
+        if not revision_filter.checks_subjects and not revision_filter.checks_merges:
+            raw_rev_list = str(_git("rev-list", *options, *rev_list_args, _cwd=self.repository_path, **kwargs))
+            self.commits.extend(LocalGitCommit(self, sha) for sha in raw_rev_list.split())
+            return
+
+        # With --parents, rev-list lists the parents of every commit after its sha. With --format, it outputs a
+        # 'commit <sha>' line followed by the formatted line for every commit.
+        if revision_filter.checks_merges:
+            options.append("--parents")
+        if revision_filter.checks_subjects:
+            options.append(f"--format={REV_LIST_FORMAT}")
+        raw_rev_list = str(_git("rev-list", *options, *rev_list_args, _cwd=self.repository_path, **kwargs))
+        commits: List[GitCommit] = []
+        candidates: Dict[str, GitCommit] = {}
+        for line in raw_rev_list.split("\n"):
+            if line and not line.startswith("\x00"):
+                sha, *parents = (line[len("commit ") :] if line.startswith("commit ") else line).split()
+                commits.append(LocalGitCommit(self, sha))
+                if len(parents) > 1:
+                    candidates[sha] = commits[-1]
+            elif line and commits:
+                _, author_name, subject = line.split("\x00", 2)
+                # The title of commits whose subject starts with the comment char is a later line of the message
+                if revision_filter.may_skip(author_name, subject) or subject.startswith(self.commentchar):
+                    candidates[sha] = commits[-1]
+
+        if candidates:
+            self.prefetch(revision_filter.required_fields, list(candidates.values()))
+            skipped = {sha for sha, commit in candidates.items() if revision_filter.skip(commit)}
+            if skipped:
+                LOG.debug("Skipping %d commit(s) while walking revisions", len(skipped))
+                self.skipped_commits += len(skipped)
+                commits = [commit for commit in commits if commit.sha not in skipped]
+
+        self.commits.extend(commits)
+
+    def prefetch(self, fields: Iterable[str], commits: Optional[Sequence["GitCommit"]] = None) -> None:
+        """Retrieves the given fields (COMMIT_FIELD_*) for the given commits (all commits in this context by default)
+        using a single git call per kind of data, instead of separate git calls for every commit:
+        - message, author, date and parents (LOG_FIELDS): `git log --no-walk --stdin`
+        - changed files: `git diff-tree --stdin --name-only`, or `--numstat` when the changed file stats are required
+        Branches are always retrieved lazily (per commit). Fields that were already retrieved are skipped, as are
+        commits that aren't LocalGitCommits (their data isn't retrieved from git)."""
+        fields = frozenset(fields)
+        local_commits = [
+            commit for commit in (self.commits if commits is None else commits) if isinstance(commit, LocalGitCommit)
+        ]
+        if fields & LOG_FIELDS:
+            pending = {commit.sha: commit for commit in local_commits if "message" not in commit._cache}
+            if pending:
+                start = time.perf_counter()
+                self._prefetch_log(pending)
+                _notify_prefetch(self.observers, "log", len(pending), start)
+
+        if COMMIT_FIELD_CHANGED_FILES_STATS in fields:
+            cache_key = "changed_files_stats"
+        elif COMMIT_FIELD_CHANGED_FILES in fields:
+            cache_key = "changed_files"
+        else:
+            return
+        pending = {
+            commit.sha: commit
+            for commit in local_commits
+            if cache_key not in commit._cache and "changed_files_stats" not in commit._cache
+        }
+        if pending:
+            start = time.perf_counter()
+            self._prefetch_changed_files(pending, cache_key)
+            _notify_prefetch(self.observers, cache_key, len(pending), start)
+
+    def _prefetch_log(self, commits: Dict[str, "LocalGitCommit"]) -> None:
+        stdin = "".join(f"{sha}\n" for sha in commits)
+        raw_log = str(
+            _git(
+                "log",
+                "--no-walk=unsorted",
+                "--stdin",
+                "-z",
+                f"--pretty=%H%x00{LOG_FORMAT}",
+                _in=stdin,
+                _cwd=self.repository_path,
+            )
+        )
+        # Records are NUL-separated (-z), as are the sha and the first fields of LOG_FORMAT within a record
+        values = raw_log.split("\x00")
+        record_size = LOG_FORMAT.count("%x00") + 2
+        for i in range(0, len(values) - record_size + 1, record_size):
+            sha, *log_values = values[i : i + record_size]
+            if sha in commits:
+                # Unlike `git log -1`, `git log -z` doesn't terminate the commit message with a newline
+                commits[sha]._cache.update(_parse_log(self, "\x00".join(log_values) + "\n"))
+
+    def _prefetch_changed_files(self, commits: Dict[str, "LocalGitCommit"], cache_key: str) -> None:
+        stdin = "".join(f"{sha}\n" for sha in commits)
+        diff_format = "--numstat" if cache_key == "changed_files_stats" else "--name-only"
+        raw_diff = str(
+            _git(
+                "diff-tree",
+                "--stdin",
+                "-r",
+                "--root",
+                diff_format,
+                "--pretty=format:%x00%H",
+                _in=stdin,
+                _cwd=self.repository_path,
+            )
+        )
+        # `git diff-tree` doesn't output anything for commits without changes (including merge commits)
+        for commit in commits.values():
+            commit._cache[cache_key] = {} if cache_key == "changed_files_stats" else []
+        # Every commit's output starts with NUL + sha, followed by an empty line and the changed files
+        for commit_diff in raw_diff.split("\x00")[1:]:
+            sha, _, changed_files = commit_diff.partition("\n")
+            if sha not in commits:
+                continue
+            changed_files = changed_files.lstrip("\n")
+            if cache_key == "changed_files_stats":
+                commits[sha]._cache[cache_key] = _parse_git_changed_file_stats(changed_files)
+            else:
+                commits[sha]._cache[cache_key] = changed_files.split("\n")[:-1]
+
     def __eq__(self, other):
         return (
             isinstance(other, GitContext)
@@ -199,6 +626,12 @@ class GitContext(PropertyCache):
         )
 
 
+def _notify_prefetch(observers: Sequence[Observer], kind: str, commits: int, start: float) -> None:
+    duration = time.perf_counter() - start
+    for observer in observers:
+        observer.on_prefetch(kind, commits, duration)
+
+
 @dataclass
 class GitCommitMessage:
     """Class representing a git commit message. A commit message consists of the following:
@@ -216,7 +649,7 @@ class GitCommitMessage:
     body: List[str]
 
     @staticmethod
-    def from_full_message(context, commit_msg_str):
+    def from_full_message(context: GitContext, commit_msg_str: str) -> "GitCommitMessage":
         """Parses a full git commit message by parsing a given string into the different parts of a commit message"""
         all_lines = commit_msg_str.splitlines()
         cutline = f"{context.commentchar} ------------------------ >8 ------------------------"
@@ -230,6 +663,10 @@ class GitCommitMessage:
         body = lines[1:] if len(lines) > 1 else []
         return GitCommitMessage(context=context, original=commit_msg_str, full=full, title=title, body=body)
 
+    def copy(self) -> "GitCommitMessage":
+        """Returns a copy of this commit message that can be modified without affecting this commit message."""
+        return replace(self, body=list(self.body))
+
     def __str__(self):
         return self.full
 
@@ -238,9 +675,10 @@ class GitCommitMessage:
 class GitChangedFileStats:
     """Class representing the stats for a changed file in git"""
 
-    filepath: Path
-    additions: int
-    deletions: int
+    filepath: Union[str, Path]
+    # None for binary files
+    additions: Optional[int]
+    deletions: Optional[int]
 
     def __str__(self) -> str:
         return f"{self.filepath}: {self.additions} additions, {self.deletions} deletions"
@@ -270,24 +708,36 @@ class GitCommit:
 
     @property
     def is_fixup_commit(self):
-        return self.message.title.startswith("fixup!")
+        return self.message.title.startswith(COMMIT_TYPE_TITLE_PREFIXES["fixup"])
 
     @property
     def is_squash_commit(self):
-        return self.message.title.startswith("squash!")
+        return self.message.title.startswith(COMMIT_TYPE_TITLE_PREFIXES["squash"])
 
     @property
     def is_fixup_amend_commit(self):
-        return self.message.title.startswith("amend!")
+        return self.message.title.startswith(COMMIT_TYPE_TITLE_PREFIXES["fixup_amend"])
 
     @property
     def is_revert_commit(self):
-        return self.message.title.startswith("Revert")
+        return self.message.title.startswith(COMMIT_TYPE_TITLE_PREFIXES["revert"])
 
     @property
     def changed_files(self):
         return list(self.changed_files_stats.keys())
 
+    @property
+    def _cache_observers(self) -> Sequence[Observer]:
+        # Used by subclasses that lazily load data from git (PropertyCache)
+        return self.context.observers
+
+    def copy(self) -> "GitCommit":
+        """Returns a shallow copy of this commit with its own copy of the commit message, so that the message of the
+        copy can be modified (e.g. by configuration rules) without affecting this commit."""
+        commit = copy.copy(self)
+        commit.message = self.message.copy()
+        return commit
+
     def __str__(self):
         date_str = arrow.get(self.date).format(GIT_TIMEFORMAT) if self.date else None
 
@@ -325,39 +775,25 @@ class LocalGitCommit(GitCommit, PropertyCache):
     startup time and reduces gitlint's memory footprint.
     """
 
-    def __init__(self, context, sha):
+    # Unlike staged commits, commits in the local repository always have a sha
+    sha: str
+
+    def __init__(self, context: GitContext, sha: str) -> None:
         PropertyCache.__init__(self)
         self.context = context
         self.sha = sha
 
     def _log(self):
         """Does a call to `git log` to determine a bunch of information about the commit."""
-        long_format = "--pretty=%aN%x00%aE%x00%ai%x00%P%n%B"
-        raw_commit = _git("log", self.sha, "-1", long_format, _cwd=self.context.repository_path).split("\n")
-
-        (name, email, date, parents), commit_msg = raw_commit[0].split("\x00"), "\n".join(raw_commit[1:])
-
-        commit_parents = [] if parents == "" else parents.split(" ")
-        commit_is_merge_commit = len(commit_parents) > 1
-
-        # "YYYY-MM-DD HH:mm:ss Z" -> ISO 8601-like format
-        # Use arrow for datetime parsing, because apparently python is quirky around ISO-8601 dates:
-        # http://stackoverflow.com/a/30696682/381010
-        commit_date = arrow.get(date, GIT_TIMEFORMAT).datetime
-
-        # Create Git commit object with the retrieved info
-        commit_msg_obj = GitCommitMessage.from_full_message(self.context, commit_msg)
-
-        self._cache.update(
-            {
-                "message": commit_msg_obj,
-                "author_name": name,
-                "author_email": email,
-                "date": commit_date,
-                "parents": commit_parents,
-                "is_merge_commit": commit_is_merge_commit,
-            }
-        )
+        raw_log = _git("log", self.sha, "-1", f"--pretty={LOG_FORMAT}", _cwd=self.context.repository_path)
+        self._cache.update(_parse_log(self.context, raw_log))
+
+    def copy(self):
+        # The message is part of the cache here, so the copy gets its own cache (pre-populated with this commit's data)
+        message = self.message.copy()
+        commit = copy.copy(self)
+        commit._cache = {**self._cache, "message": message}
+        return commit
 
     @property
     def message(self):
@@ -399,6 +835,15 @@ class LocalGitCommit(GitCommit, PropertyCache):
     def is_merge_commit(self):
         return self._try_cache("is_merge_commit", self._log)
 
+    @property
+    def changed_files(self):
+        # When prefetching commits for rules that only need the names of the changed files, those are retrieved
+        # without the (more expensive) stats, see GitContext.prefetch()
+        def cache_changed_files():
+            self._cache["changed_files"] = list(self.changed_files_stats.keys())
+
+        return self._try_cache("changed_files", cache_changed_files)
+
     @property
     def changed_files_stats(self):
         def cache_changed_files_stats():
@@ -419,28 +864,42 @@ class StagedLocalGitCommit(GitCommit, PropertyCache):
     information.
     """
 
-    def __init__(self, context, commit_message):
+    def __init__(self, context, commit_message, mailmap=False):
         PropertyCache.__init__(self)
         self.context = context
         self.message = commit_message
         self.sha = None
         self.parents = []  # Not really possible to determine before a commit
+        self.mailmap = mailmap
 
-    @property
-    @cache
-    def author_name(self):
+    def _git_config(self, key):
         try:
-            return _git("config", "--get", "user.name", _cwd=self.context.repository_path).strip()
+            return _git("config", "--get", key, _cwd=self.context.repository_path).strip()
         except GitExitCodeError as e:
-            raise GitContextError("Missing git configuration: please set user.name") from e
+            raise GitContextError(f"Missing git configuration: please set {key}") from e
+
+    def _canonical_author(self):
+        """Determines the author from the git config, applying the repository's mailmap like `git log --pretty=%aN`
+        will once the commit is made."""
+        name, email = self._git_config("user.name"), self._git_config("user.email")
+        self._cache["author_name"], self._cache["author_email"] = self.context.canonical_identity(name, email)
+
+    def _author(self, field):
+        def cache_author():
+            if self.mailmap:
+                self._canonical_author()
+            else:
+                self._cache[f"author_{field}"] = self._git_config(f"user.{field}")
+
+        return self._try_cache(f"author_{field}", cache_author)
+
+    @property
+    def author_name(self):
+        return self._author("name")
 
     @property
-    @cache
     def author_email(self):
-        try:
-            return _git("config", "--get", "user.email", _cwd=self.context.repository_path).strip()
-        except GitExitCodeError as e:
-            raise GitContextError("Missing git configuration: please set user.email") from e
+        return self._author("email")
 
     @property
     @cache
@@ -464,3 +923,31 @@ class StagedLocalGitCommit(GitCommit, PropertyCache):
             self._cache["changed_files_stats"] = _parse_git_changed_file_stats(changed_files_stats_raw)
 
         return self._try_cache("changed_files_stats", cache_changed_files_stats)
+
+
+@dataclass
+class GitTag(GitCommit):
+    """Class representing an annotated git tag. Tags are linted like commits: the tag message is the commit message,
+    the tagger is the author, the tag date is the date and the sha is the object name of the tag (not of the tagged
+    commit). Tags don't have parents, changed files or branches."""
+
+    name: str = ""
+
+    @property
+    def is_merge_commit(self) -> bool:
+        return False
+
+
+def iter_prefetched(
+    commits: Sequence["GitCommit"], fields: Iterable[str], deadline: Optional[float] = None
+) -> Iterator["GitCommit"]:
+    """Yields the given commits, prefetching the given fields (see `GitContext.prefetch()`) for batches of at most
+    PREFETCH_BATCH_SIZE commits before they're yielded. Fields for a single commit are not prefetched, as that
+    doesn't save any git calls. Once the `deadline` (a `time.monotonic()` value) has passed, batches are no longer
+    prefetched, so that callers that stop at the deadline don't wait for data of commits they won't lint."""
+    fields = frozenset(fields)
+    for start in range(0, len(commits), PREFETCH_BATCH_SIZE):
+        batch = commits[start : start + PREFETCH_BATCH_SIZE]
+        if len(commits) > 1 and (deadline is None or time.monotonic() <= deadline):
+            batch[0].context.prefetch(fields, batch)
+        yield from batch
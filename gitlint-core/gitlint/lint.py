@@ -1,14 +1,16 @@
 import logging
+import time
 from dataclasses import dataclass, field
-from typing import List
+from typing import Any, FrozenSet, List, Optional, Sequence, Set, Union
 
 from gitlint import rules as gitlint_rules
 from gitlint.config import LintConfig
 from gitlint.deprecation import Deprecation
 from gitlint.display import Display
+from gitlint.git import COMMIT_FIELD_MESSAGE, COMMIT_FIELD_PARENTS, GitCommit
+from gitlint.observers import Observer, active_observers
 
 LOG = logging.getLogger(__name__)
-logging.basicConfig()
 
 
 @dataclass
@@ -18,7 +20,7 @@ class GitLinter:
     config: LintConfig
     display: Display = field(init=False)
 
-    def __post_init__(self):
+    def __post_init__(self) -> None:
         self.display = Display(self.config)
 
     def should_ignore_rule(self, rule: gitlint_rules.Rule) -> bool:
@@ -26,7 +28,7 @@ class GitLinter:
         return rule.id in self.config.ignore or rule.name in self.config.ignore
 
     @property
-    def configuration_rules(self):
+    def configuration_rules(self) -> List[gitlint_rules.ConfigurationRule]:
         return [
             rule
             for rule in self.config.rules
@@ -34,7 +36,7 @@ class GitLinter:
         ]
 
     @property
-    def title_line_rules(self):
+    def title_line_rules(self) -> List[gitlint_rules.LineRule]:
         return [
             rule
             for rule in self.config.rules
@@ -44,7 +46,7 @@ class GitLinter:
         ]
 
     @property
-    def body_line_rules(self):
+    def body_line_rules(self) -> List[gitlint_rules.LineRule]:
         return [
             rule
             for rule in self.config.rules
@@ -54,21 +56,55 @@ class GitLinter:
         ]
 
     @property
-    def commit_rules(self):
+    def commit_rules(self) -> List[gitlint_rules.CommitRule]:
         return [
             rule
             for rule in self.config.rules
             if isinstance(rule, gitlint_rules.CommitRule) and not self.should_ignore_rule(rule)
         ]
 
+    @property
+    def required_fields(self) -> FrozenSet[str]:
+        """Commit fields (gitlint.git.COMMIT_FIELD_*) required to lint commits: the fields required by the enabled
+        rules, as well as the message and parents which are always required to determine the commit type (and
+        commit specific config). Fields used by rules that don't declare their required fields are retrieved lazily."""
+        fields = {COMMIT_FIELD_MESSAGE, COMMIT_FIELD_PARENTS}
+        for rule in self.config.rules:
+            if rule.required_fields and not self.should_ignore_rule(rule):
+                fields.update(rule.required_fields)
+        return frozenset(fields)
+
     @staticmethod
-    def _apply_line_rules(lines, commit, rules, line_nr_start):
+    def _validate(
+        rule: Union[gitlint_rules.LineRule, gitlint_rules.CommitRule],
+        observers: Sequence[Observer],
+        commit: GitCommit,
+        *args: Any,
+    ) -> Optional[List[gitlint_rules.RuleViolation]]:
+        """Validates a rule, notifying observers (if any) of its duration and violations"""
+        if not observers:
+            return rule.validate(*args)
+        start = time.perf_counter()
+        violations = rule.validate(*args)
+        duration = time.perf_counter() - start
+        for observer in observers:
+            observer.on_rule(rule, commit, duration, violations)
+        return violations
+
+    @staticmethod
+    def _apply_line_rules(
+        lines: List[str],
+        commit: GitCommit,
+        rules: List[gitlint_rules.LineRule],
+        line_nr_start: int,
+        observers: Sequence[Observer] = (),
+    ) -> List[gitlint_rules.RuleViolation]:
         """Iterates over the lines in a given list of lines and validates a given list of rules against each line"""
         all_violations = []
         line_nr = line_nr_start
         for line in lines:
             for rule in rules:
-                violations = rule.validate(line, commit)
+                violations = GitLinter._validate(rule, observers, commit, line, commit)
                 if violations:
                     for violation in violations:
                         violation.line_nr = line_nr
@@ -77,43 +113,171 @@ class GitLinter:
         return all_violations
 
     @staticmethod
-    def _apply_commit_rules(rules, commit):
+    def _apply_commit_rules(
+        rules: List[gitlint_rules.CommitRule], commit: GitCommit, observers: Sequence[Observer] = ()
+    ) -> List[gitlint_rules.RuleViolation]:
         """Applies a set of rules against a given commit and gitcontext"""
         all_violations = []
         for rule in rules:
-            violations = rule.validate(commit)
+            violations = GitLinter._validate(rule, observers, commit, commit)
             if violations:
                 all_violations.extend(violations)
         return all_violations
 
-    def lint(self, commit):
-        """Lint the last commit in a given git context by applying all ignore, title, body and commit rules."""
+    def lint(self, commit: GitCommit, max_violations: Optional[int] = None) -> List[gitlint_rules.RuleViolation]:
+        """Lint the last commit in a given git context by applying all ignore, title, body and commit rules.
+        When max_violations is set (defaults to the fail-fast general option, 0 means no maximum), rules are applied
+        cheapest-first and linting stops as soon as that many violations have been found."""
+        return GitLinter.lint_combined([self], commit, max_violations)
+
+    @staticmethod
+    def lint_combined(
+        linters: List["GitLinter"],
+        commit: GitCommit,
+        max_violations: Optional[int] = None,
+        observers: Optional[Sequence[Observer]] = None,
+    ) -> List[gitlint_rules.RuleViolation]:
+        """Lints a commit with multiple linters (typically with different configs) as if it were linted once:
+        observers are notified of the commit once and violations found by multiple linters are only returned once.
+        max_violations defaults to the fail-fast general option of the first linter. observers defaults to the
+        observers active in the current context, callers that lint many commits look those up once and pass them."""
+        if max_violations is None:
+            max_violations = linters[0].config.fail_fast
         LOG.debug("Linting commit %s", commit.sha or "[SHA UNKNOWN]")
-        LOG.debug("Commit Object\n" + str(commit))
+        # Pass commit as log argument, so it's only formatted (which triggers git calls for lazily loaded commit
+        # properties like changed files and branches) when debug logging is actually enabled
+        LOG.debug("Commit Object\n%s", commit)
 
-        # Ensure the Deprecation class has a reference to the config currently being used
-        Deprecation.config = self.config
+        # Only check once per commit whether there are any observers, so there's no overhead per rule when there aren't
+        if observers is None:
+            observers = active_observers()
+        if not observers:
+            return GitLinter._lint_combined(linters, commit, observers, max_violations)
 
-        # Apply config rules
-        for rule in self.configuration_rules:
-            rule.apply(self.config, commit)
+        for observer in observers:
+            observer.on_commit_start(commit)
+        start = time.perf_counter()
+        violations = GitLinter._lint_combined(linters, commit, observers, max_violations)
+        duration = time.perf_counter() - start
+        for observer in observers:
+            for violation in violations:
+                observer.on_violation(commit, violation)
+            observer.on_commit_end(commit, violations, duration)
+        return violations
 
-        # Skip linting if this is a special commit type that is configured to be ignored
+    @staticmethod
+    def _lint_combined(
+        linters: List["GitLinter"], commit: GitCommit, observers: Sequence[Observer], max_violations: int
+    ) -> List[gitlint_rules.RuleViolation]:
+        violations: List[gitlint_rules.RuleViolation] = []
+        for linter in linters:
+            # Ensure the Deprecation class uses the config currently being used (for the current thread only)
+            with Deprecation.use_config(linter.config):
+                remaining_violations = max_violations - len(violations) if max_violations else 0
+                for violation in linter._lint(commit, observers, remaining_violations):
+                    if violation not in violations:
+                        violations.append(violation)
+            if max_violations and len(violations) >= max_violations:
+                break
+        if len(linters) > 1:
+            violations.sort(key=lambda v: (-1 if v.line_nr is None else v.line_nr, v.rule_id))
+        return violations
+
+    def ignores(self, commit: GitCommit) -> bool:
+        """Returns whether linting the given commit doesn't apply any title, body or commit rules: because it's a
+        special commit type that is configured to be ignored, or because configuration rules (e.g. ignore-by-title)
+        ignore all rules for it."""
+        with Deprecation.use_config(self.config):
+            linter = self._apply_configuration_rules(commit.copy(), ())
+        if linter._is_ignored_commit_type(commit):
+            return True
+        return not (linter.title_line_rules or linter.body_line_rules or linter.commit_rules)
+
+    def _apply_configuration_rules(self, commit: GitCommit, observers: Sequence[Observer]) -> "GitLinter":
+        """Applies the configuration rules to the given commit and returns a linter to lint it with. Configuration rules
+        can modify the config (e.g. ignore-by-title ignores rules), so they're applied to a copy of the config: only
+        the general options they declare to modify are copied (see ConfigurationRule.modified_options). This way, the
+        config of this linter can safely be used to lint other commits as well (even concurrently)."""
+        configuration_rules = self.configuration_rules
+        modified_options: Set[str] = set()
+        for rule in configuration_rules:
+            if rule.modified_options is None:
+                linter = GitLinter(self.config.copy())
+                break
+            modified_options.update(rule.modified_options)
+        else:
+            linter = GitLinter(self.config.copy(modified_options)) if modified_options else self
+
+        for rule in configuration_rules:
+            if not observers:
+                rule.apply(linter.config, commit)
+                continue
+            start = time.perf_counter()
+            rule.apply(linter.config, commit)
+            duration = time.perf_counter() - start
+            for observer in observers:
+                observer.on_rule(rule, commit, duration, None)
+        return linter
+
+    def _is_ignored_commit_type(self, commit: GitCommit) -> bool:
         ignore_commit_types = ["merge", "squash", "fixup", "fixup_amend", "revert"]
         for commit_type in ignore_commit_types:
             if getattr(commit, f"is_{commit_type}_commit") and getattr(self.config, f"ignore_{commit_type}_commits"):
-                return []
+                return True
+        return False
 
-        violations = []
-        # determine violations by applying all rules
-        violations.extend(self._apply_line_rules([commit.message.title], commit, self.title_line_rules, 1))
-        violations.extend(self._apply_line_rules(commit.message.body, commit, self.body_line_rules, 2))
-        violations.extend(self._apply_commit_rules(self.commit_rules, commit))
+    def _lint(
+        self, commit: GitCommit, observers: Sequence[Observer], max_violations: int
+    ) -> List[gitlint_rules.RuleViolation]:
+        # Configuration rules can modify the commit message (e.g. ignore-body-lines), so we apply them to a copy of
+        # the commit. This way, the passed commit can safely be linted by other linters as well (even concurrently).
+        commit = commit.copy()
+
+        # Apply config rules, the returned linter has the resulting config
+        linter = self._apply_configuration_rules(commit, observers)
+
+        # Skip linting if this is a special commit type that is configured to be ignored
+        if linter._is_ignored_commit_type(commit):
+            return []
+
+        if max_violations:
+            violations = linter._apply_rules_fail_fast(commit, max_violations, observers)
+        else:
+            violations = []
+            # determine violations by applying all rules
+            violations.extend(
+                self._apply_line_rules([commit.message.title], commit, linter.title_line_rules, 1, observers)
+            )
+            violations.extend(self._apply_line_rules(commit.message.body, commit, linter.body_line_rules, 2, observers))
+            violations.extend(self._apply_commit_rules(linter.commit_rules, commit, observers))
 
         # Sort violations by line number and rule_id. If there's no line nr specified (=common certain commit rules),
         # we replace None with -1 so that it always get's placed first. Note that we need this to do this to support
         # python 3, as None is not allowed in a list that is being sorted.
         violations.sort(key=lambda v: (-1 if v.line_nr is None else v.line_nr, v.rule_id))
+        return violations[:max_violations] if max_violations else violations
+
+    def _apply_rules_fail_fast(
+        self, commit: GitCommit, max_violations: int, observers: Sequence[Observer]
+    ) -> List[gitlint_rules.RuleViolation]:
+        """Applies the title, body and commit rules one by one, cheapest rules first (see Rule.cost), until at least
+        max_violations violations have been found. This way, expensive rules (e.g. rules that need git to determine
+        the changed files) aren't applied to commits that already violate cheaper rules."""
+        rules = self.title_line_rules + self.body_line_rules + self.commit_rules
+        # sorted() is stable: rules with the same cost are applied in the regular order
+        rules = sorted(rules, key=lambda rule: rule.effective_cost)
+
+        violations = []
+        for rule in rules:
+            if isinstance(rule, gitlint_rules.CommitRule):
+                violations.extend(self._apply_commit_rules([rule], commit, observers))
+            elif rule.target == gitlint_rules.CommitMessageTitle:
+                violations.extend(self._apply_line_rules([commit.message.title], commit, [rule], 1, observers))
+            else:
+                violations.extend(self._apply_line_rules(commit.message.body, commit, [rule], 2, observers))
+            if len(violations) >= max_violations:
+                LOG.debug("Found %d violation(s), skipping remaining rules (fail-fast)", len(violations))
+                break
         return violations
 
     def print_violations(self, violations: List[gitlint_rules.RuleViolation]) -> None:
@@ -0,0 +1,179 @@
+"""
+Streaming parser for mbox files that contain patches, like the ones created by `git format-patch` (used by
+`gitlint batch --format mbox`).
+
+Mbox streams are parsed line by line and every patch is yielded as soon as the next patch starts, so arbitrarily large
+patch archives are processed in constant memory. Like `git am`, the commit message of a patch is its subject (without
+`[PATCH ...]` prefixes) followed by its body up to the `---` line that separates the message from the diffstat and
+the diff. The author and date are taken from the mail headers, the changed files and their stats from the diff.
+"""
+
+import codecs
+import contextlib
+import email.header
+import email.utils
+import re
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional
+
+from gitlint.git import GitChangedFileStats
+
+# 'From <sha> Mon Sep 17 00:00:00 2001' lines that start every patch in an mbox
+MBOX_FROM_LINE = re.compile(rb"^From (\S+) +\w{3} \w{3} +\d{1,2} \d{2}:\d{2}:\d{2} \d{4}\s*$")
+COMMIT_SHA = re.compile(r"^[0-9a-f]{40}([0-9a-f]{24})?$")
+# Like `git am`, '[PATCH n/m]'-like prefixes and reply prefixes are removed from subjects
+SUBJECT_PREFIX = re.compile(r"^(\s*(\[[^\]]*\]|re:))+\s*", re.IGNORECASE)
+CHARSET = re.compile(r"charset=\"?([^\";\s]+)", re.IGNORECASE)
+DIFF_HEADER = re.compile(r"^diff --git (\"?a/.*\"?) (\"?b/.*\"?)$")
+HUNK_HEADER = re.compile(r"^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@")
+# Headers that can be repeated at the start of the body, when they differ from the mail headers (e.g. when the patch
+# was sent by someone else than its author)
+IN_BODY_HEADERS = ("from", "date", "subject")
+MESSAGE_SEPARATOR = "---"
+DEFAULT_CHARSET = "utf-8"
+
+
+def _decode_header(value: str) -> str:
+    """Decodes RFC 2047 encoded words (e.g. '=?UTF-8?q?J=C3=B6hn?=') in a header value"""
+    return str(email.header.make_header(email.header.decode_header(value)))
+
+
+def _unquote_path(path: str) -> str:
+    """Unquotes a path as quoted by git in diff headers (C-style, with octal escapes for non-ASCII bytes) and removes
+    its 'a/' or 'b/' prefix."""
+    if path.startswith('"'):
+        path = path[1:-1].encode("latin-1", "backslashreplace").decode("unicode_escape").encode("latin-1").decode()
+    return path[2:]
+
+
+class MboxPatch:
+    """A single patch in an mbox stream, which is parsed line by line using `feed()`."""
+
+    def __init__(self, from_line_name: str):
+        # git format-patch puts the commit sha in the 'From ' line
+        self.sha = from_line_name if COMMIT_SHA.match(from_line_name) else None
+        self.headers: Dict[str, str] = {}
+        self.body: List[str] = []
+        self.charset = DEFAULT_CHARSET
+        self.changed_files_stats: Dict[str, GitChangedFileStats] = {}
+        self._state = "headers"
+        self._last_header: Optional[str] = None
+        self._current_file: Optional[GitChangedFileStats] = None
+        # Number of old and new lines of the current diff hunk that haven't been parsed yet
+        self._hunk_remaining = [0, 0]
+
+    def feed(self, raw_line: bytes) -> None:
+        if self._state == "headers":
+            self._feed_header(raw_line.decode(DEFAULT_CHARSET, "replace").rstrip("\r\n"))
+            return
+
+        line = raw_line.decode(self.charset, "replace").rstrip("\r\n")
+        if self._state == "message":
+            if line == MESSAGE_SEPARATOR:
+                self._state = "diff"
+            elif DIFF_HEADER.match(line):
+                self._state = "diff"
+                self._feed_diff(line)
+            else:
+                self.body.append(line)
+        else:
+            self._feed_diff(line)
+
+    def _feed_header(self, line: str) -> None:
+        if not line:
+            self._state = "message"
+            charset = CHARSET.search(self.headers.get("content-type", ""))
+            if charset:
+                # Unknown charsets are ignored, the patch is decoded as UTF-8 instead
+                with contextlib.suppress(LookupError):
+                    self.charset = codecs.lookup(charset.group(1)).name
+        elif line[0] in " \t" and self._last_header:  # Folded header
+            self.headers[self._last_header] += " " + line.strip()
+        elif ":" in line:
+            name, value = line.split(":", 1)
+            self._last_header = name.strip().lower()
+            self.headers.setdefault(self._last_header, value.strip())
+
+    def _feed_diff(self, line: str) -> None:
+        current_file = self._current_file
+        if self._hunk_remaining != [0, 0] and current_file is not None:
+            # Lines in a hunk are only counted when the hunk header says they're part of it, so that lines after the
+            # hunk (like the '-- ' signature separator at the end of a patch) aren't mistaken for deletions.
+            # Line stats are only None for binary files, which don't have hunks.
+            if line.startswith("+"):
+                current_file.additions = (current_file.additions or 0) + 1
+                self._hunk_remaining[1] -= 1
+            elif line.startswith("-"):
+                current_file.deletions = (current_file.deletions or 0) + 1
+                self._hunk_remaining[0] -= 1
+            elif not line.startswith("\\"):  # '\ No newline at end of file'
+                self._hunk_remaining = [self._hunk_remaining[0] - 1, self._hunk_remaining[1] - 1]
+            return
+
+        diff_header = DIFF_HEADER.match(line)
+        if diff_header:
+            path = _unquote_path(diff_header.group(2))
+            self._current_file = self.changed_files_stats[path] = GitChangedFileStats(path, 0, 0)
+        elif self._current_file is None:
+            return
+        elif line.startswith("@@"):
+            hunk_header = HUNK_HEADER.match(line)
+            if hunk_header:
+                old_lines, new_lines = hunk_header.groups()
+                self._hunk_remaining = [int(old_lines or 1), int(new_lines or 1)]
+        elif line == "GIT binary patch" or line.startswith("Binary files "):
+            # Like `git diff --numstat`, there are no line stats for binary files
+            self._current_file.additions = self._current_file.deletions = None
+
+    def record(self) -> Dict[str, Any]:
+        """Returns the patch as a record for `gitlint batch`: a dict with the commit 'message' and the 'sha',
+        'author_name', 'author_email', 'date' and 'changed_files_stats' of the patch (None when not known)."""
+        headers = dict(self.headers)
+        body = list(self.body)
+        # In-body headers, followed by an empty line
+        while body and ":" in body[0] and body[0].split(":", 1)[0].lower() in IN_BODY_HEADERS:
+            name, value = body.pop(0).split(":", 1)
+            headers[name.lower()] = value.strip()
+            if body and not body[0].strip():
+                body.pop(0)
+                break
+
+        while body and not body[0].strip():
+            body.pop(0)
+        while body and not body[-1].strip():
+            body.pop()
+
+        subject = SUBJECT_PREFIX.sub("", _decode_header(headers.get("subject", "")))
+        author_name, author_email = email.utils.parseaddr(_decode_header(headers.get("from", "")))
+        try:
+            date = email.utils.parsedate_to_datetime(headers["date"])
+        except (KeyError, TypeError, ValueError):
+            date = None
+
+        return {
+            "message": "\n".join([subject, "", *body]) if body else subject,
+            "sha": self.sha,
+            "author_name": author_name or None,
+            "author_email": author_email or None,
+            "date": date,
+            "changed_files_stats": self.changed_files_stats,
+        }
+
+
+def iter_mbox_records(stream: BinaryIO) -> Iterator[Dict[str, Any]]:
+    """Parses the patches in a binary mbox stream, yielding a record (see `MboxPatch.record()`) for every patch as
+    soon as it has been read. Lines before the first 'From ' line are ignored."""
+    patch = None
+    after_empty_line = True
+    for raw_line in stream:
+        # Like in the mbox format, 'From ' lines only start a new patch at the start of the stream or after an empty
+        # line, so that commit messages and diffs can contain lines like it
+        from_line = MBOX_FROM_LINE.match(raw_line) if after_empty_line else None
+        after_empty_line = not raw_line.strip()
+        if from_line:
+            if patch:
+                yield patch.record()
+            patch = MboxPatch(from_line.group(1).decode(DEFAULT_CHARSET, "replace"))
+        elif patch:
+            patch.feed(raw_line)
+    if patch:
+        yield patch.record()
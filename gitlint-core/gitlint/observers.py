@@ -0,0 +1,210 @@
+"""
+Instrumentation hooks for gitlint. Observers are notified when gitlint lints commits, validates rules, finds
+violations and calls git, which allows feeding gitlint's timings into other tools without patching gitlint internals.
+
+    class MyObserver(Observer):
+        def on_rule(self, rule, commit, duration, violations):
+            print(rule.id, duration)
+
+    with observe(MyObserver()):
+        ...  # lint commits
+
+Observers are registered for the current context (thread/async task) only. They're looked up once per lint run (and
+per git call), when no observers are registered rules are not timed at all.
+
+`gitlint --profile` (`gitlint.profiling.Profiler`), `gitlint --stats` (`gitlint.stats.RunStats`) and
+`gitlint --prometheus-textfile` (`PrometheusTextfileObserver`) are all implemented as observers.
+"""
+
+import os
+import tempfile
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from typing import Counter as CounterType
+
+from gitlint.utils import FILE_ENCODING
+
+if TYPE_CHECKING:
+    # Only imported for type checking, as the git module (imported by the rules module) imports this module
+    from gitlint.git import GitCommit
+    from gitlint.rules import Rule, RuleViolation
+
+# Global git options that take a separate value, see `command_type()`
+GIT_OPTIONS_WITH_VALUE = ("-C", "-c")
+
+# Observers registered for the current context
+ACTIVE_OBSERVERS: "ContextVar[Tuple[Observer, ...]]" = ContextVar("gitlint_active_observers", default=())
+
+
+class Observer:
+    """Base class for gitlint observers. All hooks are no-ops, subclasses override the ones they're interested in.
+    Hooks can be called from multiple threads concurrently when an observer is registered in multiple threads.
+    All durations are in seconds."""
+
+    def on_commit_start(self, commit: "GitCommit") -> None:
+        """Called before a commit is linted."""
+
+    def on_rule(
+        self, rule: "Rule", commit: "GitCommit", duration: float, violations: Optional[List["RuleViolation"]]
+    ) -> None:
+        """Called after a rule has been applied: `validate()` for line rules (once per line) and commit rules,
+        `apply()` for configuration rules (`violations` is None for those)."""
+
+    def on_violation(self, commit: "GitCommit", violation: "RuleViolation") -> None:
+        """Called for every violation that is reported for a commit (after all rules have been applied)."""
+
+    def on_commit_end(self, commit: "GitCommit", violations: List["RuleViolation"], duration: float) -> None:
+        """Called after a commit has been linted."""
+
+    def on_git_call(self, args: Sequence[str], duration: float, stdout_bytes: int, exit_code: int) -> None:
+        """Called after a git subprocess has finished. `args` includes the 'git' executable itself."""
+
+    def on_cache_lookup(self, cache_key: str, hit: bool) -> None:
+        """Called for every lookup of a lazily loaded (cached) property of a commit or git context."""
+
+    def on_cache_populate(self, cache_key: str, duration: float) -> None:
+        """Called after a lazily loaded property has been retrieved (typically from git) on a cache miss."""
+
+    def on_prefetch(self, kind: str, commits: int, duration: float) -> None:
+        """Called after data of multiple commits has been retrieved from git at once (see `GitContext.prefetch()`):
+        `kind` is 'log' (message, author, date and parents), 'changed_files' or 'changed_files_stats'."""
+
+
+def active_observers() -> Tuple[Observer, ...]:
+    """Returns the observers registered for the current context (an empty tuple if there are none)."""
+    return ACTIVE_OBSERVERS.get()
+
+
+@contextmanager
+def observe(*observers: Observer) -> Iterator[None]:
+    """Context manager that registers the given observers (in addition to already registered observers) for the
+    current context."""
+    token = ACTIVE_OBSERVERS.set(ACTIVE_OBSERVERS.get() + observers)
+    try:
+        yield
+    finally:
+        ACTIVE_OBSERVERS.reset(token)
+
+
+def command_type(args: Sequence[str]) -> str:
+    """Returns the type of a command used for accounting: the git subcommand (e.g. 'log' for
+    `git log -1 --pretty=...` and `git -C <path> log`) or the executable for non-git commands. Global git options
+    with a value (`-C <path>`, `-c <name>=<value>`) are skipped, so that there's a bounded number of command types."""
+    if len(args) > 1 and args[0] == "git":
+        index = 1
+        while index + 2 < len(args) and args[index] in GIT_OPTIONS_WITH_VALUE:
+            index += 2
+        return args[index]
+    return args[0]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+class PrometheusTextfileObserver(Observer):
+    """Collects metrics and writes them to a file in the Prometheus text exposition format, e.g. to be picked up by
+    the node_exporter textfile collector. `write()` replaces the file atomically."""
+
+    def __init__(self, path: str, prefix: str = "gitlint"):
+        self.path = path
+        self.prefix = prefix
+        self.commits = 0
+        self.commit_duration = 0.0
+        self.violations: CounterType[str] = Counter()
+        self.rule_calls: CounterType[str] = Counter()
+        self.rule_duration: Dict[str, float] = defaultdict(float)
+        self.git_calls: CounterType[str] = Counter()
+        self.git_duration: Dict[str, float] = defaultdict(float)
+        self.git_stdout_bytes: CounterType[str] = Counter()
+        self._lock = threading.Lock()
+
+    def on_commit_end(self, _commit, _violations, duration):
+        with self._lock:
+            self.commits += 1
+            self.commit_duration += duration
+
+    def on_rule(self, rule, _commit, duration, _violations):
+        with self._lock:
+            self.rule_calls[rule.id] += 1
+            self.rule_duration[rule.id] += duration
+
+    def on_violation(self, _commit, violation):
+        with self._lock:
+            self.violations[violation.rule_id] += 1
+
+    def on_git_call(self, args, duration, stdout_bytes, _exit_code):
+        command = command_type(args)
+        with self._lock:
+            self.git_calls[command] += 1
+            self.git_duration[command] += duration
+            self.git_stdout_bytes[command] += stdout_bytes
+
+    def _counter(
+        self,
+        lines: List[str],
+        name: str,
+        help_text: str,
+        samples: Union[float, Mapping[str, float]],
+        label: Optional[str] = None,
+    ) -> None:
+        """Appends a counter to the given lines. `samples` is a single value, or a {label value: value} dict when a
+        label name is passed."""
+        full_name = f"{self.prefix}_{name}"
+        lines.extend([f"# HELP {full_name} {help_text}", f"# TYPE {full_name} counter"])
+        if label is None or not isinstance(samples, Mapping):
+            lines.append(f"{full_name} {samples}")
+            return
+        for label_value, value in sorted(samples.items()):
+            lines.append(f'{full_name}{{{label}="{_escape_label_value(label_value)}"}} {value}')
+
+    def render(self) -> str:
+        """Returns the collected metrics in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self._lock:
+            self._counter(lines, "commits_total", "Number of linted commits.", self.commits)
+            self._counter(lines, "commit_duration_seconds_total", "Time spent linting commits.", self.commit_duration)
+            self._counter(lines, "violations_total", "Number of violations per rule.", self.violations, "rule")
+            self._counter(lines, "rule_calls_total", "Number of rule invocations.", self.rule_calls, "rule")
+            self._counter(
+                lines, "rule_duration_seconds_total", "Time spent in rule invocations.", self.rule_duration, "rule"
+            )
+            self._counter(lines, "git_calls_total", "Number of git calls.", self.git_calls, "command")
+            self._counter(
+                lines, "git_duration_seconds_total", "Wall time spent in git calls.", self.git_duration, "command"
+            )
+            self._counter(
+                lines,
+                "git_stdout_bytes_total",
+                "Bytes read from the stdout of git calls.",
+                self.git_stdout_bytes,
+                "command",
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self) -> None:
+        """Writes the collected metrics to `path`. The file is replaced atomically, so that readers (like the
+        node_exporter textfile collector) never see a partially written file."""
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".gitlint-metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding=FILE_ENCODING) as metrics_file:
+                metrics_file.write(self.render())
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,172 @@
+"""
+Profiling support for gitlint (`gitlint --profile`): collects timing and violation statistics per rule, as well as
+the time spent retrieving commit properties from git (lazily per commit, or prefetched for many commits at once).
+
+Profiling is enabled by activating a `Profiler` for the current context:
+
+    profiler = Profiler()
+    with profiler.activate():
+        ...  # lint commits
+    print(profiler.report())
+
+`Profiler` is an observer (see `gitlint.observers`), its `activate()` method registers it for the current context.
+"""
+
+import math
+import random
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional
+
+from gitlint.observers import Observer, observe
+
+if TYPE_CHECKING:
+    from gitlint.rules import Rule, RuleViolation
+
+PERCENTILES = (50, 95, 99)
+# Maximum number of durations that are kept per profiled item to determine percentiles
+MAX_SAMPLES = 1000
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Returns the given percentile of a sorted list of values, using the nearest-rank method."""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(percent / 100 * len(sorted_values)), 1)
+    return sorted_values[rank - 1]
+
+
+@dataclass
+class TimingStats:
+    """Call count, durations (in seconds) and violation count for a single profiled item (a rule, a git fetch).
+    The call count, total and maximum duration are exact. Percentiles are determined from at most MAX_SAMPLES
+    durations: once more durations have been recorded, a uniform random sample of them is kept (reservoir sampling),
+    so that memory usage doesn't grow with the number of linted commits."""
+
+    name: str
+    calls: int = 0
+    total: float = 0.0
+    max_duration: float = 0.0
+    violations: int = 0
+    samples: List[float] = field(default_factory=list, repr=False)
+
+    def add(self, duration: float) -> None:
+        self.calls += 1
+        self.total += duration
+        self.max_duration = max(self.max_duration, duration)
+        if len(self.samples) < MAX_SAMPLES:
+            self.samples.append(duration)
+            return
+        index = random.randrange(self.calls)
+        if index < MAX_SAMPLES:
+            self.samples[index] = duration
+
+    def percentiles(self) -> Dict[int, float]:
+        sorted_durations = sorted(self.samples)
+        return {percent: percentile(sorted_durations, percent) for percent in PERCENTILES}
+
+    def as_dict(self) -> Dict[str, Any]:
+        stats: Dict[str, Any] = {"name": self.name, "calls": self.calls, "total": self.total}
+        stats["violations"] = self.violations
+        stats["mean"] = self.total / self.calls if self.calls else 0.0
+        stats["max"] = self.max_duration
+        stats.update({f"p{percent}": value for percent, value in self.percentiles().items()})
+        return stats
+
+
+class Profiler(Observer):
+    """Collects profiling statistics. Thread-safe: a single profiler can be active in multiple threads."""
+
+    def __init__(self) -> None:
+        self.rules: Dict[str, TimingStats] = {}
+        self.git_fetches: Dict[str, TimingStats] = {}
+        self.commits = 0
+        self.start_time = time.perf_counter()
+        self.end_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator["Profiler"]:
+        """Context manager that activates this profiler for the current context."""
+        try:
+            with observe(self):
+                yield self
+        finally:
+            self.end_time = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    def record_commit(self) -> None:
+        with self._lock:
+            self.commits += 1
+
+    def record_rule(self, rule: "Rule", duration: float, violations: Optional[List["RuleViolation"]] = None) -> None:
+        """Records a single rule invocation (`validate` for line and commit rules, `apply` for configuration rules)."""
+        with self._lock:
+            stats = self.rules.get(rule.id)
+            if stats is None:
+                stats = self.rules[rule.id] = TimingStats(rule.name)
+            stats.add(duration)
+            stats.violations += len(violations) if violations else 0
+
+    def record_git_fetch(self, cache_key: str, duration: float) -> None:
+        """Records the retrieval of a lazily loaded property (e.g. a commit's message or branches) from git, or of
+        prefetched commit data (e.g. 'log (prefetch)')."""
+        with self._lock:
+            stats = self.git_fetches.get(cache_key)
+            if stats is None:
+                stats = self.git_fetches[cache_key] = TimingStats(cache_key)
+            stats.add(duration)
+
+    def on_commit_start(self, _commit):
+        self.record_commit()
+
+    def on_rule(self, rule, _commit, duration, violations):
+        self.record_rule(rule, duration, violations)
+
+    def on_cache_populate(self, cache_key, duration):
+        self.record_git_fetch(cache_key, duration)
+
+    def on_prefetch(self, kind, _commits, duration):
+        self.record_git_fetch(f"{kind} (prefetch)", duration)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "commits": self.commits,
+                "elapsed": self.elapsed,
+                "rules": {rule_id: stats.as_dict() for rule_id, stats in self.rules.items()},
+                "git_fetches": {key: stats.as_dict() for key, stats in self.git_fetches.items()},
+            }
+
+    def dump_json(self, path: str) -> None:
+        import json
+
+        with open(path, "w", encoding="UTF-8") as json_file:
+            json.dump(self.as_dict(), json_file, indent=2, ensure_ascii=False)
+
+    def report(self) -> str:
+        """Returns a human readable summary table, sorted by the total time spent per rule and git fetch (all times in
+        milliseconds)."""
+        stats = self.as_dict()
+        lines = [
+            f"gitlint profile: {stats['commits']} commit(s) linted in {stats['elapsed'] * 1000:.2f}ms (times in ms)"
+        ]
+        for title, items in [("Rule", stats["rules"]), ("Git fetch", stats["git_fetches"])]:
+            if not items:
+                continue
+            header = f"{title:<40} {'Calls':>7} {'Total':>10} {'Mean':>8}"
+            header += "".join(f" {f'p{percent}':>8}" for percent in PERCENTILES)
+            header += f" {'Violations':>10}" if title == "Rule" else ""
+            lines.extend(["", header, "-" * len(header)])
+            for key, item in sorted(items.items(), key=lambda item: float(item[1]["total"]), reverse=True):
+                label = f"{key} {item['name']}" if key != item["name"] else key
+                line = f"{label:<40} {item['calls']:>7} {item['total'] * 1000:>10.3f} {item['mean'] * 1000:>8.3f}"
+                line += "".join(f" {item[f'p{percent}'] * 1000:>8.3f}" for percent in PERCENTILES)
+                line += f" {item['violations']:>10}" if title == "Rule" else ""
+                lines.append(line)
+        return "\n".join(lines)
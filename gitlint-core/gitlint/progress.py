@@ -0,0 +1,93 @@
+"""
+Live progress reporting for linting large commit ranges (`gitlint --progress`). Progress is shown on a single stderr
+line that is redrawn in place, so it's only shown when stderr is a terminal.
+"""
+
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, Dict, Optional, TextIO
+
+from gitlint.observers import Observer
+
+# Minimum time (in seconds) between progress line updates
+DEFAULT_REFRESH_INTERVAL = 0.2
+
+# Carriage return + ANSI "erase line" escape sequence
+CLEAR_LINE = "\r\x1b[K"
+
+
+def format_duration(seconds: float) -> str:
+    """Formats a number of seconds as H:MM:SS."""
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+
+class ProgressObserver(Observer):
+    """Observer that displays the number of linted commits out of `total`, the throughput, ETA and the rule that
+    has taken the most time so far. The progress line is redrawn at most once per `refresh_interval` seconds.
+    Meant to be used when linting commits from a single thread."""
+
+    def __init__(
+        self,
+        total: int,
+        stream: Optional[TextIO] = None,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.total = total
+        self.stream = stream or sys.stderr
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self.commits = 0
+        self.rule_durations: Dict[str, float] = defaultdict(float)
+        self.start_time = clock()
+        self._last_refresh: Optional[float] = None
+        self._visible = False
+
+    @staticmethod
+    def is_supported(stream: Optional[TextIO] = None) -> bool:
+        """Progress is only shown on terminals: the progress line is redrawn in place using control characters."""
+        stream = stream or sys.stderr
+        return hasattr(stream, "isatty") and stream.isatty()
+
+    def on_rule(self, rule, _commit, duration, _violations):
+        self.rule_durations[rule.id] += duration
+
+    def on_commit_end(self, _commit, _violations, _duration):
+        self.commits += 1
+        now = self.clock()
+        if self._last_refresh is None or now - self._last_refresh >= self.refresh_interval or self.done:
+            self._last_refresh = now
+            self.render(now)
+
+    @property
+    def done(self) -> bool:
+        return self.commits >= self.total
+
+    def status_line(self, now: Optional[float] = None) -> str:
+        elapsed = (self.clock() if now is None else now) - self.start_time
+        rate = self.commits / elapsed if elapsed > 0 else 0.0
+        width = len(str(self.total))
+        percent = 100 * self.commits / self.total if self.total else 100
+        parts = [f"[{self.commits:>{width}}/{self.total}] {percent:5.1f}%", f"{rate:.1f} commits/s"]
+        if rate > 0 and not self.done:
+            parts.append(f"ETA {format_duration((self.total - self.commits) / rate)}")
+        if self.rule_durations:
+            slowest_rule, duration = max(self.rule_durations.items(), key=lambda item: item[1])
+            parts.append(f"slowest rule: {slowest_rule} ({duration * 1000:.1f}ms)")
+        return "gitlint: " + ", ".join(parts)
+
+    def render(self, now: Optional[float] = None) -> None:
+        self.stream.write(CLEAR_LINE + self.status_line(now))
+        self.stream.flush()
+        self._visible = True
+
+    def clear(self) -> None:
+        """Removes the progress line (if shown), so other output can be written to the stream. The progress line is
+        redrawn on the next refresh."""
+        if self._visible:
+            self.stream.write(CLEAR_LINE)
+            self.stream.flush()
+            self._visible = False
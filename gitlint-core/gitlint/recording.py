@@ -0,0 +1,151 @@
+"""
+Recording and replaying git calls (`gitlint --git-record` and `gitlint --git-replay`), to benchmark gitlint itself.
+
+Most of gitlint's runtime is usually spent waiting for git, which makes timings noisy and hides the cost of gitlint's
+own work (building configs, applying rules, printing violations). A `GitRecorder` runs git as usual and records every
+git call and its output, which are saved to a gzip-compressed JSON file. A `GitReplayer` serves the outputs of a
+recording from memory without starting any git processes, so the same gitlint invocation can be benchmarked
+deterministically against a captured repository, also on machines that don't have the repository.
+
+    recorder = GitRecorder()
+    with use_git_backend(recorder):
+        ...  # lint commits
+    recorder.save("gitlint-git.json.gz")
+
+    with use_git_backend(GitReplayer.load("gitlint-git.json.gz")):
+        ...  # lint the same commits, without running git
+
+Calls are identified by their arguments, stdin and working directory (relative to the current directory, so that
+recordings can be replayed from another location with the same layout). Calls that are made multiple times are replayed
+in the order they were recorded, the last output is repeated when a call is made more often than it was recorded.
+"""
+
+import gzip
+import json
+import os
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from gitlint import shell as sh
+from gitlint.git import GIT_BACKEND, GitContextError
+from gitlint.shell import ErrorReturnCode, ShResult
+from gitlint.utils import FILE_ENCODING, TERMINAL_ENCODING
+
+RECORDING_FORMAT_VERSION = 1
+
+# (working directory, git arguments, stdin) of a git call
+CallKey = Tuple[Optional[str], Tuple[str, ...], Optional[str]]
+
+
+class GitReplayError(GitContextError):
+    pass
+
+
+def _call_key(command_parts: Iterable[str], kwargs: Dict[str, Any]) -> CallKey:
+    cwd = kwargs.get("_cwd")
+    return (os.path.relpath(cwd) if cwd is not None else None, tuple(command_parts), kwargs.get("_in"))
+
+
+class GitRecorder:
+    """Runs git commands using `gitlint.shell` and records their outputs (also for non-zero exit codes).
+    Thread-safe: a single recorder can be used by multiple threads."""
+
+    def __init__(self) -> None:
+        self.calls: Dict[CallKey, Deque[ShResult]] = {}
+        self._lock = threading.Lock()
+
+    def git(self, *command_parts: str, **kwargs: Any) -> ShResult:
+        try:
+            result = sh.git(*command_parts, **kwargs)
+        except ErrorReturnCode as e:
+            self._record(command_parts, kwargs, ShResult(e.full_cmd, e.stdout, e.stderr, e.exit_code))
+            raise
+        self._record(command_parts, kwargs, result)
+        return result
+
+    def _record(self, command_parts: Tuple[str, ...], kwargs: Dict[str, Any], result: ShResult) -> None:
+        with self._lock:
+            self.calls.setdefault(_call_key(command_parts, kwargs), deque()).append(result)
+
+    def save(self, path: str) -> None:
+        """Writes the recorded calls to a gzip-compressed JSON file."""
+        with self._lock:
+            calls = [
+                {
+                    "cwd": cwd,
+                    "args": list(args),
+                    "stdin": stdin,
+                    "results": [
+                        {"stdout": result.stdout, "stderr": _decode(result.stderr), "exit_code": result.exit_code}
+                        for result in results
+                    ],
+                }
+                for (cwd, args, stdin), results in self.calls.items()
+            ]
+        with gzip.open(path, "wt", encoding=FILE_ENCODING) as recording:
+            json.dump({"version": RECORDING_FORMAT_VERSION, "calls": calls}, recording, separators=(",", ":"))
+
+
+def _decode(stderr: Union[str, bytes]) -> str:
+    # Like `sh`, `gitlint.shell` doesn't decode stderr
+    return stderr.decode(TERMINAL_ENCODING, "replace") if isinstance(stderr, bytes) else stderr
+
+
+class GitReplayer:
+    """Serves the outputs of recorded git calls from memory, without running git. Calls that weren't recorded raise a
+    `GitReplayError`. Thread-safe: a single replayer can be used by multiple threads."""
+
+    def __init__(self, calls: Dict[CallKey, Deque[ShResult]], path: str = "recording") -> None:
+        self.calls = calls
+        self.path = path
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def load(path: str) -> "GitReplayer":
+        """Loads a recording that was saved using `GitRecorder.save()`."""
+        try:
+            with gzip.open(path, "rt", encoding=FILE_ENCODING) as recording:
+                data = json.load(recording)
+            if data.get("version") != RECORDING_FORMAT_VERSION:
+                raise ValueError(f"unsupported version {data.get('version')}")
+            calls = {}
+            for call in data["calls"]:
+                key = (call["cwd"], tuple(call["args"]), call["stdin"])
+                full_cmd = " ".join(["git", *key[1]])
+                calls[key] = deque(
+                    ShResult(
+                        full_cmd, result["stdout"], result["stderr"].encode(TERMINAL_ENCODING), result["exit_code"]
+                    )
+                    for result in call["results"]
+                )
+        except KeyError as e:
+            raise GitReplayError(f"{path} is not a valid git recording: missing {e}") from e
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            raise GitReplayError(f"{path} is not a valid git recording: {e}") from e
+        return GitReplayer(calls, path)
+
+    def git(self, *command_parts: str, **kwargs: Any) -> ShResult:
+        key = _call_key(command_parts, kwargs)
+        with self._lock:
+            results = self.calls.get(key)
+            if not results:
+                location = f" in {key[0]}" if key[0] is not None else ""
+                raise GitReplayError(f"'{' '.join(['git', *command_parts])}'{location} is not part of {self.path}.")
+            result = results.popleft() if len(results) > 1 else results[0]
+
+        # Same semantics as `gitlint.shell.git`: only exit codes in _ok_code (0 by default) are not an error
+        if result.exit_code in kwargs.get("_ok_code", [0]):
+            return result
+        raise ErrorReturnCode(result.full_cmd, result.stdout, result.stderr, result.exit_code)
+
+
+@contextmanager
+def use_git_backend(backend: Union[GitRecorder, GitReplayer]) -> Iterator[None]:
+    """Context manager that runs all git calls in the current context using the given recorder or replayer."""
+    token = GIT_BACKEND.set(backend.git)
+    try:
+        yield
+    finally:
+        GIT_BACKEND.reset(token)
@@ -0,0 +1,127 @@
+"""
+Linting many repositories in a single gitlint invocation, used by `gitlint repos` and `--recurse-submodules`.
+
+Repositories are linted concurrently by a bounded pool of worker threads: most of the time is spent waiting for git
+subprocesses, so threads parallelize well in spite of the GIL. Building a config (parsing config files, loading rules
+and plugins) is relatively expensive, so configs are built once per distinct config file and the resulting linter is
+shared by all repositories whose config files are identical.
+"""
+
+import concurrent.futures
+import contextvars
+import hashlib
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from gitlint.api import Linter, LintResult
+from gitlint.config import LintConfigBuilder
+from gitlint.exception import GitlintError
+from gitlint.git import git_submodule_updates
+
+REPOSITORY_CONFIG_FILE = ".gitlint"
+DEFAULT_JOBS = 4
+
+
+@dataclass
+class RepositoryTarget:
+    """A repository to lint and the range of commits to lint in it (the last commit if not specified)."""
+
+    path: str
+    refspec: Optional[str] = None
+    # Name to display the repository with, its path if not specified
+    name: Optional[str] = None
+
+
+@dataclass
+class RepositoryResult:
+    """The results of linting a repository. When linting fails (e.g. because of an invalid range or config file),
+    `error` is set and `results` only contains the commits that were linted before the failure."""
+
+    target: RepositoryTarget
+    linter: Optional[Linter] = None
+    results: List[LintResult] = field(default_factory=list)
+    error: Optional[GitlintError] = None
+
+
+class LinterCache:
+    """Builds the linters for repositories, from the repository's `.gitlint` file or from a config file that is shared
+    by all repositories (`config_path`). Options set in `overrides` (typically the ones set via the command-line) take
+    precedence over config files. Repositories whose config files have identical contents share a single linter,
+    unless directory configs are enabled: those are looked up in the repository itself. Thread-safe."""
+
+    def __init__(self, overrides: Optional[LintConfigBuilder] = None, config_path: Optional[str] = None):
+        self.overrides = overrides or LintConfigBuilder()
+        self.config_path = config_path
+        self._linters: Dict[Tuple[Optional[str], Optional[str]], Linter] = {}
+        self._lock = threading.Lock()
+
+    def linter(self, repository_path: str) -> Linter:
+        config_path = self.config_path or os.path.join(repository_path, REPOSITORY_CONFIG_FILE)
+        digest = None
+        if os.path.isfile(config_path):
+            with open(config_path, "rb") as config_file:
+                digest = hashlib.sha256(config_file.read()).hexdigest()
+
+        with self._lock:
+            linter = self._linters.get((digest, None)) or self._linters.get((digest, repository_path))
+            if linter is None:
+                config_builder = LintConfigBuilder()
+                if digest is not None:
+                    config_builder.set_from_config_file(config_path)
+                config_builder.set_config_from_builder(self.overrides)
+                # The target of a shared config is the first repository that uses it, it's only used to look up
+                # directory configs (which are never shared)
+                config_builder.set_option("general", "target", repository_path)
+                linter = Linter(config_builder, config_overrides=self.overrides)
+                shared_by = None if linter.directory_configs is None else repository_path
+                self._linters[(digest, shared_by)] = linter
+            return linter
+
+
+def submodule_targets(
+    repository_path: str, refspec: str, paths: Optional[Sequence[str]] = None, first_parent: bool = False
+) -> List[RepositoryTarget]:
+    """Returns targets to lint the submodule commits that the submodule updates in `refspec` pull in (i.e. old..new
+    in every updated submodule), sorted by submodule path. See `gitlint.git.git_submodule_updates`."""
+    updates = git_submodule_updates(repository_path, refspec, paths, first_parent)
+    return [
+        RepositoryTarget(os.path.join(repository_path, path), f"{old_sha}..{new_sha}", name=path)
+        for path, (old_sha, new_sha) in sorted(updates.items())
+    ]
+
+
+def lint_repository(target: RepositoryTarget, linters: LinterCache) -> RepositoryResult:
+    """Lints the commits in the range of the given repository, using the linter for the repository from `linters`."""
+    result = RepositoryResult(target)
+    try:
+        result.linter = linters.linter(target.path)
+        for lint_result in result.linter.lint_range(target.path, target.refspec):
+            result.results.append(lint_result)
+    except GitlintError as e:
+        result.error = e
+    return result
+
+
+def _lint_repository_in_context(
+    context: contextvars.Context, target: RepositoryTarget, linters: LinterCache
+) -> RepositoryResult:
+    """Runs `lint_repository()` in the given context (submitting `context.run` itself can't be type checked)."""
+    return context.run(lint_repository, target, linters)
+
+
+def lint_repositories(
+    targets: Iterable[RepositoryTarget], linters: LinterCache, jobs: int = DEFAULT_JOBS
+) -> Iterator[RepositoryResult]:
+    """Lints the given repositories using a pool of `jobs` worker threads, yielding a result per repository in the
+    order of `targets` (as soon as the repository and all repositories before it have been linted)."""
+    with concurrent.futures.ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="gitlint-repos") as executor:
+        # Worker threads don't inherit context variables, run every task in a copy of the current context so that
+        # active observers (stats, profiling, ...) also observe the commits linted by the workers
+        futures = [
+            executor.submit(_lint_repository_in_context, contextvars.copy_context(), target, linters)
+            for target in targets
+        ]
+        for future in futures:
+            yield future.result()
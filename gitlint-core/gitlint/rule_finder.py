@@ -3,9 +3,78 @@ import importlib
 import inspect
 import os
 import sys
-from typing import List, Type
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple, Type
 
-from gitlint import options, rules
+from gitlint import metadata, options, rules
+
+# Entry point group under which installed python packages can register gitlint rules.
+# The entry point name is the rule id, optionally followed by a slash and the rule name (e.g. 'UC1/my-rule-name'),
+# the entry point value points to the rule class (e.g. 'my_package.my_module:MyRuleClass').
+# This allows gitlint to match rule ids and names against the config without importing the rule modules.
+RULE_ENTRY_POINT_GROUP = "gitlint.rules"
+RULE_ENTRY_POINT_NAME_SEPARATOR = "/"
+
+
+@dataclass(frozen=True)
+class RuleEntryPoint:
+    """Class representing a rule that is registered under the gitlint.rules entry point group.
+    The rule class itself is only imported when calling `load()`."""
+
+    id: str
+    name: Optional[str]
+    entry_point: Any
+
+    def matches(self, rule_id_or_name: str) -> bool:
+        return rule_id_or_name == self.id or (self.name is not None and rule_id_or_name == self.name)
+
+    def load(self) -> Type[rules.Rule]:
+        """Imports the rule class and validates it against the rule id and name in the entry point metadata."""
+        try:
+            rule_class = self.entry_point.load()
+        except Exception as e:
+            raise rules.UserRuleError(f"Error while loading plugin rule '{self.entry_point.value}': {e}") from e
+
+        if not inspect.isclass(rule_class):
+            raise rules.UserRuleError(f"Plugin rule '{self.entry_point.value}' is not a class")
+
+        assert_valid_rule_class(rule_class, "Plugin")
+
+        if rule_class.id != self.id or (self.name is not None and rule_class.name != self.name):
+            msg = (
+                f"Plugin rule class '{rule_class.__name__}' ({rule_class.id}: {rule_class.name}) does not match its "
+                f"entry point name '{self.entry_point.name}'"
+            )
+            raise rules.UserRuleError(msg)
+        return rule_class
+
+
+def _entry_points(group: str) -> Tuple[Any, ...]:
+    """Returns all installed entry points for a given group, compatible with the different importlib.metadata APIs."""
+    all_entry_points = metadata.entry_points()
+    # Python >= 3.10 (and recent importlib_metadata versions) return an EntryPoints object that supports select(),
+    # older versions return a dict of group name -> list of entry points.
+    if hasattr(all_entry_points, "select"):
+        return tuple(all_entry_points.select(group=group))
+    return tuple(all_entry_points.get(group, []))  # pragma: no cover
+
+
+@lru_cache(maxsize=None)
+def find_rule_entry_points(group: str = RULE_ENTRY_POINT_GROUP) -> Tuple[RuleEntryPoint, ...]:
+    """
+    Finds all rules registered under a given entry point group. This only reads package metadata, none of the rule
+    modules are imported. Use `RuleEntryPoint.load()` to import the actual rule class.
+    Results are cached since the set of installed packages does not change during a gitlint run.
+
+    :param group: entry point group to search
+    :return: tuple of RuleEntryPoint objects
+    """
+    rule_entry_points = []
+    for entry_point in _entry_points(group):
+        rule_id, _, rule_name = entry_point.name.partition(RULE_ENTRY_POINT_NAME_SEPARATOR)
+        rule_entry_points.append(RuleEntryPoint(rule_id.strip(), rule_name.strip() or None, entry_point))
+    return tuple(rule_entry_points)
 
 
 def find_rule_classes(extra_path: str) -> List[Type[rules.Rule]]:
@@ -2,11 +2,18 @@ import copy
 import logging
 import re
 from dataclasses import dataclass, field
-from typing import ClassVar, Dict, List, Optional, Type
+from typing import Any, Callable, ClassVar, Dict, FrozenSet, List, Optional, Type
 
 from gitlint.deprecation import Deprecation
 from gitlint.exception import GitlintError
-from gitlint.git import GitCommit
+from gitlint.git import (
+    COMMIT_FIELD_AUTHOR,
+    COMMIT_FIELD_CHANGED_FILES,
+    COMMIT_FIELD_MESSAGE,
+    COMMIT_FIELD_PARENTS,
+    LOG_FIELDS,
+    GitCommit,
+)
 from gitlint.options import (
     BoolOption,
     IntOption,
@@ -16,6 +23,14 @@ from gitlint.options import (
     StrOption,
 )
 
+# Rule costs, rules are applied cheapest-first in fail-fast mode.
+# Rules that only need the commit message and metadata retrieved alongside it (author, parents, etc)
+RULE_COST_MESSAGE = 1
+# Rules that need additional git calls, e.g. to retrieve changed files or branches
+RULE_COST_GIT = 10
+# Rules that don't declare a cost (e.g. user-defined rules)
+RULE_COST_UNKNOWN = 100
+
 
 @dataclass
 class Rule:
@@ -26,6 +41,11 @@ class Rule:
     id: ClassVar[str]
     name: ClassVar[str]
     target: ClassVar[Optional[Type["LineRuleTarget"]]] = None
+    # Relative cost of applying the rule (see RULE_COST_*), None means RULE_COST_UNKNOWN
+    cost: ClassVar[Optional[int]] = None
+    # Commit fields used by the rule (gitlint.git.COMMIT_FIELD_*), None means unknown. The fields required by all
+    # enabled rules are retrieved in bulk when linting multiple commits, other fields are retrieved lazily.
+    required_fields: ClassVar[Optional[FrozenSet[str]]] = None
     _log: ClassVar[Optional[logging.Logger]] = None
 
     # Instance attributes
@@ -47,6 +67,16 @@ class Rule:
             logging.basicConfig()
         return self._log
 
+    @property
+    def effective_cost(self) -> int:
+        if self.cost is not None:
+            return self.cost
+        # Derive the cost from the required fields, when declared: only the LOG_FIELDS are retrieved alongside the
+        # commit message
+        if self.required_fields is not None:
+            return RULE_COST_MESSAGE if self.required_fields <= LOG_FIELDS else RULE_COST_GIT
+        return RULE_COST_UNKNOWN
+
     def __eq__(self, other):
         return (
             self.id == other.id
@@ -76,14 +106,28 @@ class RuleViolation:
 class ConfigurationRule(Rule):
     """Class representing rules that can dynamically change the configuration of gitlint during runtime."""
 
+    # General options (e.g. "ignore") that apply() can modify. Configuration rules are applied to a copy of the config
+    # for every commit, declaring the modified options allows gitlint to only copy those. None (the default) means that
+    # apply() can modify any part of the config, including rules and their options.
+    modified_options: ClassVar[Optional[FrozenSet[str]]] = None
+
+    # Implemented by subclasses (not defined here, see rule_finder.assert_valid_rule_class): apply(config, commit)
+    apply: Callable[[Any, GitCommit], None]
+
 
 class CommitRule(Rule):
     """Class representing rules that act on an entire commit at once"""
 
+    # Implemented by subclasses: validate(commit)
+    validate: Callable[[GitCommit], Optional[List["RuleViolation"]]]
+
 
 class LineRule(Rule):
     """Class representing rules that act on a line by line basis"""
 
+    # Implemented by subclasses: validate(line, commit)
+    validate: Callable[[str, GitCommit], Optional[List["RuleViolation"]]]
+
 
 class LineRuleTarget:
     """Base class for LineRule targets. A LineRuleTarget specifies where a given rule will be applied
@@ -106,6 +150,8 @@ class UserRuleError(GitlintError):
 class MaxLineLength(LineRule):
     name = "max-line-length"
     id = "R1"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     options_spec = [IntOption("line-length", 80, "Max line length")]
     violation_message = "Line exceeds max length ({0}>{1})"
 
@@ -118,6 +164,8 @@ class MaxLineLength(LineRule):
 class TrailingWhiteSpace(LineRule):
     name = "trailing-whitespace"
     id = "R2"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     violation_message = "Line has trailing whitespace"
     pattern = re.compile(r"\s$", re.UNICODE)
 
@@ -129,6 +177,8 @@ class TrailingWhiteSpace(LineRule):
 class HardTab(LineRule):
     name = "hard-tab"
     id = "R3"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     violation_message = "Line contains hard tab characters (\\t)"
 
     def validate(self, line, _commit):
@@ -142,6 +192,8 @@ class LineMustNotContainWord(LineRule):
 
     name = "line-must-not-contain"
     id = "R5"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     options_spec = [ListOption("words", [], "Comma separated list of words that should not be found")]
     violation_message = "Line contains {0}"
 
@@ -159,6 +211,8 @@ class LineMustNotContainWord(LineRule):
 class LeadingWhiteSpace(LineRule):
     name = "leading-whitespace"
     id = "R6"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     violation_message = "Line has leading whitespace"
 
     def validate(self, line, _commit):
@@ -185,6 +239,8 @@ class TitleTrailingWhitespace(TrailingWhiteSpace):
 class TitleTrailingPunctuation(LineRule):
     name = "title-trailing-punctuation"
     id = "T3"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     target = CommitMessageTitle
 
     def validate(self, title, _commit):
@@ -219,6 +275,8 @@ class TitleLeadingWhitespace(LeadingWhiteSpace):
 class TitleRegexMatches(LineRule):
     name = "title-match-regex"
     id = "T7"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     target = CommitMessageTitle
     options_spec = [RegexOption("regex", None, "Regex the title should match")]
 
@@ -235,6 +293,8 @@ class TitleRegexMatches(LineRule):
 class TitleMinLength(LineRule):
     name = "title-min-length"
     id = "T8"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     target = CommitMessageTitle
     options_spec = [IntOption("min-length", 5, "Minimum required title length")]
 
@@ -267,6 +327,8 @@ class BodyHardTab(HardTab):
 class BodyFirstLineEmpty(CommitRule):
     name = "body-first-line-empty"
     id = "B4"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
 
     def validate(self, commit):
         if len(commit.message.body) >= 1:
@@ -278,6 +340,8 @@ class BodyFirstLineEmpty(CommitRule):
 class BodyMinLength(CommitRule):
     name = "body-min-length"
     id = "B5"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     options_spec = [IntOption("min-length", 20, "Minimum body length")]
 
     def validate(self, commit):
@@ -292,6 +356,8 @@ class BodyMinLength(CommitRule):
 class BodyMissing(CommitRule):
     name = "body-is-missing"
     id = "B6"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE, COMMIT_FIELD_PARENTS])
+    cost = RULE_COST_MESSAGE
     options_spec = [BoolOption("ignore-merge-commits", True, "Ignore merge commits")]
 
     def validate(self, commit):
@@ -305,8 +371,16 @@ class BodyMissing(CommitRule):
 class BodyChangedFileMention(CommitRule):
     name = "body-changed-file-mention"
     id = "B7"
+    cost = RULE_COST_GIT
     options_spec = [ListOption("files", [], "Files that need to be mentioned")]
 
+    @property
+    def required_fields(self):
+        # The changed files are only used when files are configured
+        if self.options["files"].value:
+            return frozenset([COMMIT_FIELD_MESSAGE, COMMIT_FIELD_CHANGED_FILES])
+        return frozenset([COMMIT_FIELD_MESSAGE])
+
     def validate(self, commit):
         violations = []
         for needs_mentioned_file in self.options["files"].value:
@@ -322,6 +396,8 @@ class BodyChangedFileMention(CommitRule):
 class BodyRegexMatches(CommitRule):
     name = "body-match-regex"
     id = "B8"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    cost = RULE_COST_MESSAGE
     options_spec = [RegexOption("regex", None, "Regex the body should match")]
 
     def validate(self, commit):
@@ -350,6 +426,8 @@ class BodyRegexMatches(CommitRule):
 class AuthorValidEmail(CommitRule):
     name = "author-valid-email"
     id = "M1"
+    required_fields = frozenset([COMMIT_FIELD_AUTHOR])
+    cost = RULE_COST_MESSAGE
     DEFAULT_AUTHOR_VALID_EMAIL_REGEX = r"^[^@ ]+@[^@ ]+\.[^@ ]+"
     options_spec = [
         RegexOption("regex", DEFAULT_AUTHOR_VALID_EMAIL_REGEX, "Regex that author email address should match")
@@ -375,6 +453,8 @@ class AuthorValidEmail(CommitRule):
 class IgnoreByTitle(ConfigurationRule):
     name = "ignore-by-title"
     id = "I1"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    modified_options = frozenset(["ignore"])
     options_spec = [
         RegexOption("regex", None, "Regex matching the titles of commits this rule should apply to"),
         StrOption("ignore", "all", "Comma-separated list of rules to ignore"),
@@ -402,6 +482,8 @@ class IgnoreByTitle(ConfigurationRule):
 class IgnoreByBody(ConfigurationRule):
     name = "ignore-by-body"
     id = "I2"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    modified_options = frozenset(["ignore"])
     options_spec = [
         RegexOption("regex", None, "Regex matching lines of the body of commits this rule should apply to"),
         StrOption("ignore", "all", "Comma-separated list of rules to ignore"),
@@ -432,6 +514,8 @@ class IgnoreByBody(ConfigurationRule):
 class IgnoreBodyLines(ConfigurationRule):
     name = "ignore-body-lines"
     id = "I3"
+    required_fields = frozenset([COMMIT_FIELD_MESSAGE])
+    modified_options = frozenset()
     options_spec = [RegexOption("regex", None, "Regex matching lines of the body that should be ignored")]
 
     def apply(self, _, commit):
@@ -457,6 +541,8 @@ class IgnoreBodyLines(ConfigurationRule):
 class IgnoreByAuthorName(ConfigurationRule):
     name = "ignore-by-author-name"
     id = "I4"
+    required_fields = frozenset([COMMIT_FIELD_AUTHOR])
+    modified_options = frozenset(["ignore"])
     options_spec = [
         RegexOption("regex", None, "Regex matching the author name of commits this rule should apply to"),
         StrOption("ignore", "all", "Comma-separated list of rules to ignore"),
@@ -4,9 +4,11 @@ We still keep the `sh` API and semantics so the rest of the gitlint codebase doe
 """
 
 import subprocess
+import time
 from dataclasses import dataclass
 from typing import Any
 
+from gitlint.observers import active_observers
 from gitlint.utils import TERMINAL_ENCODING
 
 
@@ -52,12 +54,25 @@ def _exec(*args: str, **kwargs: Any) -> ShResult:
     if "_cwd" in kwargs:
         popen_kwargs["cwd"] = kwargs["_cwd"]
 
+    # Data to send to the command's stdin (same semantics as 'sh' _in)
+    stdin_data = None
+    if "_in" in kwargs:
+        popen_kwargs["stdin"] = pipe
+        stdin_data = kwargs["_in"].encode(TERMINAL_ENCODING)
+
+    observers = active_observers()
+    start = time.perf_counter() if observers else 0
     try:
         with subprocess.Popen(args, **popen_kwargs) as p:
-            result = p.communicate()
+            result = p.communicate(stdin_data)
     except FileNotFoundError as e:
         raise CommandNotFound from e
 
+    if observers:
+        duration = time.perf_counter() - start
+        for observer in observers:
+            observer.on_git_call(args, duration, len(result[0]), p.returncode)
+
     exit_code = p.returncode
     stdout = result[0].decode(TERMINAL_ENCODING)
     stderr = result[1]  # 'sh' does not decode the stderr bytes to unicode
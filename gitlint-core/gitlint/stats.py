@@ -0,0 +1,137 @@
+"""
+Run statistics for gitlint (`gitlint --stats`): accounts for the git subprocesses that gitlint spawns (calls, wall time
+and bytes read from stdout per git command), `PropertyCache` hits and misses and the number of linted commits.
+
+Statistics are collected by activating a `RunStats` instance for the current context:
+
+    stats = RunStats()
+    with stats.activate():
+        ...  # lint commits
+    print(stats.report())
+
+`RunStats` is an observer (see `gitlint.observers`), its `activate()` method registers it for the current context.
+"""
+
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Sequence
+from typing import Counter as CounterType
+
+from gitlint.observers import Observer, command_type, observe
+
+
+@dataclass
+class CommandStats:
+    """Number of calls, total wall time (in seconds) and number of bytes read from stdout for a command type."""
+
+    calls: int = 0
+    duration: float = 0.0
+    stdout_bytes: int = 0
+
+
+class RunStats(Observer):
+    """Collects run statistics. Thread-safe: a single instance can be active in multiple threads.
+    Only totals are kept (per git command and cache key), so memory usage doesn't grow with the number of commits."""
+
+    def __init__(self) -> None:
+        self.commands: Dict[str, CommandStats] = {}
+        self.cache_hits: CounterType[str] = Counter()
+        self.cache_misses: CounterType[str] = Counter()
+        self.commits = 0
+        self.start_time = time.perf_counter()
+        self.end_time: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def activate(self) -> Iterator["RunStats"]:
+        """Context manager that activates statistics collection for the current context."""
+        try:
+            with observe(self):
+                yield self
+        finally:
+            self.end_time = time.perf_counter()
+
+    @property
+    def elapsed(self) -> float:
+        return (self.end_time or time.perf_counter()) - self.start_time
+
+    @property
+    def commits_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.commits / elapsed if elapsed > 0 else 0.0
+
+    def record_commit(self) -> None:
+        with self._lock:
+            self.commits += 1
+
+    def record_command(self, args: Sequence[str], duration: float, stdout_bytes: int) -> None:
+        """Records a single subprocess call (typically git)."""
+        with self._lock:
+            stats = self.commands.setdefault(command_type(args), CommandStats())
+            stats.calls += 1
+            stats.duration += duration
+            stats.stdout_bytes += stdout_bytes
+
+    def record_cache_lookup(self, cache_key: str, hit: bool) -> None:
+        """Records a `PropertyCache` lookup."""
+        with self._lock:
+            (self.cache_hits if hit else self.cache_misses)[cache_key] += 1
+
+    def on_commit_start(self, _commit):
+        self.record_commit()
+
+    def on_git_call(self, args, duration, stdout_bytes, _exit_code):
+        self.record_command(args, duration, stdout_bytes)
+
+    def on_cache_lookup(self, cache_key, hit):
+        self.record_cache_lookup(cache_key, hit)
+
+    def as_dict(self) -> Dict[str, Any]:
+        with self._lock:
+            commands = {
+                command: {"calls": stats.calls, "duration": stats.duration, "stdout_bytes": stats.stdout_bytes}
+                for command, stats in self.commands.items()
+            }
+            cache = {
+                key: {"hits": self.cache_hits[key], "misses": self.cache_misses[key]}
+                for key in sorted(set(self.cache_hits) | set(self.cache_misses))
+            }
+            return {
+                "commits": self.commits,
+                "elapsed": self.elapsed,
+                "commits_per_second": self.commits_per_second,
+                "git_commands": commands,
+                "cache": cache,
+            }
+
+    def report(self) -> str:
+        """Returns a human readable summary of the collected statistics."""
+        stats = self.as_dict()
+        lines = [
+            f"gitlint stats: {stats['commits']} commit(s) linted in {stats['elapsed'] * 1000:.2f}ms "
+            f"({stats['commits_per_second']:.1f} commits/s)"
+        ]
+
+        if stats["git_commands"]:
+            header = f"{'Git command':<24} {'Calls':>7} {'Total ms':>10} {'Stdout bytes':>13}"
+            lines.extend(["", header, "-" * len(header)])
+            commands = sorted(stats["git_commands"].items(), key=lambda item: float(item[1]["duration"]), reverse=True)
+            for command, item in commands:
+                lines.append(
+                    f"{command:<24} {item['calls']:>7} {item['duration'] * 1000:>10.2f} {item['stdout_bytes']:>13}"
+                )
+            total = {key: sum(item[key] for _, item in commands) for key in ("calls", "duration", "stdout_bytes")}
+            lines.append(
+                f"{'total':<24} {total['calls']:>7} {total['duration'] * 1000:>10.2f} {total['stdout_bytes']:>13}"
+            )
+
+        if stats["cache"]:
+            header = f"{'Cache key':<24} {'Hits':>7} {'Misses':>7}"
+            lines.extend(["", header, "-" * len(header)])
+            for key, item in stats["cache"].items():
+                lines.append(f"{key:<24} {item['hits']:>7} {item['misses']:>7}")
+
+        return "\n".join(lines)
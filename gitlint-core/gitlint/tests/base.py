@@ -6,11 +6,13 @@ import re
 import shutil
 import tempfile
 import unittest
+from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterator, Optional
+from typing import Counter as CounterType
 from unittest.mock import patch
 
-from gitlint.config import LintConfig
+from gitlint import shell
 from gitlint.deprecation import LOG as DEPRECATION_LOG
 from gitlint.deprecation import Deprecation
 from gitlint.git import GitChangedFileStats, GitContext
@@ -68,9 +70,6 @@ class BaseTestCase(unittest.TestCase):
         logging.getLogger("gitlint").propagate = False
         DEPRECATION_LOG.propagate = False
 
-        # Make sure Deprecation has a clean config set at the start of each test.
-        # Tests that want to specifically test deprecation should override this.
-        Deprecation.config = LintConfig()
         # Normally Deprecation only logs messages once per process.
         # For tests we want to log every time, so we reset the warning_msgs set per test.
         Deprecation.warning_msgs = set()
@@ -84,6 +83,21 @@ class BaseTestCase(unittest.TestCase):
         finally:
             shutil.rmtree(tmpdir)
 
+    @staticmethod
+    @contextlib.contextmanager
+    def count_git_calls() -> Iterator[CounterType[str]]:
+        """Context manager that counts the git commands that gitlint runs, per git (sub)command (e.g. {"log": 2}).
+        Unlike when patching `gitlint.git.sh`, the git commands are actually executed."""
+        git_calls: CounterType[str] = Counter()
+        original_git = shell.git
+
+        def git(*command_parts: str, **kwargs: Any) -> shell.ShResult:
+            git_calls[command_parts[0]] += 1
+            return original_git(*command_parts, **kwargs)
+
+        with patch.object(shell, "git", new=git):
+            yield git_calls
+
     @staticmethod
     def get_sample_path(filename: str = "") -> str:
         # Don't join up empty files names because this will add a trailing slash
@@ -1,6 +1,9 @@
+import json
 import os
 import platform
+import pstats
 import sys
+import tempfile
 from io import StringIO
 from unittest.mock import patch
 
@@ -71,23 +74,25 @@ class CLITests(BaseTestCase):
 
         # fmt: off
         sh.git.side_effect = [
-            "6f29bf81a8322a04071bb794666e48c443a90360\n" +  # git rev-list <SHA>
-            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n" +
-            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\n",
-            # git log --pretty <FORMAT> <SHA>
+            # git rev-list --no-merges --format=%x00%aN%x00%s <SHA>
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2\n"
+            "commit 4da2656b0dadc76c7ee3fd0243a96cb64007f125\n\x00test åuthor3\x00commït-title3\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
             "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00åbc\n"
-            "commït-title1\n\ncommït-body1",
-            "#",                                           # git config --get core.commentchar
+            "commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
+            "test åuthor2\x00test-email3@föo.com\x002016-12-04 15:28:15 +0100\x00åbc\n"
+            "commït-title2\n\ncommït-body2\x00"
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\x00"
+            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00åbc\n"
+            "commït-title3\n\ncommït-body3\x00",
             "3\t5\tcommit-1/file-1\n1\t4\tcommit-1/file-2\n",          # git diff-tree
             "commit-1-branch-1\ncommit-1-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
-            "test åuthor2\x00test-email3@föo.com\x002016-12-04 15:28:15 +0100\x00åbc\n"
-            "commït-title2\n\ncommït-body2",
             "8\t3\tcommit-2/file-1\n1\t5\tcommit-2/file-2\n",          # git diff-tree
             "commit-2-branch-1\ncommit-2-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
-            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00åbc\n"
-            "commït-title3\n\ncommït-body3",
             "7\t2\tcommit-3/file-1\n1\t7\tcommit-3/file-2\n",          # git diff-tree
             "commit-3-branch-1\ncommit-3-branch-2\n",      # git branch --contains <sha>
         ]
@@ -108,20 +113,21 @@ class CLITests(BaseTestCase):
             "6f29bf81a8322a04071bb794666e48c443a90360\n",  # git rev-list <SHA>
             "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n",
             "4da2656b0dadc76c7ee3fd0243a96cb64007f125\n",
-            # git log --pretty <FORMAT> <SHA>
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
             "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00åbc\n"
-            "commït-title1\n\ncommït-body1",
+            "commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
+            "test åuthor2\x00test-email3@föo.com\x002016-12-04 15:28:15 +0100\x00åbc\n"
+            "commït-title2\n\ncommït-body2\x00"
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\x00"
+            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00åbc\n"
+            "commït-title3\n\ncommït-body3\x00",
             "#",                                           # git config --get core.commentchar
             "3\t5\tcommit-1/file-1\n1\t4\tcommit-1/file-2\n",          # git diff-tree
             "commit-1-branch-1\ncommit-1-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
-            "test åuthor2\x00test-email3@föo.com\x002016-12-04 15:28:15 +0100\x00åbc\n"
-            "commït-title2\n\ncommït-body2",
             "8\t3\tcommit-2/file-1\n1\t5\tcommit-2/file-2\n",          # git diff-tree
             "commit-2-branch-1\ncommit-2-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
-            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00åbc\n"
-            "commït-title3\n\ncommït-body3",
             "7\t2\tcommit-3/file-1\n1\t7\tcommit-3/file-2\n",          # git diff-tree
             "commit-3-branch-1\ncommit-3-branch-2\n",      # git branch --contains <sha>
         ]
@@ -140,23 +146,25 @@ class CLITests(BaseTestCase):
         # fmt: off
         # Note that the second commit title has a trailing period that is being ignored by gitlint-ignore: T3
         sh.git.side_effect = [
-            "6f29bf81a8322a04071bb794666e48c443a90360\n" +  # git rev-list <SHA>
-            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n" +
-            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\n",
-            # git log --pretty <FORMAT> <SHA>
+            # git rev-list --no-merges --format=%x00%aN%x00%s <SHA>
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2.\n"
+            "commit 4da2656b0dadc76c7ee3fd0243a96cb64007f125\n\x00test åuthor3\x00commït-title3.\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
             "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00åbc\n"
-            "commït-title1\n\ncommït-body1",
-            "#",                                           # git config --get core.commentchar
+            "commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
+            "test åuthor2\x00test-email2@föo.com\x002016-12-04 15:28:15 +0100\x00åbc\n"
+            "commït-title2.\n\ncommït-body2\ngitlint-ignore: T3\n\x00"
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\x00"
+            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00åbc\n"
+            "commït-title3.\n\ncommït-body3\x00",
             "9\t4\tcommit-1/file-1\n0\t2\tcommit-1/file-2\n",          # git diff-tree
             "commit-1-branch-1\ncommit-1-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
-            "test åuthor2\x00test-email2@föo.com\x002016-12-04 15:28:15 +0100\x00åbc\n"
-            "commït-title2.\n\ncommït-body2\ngitlint-ignore: T3\n",
             "3\t7\tcommit-2/file-1\n4\t6\tcommit-2/file-2\n",          # git diff-tree
             "commit-2-branch-1\ncommit-2-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
-            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00åbc\n"
-            "commït-title3.\n\ncommït-body3",
             "3\t8\tcommit-3/file-1\n1\t4\tcommit-3/file-2\n",          # git diff-tree
             "commit-3-branch-1\ncommit-3-branch-2\n",      # git branch --contains <sha>
         ]
@@ -176,26 +184,28 @@ class CLITests(BaseTestCase):
         # fmt: off
         # Note that the second commit
         sh.git.side_effect = [
-            "6f29bf81a8322a04071bb794666e48c443a90360\n" +  # git rev-list <SHA>
-            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n" +
-            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\n",
-            # git log --pretty <FORMAT> <SHA>
+            # git rev-list --no-merges --format=%x00%aN%x00%s <SHA>
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2.\n"
+            "commit 4da2656b0dadc76c7ee3fd0243a96cb64007f125\n\x00test åuthor3\x00commït-title3.\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
             "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00åbc\n"
-            "commït-title1\n\ncommït-body1",
-            "#",                                           # git config --get core.commentchar
-            "5\t9\tcommit-1/file-1\n1\t4\tcommit-1/file-2\n",          # git diff-tree
-            "commit-1-branch-1\ncommit-1-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
+            "commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
             "test åuthor2\x00test-email3@föo.com\x002016-12-04 15:28:15 +0100\x00åbc\n"
             # Normally T3 violation (trailing punctuation), but this commit is ignored because of
             # config below
-            "commït-title2.\n\ncommït-body2\n",
-            "4\t7\tcommit-2/file-1\n1\t4\tcommit-2/file-2\n",          # git diff-tree
-            "commit-2-branch-1\ncommit-2-branch-2\n",      # git branch --contains <sha>
-                                                            # git log --pretty <FORMAT> <SHA>
+            "commït-title2.\n\ncommït-body2\n\x00"
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\x00"
             "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00åbc\n"
             # Normally T1 and B5 violations, now only T1 because we're ignoring B5 in config below
-            "commït-title3.\n\ncommït-body3 foo",
+            "commït-title3.\n\ncommït-body3 foo\x00",
+            "5\t9\tcommit-1/file-1\n1\t4\tcommit-1/file-2\n",          # git diff-tree
+            "commit-1-branch-1\ncommit-1-branch-2\n",      # git branch --contains <sha>
+            "4\t7\tcommit-2/file-1\n1\t4\tcommit-2/file-2\n",          # git diff-tree
+            "commit-2-branch-1\ncommit-2-branch-2\n",      # git branch --contains <sha>
             "1\t9\tcommit-3/file-1\n3\t7\tcommit-3/file-2\n",          # git diff-tree
             "commit-3-branch-1\ncommit-3-branch-2\n",      # git branch --contains <sha>
         ]
@@ -283,6 +293,44 @@ class CLITests(BaseTestCase):
             expected_logs = self.get_expected("cli/test_cli/test_input_stream_debug_2", expected_kwargs)
             self.assert_logged(expected_logs)
 
+    @patch("gitlint.cli.get_stdin_data", return_value="WIP: tïtle \n")
+    def test_profile(self, _):
+        """Test for --profile and --profile-output options"""
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--profile"])
+            self.assertEqual(stderr.getvalue(), self.get_expected("cli/test_cli/test_input_stream_1"))
+            self.assertEqual(result.exit_code, 3)
+            self.assertTrue(result.stderr.startswith("gitlint profile: 1 commit(s) linted in "))
+            self.assertRegex(result.stderr, r"\nT5 title-must-not-contain-word +1 [ .0-9]+ 1\n")
+            self.assertRegex(result.stderr, r"\ncommentchar +1 ")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # JSON output
+            profile_output = os.path.join(tmpdir, "pröfile.json")
+            result = self.cli.invoke(cli.cli, ["--profile-output", profile_output])
+            self.assertEqual(result.exit_code, 3)
+            self.assertTrue(result.stderr.startswith("gitlint profile: 1 commit(s) linted in "))
+            with open(profile_output, encoding="UTF-8") as json_file:
+                profile = json.load(json_file)
+            self.assertEqual(profile["commits"], 1)
+            self.assertEqual(profile["rules"]["T5"]["violations"], 1)
+
+            # Any other extension: python profiler output (pstats)
+            profile_output = os.path.join(tmpdir, "pröfile.prof")
+            result = self.cli.invoke(cli.cli, ["--profile-output", profile_output])
+            self.assertEqual(result.exit_code, 3)
+            stats = pstats.Stats(profile_output)
+            self.assertTrue(any(function[2] == "_lint" for function in stats.stats))
+
+            # The output directory is checked before linting
+            missing_dir = os.path.join(tmpdir, "missing")
+            result = self.cli.invoke(cli.cli, ["--profile-output", os.path.join(missing_dir, "pröfile.json")])
+            self.assertEqual(result.exit_code, self.USAGE_ERROR_CODE)
+            self.assertIn(
+                f"Invalid value for '--profile-output': Directory '{missing_dir}' does not exist.", result.stderr
+            )
+            self.assertNotIn("gitlint profile", result.stderr)
+
     @patch("gitlint.cli.get_stdin_data", return_value="Should be ignored\n")
     @patch("gitlint.git.sh")
     def test_lint_ignore_stdin(self, sh, stdin_data):
@@ -332,6 +380,25 @@ class CLITests(BaseTestCase):
             expected_logs = self.get_expected("cli/test_cli/test_lint_staged_stdin_2", expected_kwargs)
             self.assert_logged(expected_logs)
 
+    @patch("gitlint.cli.get_stdin_data", return_value="Tïtle\n\nThis is a commït body that is long enough\n")
+    @patch("gitlint.git.sh")
+    def test_lint_staged_mailmap(self, sh, _):
+        """Test for resolving the author of staged commits using the mailmap (--mailmap)"""
+        git_outputs = {
+            ("config", "--get", "core.commentchar"): "#",
+            ("config", "--get", "user.name"): "föo user\n",
+            ("config", "--get", "user.email"): "föo@bar.com\n",
+            ("check-mailmap", "föo user <föo@bar.com>"): "Föo User <föo-at-bar.com>\n",
+            ("diff", "--staged", "--numstat", "-r"): "",
+            ("rev-parse", "--abbrev-ref", "HEAD"): "my-branch\n",
+        }
+        sh.git.side_effect = lambda *args, **_kwargs: git_outputs[args]
+
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--staged", "--mailmap"])
+            self.assertEqual(stderr.getvalue(), '-: M1 Author email for commit is invalid: "föo-at-bar.com"\n')
+            self.assertEqual(result.exit_code, 1)
+
     @patch("arrow.now", return_value=arrow.get("2020-02-19T12:18:46.675182+01:00"))
     @patch("gitlint.git.sh")
     def test_lint_staged_msg_filename(self, sh, _):
@@ -460,21 +527,25 @@ class CLITests(BaseTestCase):
 
         # fmt: off
         sh.git.side_effect = [
-            "6f29bf81a8322a04071bb794666e48c443a90360\n"  # git rev-list <SHA>
-            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n"
-            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\n",
-            # git log --pretty <FORMAT> <SHA>
+            # git rev-list --format=%x00%aN%x00%s <SHA>
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2.\n"
+            "commit 4da2656b0dadc76c7ee3fd0243a96cb64007f125\n\x00test åuthor3\x00föobar\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
             "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00a123\n"
-            "commït-title1\n\ncommït-body1",
-            "#",                                                     # git config --get core.commentchar
+            "commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
+            "test åuthor2\x00test-email2@föo.com\x002016-12-04 15:28:15 +0100\x00b123\n"
+            "commït-title2.\n\ncommït-body2\x00"
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\x00"
+            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00c123\n"
+            "föobar\nbar\x00",
             "5\t8\tcommit-1/file-1\n2\t9\tcommit-1/file-2\n",                    # git diff-tree
             "commit-1-branch-1\ncommit-1-branch-2\n",                # git branch --contains <sha>
-            "test åuthor2\x00test-email2@föo.com\x002016-12-04 15:28:15 +0100\x00b123\n"
-            "commït-title2.\n\ncommït-body2",
             "5\t8\tcommit-2/file-1\n7\t9\tcommit-2/file-2\n",        # git diff-tree
             "commit-2-branch-1\ncommit-2-branch-2\n",                # git branch --contains <sha>
-            "test åuthor3\x00test-email3@föo.com\x002016-12-05 15:28:15 +0100\x00c123\n"
-            "föobar\nbar",
             "1\t4\tcommit-3/file-1\n3\t4\tcommit-3/file-2\n",        # git diff-tree
             "commit-3-branch-1\ncommit-3-branch-2\n",                # git branch --contains <sha>
         ]
@@ -733,3 +804,149 @@ class CLITests(BaseTestCase):
             expected_kwargs.update({"config_path": config_path})
             expected_logs = self.get_expected("cli/test_cli/test_named_rules_2", expected_kwargs)
             self.assert_logged(expected_logs)
+
+    @patch("gitlint.git.sh")
+    def test_batch(self, sh):
+        """Test for batch subcommand with NUL-separated commit messages"""
+        sh.git.side_effect = ["#"]  # git config --get core.commentchar
+
+        stdin = (
+            "WIP: tïtle1\n\ncommït-body1 that is long enough\n\0"
+            "\0"  # empty records are ignored
+            "commït-title2\n\ncommït-body2 that is long enough\n# cömment\0"
+            "WIP: tïtle3\n\ncommït-body3\ngitlint-ignore: all\0"  # commit specific config applies per record
+            "WIP: tïtle4\n\ncommït-body4\n"  # trailing NUL is optional
+        )
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["batch"], input=stdin.encode(TERMINAL_ENCODING))
+            expected_stderr = (
+                "Record 1:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: tïtle1\"\n\n"
+                "Record 4:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: tïtle4\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body4"\n'
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            self.assertEqual(result.output, "")
+            self.assertEqual(result.exit_code, 3)
+
+        # Repository information is only retrieved once for all records
+        sh.git.assert_called_once()
+
+    @patch("gitlint.git.sh")
+    def test_batch_fail_fast(self, sh):
+        """Test for batch subcommand in fail-fast mode: stops reading records once enough violations are found"""
+        sh.git.side_effect = ["#"]  # git config --get core.commentchar
+
+        stdin = "WIP: tïtle1\n\ncommït-body1\0WIP: tïtle2\n\ncommït-body2\0WIP: tïtle3\n\ncommït-body3"
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--fail-fast=3", "batch"], input=stdin)
+            expected_stderr = (
+                "Record 1:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: tïtle1\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body1"\n\n'
+                "Record 2:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: tïtle2\"\n"
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            self.assertEqual(result.stderr, "gitlint: stopped after 3 violation(s).\n")
+            self.assertEqual(result.exit_code, 3)
+
+    @patch("gitlint.git.sh")
+    def test_batch_jsonl(self, sh):
+        """Test for batch subcommand with JSON lines"""
+        sh.git.side_effect = ["#"]  # git config --get core.commentchar
+
+        stdin = (
+            '{"message": "WIP: tïtle1\\n\\ncommït-body1", "sha": "6f29bf81a8322a04071bb794666e48c443a90360", '
+            '"author_name": "test åuthor", "author_email": "test-email@föo.com", "my-key": [1, 2]}\n'
+            "\n"
+            '{"message": "commït-title2\\n\\ncommït-body2 that is long enough"}\n'
+            '{"message": "WIP: tïtle3\\n\\ncommït-body3 that is long enough", "sha": null}\n'
+        )
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["batch", "--format", "jsonl"], input=stdin)
+            expected_stderr = (
+                "Commit 6f29bf81a8:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: tïtle1\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body1"\n\n'
+                "Record 3:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: tïtle3\"\n"
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            self.assertEqual(result.exit_code, 3)
+
+    @patch("gitlint.git.sh")
+    def test_batch_mbox(self, sh):
+        """Test for batch subcommand with an mbox stream"""
+        sh.git.side_effect = ["#"]  # git config --get core.commentchar
+
+        with open(self.get_sample_path("mbox/patches.mbox"), "rb") as mbox:
+            stdin = mbox.read()
+        args = ["-c", "body-changed-file-mention.files=föo.txt,öld.txt", "batch", "--format", "mbox"]
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, args, input=stdin)
+            expected_stderr = (
+                "Commit 6f29bf81a8:\n"
+                "4: B7 Body does not mention changed file 'föo.txt'\n\n"
+                "Commit 7e31cf6e33:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: Remove old files\"\n"
+                '3: B5 Body message is too short (4<20): "Bödy"\n'
+                "3: B7 Body does not mention changed file 'öld.txt'\n"
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            self.assertEqual(result.exit_code, 4)
+
+    @patch("gitlint.git.sh")
+    def test_batch_negative(self, sh):
+        """Negative tests for the batch subcommand"""
+        sh.git.side_effect = ["#"]  # git config --get core.commentchar
+
+        expected_errors = [
+            (
+                '{"message": "föo"}\nnöt json\n',
+                "Invalid JSON on line 2 of stdin: Expecting value: line 1 column 1 (char 0)",
+            ),
+            ('["föo"]\n', "Line 1 of stdin must be a JSON object with a 'message' string."),
+            ('{"sha": "föo"}\n', "Line 1 of stdin must be a JSON object with a 'message' string."),
+            ('{"message": "föo", "author_name": 1}\n', "Line 1 of stdin: 'author_name' must be a string."),
+        ]
+        for stdin, expected_error in expected_errors:
+            with patch("gitlint.display.stderr", new=StringIO()):
+                result = self.cli.invoke(cli.cli, ["batch", "--format", "jsonl"], input=stdin)
+            self.assertIn(f"Error: {expected_error}\n", result.output)
+            self.assertEqual(result.exit_code, self.USAGE_ERROR_CODE)
+
+        # Messages that aren't valid in the terminal encoding
+        sh.git.side_effect = ["#"]
+        with patch("gitlint.utils.TERMINAL_ENCODING", "UTF-8"), patch("gitlint.display.stderr", new=StringIO()):
+            result = self.cli.invoke(cli.cli, ["batch"], input=b"f\xc3\xb6o\0b\xffr\0")
+        expected = "Error: Message 2 of stdin is not valid utf-8 (invalid start byte at position 1).\n"
+        self.assertEqual(result.output, expected)
+        self.assertEqual(result.exit_code, self.USAGE_ERROR_CODE)
+
+        # No records at all
+        result = self.cli.invoke(cli.cli, ["batch"], input="")
+        self.assertEqual(result.exit_code, 0)
+        result = self.cli.invoke(cli.cli, ["--fail-without-commits", "batch"], input="")
+        self.assertEqual(result.output, "Error: No commit messages on stdin\n")
+        self.assertEqual(result.exit_code, self.USAGE_ERROR_CODE)
+
+    def test_repos_negative(self):
+        """Negative tests for the repos subcommand"""
+        result = self.cli.invoke(cli.cli, ["repos"])
+        self.assertEqual(result.output, "Error: No repositories to lint, pass repository paths and/or a --manifest.\n")
+        self.assertEqual(result.exit_code, self.USAGE_ERROR_CODE)
+
+        with self.tempdir() as tmpdir:
+            manifest_path = os.path.join(tmpdir, "manifest.txt")
+            expected_errors = [
+                ("repö HEAD~1..HEAD föo\n", f"Line 1 of {manifest_path} must be '<repository> [<range>]'."),
+                ("# Cömment\nrepö\n", f"Line 2 of {manifest_path}: 'repö' is not a directory."),
+            ]
+            for manifest, expected_error in expected_errors:
+                with open(manifest_path, "w", encoding=FILE_ENCODING) as manifest_file:
+                    manifest_file.write(manifest)
+                result = self.cli.invoke(cli.cli, ["repos", "--manifest", manifest_path])
+                self.assertEqual(result.output, f"Error: {expected_error}\n")
+                self.assertEqual(result.exit_code, self.USAGE_ERROR_CODE)
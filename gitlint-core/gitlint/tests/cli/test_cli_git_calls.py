@@ -0,0 +1,596 @@
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+from collections import Counter
+from io import StringIO
+from unittest.mock import patch
+
+from click.testing import CliRunner
+from gitlint import cli
+from gitlint.api import Linter
+from gitlint.config import LintConfig, LintConfigBuilder
+from gitlint.git import (
+    COMMIT_FIELD_AUTHOR,
+    COMMIT_FIELD_CHANGED_FILES,
+    COMMIT_FIELD_CHANGED_FILES_STATS,
+    COMMIT_FIELD_MESSAGE,
+    GitContext,
+)
+from gitlint.profiling import Profiler
+from gitlint.progress import CLEAR_LINE
+from gitlint.rules import ConfigurationRule, RuleViolation
+from gitlint.stats import RunStats
+from gitlint.tests.base import BaseTestCase
+
+
+class CLIGitCallsTests(BaseTestCase):
+    """Tests that count the git commands gitlint runs against an actual git repository. Git calls are by far the most
+    expensive thing gitlint does, these tests ensure we don't (accidentally) run more of them than required."""
+
+    def setUp(self):
+        super().setUp()
+        self.cli = CliRunner()
+        # Other tests enable debug logging on the gitlint logger, which would cause lazily loaded commit properties to
+        # be retrieved from git when formatting debug log messages
+        logging.getLogger("gitlint").setLevel(logging.WARNING)
+
+        self.repo = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.repo)
+        self.git("init", "--quiet")
+        for i in range(3):
+            self.git("commit", "--quiet", "--allow-empty", "-m", f"WIP: cömmit {i}", "-m", "Bödy that is long enough")
+
+    def git(self, *args):
+        identity = ["-c", "user.name=gitlint test", "-c", "user.email=test@gitlint.com", "-c", "commit.gpgsign=false"]
+        subprocess.run(["git", *identity, *args], cwd=self.repo, check=True, capture_output=True)
+
+    def invoke(self, args, **kwargs):
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--target", self.repo, *args], **kwargs)
+            self.assertIn("T5 Title contains the word 'WIP'", stderr.getvalue())
+            return result
+
+    def test_lint_last_commit(self):
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(["--ignore-stdin"])
+        self.assertEqual(result.exit_code, 1)
+        # git log -1 --pretty=%H, git log <sha>, git config --get core.commentchar
+        self.assertEqual(git_calls, Counter({"log": 2, "config": 1}))
+
+    def test_lint_range(self):
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(["--ignore-stdin", "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 2)
+        # git rev-list, git log --no-walk --stdin (once for all commits), git config --get core.commentchar (once)
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "log": 1, "config": 1}))
+
+    @patch("gitlint.cli.get_stdin_data", return_value="WIP: cömmit\n\nBödy that is long enough")
+    def test_lint_stdin(self, _):
+        with self.count_git_calls() as git_calls:
+            result = self.invoke([])
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(git_calls, Counter({"config": 1}))
+
+    def test_lint_debug(self):
+        # When debug logging is enabled, the git version and all commit properties are logged
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(["--ignore-stdin", "--debug", "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 2)
+        expected = Counter({"--version": 1, "rev-list": 1, "log": 1, "config": 1, "diff-tree": 2, "branch": 2})
+        self.assertEqual(git_calls, expected)
+
+    def test_prefetch(self):
+        # Fields that are retrieved in bulk are identical to fields that are retrieved per commit
+        for file_name in ["foo.txt", "file with spaces.txt"]:
+            with open(os.path.join(self.repo, file_name), "w", encoding="UTF-8") as changed_file:
+                changed_file.write("föo\nbar\n")
+        self.git("add", ".")
+        self.git("commit", "--quiet", "-m", "Cömmit with files\n\nBödy\n\n\n")
+
+        all_fields = [COMMIT_FIELD_MESSAGE, COMMIT_FIELD_AUTHOR, COMMIT_FIELD_CHANGED_FILES_STATS]
+        fields = ["message", "author_name", "author_email", "date", "parents", "is_merge_commit", "changed_files"]
+        fields.append("changed_files_stats")
+        expected = [
+            {field: getattr(commit, field) for field in fields}
+            for commit in GitContext.from_local_repository(self.repo, refspec="HEAD").commits
+        ]
+        gitcontext = GitContext.from_local_repository(self.repo, refspec="HEAD")
+        with self.count_git_calls() as git_calls:
+            gitcontext.prefetch(all_fields)
+            self.assertListEqual(
+                [{field: getattr(commit, field) for field in fields} for commit in gitcontext.commits], expected
+            )
+        self.assertEqual(git_calls, Counter({"log": 1, "config": 1, "diff-tree": 1}))
+        self.assertListEqual(gitcontext.commits[0].changed_files, ["file with spaces.txt", "foo.txt"])
+
+        # Only the names of changed files are retrieved when the stats aren't required
+        gitcontext = GitContext.from_local_repository(self.repo, refspec="HEAD")
+        with self.count_git_calls() as git_calls:
+            gitcontext.prefetch([COMMIT_FIELD_CHANGED_FILES])
+            self.assertListEqual(gitcontext.commits[0].changed_files, ["file with spaces.txt", "foo.txt"])
+            self.assertListEqual(gitcontext.commits[1].changed_files, [])
+        self.assertEqual(git_calls, Counter({"diff-tree": 1}))
+
+    def test_prefetch_profile(self):
+        # Prefetching is profiled as a git fetch per batch of commits
+        with Profiler().activate() as profiler:
+            gitcontext = GitContext.from_local_repository(self.repo, refspec="HEAD~2..HEAD")
+            gitcontext.prefetch([COMMIT_FIELD_MESSAGE, COMMIT_FIELD_CHANGED_FILES])
+            gitcontext.prefetch([COMMIT_FIELD_MESSAGE, COMMIT_FIELD_CHANGED_FILES])  # Already retrieved
+        self.assertEqual(profiler.git_fetches["log (prefetch)"].calls, 1)
+        self.assertEqual(profiler.git_fetches["changed_files (prefetch)"].calls, 1)
+        self.assertNotIn("message", profiler.git_fetches)
+
+    def test_revision_filter(self):
+        self.git("checkout", "--quiet", "-b", "side")
+        self.git("commit", "--quiet", "--allow-empty", "-m", "WIP: side cömmit", "-m", "Bödy that is long enough")
+        self.git("checkout", "--quiet", "-")
+        self.git("merge", "--quiet", "--no-ff", "-m", "Merge side", "side")
+        self.git("commit", "--quiet", "--allow-empty", "-m", "fixup! WIP: cömmit 2")
+        self.git("commit", "--quiet", "--allow-empty", "-m", "WIP: skïp me", "-m", "Bödy that is long enough")
+        self.git("commit", "--quiet", "--allow-empty", "--author", "Böt <bot@gitlint.com>", "-m", "WIP: böt")
+        # Commits that look like they can be skipped based on their subject, but are linted
+        self.git("commit", "--quiet", "--allow-empty", "-m", "WIP: not a fixup", "-m", "fixup! on a body line")
+        self.git("commit", "--quiet", "--allow-empty", "--cleanup=verbatim", "-m", "\nfixup! after an empty line")
+        self.git("commit", "--quiet", "--allow-empty", "-m", "WIP: skïp me not", "-m", "gitlint-ignore: I1")
+
+        config = LintConfig()
+        config.set_rule_option("I1", "regex", "^WIP: skïp me")
+        config.set_rule_option("I4", "regex", "^Böt$")
+        linter = Linter(config)
+
+        # Linting the remaining commits yields the same violations as linting all commits
+        all_commits = GitContext.from_local_repository(self.repo, refspec="HEAD").commits
+        expected = {result.commit.sha: result.violations for result in linter.lint_commits(all_commits)}
+        with self.count_git_calls() as git_calls:
+            gitcontext = GitContext.from_local_repository(
+                self.repo, refspec="HEAD", revision_filter=linter.revision_filter()
+            )
+        # The message of commits that may be skipped is retrieved for all of them at once
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "config": 1, "log": 1}))
+        self.assertEqual(len(all_commits), 11)
+        self.assertEqual(len(gitcontext.commits), 7)
+        self.assertEqual(gitcontext.skipped_commits, 3)  # The merge commit is skipped by git itself
+        results = {result.commit.sha: result.violations for result in linter.lint_commits(gitcontext.commits)}
+        self.assertDictEqual(results, {sha: violations for sha, violations in expected.items() if sha in results})
+        self.assertFalse(any(violations for sha, violations in expected.items() if sha not in results))
+
+        # Ranges that only contain skipped commits (here: the merge and fixup commit) aren't empty
+        args = ["--target", self.repo, "--ignore-stdin", "--fail-without-commits", "--commits", "side..HEAD~5"]
+        result = self.cli.invoke(cli.cli, args)
+        self.assertEqual(result.output, "")
+        self.assertEqual(result.exit_code, 0)
+
+    def test_revision_filter_configuration_rules(self):
+        # Configuration rules can enable linting merge commits, in which case git doesn't skip merge commits: they're
+        # skipped per commit instead
+        class LintReleaseMerges(ConfigurationRule):
+            name = "lint-release-merges"
+            id = "UCR1"
+
+            def apply(self, config, commit):
+                if commit.message.title.startswith("Merge release"):
+                    config.ignore_merge_commits = False
+
+        for branch in ["side", "release"]:
+            self.git("checkout", "--quiet", "-b", branch, "HEAD~1")
+            self.git("commit", "--quiet", "--allow-empty", "-m", f"{branch} cömmit", "-m", "Bödy that is long enough")
+            self.git("checkout", "--quiet", "-")
+            self.git("merge", "--quiet", "--no-ff", "-m", f"Merge {branch} (WIP)", branch)
+
+        config = LintConfig()
+        config.rules.add_rule(LintReleaseMerges, LintReleaseMerges.id)
+        linter = Linter(config)
+        self.assertFalse(linter.revision_filter().no_merges)
+        with self.count_git_calls() as git_calls:
+            results = list(linter.lint_range(self.repo, "HEAD~2..HEAD", first_parent=True))
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "config": 1, "log": 1}))
+        t5 = RuleViolation("T5", "Title contains the word 'WIP' (case-insensitive)", "Merge release (WIP)", 1)
+        self.assertListEqual(
+            [(result.commit.message.title, result.violations) for result in results], [(t5.content, [t5])]
+        )
+
+        # Git skips merge commits when all configuration rules declare they don't modify ignore-merge-commits
+        LintReleaseMerges.modified_options = frozenset(["ignore"])
+        linter = Linter(config)
+        self.assertTrue(linter.revision_filter().no_merges)
+        self.assertListEqual(list(linter.lint_range(self.repo, "HEAD~2..HEAD", first_parent=True)), [])
+
+    def test_api_lint_range(self):
+        with self.count_git_calls() as git_calls:
+            results = list(Linter().lint_range(self.repo, "HEAD~2..HEAD"))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "log": 1, "config": 1}))
+
+    def test_paths_and_first_parent(self):
+        def commit_file(path, title):
+            os.makedirs(os.path.join(self.repo, os.path.dirname(path)), exist_ok=True)
+            with open(os.path.join(self.repo, path), "a", encoding="UTF-8") as file:
+                file.write(f"{title}\n")
+            self.git("add", path)
+            self.git("commit", "--quiet", "-m", title, "-m", "Bödy that is long enough")
+
+        self.git("tag", "base")
+        commit_file("äpp/main.py", "WIP: äpp 1")
+        commit_file("döcs/index.md", "WIP: döcs 1")
+        self.git("checkout", "--quiet", "-b", "side")
+        commit_file("äpp/side.py", "WIP: äpp side")
+        self.git("checkout", "--quiet", "-")
+        self.git("merge", "--quiet", "--no-ff", "-m", "Merge side", "side")
+        commit_file("döcs/index.md", "WIP: döcs 2")
+
+        def linted_titles(**kwargs):
+            return [result.commit.message.title for result in Linter().lint_range(self.repo, "base..HEAD", **kwargs)]
+
+        self.assertListEqual(linted_titles(paths=["äpp"]), ["WIP: äpp side", "WIP: äpp 1"])
+        self.assertListEqual(linted_titles(first_parent=True), ["WIP: döcs 2", "WIP: döcs 1", "WIP: äpp 1"])
+        self.assertListEqual(linted_titles(paths=["äpp"], first_parent=True), ["WIP: äpp 1"])
+        self.assertListEqual(linted_titles(paths=[":(glob)**/*.md"]), ["WIP: döcs 2", "WIP: döcs 1"])
+
+        # Paths and first-parent are evaluated by git rev-list, no additional git calls are required
+        with self.count_git_calls() as git_calls:
+            args = ["--ignore-stdin", "--commits", "base..HEAD", "--path", "äpp", "--path", "döcs", "--first-parent"]
+            result = self.invoke(args)
+        self.assertEqual(result.exit_code, 3)
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "log": 1, "config": 1}))
+
+        for args in [["--path", "äpp"], ["--first-parent", "--commit", "HEAD"], ["--first-parent", "--commits", "a,b"]]:
+            result = self.cli.invoke(cli.cli, ["--target", self.repo, "--ignore-stdin", *args])
+            self.assertEqual(result.exit_code, cli.USAGE_ERROR_CODE)
+            self.assertEqual(
+                result.output,
+                "Error: --path and --first-parent can only be used with a range of commits (--commits).\n",
+            )
+
+    def test_directory_configs(self):
+        def commit_files(title, files):
+            for path, contents in files.items():
+                os.makedirs(os.path.join(self.repo, os.path.dirname(path)), exist_ok=True)
+                with open(os.path.join(self.repo, path), "a", encoding="UTF-8") as file:
+                    file.write(contents)
+            self.git("add", *files)
+            self.git("commit", "--quiet", "-m", title, "-m", "Bödy that is long enough")
+
+        app_config = "[general]\nignore=T5\nignore-fixup-commits=false\n[title-max-length]\nline-length=10\n"
+        # Git quotes non-ASCII file names in its diff-tree output, so these aren't used here
+        commit_files("WIP: äpp", {"app/.gitlint": app_config, "app/main.py": "1"})
+        commit_files("WIP: döcs", {"docs/index.md": "1"})
+        # Fixup commits are skipped by the regular config, but not by the config of the app directory
+        commit_files("fixup! WIP: äpp", {"app/main.py": "2"})
+
+        def lint(directory_configs):
+            config_builder = LintConfigBuilder()
+            config_builder.set_option("general", "target", self.repo)
+            config_builder.set_option("general", "directory-configs", directory_configs)
+            results = Linter(config_builder).lint_range(self.repo, "HEAD~3..HEAD")
+            return [
+                (result.commit.message.title, [violation.rule_id for violation in result.violations])
+                for result in results
+            ]
+
+        self.assertListEqual(lint(False), [("WIP: döcs", ["T5"]), ("WIP: äpp", ["T5"])])
+        self.assertListEqual(lint(True), [("fixup! WIP: äpp", ["T1"]), ("WIP: döcs", ["T5"]), ("WIP: äpp", [])])
+
+        # The changed files that determine the configs are retrieved in bulk: once for the commits that may be
+        # skipped while walking the range (here: the fixup commit) and once for the other commits
+        args = ["--ignore-stdin", "-c", "general.directory-configs=true", "--commits", "HEAD~3..HEAD"]
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(args)
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "config": 1, "log": 2, "diff-tree": 2}))
+
+    def test_repos(self):
+        # Repositories with identical config files share a single config, repositories without one use the defaults
+        repos = [self.repo]
+        for name in ("repö2", "repö3"):
+            repo = os.path.join(tempfile.mkdtemp(), name)
+            self.addCleanup(shutil.rmtree, os.path.dirname(repo))
+            subprocess.run(["git", "clone", "--quiet", self.repo, repo], check=True, capture_output=True)
+            repos.append(repo)
+        for repo in repos[:2]:
+            with open(os.path.join(repo, ".gitlint"), "w", encoding="UTF-8") as config_file:
+                config_file.write("[title-max-length]\nline-length=10\n")
+
+        manifest_path = os.path.join(os.path.dirname(repos[2]), "manifest.txt")
+        with open(manifest_path, "w", encoding="UTF-8") as manifest:
+            manifest.write(f"# Repositories to lint\n\nrepö3 HEAD~1..HEAD\n{repos[0]}\n")
+
+        args = ["--ignore-stdin", "repos", "--jobs", "2", repos[1], "--manifest", manifest_path]
+        with self.count_git_calls() as git_calls, patch("gitlint.repos.Linter", wraps=Linter) as linter:
+            result = self.invoke(args)
+        self.assertEqual(linter.call_count, 2)
+        self.assertEqual(result.exit_code, 5)
+        # git log -1 --pretty=%H + git log <sha> for the last commit, git rev-list + git log for ranges
+        self.assertEqual(git_calls, Counter({"log": 5, "rev-list": 1, "config": 3}))
+
+        # Output is grouped by repository, in the order the repositories were passed
+        title_violation = '1: T1 Title exceeds max length (13>10): "WIP: cömmit 2"'
+        wip_violation = "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: cömmit 2\""
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, args)
+        sha = subprocess.run(
+            ["git", "rev-parse", "--short=10", "HEAD"], cwd=self.repo, check=True, capture_output=True, text=True
+        ).stdout.strip()
+        expected = [
+            f"Repository {os.path.realpath(repos[1])}:",
+            f"Commit {sha}:",
+            title_violation,
+            wip_violation,
+            "",
+            f"Repository {os.path.realpath(repos[2])}:",
+            f"Commit {sha}:",
+            wip_violation,
+            "",
+            f"Repository {os.path.realpath(repos[0])}:",
+            f"Commit {sha}:",
+            title_violation,
+            wip_violation,
+        ]
+        self.assertListEqual(stderr.getvalue().splitlines(), expected)
+
+        # Repositories that can't be linted are reported, the other repositories are still linted
+        with open(manifest_path, "w", encoding="UTF-8") as manifest:
+            manifest.write("repö3 föo..HEAD\n")
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, [*args[:5], "--manifest", manifest_path])
+        self.assertEqual(result.exit_code, cli.GIT_CONTEXT_ERROR_CODE)
+        self.assertIn(f"gitlint: {os.path.realpath(repos[2])}: ", result.output)
+        self.assertEqual(stderr.getvalue().splitlines()[0], f"Repository {os.path.realpath(repos[1])}:")
+
+    def test_recurse_submodules(self):
+        submodule = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, submodule)
+        subprocess.run(["git", "init", "--quiet", submodule], check=True, capture_output=True)
+        self.git("-C", submodule, "commit", "--quiet", "--allow-empty", "-m", "Initial cömmit")
+        self.git("-c", "protocol.file.allow=always", "submodule", "--quiet", "add", submodule, "süb")
+        self.git("commit", "--quiet", "-m", "Add süb", "-m", "Bödy that is long enough")
+
+        # Two submodule updates, pulling in 3 submodule commits
+        for i in range(2):
+            for j in range(i + 1):
+                title = f"WIP: süb cömmit {i}.{j}"
+                self.git(
+                    "-C", "süb", "commit", "--quiet", "--allow-empty", "-m", title, "-m", "Bödy that is long enough"
+                )
+            self.git("add", "süb")
+            self.git("commit", "--quiet", "-m", f"Update süb {i}", "-m", "Bödy that is long enough")
+
+        # Superproject: git rev-list + git log + git config, submodule updates: git log,
+        # submodule: git rev-list + git log + git config
+        args = ["--ignore-stdin", "--recurse-submodules", "--commits", "HEAD~2..HEAD"]
+        with self.count_git_calls() as git_calls, patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--target", self.repo, *args])
+        self.assertEqual(result.exit_code, 3)
+        self.assertEqual(git_calls, Counter({"rev-list": 2, "log": 3, "config": 2}))
+        lines = stderr.getvalue().splitlines()
+        self.assertEqual(lines[0], "Submodule süb:")
+        self.assertEqual(len([line for line in lines if line.startswith("Commit ")]), 3)
+        self.assertIn("1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: süb cömmit 1.1\"", lines)
+
+        # Superproject violations come first, submodule violations are added to the exit code
+        result = self.invoke(["--ignore-stdin", "--recurse-submodules", "--commits", "HEAD~5..HEAD"])
+        self.assertEqual(result.exit_code, 5)
+
+        # Submodule updates that are merged in (merge commits themselves are ignored)
+        self.git("checkout", "--quiet", "-b", "süb-update")
+        body = "Bödy that is long enough"
+        self.git("-C", "süb", "commit", "--quiet", "--allow-empty", "-m", "WIP: süb cömmit 2.0", "-m", body)
+        self.git("commit", "--quiet", "--all", "-m", "Update süb 2", "-m", body)
+        self.git("checkout", "--quiet", "-")
+        self.git("merge", "--quiet", "--no-ff", "-m", "Integrate the süb update", "süb-update")
+
+        # Only the merge commit is in the range, the submodule update is part of its changes
+        args = ["--ignore-stdin", "--recurse-submodules", "--commits", "süb-update..HEAD"]
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--target", self.repo, *args])
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn(
+            "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: süb cömmit 2.0\"", stderr.getvalue()
+        )
+
+        args = ["--ignore-stdin", "--recurse-submodules", "--commits", "HEAD~2..HEAD"]
+
+        # Commits pulled in by submodules that aren't checked out can't be linted
+        self.git("submodule", "--quiet", "deinit", "--force", "süb")
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--target", self.repo, *args])
+        self.assertEqual(result.exit_code, cli.GIT_CONTEXT_ERROR_CODE)
+        self.assertIn("gitlint: submodule süb is not checked out, can't lint ", result.output)
+        self.assertEqual(stderr.getvalue(), "")
+
+        result = self.cli.invoke(cli.cli, ["--target", self.repo, "--ignore-stdin", "--recurse-submodules"])
+        self.assertEqual(result.exit_code, cli.USAGE_ERROR_CODE)
+        expected = "Error: --recurse-submodules can only be used with a range of commits (--commits).\n"
+        self.assertEqual(result.output, expected)
+
+    def test_tags(self):
+        for i in range(50):
+            self.git(
+                "tag", "--annotate", f"v1.{i}", "--message", f"Rélease 1.{i}", "--message", "Bödy that is long enough"
+            )
+        self.git("tag", "--annotate", "v2.0", "--message", "WIP: rélease 2.0", "--message", "Bödy that is long enough")
+        self.git("tag", "lïghtweight")
+
+        # All tags are retrieved using a single git call
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(["tags"])
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(git_calls, Counter({"for-each-ref": 1, "config": 1}))
+
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--target", self.repo, "tags", "v1.*"])
+        self.assertEqual(result.exit_code, 0)
+        self.assertEqual(stderr.getvalue(), "")
+
+        expected = "Tag v2.0:\n1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: rélease 2.0\"\n"
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["--target", self.repo, "tags", "v1.1*", "v2.*"])
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(stderr.getvalue(), expected)
+
+        results = list(Linter().lint_tags(self.repo, ["v2.*", "lïghtweight"]))
+        self.assertListEqual([result.commit.name for result in results], ["v2.0"])
+        self.assertEqual(results[0].commit.author_email, "test@gitlint.com")
+        self.assertListEqual([violation.rule_id for violation in results[0].violations], ["T5"])
+
+    def test_bundle(self):
+        bundle_path = os.path.join(self.repo, "commits.bundle")
+        self.git("commit", "--quiet", "--allow-empty", "-m", "Cömmit 3", "-m", "Bödy that is long enough")
+        self.git("branch", "--move", "main")
+        self.git("bundle", "create", bundle_path, "HEAD~3..main")
+
+        # The bundle is read directly, the only git call is the one to get the commentchar. The prerequisite of the
+        # bundle (HEAD~3) isn't part of it and isn't linted.
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(["bundle", bundle_path])
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(git_calls, Counter({"config": 1}))
+
+        results = list(Linter().lint_bundle(bundle_path))
+        log = subprocess.run(["git", "log", "-3", "--format=%H"], cwd=self.repo, capture_output=True, text=True)
+        self.assertListEqual([result.commit.sha for result in results], log.stdout.split())
+        titles = ["Cömmit 3", "WIP: cömmit 2", "WIP: cömmit 1"]
+        self.assertListEqual([result.commit.message.title for result in results], titles)
+        self.assertListEqual([len(result.violations) for result in results], [0, 1, 1])
+        self.assertEqual(results[0].commit.author_email, "test@gitlint.com")
+        self.assertListEqual(results[0].commit.branches, ["main"])
+
+        result = self.cli.invoke(cli.cli, ["--target", self.repo, "bundle", os.path.join(self.repo, ".git/HEAD")])
+        self.assertEqual(result.exit_code, 254)
+        self.assertEqual(result.output, f"{os.path.join(self.repo, '.git/HEAD')} is not a git bundle.\n")
+
+    def test_bundle_merge(self):
+        # Merge commits are recognized by their parents, like in a repository, also when they have a custom title
+        self.git("checkout", "--quiet", "-b", "feature")
+        self.git("commit", "--quiet", "--allow-empty", "-m", "Feature cömmit", "-m", "Bödy that is long enough")
+        self.git("checkout", "--quiet", "-")
+        self.git("merge", "--quiet", "--no-ff", "-m", "WIP: integrate the feature", "feature")
+        bundle_path = os.path.join(self.repo, "commits.bundle")
+        self.git("bundle", "create", bundle_path, "HEAD~1..HEAD")
+
+        results = list(Linter().lint_bundle(bundle_path))
+        titles = ["WIP: integrate the feature", "Feature cömmit"]
+        self.assertListEqual([result.commit.message.title for result in results], titles)
+        self.assertListEqual([result.commit.is_merge_commit for result in results], [True, False])
+        self.assertListEqual([result.violations for result in results], [[], []])
+
+        result = self.invoke(["-c", "general.ignore-merge-commits=false", "bundle", bundle_path])
+        self.assertEqual(result.exit_code, 1)
+
+    def test_git_record_replay(self):
+        recording = os.path.join(self.repo, "recording.json.gz")
+        args = ["--ignore-stdin", "-c", "B7.files=föo", "--commits", "HEAD~2..HEAD"]
+        with self.count_git_calls() as git_calls:
+            recorded = self.invoke(["--git-record", recording, *args])
+        self.assertEqual(recorded.exit_code, 2)
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "log": 1, "config": 1, "diff-tree": 1}))
+
+        # Replaying yields the same results without running git at all, also when the repository is gone
+        shutil.move(os.path.join(self.repo, ".git"), os.path.join(self.repo, "git-backup"))
+        with self.count_git_calls() as git_calls:
+            replayed = self.invoke(["--git-replay", recording, *args])
+        self.assertEqual(replayed.exit_code, 2)
+        self.assertEqual(replayed.output, recorded.output)
+        self.assertEqual(git_calls, Counter())
+
+        # Git calls that weren't recorded can't be replayed
+        result = self.cli.invoke(
+            cli.cli, ["--target", self.repo, "--git-replay", recording, "--ignore-stdin", "--commit", "HEAD"]
+        )
+        self.assertEqual(result.exit_code, 254)
+        expected = f"'git log -1 HEAD --pretty=%H' in {os.path.relpath(self.repo)} is not part of {recording}.\n"
+        self.assertEqual(result.output, expected)
+
+        result = self.cli.invoke(cli.cli, ["--git-record", recording, "--git-replay", recording])
+        self.assertEqual(result.exit_code, 253)
+        self.assertEqual(result.output, "Error: --git-record and --git-replay can't be used together.\n")
+
+        # The recording directory is checked before linting
+        missing_dir = os.path.join(self.repo, "missing")
+        result = self.cli.invoke(cli.cli, ["--git-record", os.path.join(missing_dir, "recording.json.gz")])
+        self.assertEqual(result.exit_code, cli.USAGE_ERROR_CODE)
+        self.assertIn(f"Invalid value for '--git-record': Directory '{missing_dir}' does not exist.", result.stderr)
+
+    def test_fail_fast(self):
+        # B7 needs the changed files of a commit, which are retrieved for all commits at once
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(["--ignore-stdin", "-c", "B7.files=föo", "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "log": 1, "config": 1, "diff-tree": 1}))
+
+        # In fail-fast mode, cheap rules are applied first and linting stops after the first violation, so the
+        # changed files are never retrieved and the second commit is skipped
+        with self.count_git_calls() as git_calls:
+            result = self.invoke(["--ignore-stdin", "-c", "B7.files=föo", "--fail-fast", "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 1)
+        self.assertEqual(result.stderr, "gitlint: stopped after 1 violation(s), skipped 1 commit(s).\n")
+        self.assertEqual(git_calls, Counter({"rev-list": 1, "log": 1, "config": 1}))
+
+        result = self.invoke(["--ignore-stdin", "--fail-fast=2", "--commits", "HEAD~2..HEAD", "lint"])
+        self.assertEqual(result.exit_code, 2)
+        self.assertEqual(result.stderr, "")
+
+    def test_stats(self):
+        result = self.invoke(["--ignore-stdin", "--stats", "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 2)
+        self.assertRegex(result.stderr, r"^gitlint stats: 2 commit\(s\) linted in [0-9.]+ms \([0-9.]+ commits/s\)\n")
+        self.assertRegex(result.stderr, r"\nlog +1 ")
+        self.assertRegex(result.stderr, r"\nrev-list +1 ")
+        self.assertRegex(result.stderr, r"\nconfig +1 ")
+        self.assertRegex(result.stderr, r"\ntotal +3 ")
+        self.assertRegex(result.stderr, r"\ncommentchar +[0-9]+ +1\n")
+
+    def test_api_stats(self):
+        # Run statistics match the git calls that are actually made
+        run_stats = RunStats()
+        with self.count_git_calls() as git_calls, run_stats.activate():
+            results = list(Linter().lint_range(self.repo, "HEAD~2..HEAD"))
+        self.assertEqual(len(results), 2)
+
+        stats = run_stats.as_dict()
+        self.assertEqual(stats["commits"], 2)
+        self.assertGreater(stats["commits_per_second"], 0)
+        self.assertEqual({command: item["calls"] for command, item in stats["git_commands"].items()}, git_calls)
+        # git rev-list outputs 'commit <sha>' (48 bytes) and the author name and subject (29 bytes) for 2 commits
+        self.assertEqual(stats["git_commands"]["rev-list"]["stdout_bytes"], 154)
+        # Commit messages are retrieved for all commits at once, before linting
+        self.assertEqual(stats["cache"]["message"]["misses"], 0)
+        self.assertEqual(stats["cache"]["commentchar"]["misses"], 1)
+        self.assertGreater(stats["cache"]["commentchar"]["hits"], 0)
+
+    def test_prometheus_textfile(self):
+        metrics_path = os.path.join(self.repo, "gitlint.prom")
+        result = self.invoke(["--ignore-stdin", "--prometheus-textfile", metrics_path, "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 2)
+        with open(metrics_path, encoding="UTF-8") as metrics_file:
+            metrics = metrics_file.read()
+        self.assertIn("gitlint_commits_total 2\n", metrics)
+        self.assertIn('gitlint_violations_total{rule="T5"} 2\n', metrics)
+        self.assertIn('gitlint_git_calls_total{command="log"} 1\n', metrics)
+        self.assertIn('gitlint_git_calls_total{command="rev-list"} 1\n', metrics)
+
+        # The metrics directory is checked before linting
+        missing_dir = os.path.join(self.repo, "missing")
+        metrics_path = os.path.join(missing_dir, "gitlint.prom")
+        result = self.cli.invoke(
+            cli.cli, ["--target", self.repo, "--ignore-stdin", "--prometheus-textfile", metrics_path]
+        )
+        self.assertEqual(result.exit_code, cli.USAGE_ERROR_CODE)
+        expected = f"Invalid value for '--prometheus-textfile': Directory '{missing_dir}' does not exist."
+        self.assertIn(expected, result.stderr)
+
+    def test_progress(self):
+        # Progress is only shown when stderr is a terminal
+        result = self.invoke(["--ignore-stdin", "--progress", "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 2)
+        self.assertNotIn(CLEAR_LINE, result.stderr)
+
+        with patch("gitlint.cli.ProgressObserver.is_supported", return_value=True):
+            result = self.invoke(["--ignore-stdin", "--progress", "--commits", "HEAD~2..HEAD"])
+        self.assertEqual(result.exit_code, 2)
+        # The progress line is cleared before violations are printed and when linting is done
+        self.assertRegex(result.stderr, r"^\r\x1b\[Kgitlint: \[1/2\]  50\.0%, [0-9.]+ commits/s, ETA 0:00:00, ")
+        self.assertRegex(result.stderr, r"\r\x1b\[Kgitlint: \[2/2\] 100\.0%, [0-9.]+ commits/s, slowest rule: ")
+        self.assertTrue(result.stderr.endswith(CLEAR_LINE))
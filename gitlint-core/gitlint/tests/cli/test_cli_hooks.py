@@ -1,6 +1,6 @@
 import os
 from io import StringIO
-from unittest.mock import patch
+from unittest.mock import call, patch
 
 from click.testing import CliRunner
 from gitlint import cli, config, hooks
@@ -87,6 +87,30 @@ class CLIHookTests(BaseTestCase):
         expected_config.target = os.path.realpath(os.getcwd())
         uninstall_hook.assert_called_once_with(expected_config)
 
+    @patch("gitlint.hooks.GitHookInstaller.install_pre_push_hook")
+    @patch("gitlint.hooks.git_hooks_dir", return_value=os.path.join("/hür", "dur"))
+    def test_install_hook_pre_push(self, _, install_hook):
+        """Test for install-hook subcommand with --type pre-push"""
+        result = self.cli.invoke(cli.cli, ["install-hook", "--type", "pre-push"])
+        expected_path = os.path.join("/hür", "dur", hooks.PRE_PUSH_HOOK_DST_PATH)
+        self.assertEqual(result.output, f"Successfully installed gitlint pre-push hook in {expected_path}\n")
+        self.assertEqual(result.exit_code, 0)
+        expected_config = config.LintConfig()
+        expected_config.target = os.path.realpath(os.getcwd())
+        install_hook.assert_called_once_with(expected_config)
+
+    @patch("gitlint.hooks.GitHookInstaller.uninstall_pre_push_hook")
+    @patch("gitlint.hooks.git_hooks_dir", return_value=os.path.join("/hür", "dur"))
+    def test_uninstall_hook_pre_push(self, _, uninstall_hook):
+        """Test for uninstall-hook subcommand with --type pre-push"""
+        result = self.cli.invoke(cli.cli, ["uninstall-hook", "--type", "pre-push"])
+        expected_path = os.path.join("/hür", "dur", hooks.PRE_PUSH_HOOK_DST_PATH)
+        self.assertEqual(result.output, f"Successfully uninstalled gitlint pre-push hook from {expected_path}\n")
+        self.assertEqual(result.exit_code, 0)
+        expected_config = config.LintConfig()
+        expected_config.target = os.path.realpath(os.getcwd())
+        uninstall_hook.assert_called_once_with(expected_config)
+
     def test_run_hook_no_tty(self):
         """Test for run-hook subcommand.
         When no TTY is available (like is the case for this test), the hook will abort after the first check.
@@ -275,3 +299,271 @@ class CLIHookTests(BaseTestCase):
             self.assertEqual(result.output, self.get_expected("cli/test_cli_hooks/test_hook_local_commit_1_stdout"))
             # If we can't edit the message, run-hook follows regular gitlint behavior and exit code = # violations
             self.assertEqual(result.exit_code, 2)
+
+    @patch("gitlint.git.sh")
+    def test_pre_receive(self, sh):
+        """Test for pre-receive subcommand"""
+        sh.git.side_effect = [
+            # git rev-list --no-merges --format=%x00%aN%x00%s
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00WIP: commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
+            "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00\nWIP: commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
+            "test åuthor2\x00test-email2@föo.com\x002016-12-04 15:28:15 +0100\x00\ncommït-title2\n\ncommït-body2\x00",
+            "3\t5\tcommit-1/file-1\n",  # git diff-tree
+            "commit-1-branch-1\n",  # git branch --contains <sha>
+            "8\t3\tcommit-2/file-1\n",  # git diff-tree
+            "commit-2-branch-1\n",  # git branch --contains <sha>
+        ]
+
+        # Updated ref, new ref pointing to the same commit and a deleted ref
+        stdin = (
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125 6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/main\n"
+            "0000000000000000000000000000000000000000 6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/fëature\n"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401 0000000000000000000000000000000000000000 refs/heads/old\n"
+        )
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["pre-receive"], input=stdin)
+            expected_stderr = (
+                "Commit 6f29bf81a8:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: commït-title1\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body1"\n\n'
+                "Commit 25053ccec5:\n"
+                '3: B5 Body message is too short (12<20): "commït-body2"\n'
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            self.assertEqual(result.exit_code, 3)
+
+        # All new commits are determined in a single rev-list call, excluding commits reachable from existing refs
+        self.assertEqual(
+            sh.git.mock_calls[0],
+            call(
+                "rev-list",
+                "--no-merges",
+                "--format=%x00%aN%x00%s",
+                "--stdin",
+                "--not",
+                "--all",
+                _in="6f29bf81a8322a04071bb794666e48c443a90360\n",
+                _tty_out=False,
+                _cwd=os.path.realpath(os.getcwd()),
+            ),
+        )
+
+    @patch("gitlint.cli.time.monotonic", side_effect=[0, 0.5, 0.5, 1.5])
+    @patch("gitlint.git.sh")
+    def test_pre_receive_time_budget(self, sh, _):
+        """Test for pre-receive subcommand with a time budget that is exceeded before all commits are linted: the
+        commits that aren't linted count as violations, so the push is rejected"""
+        sh.git.side_effect = [
+            # git rev-list --no-merges --format=%x00%aN%x00%s
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00WIP: commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
+            "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00\nWIP: commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
+            "test åuthor2\x00test-email2@föo.com\x002016-12-04 15:28:15 +0100\x00\ncommït-title2\n\ncommït-body2\x00",
+            "3\t5\tcommit-1/file-1\n",  # git diff-tree
+            "commit-1-branch-1\n",  # git branch --contains <sha>
+        ]
+
+        stdin = "4da2656b0dadc76c7ee3fd0243a96cb64007f125 6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/main\n"
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["pre-receive", "--time-budget", "1"], input=stdin)
+            expected_stderr = (
+                "Commit 6f29bf81a8:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: commït-title1\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body1"\n'
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            expected_output = (
+                "gitlint: time budget of 1.0s exceeded, 1 commit(s) not linted, counting them as violations.\n"
+            )
+            self.assertEqual(result.output, expected_output)
+            self.assertEqual(result.exit_code, 3)
+
+    # The deadline is checked before prefetching every batch and before linting every commit
+    @patch("gitlint.cli.time.monotonic", side_effect=[0, 0.5, 0.5, 1.5, 1.5])
+    @patch("gitlint.git.PREFETCH_BATCH_SIZE", 1)
+    @patch("gitlint.git.sh")
+    def test_pre_receive_time_budget_accept_unlinted(self, sh, _):
+        """Test for pre-receive subcommand with a time budget and --accept-unlinted: commits that aren't linted within
+        the time budget are accepted, and the batches they are part of aren't prefetched"""
+        sh.git.side_effect = [
+            # git rev-list --no-merges --format=%x00%aN%x00%s
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00WIP: commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (first batch only)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
+            "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00\nWIP: commït-title1\n\ncommït-body1\x00",
+            "3\t5\tcommit-1/file-1\n",  # git diff-tree
+            "commit-1-branch-1\n",  # git branch --contains <sha>
+        ]
+
+        stdin = "4da2656b0dadc76c7ee3fd0243a96cb64007f125 6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/main\n"
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["pre-receive", "--time-budget", "1", "--accept-unlinted"], input=stdin)
+            expected_stderr = (
+                "Commit 6f29bf81a8:\n"
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: commït-title1\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body1"\n'
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            self.assertEqual(result.output, "gitlint: time budget of 1.0s exceeded, skipped 1 commit(s).\n")
+            self.assertEqual(result.exit_code, 2)
+        self.assertEqual(sh.git.call_count, 5)
+
+    @patch("gitlint.git.sh")
+    def test_pre_receive_no_new_commits(self, sh):
+        """Test for pre-receive subcommand when a push doesn't introduce new commits"""
+        sh.git.side_effect = [""]  # git rev-list
+
+        stdin = (
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125 6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/main\n"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401 0000000000000000000000000000000000000000 refs/heads/old\n"
+        )
+        result = self.cli.invoke(cli.cli, ["pre-receive"], input=stdin)
+        self.assertEqual(result.output, "")
+        self.assertEqual(result.exit_code, 0)
+
+        # Only deleted refs: no git calls required at all
+        sh.git.reset_mock()
+        stdin = "25053ccec5e28e1bb8f7551fdbb5ab213ada2401 0000000000000000000000000000000000000000 refs/heads/old\n"
+        result = self.cli.invoke(cli.cli, ["pre-receive"], input=stdin)
+        self.assertEqual(result.output, "")
+        self.assertEqual(result.exit_code, 0)
+        sh.git.assert_not_called()
+
+    @patch("gitlint.git.sh")
+    def test_pre_push(self, sh):
+        """Test for pre-push subcommand"""
+        sh.git.side_effect = [
+            # git rev-list --no-merges --format=%x00%aN%x00%s
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00WIP: commït-title1\n",
+            "#",  # git config --get core.commentchar
+            "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00\nWIP: commït-title1\n\ncommït-body1",
+            "3\t5\tcommit-1/file-1\n",  # git diff-tree
+            "commit-1-branch-1\n",  # git branch --contains <sha>
+        ]
+
+        # Pushed branch, pushed tag pointing to the same commit and a deleted remote branch
+        stdin = (
+            "refs/heads/fëature 6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/fëature "
+            "0000000000000000000000000000000000000000\n"
+            "refs/tags/v1 6f29bf81a8322a04071bb794666e48c443a90360 refs/tags/v1 "
+            "0000000000000000000000000000000000000000\n"
+            "(delete) 0000000000000000000000000000000000000000 refs/heads/old "
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n"
+        )
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["pre-push", "origin", "git@example.com:repo.git"], input=stdin)
+            expected_stderr = (
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: commït-title1\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body1"\n'
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            self.assertEqual(result.exit_code, 2)
+
+        # Commits reachable from any remote-tracking branch are excluded in the same rev-list call
+        self.assertEqual(
+            sh.git.mock_calls[0],
+            call(
+                "rev-list",
+                "--no-merges",
+                "--format=%x00%aN%x00%s",
+                "--stdin",
+                "--not",
+                "--remotes",
+                _in="6f29bf81a8322a04071bb794666e48c443a90360\n",
+                _tty_out=False,
+                _cwd=os.path.realpath(os.getcwd()),
+            ),
+        )
+
+    @patch("gitlint.git.sh")
+    def test_pre_push_no_new_commits(self, sh):
+        """Test for pre-push subcommand when all pushed commits are already on the remote"""
+        sh.git.side_effect = [""]  # git rev-list
+
+        stdin = (
+            "refs/heads/main 6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/main "
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125\n"
+        )
+        result = self.cli.invoke(cli.cli, ["pre-push", "origin", "git@example.com:repo.git"], input=stdin)
+        self.assertEqual(result.output, "")
+        self.assertEqual(result.exit_code, 0)
+
+    @patch("gitlint.watch.RefWatcher")
+    @patch("gitlint.git.sh")
+    def test_watch(self, sh, ref_watcher):
+        """Test for watch subcommand"""
+        sh.git.side_effect = [
+            ".git\n.git\n",  # git rev-parse --git-dir --git-common-dir
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125 HEAD\n"  # git show-ref --head
+            "4da2656b0dadc76c7ee3fd0243a96cb64007f125 refs/heads/main\n"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401 refs/heads/öther\n",
+            "6f29bf81a8322a04071bb794666e48c443a90360 HEAD\n"  # git show-ref --head (after 1st update)
+            "6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/main\n"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401 refs/heads/öther\n",
+            # git rev-list --no-merges --format=%x00%aN%x00%s
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00WIP: commït-title1\n",
+            "#",  # git config --get core.commentchar
+            "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00\nWIP: commït-title1\n\ncommït-body1",
+            "3\t5\tcommit-1/file-1\n",  # git diff-tree
+            "commit-1-branch-1\n",  # git branch --contains <sha>
+            "6f29bf81a8322a04071bb794666e48c443a90360 HEAD\n"  # git show-ref --head (after 2nd update: no changes)
+            "6f29bf81a8322a04071bb794666e48c443a90360 refs/heads/main\n"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401 refs/heads/öther\n",
+        ]
+        ref_watcher.return_value.mode = "pölling"
+        ref_watcher.return_value.wait.side_effect = [True, True, KeyboardInterrupt]
+
+        with patch("gitlint.display.stderr", new=StringIO()) as stderr:
+            result = self.cli.invoke(cli.cli, ["watch", "--poll", "--debounce", "0.1"])
+            expected_stderr = (
+                "1: T5 Title contains the word 'WIP' (case-insensitive): \"WIP: commït-title1\"\n"
+                '3: B5 Body message is too short (12<20): "commït-body1"\n'
+            )
+            self.assertEqual(stderr.getvalue(), expected_stderr)
+            target = os.path.realpath(os.getcwd())
+            expected_output = (
+                f"gitlint: watching {target} for new commits (pölling), press Ctrl+C to stop.\n"
+                "gitlint: 1 new commit(s) in HEAD, refs/heads/main\n"
+            )
+            self.assertEqual(result.output, expected_output)
+            self.assertEqual(result.exit_code, 0)
+
+        ref_watcher.assert_called_once_with(
+            os.path.join(target, ".git"), os.path.join(target, ".git"), 0.1, 1.0, use_inotify=False
+        )
+        ref_watcher.return_value.close.assert_called_once()
+
+        # Only commits that weren't reachable from any ref before the update are linted, commits that gitlint ignores
+        # altogether (like merge commits) are skipped while walking them
+        self.assertEqual(
+            sh.git.mock_calls[3],
+            call(
+                "rev-list",
+                "--no-merges",
+                "--format=%x00%aN%x00%s",
+                "--stdin",
+                _in="6f29bf81a8322a04071bb794666e48c443a90360\n^4da2656b0dadc76c7ee3fd0243a96cb64007f125\n"
+                "^25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n",
+                _tty_out=False,
+                _cwd=target,
+            ),
+        )
+
+    @patch("gitlint.git.sh")
+    def test_watch_not_a_repo(self, sh):
+        """Test for watch subcommand when the target is not a git repository"""
+        sh.git.side_effect = ErrorReturnCode("git rev-parse --git-dir", b"", b"fatal: not a git repository", 128)
+        result = self.cli.invoke(cli.cli, ["watch"])
+        self.assertEqual(result.exit_code, self.GIT_CONTEXT_ERROR_CODE)
+        self.assertIn("not a git repository", result.output)
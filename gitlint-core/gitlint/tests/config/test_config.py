@@ -54,7 +54,9 @@ class LintConfigTests(BaseTestCase):
 
         self.assertFalse(config.ignore_stdin)
         self.assertFalse(config.staged)
+        self.assertFalse(config.mailmap)
         self.assertFalse(config.fail_without_commits)
+        self.assertEqual(config.fail_fast, 0)
         self.assertTrue(config.regex_style_search)
         self.assertFalse(config.debug)
         self.assertEqual(config.verbosity, 3)
@@ -105,10 +107,18 @@ class LintConfigTests(BaseTestCase):
         config.set_general_option("staged", "true")
         self.assertTrue(config.staged)
 
+        # mailmap
+        config.set_general_option("mailmap", "true")
+        self.assertTrue(config.mailmap)
+
         # fail-without-commits
         config.set_general_option("fail-without-commits", "true")
         self.assertTrue(config.fail_without_commits)
 
+        # fail-fast
+        config.set_general_option("fail-fast", "3")
+        self.assertEqual(config.fail_fast, 3)
+
         # regex-style-search
         config.set_general_option("regex-style-search", "true")
         self.assertTrue(config.regex_style_search)
@@ -231,6 +241,12 @@ class LintConfigTests(BaseTestCase):
             with self.assertRaisesMessage(LintConfigError, "Option 'verbosity' must be set between 0 and 3"):
                 config.verbosity = value
 
+        # invalid fail-fast
+        for value in [-1, "föo"]:
+            expected_msg = f"Option 'fail-fast' must be a positive integer (current value: '{value}')"
+            with self.assertRaisesMessage(LintConfigError, expected_msg):
+                config.fail_fast = value
+
         # invalid ignore_xxx_commits
         ignore_attributes = [
             "ignore_merge_commits",
@@ -252,7 +268,7 @@ class LintConfigTests(BaseTestCase):
         # splitting which means it it will accept just about everything
 
         # invalid boolean options
-        for attribute in ["debug", "staged", "ignore_stdin", "fail_without_commits", "regex_style_search"]:
+        for attribute in ["debug", "staged", "mailmap", "ignore_stdin", "fail_without_commits", "regex_style_search"]:
             option_name = attribute.replace("_", "-")
             with self.assertRaisesMessage(LintConfigError, f"Option '{option_name}' must be either 'true' or 'false'"):
                 setattr(config, attribute, "föobar")
@@ -265,6 +281,21 @@ class LintConfigTests(BaseTestCase):
         ):
             config.target = "föo/bar"
 
+    def test_directory_configs(self):
+        config = LintConfig()
+        self.assertFalse(config.directory_configs)
+        self.assertEqual(config.directory_config_merge, "common")
+
+        config.set_general_option("directory-configs", "true")
+        self.assertTrue(config.directory_configs)
+        config.set_general_option("directory-config-merge", "all")
+        self.assertEqual(config.directory_config_merge, "all")
+
+        expected_msg = "Option 'directory-config-merge' must be one of: common, all (current value: 'föo')"
+        with self.assertRaisesMessage(LintConfigError, expected_msg):
+            config.directory_config_merge = "föo"
+        self.assertEqual(config.directory_config_merge, "all")
+
     def test_ignore_independent_from_rules(self):
         # Test that the lintconfig rules are not modified when setting config.ignore
         # This was different in the past, this test is mostly here to catch regressions
@@ -274,6 +305,29 @@ class LintConfigTests(BaseTestCase):
         self.assertEqual(config.ignore, ["T1", "T2"])
         self.assertSequenceEqual(config.rules, original_rules)
 
+    def test_copy(self):
+        config = LintConfig()
+        config.ignore = ["T1"]
+        config.set_rule_option("title-max-length", "line-length", 100)
+
+        # Full copy: nothing is shared
+        copied = config.copy()
+        self.assertEqual(copied, config)
+        copied.ignore.append("T2")
+        copied.set_rule_option("title-max-length", "line-length", 200)
+        copied.verbosity = 1
+        self.assertEqual(config.ignore, ["T1"])
+        self.assertEqual(config.get_rule_option("title-max-length", "line-length"), 100)
+        self.assertEqual(config.verbosity, 3)
+
+        # Only the given general options are copied, everything else is shared
+        copied = config.copy(["ignore"])
+        self.assertEqual(copied, config)
+        copied.ignore.append("T2")
+        self.assertEqual(config.ignore, ["T1"])
+        self.assertIs(copied.rules, config.rules)
+        self.assertIs(copied._verbosity, config._verbosity)
+
     def test_config_equality(self):
         self.assertEqual(LintConfig(), LintConfig())
         self.assertNotEqual(LintConfig(), LintConfigGenerator())
@@ -282,7 +336,10 @@ class LintConfigTests(BaseTestCase):
         attrs = [
             ("contrib", ["CC1"]),
             ("debug", True),
+            ("directory_configs", True),
+            ("directory_config_merge", "all"),
             ("extra_path", self.get_sample_path("user_rules")),
+            ("fail_fast", 1),
             ("fail_without_commits", True),
             ("ignore", ["T1"]),
             ("ignore_stdin", True),
@@ -291,6 +348,7 @@ class LintConfigTests(BaseTestCase):
             ("ignore_fixup_amend_commits", False),
             ("ignore_squash_commits", False),
             ("ignore_revert_commits", False),
+            ("mailmap", True),
             ("regex_style_search", False),
             ("rules", []),
             ("staged", True),
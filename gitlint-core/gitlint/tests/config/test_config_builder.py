@@ -85,6 +85,19 @@ class LintConfigBuilderTests(BaseTestCase):
         self.assertEqual(config.get_rule_option("title-max-length", "line-length"), 20)
         self.assertEqual(config.get_rule_option("body-max-line-length", "line-length"), 30)
 
+    def test_build_existing_config(self):
+        config_builder = LintConfigBuilder()
+        config_builder.set_from_config_file(self.get_sample_path("config/gitlintconfig"))
+        config = config_builder.build()
+
+        # Rebuilding a config with a builder that wasn't loaded from a config file keeps the original config path
+        commit_config_builder = LintConfigBuilder()
+        commit_config_builder.set_config_from_commit(self.gitcommit("tëst\ngitlint-ignore: T1"))
+        commit_config = commit_config_builder.build(copy.deepcopy(config))
+        self.assertEqual(commit_config._config_path, config._config_path)
+        self.assertEqual(commit_config.ignore, ["T1"])
+        self.assertEqual(commit_config.get_rule_option("title-max-length", "line-length"), 20)
+
     def test_set_from_config_file_negative(self):
         config_builder = LintConfigBuilder()
 
@@ -156,6 +169,28 @@ class LintConfigBuilderTests(BaseTestCase):
         self.assertListEqual(config.get_rule_option("title-must-not-contain-word", "words"), ["håha"])
         self.assertEqual(config.verbosity, 1)
 
+    def test_set_config_from_builder(self):
+        config_builder = LintConfigBuilder()
+        config_builder.set_option("general", "verbosity", 2)
+        config_builder.set_option("title-max-length", "line-length", 100)
+
+        other_builder = LintConfigBuilder()
+        other_builder.set_option("title-max-length", "line-length", 120)
+        other_builder.set_option("body-max-line-length", "line-length", 150)
+        config_builder.set_config_from_builder(other_builder)
+
+        expected = {
+            "general": {"verbosity": 2},
+            "title-max-length": {"line-length": 120},
+            "body-max-line-length": {"line-length": 150},
+        }
+        self.assertDictEqual(config_builder._config_blueprint, expected)
+        # The other builder is not modified
+        self.assertDictEqual(
+            other_builder._config_blueprint,
+            {"title-max-length": {"line-length": 120}, "body-max-line-length": {"line-length": 150}},
+        )
+
     def test_set_config_from_string_list_negative(self):
         config_builder = LintConfigBuilder()
 
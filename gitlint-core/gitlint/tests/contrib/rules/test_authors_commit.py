@@ -1,6 +1,7 @@
 from collections import namedtuple
 from unittest.mock import patch
 
+from gitlint.cache import RESOURCE_CACHE
 from gitlint.config import LintConfig
 from gitlint.contrib.rules.authors_commit import AllowedAuthors
 from gitlint.rules import RuleViolation
@@ -14,6 +15,7 @@ class ContribAuthorsCommitTests(BaseTestCase):
         self.author_2 = author("Bob Smith", "bob.smith@mail.com")
         self.rule = AllowedAuthors()
         self.gitcontext = self.get_gitcontext()
+        RESOURCE_CACHE.clear()
 
     def get_gitcontext(self):
         gitcontext = self.gitcontext(self.get_sample("commit_message/sample1"))
@@ -87,7 +89,7 @@ class ContribAuthorsCommitTests(BaseTestCase):
         self.assertListEqual([expected_violation], violations)
 
     @patch(
-        "gitlint.contrib.rules.authors_commit.Path.read_text",
+        "gitlint.cache.Path.read_text",
         return_value="John Doe <john.doe@mail.com>",
     )
     def test_read_authors_file(self, _mock_read_text):
@@ -96,10 +98,15 @@ class ContribAuthorsCommitTests(BaseTestCase):
         self.assertEqual(len(authors), 1)
         self.assertEqual(authors, {self.author_1})
 
-    @patch(
-        "gitlint.contrib.rules.authors_commit.Path.exists",
-        return_value=False,
-    )
-    def test_read_authors_file_missing_file(self, _mock_iterdir):
-        with self.assertRaisesMessage(FileNotFoundError, "No AUTHORS file found!"):
-            AllowedAuthors._read_authors_from_file(self.gitcontext)
+    def test_read_authors_file_cached(self):
+        with patch("gitlint.cache.Path.read_text", return_value="John Doe <john.doe@mail.com>") as read_text:
+            for _ in range(3):
+                authors, _ = AllowedAuthors._read_authors_from_file(self.gitcontext)
+                self.assertEqual(authors, {self.author_1})
+            read_text.assert_called_once()
+
+    def test_read_authors_file_missing_file(self):
+        with self.tempdir() as tmpdir:
+            self.gitcontext.repository_path = tmpdir
+            with self.assertRaisesMessage(FileNotFoundError, "No AUTHORS file found!"):
+                AllowedAuthors._read_authors_from_file(self.gitcontext)
@@ -7,6 +7,7 @@ from gitlint.git import (
     GitNotInstalledError,
     git_commentchar,
     git_hooks_dir,
+    git_submodule_updates,
 )
 from gitlint.shell import CommandNotFound, ErrorReturnCode
 from gitlint.tests.base import BaseTestCase
@@ -119,3 +120,55 @@ class GitTests(BaseTestCase):
         self.assertEqual(git_hooks_dir("/blä"), os.path.abspath(os.path.join("/blä", hooks_dir)))
 
         git.assert_called_once_with("rev-parse", "--git-path", "hooks", _cwd="/blä")
+
+    @patch("gitlint.git._git")
+    def test_git_submodule_updates(self, git):
+        def raw_entry(old_mode, new_mode, old_sha, new_sha, status, path):
+            return f":{old_mode} {new_mode} {old_sha * 40} {new_sha * 40} {status}\0{path}\0"
+
+        # Newest commit first, entries for regular files are ignored
+        git.return_value = "".join(
+            [
+                raw_entry("160000", "160000", "b", "c", "M", "süb/one"),
+                raw_entry("100644", "100644", "1", "2", "M", "föo.txt"),
+                raw_entry("160000", "160000", "d", "e", "M", "sübtwo"),
+                raw_entry("160000", "160000", "a", "b", "M", "süb/one"),
+                # Submodules that were added in the range are linted from the commit they were added with
+                raw_entry("160000", "160000", "f", "1", "M", "ädded"),
+                raw_entry("000000", "160000", "0", "f", "A", "ädded"),
+                raw_entry("000000", "160000", "0", "2", "A", "ädded-only"),
+                # Removed submodules are not included
+                raw_entry("160000", "000000", "f", "0", "D", "rëmoved"),
+                raw_entry("160000", "160000", "e", "f", "M", "rëmoved"),
+            ]
+        )
+        expected = {"süb/one": ("a" * 40, "c" * 40), "sübtwo": ("d" * 40, "e" * 40), "ädded": ("f" * 40, "1" * 40)}
+        self.assertDictEqual(git_submodule_updates("/blä", "main..HEAD"), expected)
+        expected_args = ["-z", "--format=", "--raw", "-m", "--topo-order", "--no-abbrev", "--no-renames", "main..HEAD"]
+        git.assert_called_once_with("log", *expected_args, _cwd="/blä")
+
+        git.reset_mock()
+        git.return_value = ""
+        self.assertDictEqual(git_submodule_updates("/blä", "main..HEAD", ["süb"], first_parent=True), {})
+        expected_args = [
+            "-z",
+            "--format=",
+            "--raw",
+            "-m",
+            "--topo-order",
+            "--no-abbrev",
+            "--no-renames",
+            "--first-parent",
+            "main..HEAD",
+        ]
+        git.assert_called_once_with("log", *expected_args, "--", "süb", _cwd="/blä")
+
+        # Output that doesn't consist of raw entries and paths is an error
+        for output, entry in [
+            ("föo\0", "föo"),
+            (":160000 160000 a b M\0", ":160000 160000 a b M"),
+            (":160000 160000 a b\0süb\0", ":160000 160000 a b"),
+        ]:
+            git.return_value = output
+            with self.assertRaisesMessage(GitContextError, f"Unexpected output of 'git log --raw' in /blä: '{entry}'"):
+                git_submodule_updates("/blä", "main..HEAD")
@@ -30,7 +30,7 @@ class GitCommitTests(BaseTestCase):
             sample_sha,
             "test åuthor\x00test-emåil@foo.com\x002016-12-03 15:28:15 +0100\x00åbc\ncömmit-title\n\ncömmit-body",
             "#",  # git config --get core.commentchar
-            "4\t15\tfile1.txt\n-\t-\tpåth/to/file2.bin\n",
+            "4\t15\tfile1.txt\n-\t-\tpåth/to/file2.bin\n1\t0\tfile with  spåces.txt\n",
             "foöbar\n* hürdur\n",
         ]
 
@@ -75,10 +75,13 @@ class GitCommitTests(BaseTestCase):
         # First 2 'git log' calls should've happened at this point
         self.assertListEqual(sh.git.mock_calls, expected_calls[:3])
 
-        self.assertListEqual(last_commit.changed_files, ["file1.txt", "påth/to/file2.bin"])
+        # File names can contain spaces
+        expected_changed_files = ["file1.txt", "påth/to/file2.bin", "file with  spåces.txt"]
+        self.assertListEqual(last_commit.changed_files, expected_changed_files)
         expected_file_stats = {
             "file1.txt": GitChangedFileStats("file1.txt", 4, 15),
             "påth/to/file2.bin": GitChangedFileStats("påth/to/file2.bin", None, None),
+            "file with  spåces.txt": GitChangedFileStats("file with  spåces.txt", 1, 0),
         }
         self.assertDictEqual(last_commit.changed_files_stats, expected_file_stats)
 
@@ -157,6 +160,23 @@ class GitCommitTests(BaseTestCase):
         # All expected calls should've happened at this point
         self.assertListEqual(sh.git.mock_calls, expected_calls)
 
+    @patch("gitlint.git.sh")
+    def test_from_local_repository_paths_first_parent(self, sh):
+        sh.git.side_effect = ["åbc123\n"]  # git rev-list --first-parent <refspec> -- <paths>
+        context = GitContext.from_local_repository(
+            "fåke/path", refspec="åbc123..def456", paths=["påth/to", ":(glob)**/*.md"], first_parent=True
+        )
+        self.assertListEqual([commit.sha for commit in context.commits], ["åbc123"])
+        expected_args = ["--first-parent", "åbc123..def456", "--", "påth/to", ":(glob)**/*.md"]
+        self.assertListEqual(sh.git.mock_calls, [call("rev-list", *expected_args, **self.expected_sh_special_args)])
+
+        # Paths and first-parent are only supported for refspecs
+        expected_msg = "Paths and first-parent can only be used when retrieving a range of commits."
+        for kwargs in [{"paths": ["föo"]}, {"first_parent": True, "commit_hashes": ["åbc123"]}]:
+            with self.assertRaisesMessage(GitContextError, expected_msg):
+                GitContext.from_local_repository("fåke/path", **kwargs)
+        self.assertEqual(sh.git.call_count, 1)
+
     @patch("gitlint.git.sh")
     def test_from_local_repository_specific_commit_hash(self, sh):
         sample_hash = "åbc123"
@@ -562,6 +582,28 @@ class GitCommitTests(BaseTestCase):
         self.assertFalse(commit.is_revert_commit)
         self.assertEqual(len(gitcontext.commits), 1)
 
+    @patch("gitlint.git.git_commentchar")
+    def test_commit_from_msg(self, commentchar):
+        commentchar.return_value = "#"
+        gitcontext = GitContext(repository_path="fåke/path")
+        commit = gitcontext.commit_from_msg(
+            "Tïtle\n\nBödy\n#Cömment", sha="6f29bf81a8322a04071bb794666e48c443a90360", author_email="föo@bar.com"
+        )
+
+        self.assertIsInstance(commit, GitCommit)
+        self.assertIs(commit.context, gitcontext)
+        self.assertEqual(commit.message.title, "Tïtle")
+        self.assertEqual(commit.message.body, ["", "Bödy"])
+        self.assertEqual(commit.sha, "6f29bf81a8322a04071bb794666e48c443a90360")
+        self.assertEqual(commit.author_name, None)
+        self.assertEqual(commit.author_email, "föo@bar.com")
+        # Commits are not added to the context
+        self.assertListEqual(gitcontext.commits, [])
+
+        # Repository information is shared between commits of the same context
+        gitcontext.commit_from_msg("Tïtle 2")
+        commentchar.assert_called_once_with("fåke/path")
+
     def test_from_commit_msg_merge_commit(self):
         commit_msg = "Merge f919b8f34898d9b48048bcd703bc47139f4ff621 into 8b0409a26da6ba8a47c1fd2e746872a8dab15401"
         gitcontext = GitContext.from_commit_msg(commit_msg)
@@ -699,6 +741,29 @@ class GitCommitTests(BaseTestCase):
 
         self.assertListEqual(sh.git.mock_calls, expected_calls[0:5])
 
+    @patch("gitlint.git.sh")
+    def test_staged_commit_with_mailmap(self, sh):
+        sh.git.side_effect = [
+            "#",  # git config --get core.commentchar
+            "test åuthor\n",  # git config --get user.name
+            "test-emåil@foo.com\n",  # git config --get user.email
+            "Canonical Åuthor <canonical@foo.com>\n",  # git check-mailmap
+        ]
+
+        context = GitContext.from_staged_commit("Foōbar 123\n\ncömmit-body\n", "fåke/path", mailmap=True)
+        last_commit = context.commits[-1]
+
+        # Author name and email are determined together, and are resolved against the mailmap
+        self.assertEqual(last_commit.author_name, "Canonical Åuthor")
+        self.assertEqual(last_commit.author_email, "canonical@foo.com")
+        expected_calls = [
+            call("config", "--get", "core.commentchar", _ok_code=[0, 1], **self.expected_sh_special_args),
+            call("config", "--get", "user.name", **self.expected_sh_special_args),
+            call("config", "--get", "user.email", **self.expected_sh_special_args),
+            call("check-mailmap", "test åuthor <test-emåil@foo.com>", **self.expected_sh_special_args),
+        ]
+        self.assertListEqual(sh.git.mock_calls, expected_calls)
+
     @patch("gitlint.git.sh")
     def test_staged_commit_with_missing_username(self, sh):
         sh.git.side_effect = [
@@ -723,6 +788,37 @@ class GitCommitTests(BaseTestCase):
             ctx = GitContext.from_staged_commit("Foōbar 123\n\ncömmit-body\n", "fåke/path")
             ctx.commits[0].author_email  # accessing this attribute should raise an exception
 
+    @patch("gitlint.git.sh")
+    def test_copy(self, sh):
+        sample_sha = "d8ac47e9f2923c7f22d8668e3a1ed04eb4cdbca9"
+        sh.git.side_effect = [
+            "test åuthor\x00test-emåil@foo.com\x002016-12-03 15:28:15 +0100\x00åbc\ncömmit-title\n\ncömmit-body",
+            "#",  # git config --get core.commentchar
+        ]
+
+        commits = [
+            LocalGitCommit(GitContext(repository_path="fåke/path"), sample_sha),
+            self.gitcommit("cömmit-title\n\ncömmit-body", sha=sample_sha, author_name="test åuthor"),
+        ]
+        for commit in commits:
+            commit_copy = commit.copy()
+            self.assertEqual(commit_copy.sha, sample_sha)
+            self.assertEqual(commit_copy.message, commit.message)
+            self.assertIsNot(commit_copy.message, commit.message)
+
+            # Modifying the message of the copy doesn't affect the original commit
+            commit_copy.message.body.append("föo")
+            commit_copy.message.title = "bår"
+            self.assertEqual(commit.message.title, "cömmit-title")
+            self.assertListEqual(commit.message.body, ["", "cömmit-body"])
+
+            # Other commit data is shared
+            self.assertEqual(commit_copy.author_name, "test åuthor")
+            self.assertIs(commit_copy.context, commit.context)
+
+        # Data that was already retrieved from git isn't retrieved again for the copy
+        self.assertEqual(sh.git.call_count, 2)
+
     def test_gitcommitmessage_equality(self):
         commit_message1 = GitCommitMessage(GitContext(), "tëst\n\nfoo", "tëst\n\nfoo", "tēst", ["", "föo"])
         attrs = ["original", "full", "title", "body"]
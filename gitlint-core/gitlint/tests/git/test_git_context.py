@@ -28,6 +28,38 @@ class GitContextTests(BaseTestCase):
         self.assertEqual(context.current_branch, "foöbar")
         self.assertEqual(sh.git.mock_calls, expected_calls)
 
+    @patch("gitlint.git.MAILMAP_BATCH_SIZE", 2)
+    @patch("gitlint.git.sh")
+    def test_canonical_identities(self, sh):
+        sh.git.side_effect = [
+            "Jöhn Doe <john@doe.com>\nJöhn Doe <john@doe.com>\n",  # git check-mailmap (batch 1)
+            "<bår@foo.com>\n",  # git check-mailmap (batch 2)
+            "Bob Smïth <bob@smith.com>\n",  # git check-mailmap
+        ]
+
+        context = GitContext("fåke/path")
+        identities = [("J Doe", "jd@öld.com"), ("", "jd@öld.com"), ("J Doe", "jd@öld.com"), ("", "bår@foo.com")]
+        expected = {
+            ("J Doe", "jd@öld.com"): ("Jöhn Doe", "john@doe.com"),
+            ("", "jd@öld.com"): ("Jöhn Doe", "john@doe.com"),
+            ("", "bår@foo.com"): ("", "bår@foo.com"),
+        }
+        # Duplicate identities are only resolved once, in batches of MAILMAP_BATCH_SIZE
+        self.assertDictEqual(context.canonical_identities(iter(identities)), expected)
+        expected_calls = [
+            call("check-mailmap", "J Doe <jd@öld.com>", "<jd@öld.com>", **self.expected_sh_special_args),
+            call("check-mailmap", "<bår@foo.com>", **self.expected_sh_special_args),
+        ]
+        self.assertListEqual(sh.git.mock_calls, expected_calls)
+
+        # Results are memoized
+        self.assertEqual(context.canonical_identity("J Doe", "jd@öld.com"), ("Jöhn Doe", "john@doe.com"))
+        self.assertListEqual(sh.git.mock_calls, expected_calls)
+
+        self.assertEqual(context.canonical_identity("Bob", "bob@smith.com"), ("Bob Smïth", "bob@smith.com"))
+        expected_calls.append(call("check-mailmap", "Bob <bob@smith.com>", **self.expected_sh_special_args))
+        self.assertListEqual(sh.git.mock_calls, expected_calls)
+
     @patch("gitlint.git.sh")
     def test_gitcontext_equality(self, sh):
         sh.git.side_effect = [
@@ -71,3 +103,52 @@ class GitContextTests(BaseTestCase):
             "different-brånch\n",  # context4: git rev-parse --abbrev-ref HEAD
         ]
         self.assertNotEqual(context1, context4)
+
+    @patch("gitlint.git.sh")
+    def test_from_tags(self, sh):
+        def record(*fields):
+            return "".join(f"{field}\0" for field in fields) + "\n"
+
+        signature = "-----BEGIN PGP SIGNATURE-----\nföo\n-----END PGP SIGNATURE-----\n"
+        sh.git.side_effect = [
+            record(
+                "v1.0", "tag", "a" * 40, "Jöhn", "<john@doe.com>", "2023-03-10 12:30:00 +0100", "Rélease\n\nBödy\n", ""
+            )
+            + record("lïght", "commit", "b" * 40, "", "", "", "", "")
+            + record("v2.0", "tag", "c" * 40, "", "", "", f"Signed rélease\n{signature}", signature),
+            "#",  # git config --get core.commentchar
+        ]
+
+        context = GitContext.from_tags("fåke/path", ["v*", "rélease-*"])
+        expected_format = (
+            "--format=%(refname:strip=2)%00%(objecttype)%00%(objectname)%00%(taggername)%00%(taggeremail)%00"
+            "%(taggerdate:iso)%00%(contents)%00%(contents:signature)%00"
+        )
+        expected_call = call(
+            "for-each-ref", expected_format, "refs/tags/v*", "refs/tags/rélease-*", **self.expected_sh_special_args
+        )
+        commentchar_call = call("config", "--get", "core.commentchar", _ok_code=[0, 1], **self.expected_sh_special_args)
+        self.assertEqual(sh.git.mock_calls, [expected_call, commentchar_call])
+
+        # Lightweight tags are skipped
+        self.assertListEqual([tag.name for tag in context.commits], ["v1.0", "v2.0"])
+        tag = context.commits[0]
+        self.assertEqual(tag.sha, "a" * 40)
+        self.assertEqual(tag.author_name, "Jöhn")
+        self.assertEqual(tag.author_email, "john@doe.com")
+        self.assertEqual(tag.date.isoformat(), "2023-03-10T12:30:00+01:00")
+        self.assertEqual(tag.message.title, "Rélease")
+        self.assertListEqual(tag.message.body, ["", "Bödy"])
+        self.assertFalse(tag.is_merge_commit)
+        self.assertListEqual(tag.parents, [])
+        self.assertListEqual(tag.changed_files, [])
+
+        # Signatures aren't part of the tag message
+        tag = context.commits[1]
+        self.assertEqual(tag.message.full, "Signed rélease")
+        self.assertIsNone(tag.date)
+
+        sh.git.reset_mock(side_effect=True)
+        sh.git.return_value = ""
+        self.assertListEqual(GitContext.from_tags("fåke/path").commits, [])
+        sh.git.assert_called_once_with("for-each-ref", expected_format, "refs/tags", **self.expected_sh_special_args)
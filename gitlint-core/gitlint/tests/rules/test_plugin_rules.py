@@ -0,0 +1,115 @@
+from unittest.mock import patch
+
+from gitlint import metadata
+from gitlint.config import LintConfig, LintConfigError
+from gitlint.contrib.rules.signedoff_by import SignedOffBy
+from gitlint.rule_finder import (
+    RULE_ENTRY_POINT_GROUP,
+    RuleEntryPoint,
+    find_rule_entry_points,
+)
+from gitlint.rules import UserRuleError
+from gitlint.tests.base import BaseTestCase
+
+
+def entry_point(name: str, value: str) -> metadata.EntryPoint:
+    return metadata.EntryPoint(name, value, RULE_ENTRY_POINT_GROUP)
+
+
+class PluginRuleTests(BaseTestCase):
+    ENTRY_POINTS = (
+        entry_point("CC1/contrib-body-requires-signed-off-by", "gitlint.contrib.rules.signedoff_by:SignedOffBy"),
+        # Points to a module that doesn't exist: this must never be imported unless the rule is enabled
+        entry_point("UP1/my-plügin-rule", "gitlint_nonexistent_plugin_module:MyPluginRule"),
+        entry_point(" UP2 ", "gitlint_nonexistent_plugin_module:MyOtherPluginRule"),
+    )
+
+    def setUp(self):
+        super().setUp()
+        find_rule_entry_points.cache_clear()
+        self.entry_points_patch = patch("gitlint.rule_finder._entry_points", return_value=self.ENTRY_POINTS)
+        self.entry_points_patch.start()
+
+    def tearDown(self):
+        self.entry_points_patch.stop()
+        find_rule_entry_points.cache_clear()
+        super().tearDown()
+
+    def test_find_rule_entry_points(self):
+        expected = (
+            RuleEntryPoint("CC1", "contrib-body-requires-signed-off-by", self.ENTRY_POINTS[0]),
+            RuleEntryPoint("UP1", "my-plügin-rule", self.ENTRY_POINTS[1]),
+            RuleEntryPoint("UP2", None, self.ENTRY_POINTS[2]),
+        )
+        self.assertTupleEqual(find_rule_entry_points(), expected)
+
+        self.assertTrue(expected[1].matches("UP1"))
+        self.assertTrue(expected[1].matches("my-plügin-rule"))
+        self.assertFalse(expected[1].matches("UP2"))
+        self.assertTrue(expected[2].matches("UP2"))
+        self.assertFalse(expected[2].matches(None))
+
+    def test_load(self):
+        self.assertEqual(find_rule_entry_points()[0].load(), SignedOffBy)
+
+    def test_load_negative(self):
+        # Import errors
+        expected_msg = (
+            "Error while loading plugin rule 'gitlint_nonexistent_plugin_module:MyPluginRule': "
+            "No module named 'gitlint_nonexistent_plugin_module'"
+        )
+        with self.assertRaisesMessage(UserRuleError, expected_msg):
+            find_rule_entry_points()[1].load()
+
+        # Not a class
+        rule_entry_point = RuleEntryPoint("UP3", None, entry_point("UP3", "gitlint.rule_finder:find_rule_classes"))
+        expected_msg = "Plugin rule 'gitlint.rule_finder:find_rule_classes' is not a class"
+        with self.assertRaisesMessage(UserRuleError, expected_msg):
+            rule_entry_point.load()
+
+        # Invalid rule classes are reported as plugin rules
+        rule_entry_point = RuleEntryPoint("UP3", None, entry_point("UP3", "gitlint.config:LintConfig"))
+        expected_msg = (
+            "Plugin rule class 'LintConfig' must extend from gitlint.rules.LineRule, gitlint.rules.CommitRule or "
+            "gitlint.rules.ConfigurationRule"
+        )
+        with self.assertRaisesMessage(UserRuleError, expected_msg):
+            rule_entry_point.load()
+
+        # id or name mismatch between entry point metadata and the rule class
+        for rule_id, rule_name, ep_name in [("CC2", None, "CC2"), ("CC1", "föo", "CC1/föo")]:
+            ep = entry_point(ep_name, "gitlint.contrib.rules.signedoff_by:SignedOffBy")
+            expected_msg = (
+                "Plugin rule class 'SignedOffBy' (CC1: contrib-body-requires-signed-off-by) does not match its "
+                f"entry point name '{ep_name}'"
+            )
+            with self.assertRaisesMessage(UserRuleError, expected_msg):
+                RuleEntryPoint(rule_id, rule_name, ep).load()
+
+    def test_plugins(self):
+        config = LintConfig()
+        for rule_ref in ["CC1", "contrib-body-requires-signed-off-by"]:
+            config.set_general_option("plugins", rule_ref)
+            self.assertListEqual(config.plugins, [rule_ref])
+
+            actual_rule = config.rules.find_rule("CC1")
+            self.assertTrue(actual_rule.is_plugin)
+            self.assertIsInstance(actual_rule, SignedOffBy)
+
+        # reset value
+        config.set_general_option("plugins", "")
+        self.assertListEqual(config.plugins, [])
+        self.assertIsNone(config.rules.find_rule("CC1"))
+
+    def test_plugins_negative(self):
+        config = LintConfig()
+        with self.assertRaisesMessage(LintConfigError, "No plugin rule with id or name 'föo' found."):
+            config.plugins = "CC1,föo"
+
+        # Errors while loading the rule class are re-raised as LintConfigErrors
+        expected_msg = (
+            "Error while loading plugin rule 'gitlint_nonexistent_plugin_module:MyOtherPluginRule': "
+            "No module named 'gitlint_nonexistent_plugin_module'"
+        )
+        with self.assertRaisesMessage(LintConfigError, expected_msg):
+            config.plugins = "UP2"
@@ -0,0 +1,181 @@
+import os
+from io import StringIO
+from types import GeneratorType
+from unittest.mock import call, patch
+
+from gitlint.api import Linter, LintResult
+from gitlint.config import LintConfig, LintConfigBuilder
+from gitlint.git import GitContextError
+from gitlint.rules import RuleViolation
+from gitlint.shell import ErrorReturnCode
+from gitlint.tests.base import BaseTestCase
+
+
+class ApiTests(BaseTestCase):
+    @patch("gitlint.git.sh")
+    def test_lint_messages(self, sh):
+        sh.git.side_effect = ["#"]  # git config --get core.commentchar
+
+        linter = Linter()
+        messages = [
+            "WIP: tïtle1\n\ncommït-body1 that is long enough\n# cömment",
+            {"message": "tïtle2", "sha": "6f29bf81a8322a04071bb794666e48c443a90360", "author_email": "föo@bar.com"},
+            "WIP: tïtle3\n\ncommït-body3\ngitlint-ignore: all",  # commit specific config applies per message
+            "WIP: tïtle4\n\ncommït-body4 that is long enough",
+        ]
+        with patch("sys.stdout", new=StringIO()) as stdout, patch("sys.stderr", new=StringIO()) as stderr:
+            results = linter.lint_messages(messages, repository_path="fåke/path")
+            self.assertIsInstance(results, GeneratorType)
+            results = list(results)
+            self.assertEqual(stdout.getvalue(), "")
+            self.assertEqual(stderr.getvalue(), "")
+
+        self.assertEqual(len(results), 4)
+        self.assertIsInstance(results[0], LintResult)
+        self.assertEqual(results[0].commit.message.body, ["", "commït-body1 that is long enough"])
+        self.assertListEqual(
+            results[0].violations,
+            [RuleViolation("T5", "Title contains the word 'WIP' (case-insensitive)", "WIP: tïtle1", 1)],
+        )
+
+        self.assertEqual(results[1].commit.sha, "6f29bf81a8322a04071bb794666e48c443a90360")
+        self.assertEqual(results[1].commit.author_email, "föo@bar.com")
+        self.assertListEqual(
+            results[1].violations,
+            [RuleViolation("B6", "Body message is missing", None, 3)],
+        )
+
+        self.assertListEqual(results[2].violations, [])
+        self.assertListEqual(
+            results[3].violations,
+            [RuleViolation("T5", "Title contains the word 'WIP' (case-insensitive)", "WIP: tïtle4", 1)],
+        )
+
+        # The linter config is not modified by the commit specific config
+        self.assertListEqual(linter.config.ignore, [])
+
+        # Repository information is only retrieved once for all messages
+        sh.git.assert_called_once()
+
+    @patch("gitlint.git.sh")
+    def test_lint_messages_lazy(self, sh):
+        sh.git.side_effect = ["#"]  # git config --get core.commentchar
+
+        def messages():
+            yield "WIP: tïtle1"
+            raise AssertionError("Only messages for which a result is requested should be linted")
+
+        results = Linter().lint_messages(messages())
+        self.assertEqual(next(results).commit.message.title, "WIP: tïtle1")
+
+    def test_config(self):
+        # Config is built once from a LintConfigBuilder
+        config_builder = LintConfigBuilder()
+        config_builder.set_config_from_string_list(["general.ignore=T5", "body-min-length.min-length=5"])
+        linter = Linter(config_builder)
+        self.assertIsInstance(linter.config, LintConfig)
+        self.assertListEqual(linter.config.ignore, ["T5"])
+
+        # Configuration rules modify a copy of the config per commit
+        config = LintConfig()
+        config.set_rule_option("ignore-by-title", "regex", "^Release")
+        linter = Linter(config)
+        with patch("gitlint.git.git_commentchar", return_value="#"):
+            results = list(linter.lint_messages(["Release: tïtle", "WIP: tïtle"]))
+        self.assertListEqual(results[0].violations, [])
+        self.assertEqual(results[1].violations[0].rule_id, "T5")
+        self.assertListEqual(config.ignore, [])
+
+    @patch("gitlint.git.sh")
+    def test_lint_range(self, sh):
+        sh.git.side_effect = [
+            # git rev-list --no-merges --format=%x00%aN%x00%s
+            "commit 6f29bf81a8322a04071bb794666e48c443a90360\n\x00test åuthor1\x00WIP: commït-title1\n"
+            "commit 25053ccec5e28e1bb8f7551fdbb5ab213ada2401\n\x00test åuthor2\x00commït-title2\n",
+            "#",  # git config --get core.commentchar
+            # git log --no-walk=unsorted --stdin -z --pretty=%H%x00<FORMAT> (all commits at once)
+            "6f29bf81a8322a04071bb794666e48c443a90360\x00"
+            "test åuthor1\x00test-email1@föo.com\x002016-12-03 15:28:15 +0100\x00\nWIP: commït-title1\n\ncommït-body1\x00"
+            "25053ccec5e28e1bb8f7551fdbb5ab213ada2401\x00"
+            "test åuthor2\x00test-email2@föo.com\x002016-12-04 15:28:15 +0100\x00\ncommït-title2\n\ncommït-body2\x00",
+            "3\t5\tcommit-1/file-1\n",  # git diff-tree
+            "commit-1-branch-1\n",  # git branch --contains <sha>
+            "8\t3\tcommit-2/file-1\n",  # git diff-tree
+            "commit-2-branch-1\n",  # git branch --contains <sha>
+        ]
+
+        results = Linter().lint_range("fåke/path", "main..my-branch")
+        # Merge commits are skipped by git, the subjects of other commits are checked for special commit types
+        self.assertEqual(
+            sh.git.mock_calls[0],
+            call(
+                "rev-list",
+                "--no-merges",
+                "--format=%x00%aN%x00%s",
+                "main..my-branch",
+                _tty_out=False,
+                _cwd="fåke/path",
+            ),
+        )
+        self.assertEqual(sh.git.call_count, 2)
+
+        # Commits are only retrieved from git when iterating over the results
+        result = next(results)
+        self.assertEqual(result.commit.sha, "6f29bf81a8322a04071bb794666e48c443a90360")
+        self.assertEqual(result.commit.author_name, "test åuthor1")
+        self.assertListEqual(
+            result.violations,
+            [
+                RuleViolation("T5", "Title contains the word 'WIP' (case-insensitive)", "WIP: commït-title1", 1),
+                RuleViolation("B5", "Body message is too short (12<20)", "commït-body1", 3),
+            ],
+        )
+        self.assertEqual(sh.git.call_count, 5)
+
+        result = next(results)
+        self.assertEqual(result.commit.sha, "25053ccec5e28e1bb8f7551fdbb5ab213ada2401")
+        self.assertListEqual(
+            result.violations, [RuleViolation("B5", "Body message is too short (12<20)", "commït-body2", 3)]
+        )
+        self.assertEqual(sh.git.call_count, 7)
+        self.assertEqual(
+            sh.git.mock_calls[-1],
+            call("branch", "--contains", "25053ccec5e28e1bb8f7551fdbb5ab213ada2401", _tty_out=False, _cwd="fåke/path"),
+        )
+
+    @patch("gitlint.git.sh")
+    def test_lint_range_negative(self, sh):
+        err = "fatal: ambiguous argument 'föo': unknown revision".encode()
+        sh.git.side_effect = ErrorReturnCode("git rev-list föo", b"", err, 128)
+        with self.assertRaisesRegex(GitContextError, "unknown revision"):
+            Linter().lint_range(os.getcwd(), "föo")
+
+    def test_revision_filter(self):
+        config = LintConfig()
+        config.ignore_revert_commits = False
+        config.set_rule_option("I1", "regex", "^WIP: skïp")
+        config.set_rule_option("I4", "regex", "Böt")
+        revision_filter = Linter(config).revision_filter()
+        self.assertTrue(revision_filter.no_merges)
+        self.assertFalse(revision_filter.checks_merges)
+        self.assertTrue(revision_filter.checks_subjects)
+
+        self.assertTrue(revision_filter.may_skip("föo", "fixup! tïtle"))
+        self.assertTrue(revision_filter.may_skip("föo", "tïtle WIP: skïp"))
+        self.assertTrue(revision_filter.may_skip("Böt", "tïtle"))
+        self.assertFalse(revision_filter.may_skip("föo", "Revert tïtle"))
+        self.assertFalse(revision_filter.may_skip("föo", "tïtle fixup!"))
+
+        # Only ignore rules that ignore all rules and title regexes that are plain strings are checked upfront
+        config.set_rule_option("I1", "regex", "^WIP: sk[iï]p")
+        config.set_rule_option("I4", "ignore", "T1")
+        revision_filter = Linter(config).revision_filter()
+        self.assertFalse(revision_filter.may_skip("Böt", "WIP: skïp"))
+
+        config = LintConfig()
+        for commit_type in ["merge", "fixup", "fixup_amend", "squash", "revert"]:
+            setattr(config, f"ignore_{commit_type}_commits", False)
+        revision_filter = Linter(config).revision_filter()
+        self.assertFalse(revision_filter.no_merges)
+        self.assertFalse(revision_filter.checks_merges)
+        self.assertFalse(revision_filter.checks_subjects)
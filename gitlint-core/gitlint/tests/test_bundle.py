@@ -0,0 +1,199 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from gitlint.bundle import GitBundle, GitBundleError, bundle_context
+from gitlint.tests.base import BaseTestCase
+
+OBJ_COMMIT = 1
+OBJ_BLOB = 3
+OBJ_OFS_DELTA = 6
+OBJ_REF_DELTA = 7
+
+
+def _varint(size):
+    encoded = bytearray()
+    while True:
+        byte, size = size & 0x7F, size >> 7
+        encoded.append(byte | (0x80 if size else 0))
+        if not size:
+            return bytes(encoded)
+
+
+def _delta(base, result):
+    """Creates a git delta that copies the common prefix of base and result, and inserts the rest of result."""
+    prefix = 0
+    while prefix < min(len(base), len(result), 0xFF) and base[prefix] == result[prefix]:
+        prefix += 1
+    delta = _varint(len(base)) + _varint(len(result))
+    if prefix:
+        delta += bytes([0x90, prefix])  # Copy `prefix` bytes from offset 0
+    for start in range(prefix, len(result), 0x7F):
+        chunk = result[start : start + 0x7F]
+        delta += bytes([len(chunk)]) + chunk
+    return delta
+
+
+def _object_id(contents, hash_function=hashlib.sha1):
+    return hash_function(b"commit %d\0" % len(contents) + contents).digest()
+
+
+def _commit(message, parents=(), timestamp=1678447800, extra_headers=b"", author_name=b"J\xc3\xb6hn Doe"):
+    parent_lines = b"".join(b"parent %s\n" % parent.encode() for parent in parents)
+    identity = b"%s <john@doe.com> %d +0100" % (author_name, timestamp)
+    return (
+        b"tree 4b825dc642cb6eb9a060e54bf8d69288fbee4904\n"
+        + parent_lines
+        + b"author "
+        + identity
+        + b"\ncommitter "
+        + identity
+        + b"\n"
+        + extra_headers
+        + b"\n"
+        + message
+    )
+
+
+class BundleTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmpdir)
+        self.bundle_path = os.path.join(tmpdir, "test.bundle")
+
+    def write_bundle(self, header, objects, truncate=0):
+        """Writes a bundle with the given header lines and pack objects: (type, data, base) tuples, where base is the
+        index of the base object (offset deltas) or its object id (ref deltas)."""
+        pack = bytearray(b"PACK" + (2).to_bytes(4, "big") + len(objects).to_bytes(4, "big"))
+        offsets = []
+        for object_type, data, base in objects:
+            offsets.append(len(pack))
+            size = len(data)
+            byte, size = (object_type << 4) | (size & 0xF), size >> 4
+            while size:
+                pack.append(byte | 0x80)
+                byte, size = size & 0x7F, size >> 7
+            pack.append(byte)
+            if object_type == OBJ_OFS_DELTA:
+                distance = offsets[-1] - offsets[base]
+                encoded = [distance & 0x7F]
+                distance >>= 7
+                while distance:
+                    distance -= 1
+                    encoded.insert(0, 0x80 | (distance & 0x7F))
+                    distance >>= 7
+                pack += bytes(encoded)
+            elif object_type == OBJ_REF_DELTA:
+                pack += base
+            pack += zlib.compress(data)
+        pack += hashlib.sha1(pack).digest()  # noqa: S324 (packfile checksums are SHA-1)
+
+        with open(self.bundle_path, "wb") as bundle_file:
+            bundle_file.write("".join(f"{line}\n" for line in [*header, ""]).encode())
+            bundle_file.write(pack[: len(pack) - truncate])
+
+    def test_bundle_context(self):
+        prerequisite = "e" * 40
+        commit_a = _commit(b"WIP: C\xc3\xb6mmit A\n\nB\xc3\xb6dy that is long enough\n", [prerequisite])
+        sha_a = _object_id(commit_a).hex()
+        commit_b = _commit(b"C\xc3\xb6mmit B\n\nB\xc3\xb6dy that is long enough\n", [sha_a], 1678447860)
+        sha_b = _object_id(commit_b).hex()
+        signature = (
+            b"gpgsig -----BEGIN PGP SIGNATURE-----\n \n abc\n -----END PGP SIGNATURE-----\nencoding ISO-8859-1\n"
+        )
+        # The message and identities of commits with an encoding header are in that encoding
+        message_c = b"C\xf6mmit C\n\nB\xf6dy that is long enough\n"
+        commit_c = _commit(message_c, [sha_b], 1678447920, signature, author_name=b"J\xf6hn Doe")
+        sha_c = _object_id(commit_c).hex()
+        header = [
+            "# v2 git bundle",
+            f"-{prerequisite} Prerequisite commit",
+            f"{sha_c} refs/heads/main",
+            f"{sha_a} refs/heads/old",
+            f"{sha_a} refs/tags/v1",
+        ]
+        self.write_bundle(
+            header,
+            [
+                (OBJ_COMMIT, commit_a, None),
+                (OBJ_BLOB, b"f\xc3\xb6o\n" * 100, None),
+                # Deltas of objects outside of the (thin) pack are skipped
+                (OBJ_REF_DELTA, _delta(b"x" * 10, b"y" * 10), b"\xaa" * 20),
+                # Ref deltas can refer to objects later in the pack, offset deltas only to earlier objects
+                (OBJ_REF_DELTA, _delta(commit_b, commit_c), bytes.fromhex(sha_b)),
+                (OBJ_OFS_DELTA, _delta(commit_a, commit_b), 0),
+            ],
+        )
+
+        bundle = GitBundle.from_path(self.bundle_path)
+        self.assertListEqual(bundle.prerequisites, [prerequisite])
+        self.assertDictEqual(bundle.refs, {"refs/heads/main": sha_c, "refs/heads/old": sha_a, "refs/tags/v1": sha_a})
+        self.assertDictEqual(bundle.raw_commits(), {sha_a: commit_a, sha_c: commit_c, sha_b: commit_b})
+
+        context = bundle_context(self.bundle_path)
+        commits = context.commits
+        self.assertListEqual([commit.sha for commit in commits], [sha_c, sha_b, sha_a])
+        self.assertEqual(commits[0].message.title, "Cömmit C")
+        self.assertListEqual(commits[0].message.body, ["", "Bödy that is long enough"])
+        self.assertEqual(commits[2].message.title, "WIP: Cömmit A")
+        self.assertEqual(commits[0].author_name, "Jöhn Doe")
+        self.assertEqual(commits[0].author_email, "john@doe.com")
+        self.assertEqual(commits[0].date, datetime(2023, 3, 10, 12, 32, tzinfo=timezone(timedelta(hours=1))))
+        self.assertListEqual([commit.parents for commit in commits], [[sha_b], [sha_a], [prerequisite]])
+        self.assertListEqual([commit.branches for commit in commits], [["main"], ["main"], ["main", "old"]])
+        self.assertDictEqual(commits[0].changed_files_stats, {})
+
+    def test_sha256_bundle(self):
+        commit = _commit(b"C\xc3\xb6mmit\n").replace(b"4b825dc642cb6eb9a060e54bf8d69288fbee4904", b"0" * 64)
+        sha = _object_id(commit, hashlib.sha256).hex()
+        self.write_bundle(
+            ["# v3 git bundle", "@object-format=sha256", "@filter=blob:none", f"{sha} refs/heads/main"],
+            [(OBJ_COMMIT, commit, None)],
+        )
+        commits = bundle_context(self.bundle_path).commits
+        self.assertListEqual([(commit.sha, commit.message.title) for commit in commits], [(sha, "Cömmit")])
+
+    def test_bundle_errors(self):
+        with open(self.bundle_path, "w", encoding="UTF-8") as bundle_file:
+            bundle_file.write("Nöt a bundle\n")
+        with self.assertRaisesMessage(GitBundleError, f"{self.bundle_path} is not a git bundle."):
+            bundle_context(self.bundle_path)
+
+        with open(self.bundle_path, "w", encoding="UTF-8") as bundle_file:
+            bundle_file.write(f"# v2 git bundle\n{'a' * 40} refs/heads/main\n")
+        expected = f"{self.bundle_path} is not a git bundle: it doesn't contain a packfile."
+        with self.assertRaisesMessage(GitBundleError, expected):
+            bundle_context(self.bundle_path)
+
+        self.write_bundle(["# v3 git bundle", "@föo=bar"], [])
+        expected = f"Bundle {self.bundle_path} requires the unsupported capability 'föo=bar'."
+        with self.assertRaisesMessage(GitBundleError, expected):
+            bundle_context(self.bundle_path)
+
+        self.write_bundle(["# v2 git bundle", "föo refs/heads/main"], [])
+        with self.assertRaisesMessage(
+            GitBundleError, f"Bundle {self.bundle_path} contains an invalid object id: 'föo'."
+        ):
+            bundle_context(self.bundle_path)
+
+        commit = _commit(b"C\xc3\xb6mmit\n")
+        self.write_bundle(["# v2 git bundle"], [(OBJ_COMMIT, commit, None)], truncate=25)
+        with self.assertRaisesMessage(GitBundleError, f"Bundle {self.bundle_path} is truncated."):
+            bundle_context(self.bundle_path)
+
+        # Commits stored as delta against a prerequisite can't be resolved
+        prerequisite = _object_id(commit)
+        self.write_bundle(
+            ["# v2 git bundle", f"-{prerequisite.hex()}"],
+            [(OBJ_REF_DELTA, _delta(commit, _commit(b"C\xc3\xb6mmit 2\n")), prerequisite)],
+        )
+        expected = (
+            f"Bundle {self.bundle_path} contains a commit that is stored as a delta against prerequisite "
+            f"{prerequisite.hex()}, which can't be read without a repository that contains the prerequisite."
+        )
+        with self.assertRaisesMessage(GitBundleError, expected):
+            bundle_context(self.bundle_path)
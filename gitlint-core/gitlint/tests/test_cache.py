@@ -1,4 +1,8 @@
-from gitlint.cache import PropertyCache, cache
+import os
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from gitlint.cache import PropertyCache, ResourceCache, cache
 from gitlint.tests.base import BaseTestCase
 
 
@@ -53,3 +57,40 @@ class CacheTests(BaseTestCase):
         self.assertEqual(myclass.bar, "fōo")
         self.assertEqual(myclass.counter, 1)
         self.assertDictEqual(myclass._cache, {"hür": "fōo"})
+
+    def test_resource_cache(self):
+        resource_cache = ResourceCache()
+        parse_func = MagicMock(side_effect=lambda content: frozenset(content.split()))
+
+        with self.tempdir() as tmpdir:
+            path = Path(tmpdir) / "my-fïle"
+            path.write_text("föo bar", encoding="utf-8")
+
+            # File is only read and parsed on first access
+            for _ in range(3):
+                self.assertEqual(resource_cache.load(path, parse_func), {"föo", "bar"})
+            parse_func.assert_called_once_with("föo bar")
+
+            # A different parse function for the same file has its own cache entry
+            self.assertEqual(resource_cache.load(str(path), str.upper), "FÖO BAR")
+            parse_func.assert_called_once()
+
+            # Changing the file invalidates the cache
+            path.write_text("föo bar baz", encoding="utf-8")
+            self.assertEqual(resource_cache.load(path, parse_func), {"föo", "bar", "baz"})
+            self.assertEqual(parse_func.call_count, 2)
+
+            # Same file size, different modification time
+            path.write_text("hür bar baz", encoding="utf-8")
+            stat = path.stat()
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(resource_cache.load(path, parse_func), {"hür", "bar", "baz"})
+            self.assertEqual(parse_func.call_count, 3)
+
+            # Clearing the cache
+            resource_cache.clear()
+            resource_cache.load(path, parse_func)
+            self.assertEqual(parse_func.call_count, 4)
+
+            with self.assertRaises(FileNotFoundError):
+                resource_cache.load(Path(tmpdir) / "nonexisting", parse_func)
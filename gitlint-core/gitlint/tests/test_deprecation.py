@@ -1,3 +1,6 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 from gitlint.config import LintConfig
 from gitlint.deprecation import Deprecation
 from gitlint.rules import (
@@ -16,7 +19,6 @@ from gitlint.tests.base import (
 class DeprecationTests(BaseTestCase):
     def test_get_regex_method(self):
         config = LintConfig()
-        Deprecation.config = config
 
         # These rules have a regex option and are affected by the deprecation behavior
         rules = [
@@ -31,18 +33,47 @@ class DeprecationTests(BaseTestCase):
             Deprecation.warning_msgs = set()
             self.logcapture.clear()
 
-            # When general.regex-style-search=True, we expect regex.search to be returned and no warning to be logged
-            config.regex_style_search = True
+            # Without a config, the default behavior (regex.search) applies
             regex_method = Deprecation.get_regex_method(rule, rule.options["regex"])
             self.assertEqual(regex_method, rule.options["regex"].value.search)
-            self.assert_logged([])
 
-            # When general.regex-style-search=False, we expect regex.match to be returned and a warning to be logged
-            config.regex_style_search = False
+            with Deprecation.use_config(config):
+                # When general.regex-style-search=True, we expect regex.search to be returned and no warning logged
+                config.regex_style_search = True
+                regex_method = Deprecation.get_regex_method(rule, rule.options["regex"])
+                self.assertEqual(regex_method, rule.options["regex"].value.search)
+                self.assert_logged([])
+
+                # When general.regex-style-search=False, we expect regex.match to be returned and a warning logged
+                config.regex_style_search = False
+                regex_method = Deprecation.get_regex_method(rule, rule.options["regex"])
+                self.assertEqual(regex_method, rule.options["regex"].value.match)
+                self.assert_logged([EXPECTED_REGEX_STYLE_SEARCH_DEPRECATION_WARNING.format(rule.id, rule.name)])
+
+                # Ensure we only log once per rule
+                Deprecation.get_regex_method(rule, rule.options["regex"])
+                self.assert_logged([EXPECTED_REGEX_STYLE_SEARCH_DEPRECATION_WARNING.format(rule.id, rule.name)])
+
+            # Config is only used within the context manager
             regex_method = Deprecation.get_regex_method(rule, rule.options["regex"])
-            self.assertEqual(regex_method, rule.options["regex"].value.match)
-            self.assert_logged([EXPECTED_REGEX_STYLE_SEARCH_DEPRECATION_WARNING.format(rule.id, rule.name)])
+            self.assertEqual(regex_method, rule.options["regex"].value.search)
+
+    def test_use_config_threads(self):
+        """Each thread uses its own deprecation config"""
+        rule = IgnoreByTitle({"regex": "Föo(.*)"})
+        search_config, match_config = LintConfig(), LintConfig()
+        match_config.regex_style_search = False
+        barrier = threading.Barrier(2)
+
+        def get_regex_method(config):
+            with Deprecation.use_config(config):
+                # Make sure both threads have set their config before getting the regex method
+                barrier.wait()
+                return Deprecation.get_regex_method(rule, rule.options["regex"])
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            regex_methods = list(executor.map(get_regex_method, [search_config, match_config]))
 
-            # Ensure we only log once per rule
-            Deprecation.get_regex_method(rule, rule.options["regex"])
-            self.assert_logged([EXPECTED_REGEX_STYLE_SEARCH_DEPRECATION_WARNING.format(rule.id, rule.name)])
+        self.assertListEqual(regex_methods, [rule.options["regex"].value.search, rule.options["regex"].value.match])
+        # The warning is only logged once
+        self.assert_logged([EXPECTED_REGEX_STYLE_SEARCH_DEPRECATION_WARNING.format(rule.id, rule.name)])
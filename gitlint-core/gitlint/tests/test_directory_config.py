@@ -0,0 +1,133 @@
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from gitlint.api import Linter
+from gitlint.config import LintConfigBuilder, LintConfigError
+from gitlint.directory_config import DirectoryConfigResolver, PathTrie
+from gitlint.rules import RuleViolation
+from gitlint.tests.base import BaseTestCase
+
+
+class PathTrieTests(BaseTestCase):
+    def test_common_directory(self):
+        self.assertEqual(PathTrie.from_paths([]).common_directory(), "")
+        self.assertEqual(PathTrie.from_paths(["föo.txt", "äpp/bar.txt"]).common_directory(), "")
+        self.assertEqual(PathTrie.from_paths(["äpp/föo.txt"]).common_directory(), "äpp")
+        paths = ["äpp/src/föo.py", "äpp/src/lib/bar.py", "äpp/src/lib/baz.py"]
+        self.assertEqual(PathTrie.from_paths(paths).common_directory(), "äpp/src")
+        self.assertEqual(PathTrie.from_paths(["äpp/src/föo.py", "äpp/tests/bar.py"]).common_directory(), "äpp")
+
+    def test_directories(self):
+        paths = ["äpp/src/föo.py", "döcs/index.md", "äpp/src/bar.py", "README.md", "äpp/src/lib/baz.py"]
+        trie = PathTrie.from_paths(paths)
+        self.assertListEqual(list(trie.directories()), ["", "döcs", "äpp/src", "äpp/src/lib"])
+        self.assertListEqual(list(PathTrie.from_paths([]).directories()), [])
+
+
+class DirectoryConfigResolverTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.target = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.target)
+        self.write_config("äpp", "[title-max-length]\nline-length=20\n[body-is-missing]\nignore-merge-commits=false\n")
+        self.write_config("äpp/sub", "[title-max-length]\nline-length=10\n")
+        self.write_config("döcs", "[general]\nignore=T5\n")
+
+    def write_config(self, directory, contents):
+        os.makedirs(os.path.join(self.target, directory))
+        with open(os.path.join(self.target, directory, ".gitlint"), "w", encoding="UTF-8") as config_file:
+            config_file.write(contents)
+
+    def resolver(self, *general_options, overrides=None):
+        config_builder = LintConfigBuilder()
+        config_builder.set_option("general", "target", self.target)
+        config_builder.set_option("general", "directory-configs", "true")
+        config_builder.set_option("title-max-length", "line-length", 30)
+        for option_name, option_value in general_options:
+            config_builder.set_option("general", option_name, option_value)
+        return DirectoryConfigResolver(config_builder, overrides)
+
+    def test_directory_config(self):
+        resolver = self.resolver()
+        self.assertIs(resolver.directory_config(""), resolver.config)
+        self.assertIs(resolver.directory_config("öther/dir"), resolver.config)
+
+        # The nearest config file wins, options that aren't set are inherited from parent directories
+        app_config = resolver.directory_config("äpp/src")
+        self.assertEqual(app_config.get_rule_option("title-max-length", "line-length"), 20)
+        self.assertFalse(app_config.get_rule_option("body-is-missing", "ignore-merge-commits"))
+        sub_config = resolver.directory_config("äpp/sub/deeper/dir")
+        self.assertEqual(sub_config.get_rule_option("title-max-length", "line-length"), 10)
+        self.assertFalse(sub_config.get_rule_option("body-is-missing", "ignore-merge-commits"))
+        self.assertEqual(sub_config._config_path, os.path.realpath(os.path.join(self.target, "äpp/sub/.gitlint")))
+        docs_config = resolver.directory_config("döcs")
+        self.assertEqual(docs_config.ignore, ["T5"])
+        self.assertEqual(docs_config.get_rule_option("title-max-length", "line-length"), 30)
+
+        # Directory lookups and configs are cached
+        with patch("gitlint.directory_config.os.path.isfile") as isfile, patch.object(
+            LintConfigBuilder, "build"
+        ) as build:
+            self.assertIs(resolver.directory_config("äpp/src"), app_config)
+            self.assertIs(resolver.directory_config("äpp/sub/deeper/dir"), sub_config)
+            self.assertIs(resolver.directory_config("äpp/sub/deeper"), sub_config)
+        self.assertEqual(isfile.call_count, 0)
+        build.assert_not_called()
+
+    def test_overrides(self):
+        overrides = LintConfigBuilder()
+        overrides.set_option("title-max-length", "line-length", 15)
+        resolver = self.resolver(overrides=overrides)
+        self.assertEqual(resolver.directory_config("äpp").get_rule_option("title-max-length", "line-length"), 15)
+        self.assertEqual(resolver.directory_config("äpp/sub").get_rule_option("title-max-length", "line-length"), 15)
+
+    def test_resolve(self):
+        resolver = self.resolver()
+        commit = self.gitcommit("Tïtle", ["äpp/sub/föo.py", "äpp/sub/lib/bar.py"])
+        self.assertListEqual(resolver.resolve(commit), [resolver.directory_config("äpp/sub")])
+        commit = self.gitcommit("Tïtle", ["äpp/sub/föo.py", "äpp/src/bar.py"])
+        self.assertListEqual(resolver.resolve(commit), [resolver.directory_config("äpp")])
+        commit = self.gitcommit("Tïtle", ["äpp/föo.py", "döcs/index.md"])
+        self.assertListEqual(resolver.resolve(commit), [resolver.config])
+        self.assertListEqual(resolver.resolve(self.gitcommit("Tïtle", [])), [resolver.config])
+
+        resolver = self.resolver(("directory-config-merge", "all"))
+        commit = self.gitcommit("Tïtle", ["döcs/index.md", "äpp/sub/föo.py", "äpp/src/bar.py", "äpp/föo.py"])
+        expected = [resolver.directory_config(directory) for directory in ["döcs", "äpp", "äpp/sub"]]
+        self.assertListEqual(resolver.resolve(commit), expected)
+        commit = self.gitcommit("Tïtle", ["README.md", "äpp/sub/föo.py"])
+        self.assertListEqual(resolver.resolve(commit), [resolver.config, resolver.directory_config("äpp/sub")])
+        self.assertListEqual(resolver.resolve(self.gitcommit("Tïtle", [])), [resolver.config])
+
+    def test_lint(self):
+        config_builder = LintConfigBuilder()
+        config_builder.set_option("general", "target", self.target)
+        config_builder.set_option("general", "directory-configs", "true")
+        config_builder.set_option("general", "directory-config-merge", "all")
+        linter = Linter(config_builder)
+        message = "WIP: tïtle that is long\n\nBödy that is long enough"
+
+        title_violation = RuleViolation("T1", "Title exceeds max length (23>20)", "WIP: tïtle that is long", 1)
+        wip_message = "Title contains the word 'WIP' (case-insensitive)"
+        wip_violation = RuleViolation("T5", wip_message, "WIP: tïtle that is long", 1)
+        result = linter.lint_commit(self.gitcommit(message, ["döcs/index.md"]))
+        self.assertListEqual(result.violations, [])
+        result = linter.lint_commit(self.gitcommit(message, ["äpp/föo.py"]))
+        self.assertListEqual(result.violations, [title_violation, wip_violation])
+        # Violations are the union of the violations for all configs, violations found for multiple configs are only
+        # reported once
+        result = linter.lint_commit(self.gitcommit(message, ["äpp/föo.py", "döcs/index.md", "README.md"]))
+        self.assertListEqual(result.violations, [title_violation, wip_violation])
+        result = linter.lint_commit(self.gitcommit(message, ["äpp/föo.py", "döcs/index.md"]), max_violations=1)
+        self.assertListEqual(result.violations, [title_violation])
+
+    def test_linter_requires_builder(self):
+        config_builder = LintConfigBuilder()
+        config_builder.set_option("general", "directory-configs", "true")
+        expected_msg = "The 'directory-configs' option requires the config builder of the config."
+        with self.assertRaisesMessage(LintConfigError, expected_msg):
+            Linter(config_builder.build())
+        config = config_builder.build()
+        self.assertIsNotNone(Linter(config, config_builder).directory_configs)
@@ -6,6 +6,9 @@ from gitlint.hooks import (
     COMMIT_MSG_HOOK_DST_PATH,
     COMMIT_MSG_HOOK_SRC_PATH,
     GITLINT_HOOK_IDENTIFIER,
+    GITLINT_PRE_PUSH_HOOK_IDENTIFIER,
+    PRE_PUSH_HOOK_DST_PATH,
+    PRE_PUSH_HOOK_SRC_PATH,
     GitHookInstaller,
     GitHookInstallerError,
 )
@@ -137,3 +140,70 @@ class HookTests(BaseTestCase):
             with self.assertRaisesMessage(GitHookInstallerError, expected_msg):
                 GitHookInstaller.uninstall_commit_msg_hook(lint_config)
             remove.assert_not_called()
+
+    @staticmethod
+    @patch("os.chmod")
+    @patch("os.stat")
+    @patch("gitlint.hooks.shutil.copy")
+    @patch("os.path.exists", return_value=False)
+    @patch("os.path.isdir", return_value=True)
+    @patch("gitlint.hooks.git_hooks_dir")
+    def test_install_pre_push_hook(git_hooks_dir, isdir, path_exists, copy, stat, chmod):
+        lint_config = LintConfig()
+        lint_config.target = os.path.join("/hür", "dur")
+        git_hooks_dir.return_value = os.path.join("/föo", "bar", ".git", "hooks")
+        expected_dst = os.path.join(git_hooks_dir.return_value, PRE_PUSH_HOOK_DST_PATH)
+        GitHookInstaller.install_pre_push_hook(lint_config)
+        isdir.assert_called_with(git_hooks_dir.return_value)
+        path_exists.assert_called_once_with(expected_dst)
+        copy.assert_called_once_with(PRE_PUSH_HOOK_SRC_PATH, expected_dst)
+        stat.assert_called_once_with(expected_dst)
+        chmod.assert_called_once_with(expected_dst, ANY)
+        git_hooks_dir.assert_called_with(lint_config.target)
+
+    @patch("os.path.exists", return_value=True)
+    @patch("os.path.isdir", return_value=True)
+    @patch("gitlint.hooks.git_hooks_dir")
+    def test_install_pre_push_hook_negative(self, git_hooks_dir, _isdir, _path_exists):
+        lint_config = LintConfig()
+        lint_config.target = os.path.join("/hür", "dur")
+        git_hooks_dir.return_value = os.path.join("/föo", "bar", ".git", "hooks")
+        expected_dst = os.path.join(git_hooks_dir.return_value, PRE_PUSH_HOOK_DST_PATH)
+        expected_msg = (
+            f"There is already a pre-push hook file present in {expected_dst}.\n"
+            "gitlint currently does not support appending to an existing pre-push file."
+        )
+        with self.assertRaisesMessage(GitHookInstallerError, expected_msg):
+            GitHookInstaller.install_pre_push_hook(lint_config)
+
+    @patch("os.remove")
+    @patch("os.path.exists", return_value=True)
+    @patch("os.path.isdir", return_value=True)
+    @patch("gitlint.hooks.git_hooks_dir")
+    def test_uninstall_pre_push_hook(self, git_hooks_dir, _isdir, path_exists, remove):
+        lint_config = LintConfig()
+        git_hooks_dir.return_value = os.path.join("/föo", "bar", ".git", "hooks")
+        lint_config.target = os.path.join("/hür", "dur")
+        expected_dst = os.path.join(git_hooks_dir.return_value, PRE_PUSH_HOOK_DST_PATH)
+
+        # The commit-msg hook identifier doesn't identify a gitlint pre-push hook
+        read_data = "#!/bin/sh\n" + GITLINT_HOOK_IDENTIFIER
+        expected_msg = (
+            f"The pre-push hook in {expected_dst} was not installed by gitlint (or it was modified).\n"
+            "Uninstallation of 3th party or modified gitlint hooks is not supported."
+        )
+        with patch("builtins.open", mock_open(read_data=read_data), create=True):
+            with self.assertRaisesMessage(GitHookInstallerError, expected_msg):
+                GitHookInstaller.uninstall_pre_push_hook(lint_config)
+            remove.assert_not_called()
+
+        read_data = "#!/bin/sh\n" + GITLINT_PRE_PUSH_HOOK_IDENTIFIER
+        with patch("builtins.open", mock_open(read_data=read_data), create=True):
+            GitHookInstaller.uninstall_pre_push_hook(lint_config)
+
+        path_exists.assert_called_with(expected_dst)
+        remove.assert_called_once_with(expected_dst)
+
+    def test_pre_push_hook_identifier(self):
+        with open(PRE_PUSH_HOOK_SRC_PATH, encoding="utf-8") as hook_file:
+            self.assertEqual(hook_file.readlines()[1], GITLINT_PRE_PUSH_HOOK_IDENTIFIER)
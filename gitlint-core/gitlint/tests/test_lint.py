@@ -1,12 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
 from unittest.mock import patch
 
 from gitlint.config import LintConfig, LintConfigBuilder
 from gitlint.lint import GitLinter
-from gitlint.rules import RuleViolation, TitleMustNotContainWord
+from gitlint.observers import Observer, observe
+from gitlint.rules import CommitRule, RuleViolation, TitleMustNotContainWord
 from gitlint.tests.base import BaseTestCase
 
 
+class MyUserCommitRule(CommitRule):
+    name = "my-üser-commit-rule"
+    id = "UC1"
+
+    def validate(self, _commit):
+        return [RuleViolation(self.id, "Commit violåtion")]
+
+
+class RuleOrderObserver(Observer):
+    def __init__(self):
+        self.rule_ids = []
+
+    def on_rule(self, rule, _commit, _duration, violations):
+        # Configuration rules (violations is None) are always applied first
+        if violations is not None or rule.id[0] != "I":
+            self.rule_ids.append(rule.id)
+
+
 class LintTests(BaseTestCase):
     def test_lint_sample1(self):
         linter = GitLinter(LintConfig())
@@ -171,6 +191,63 @@ class LintTests(BaseTestCase):
         # fmt: on
         self.assertListEqual(violations, expected_errors)
 
+    def test_lint_configuration_rule_commit_unmodified(self):
+        """Configuration rules don't modify the linted commit, so it can be linted again (or by other linters)"""
+        lint_config = LintConfig()
+        lint_config.set_rule_option("I3", "regex", "(.*)tråiling(.*)")
+        commit = self.gitcommit(self.get_sample("commit_message/sample1"))
+        original_body = list(commit.message.body)
+
+        violations = GitLinter(lint_config).lint(commit)
+        self.assertNotIn("This line has a tråiling space. ", [violation.content for violation in violations])
+        self.assertListEqual(commit.message.body, original_body)
+
+        violations = GitLinter(LintConfig()).lint(commit)
+        self.assertIn(
+            RuleViolation("B2", "Line has trailing whitespace", "This line has a tråiling space. ", 4), violations
+        )
+
+    def test_lint_threads(self):
+        """Linters with different configs can lint the same commits concurrently"""
+        commits = [self.gitcommit(f"WIP: Tïtle {i}\n\nThis is a bödy with a release note {i}") for i in range(50)]
+        configs = [LintConfig() for _ in range(4)]
+        configs[1].set_rule_option("I3", "regex", "release")
+        configs[2].regex_style_search = False
+        configs[2].set_rule_option("I1", "regex", "Tïtle")  # match semantics: doesn't match "WIP: Tïtle"
+        configs[3].set_rule_option("I1", "regex", "Tïtle")
+
+        def lint(config):
+            return [GitLinter(config).lint(commit) for commit in commits]
+
+        expected = [lint(config) for config in configs]
+        with ThreadPoolExecutor(max_workers=len(configs)) as executor:
+            for _ in range(5):
+                self.assertListEqual(list(executor.map(lint, configs)), expected)
+
+        # Sanity check: the configs result in different violations
+        self.assertListEqual(
+            [[v.rule_id for v in violations[0]] for violations in expected], [["T5"], ["T5", "B6"], ["T5"], []]
+        )
+
+    def test_lint_threads_configuration_rules(self):
+        """Configuration rules that ignore rules for some commits don't affect other commits linted with the same
+        config, also when those are linted concurrently"""
+        commits = [self.gitcommit(f"WIP: Tïtle {i}{' skip' if i % 2 else ''}\n\nShort") for i in range(50)]
+        config = LintConfig()
+        config.set_rule_option("I1", "regex", "skip$")
+        config.set_rule_option("I2", "ignore", "B5")  # I2 doesn't match, so it doesn't ignore anything
+        linter = GitLinter(config)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            violations = list(executor.map(linter.lint, commits))
+        self.assertListEqual(
+            [[v.rule_id for v in commit_violations] for commit_violations in violations],
+            [[] if i % 2 else ["T5", "B5"] for i in range(50)],
+        )
+        self.assertListEqual(config.ignore, [])
+        self.assertListEqual([linter.ignores(commit) for commit in commits[:4]], [False, True, False, True])
+        self.assertListEqual(config.ignore, [])
+
     def test_lint_special_commit(self):
         for commit_type in ["merge", "revert", "squash", "fixup", "fixup_amend"]:
             commit = self.gitcommit(self.get_sample(f"commit_message/{commit_type}"))
@@ -294,3 +371,53 @@ class LintTests(BaseTestCase):
         # ignore named rule by name: only regular rule violations show up
         lint_config.ignore = [TitleMustNotContainWord.name + ":my-ïd"]
         self.assertListEqual(violations[:-1], linter.lint(commit))
+
+    def test_lint_fail_fast(self):
+        lint_config = LintConfig()
+        lint_config.rules.add_rule(MyUserCommitRule, MyUserCommitRule.id)
+        lint_config.set_rule_option("B7", "files", ["föo.txt"])
+        commit = self.gitcommit("WIP: Tïtle.\n\nShort bödy", changed_files=["föo.txt"])
+
+        expected = [
+            RuleViolation("UC1", "Commit violåtion", None, None),
+            RuleViolation("T3", "Title has trailing punctuation (.)", "WIP: Tïtle.", 1),
+            RuleViolation("T5", "Title contains the word 'WIP' (case-insensitive)", "WIP: Tïtle.", 1),
+            RuleViolation("B5", "Body message is too short (10<20)", "Short bödy", 3),
+            RuleViolation("B7", "Body does not mention changed file 'föo.txt'", None, 3),
+        ]
+        self.assertListEqual(GitLinter(lint_config).lint(commit), expected)
+
+        # Rules are applied cheapest first: rules that only need the commit message, then rules that require
+        # additional git calls (B7) and finally rules with an unknown cost (e.g. user-defined rules)
+        observer = RuleOrderObserver()
+        with observe(observer):
+            violations = GitLinter(lint_config).lint(commit, max_violations=len(expected))
+        self.assertListEqual(violations, expected)
+        applied_rules = list(dict.fromkeys(observer.rule_ids))
+        self.assertListEqual(applied_rules[-2:], ["B7", "UC1"])
+
+        # Linting stops after the maximum number of violations is reached, so expensive rules aren't applied
+        observer = RuleOrderObserver()
+        with observe(observer):
+            violations = GitLinter(lint_config).lint(commit, max_violations=2)
+        self.assertListEqual(violations, expected[1:3])
+        self.assertNotIn("B7", observer.rule_ids)
+        self.assertNotIn("UC1", observer.rule_ids)
+
+        # max_violations defaults to the fail-fast option
+        lint_config.fail_fast = 1
+        self.assertListEqual(GitLinter(lint_config).lint(commit), expected[1:2])
+
+    def test_required_fields(self):
+        lint_config = LintConfig()
+        linter = GitLinter(lint_config)
+        self.assertEqual(linter.required_fields, {"message", "parents", "author"})
+
+        # B7 only requires the changed files when files are configured
+        lint_config.set_rule_option("B7", "files", ["föo.txt"])
+        self.assertEqual(linter.required_fields, {"message", "parents", "author", "changed_files"})
+
+        # Ignored rules don't contribute their required fields, rules that don't declare them are ignored
+        lint_config.set_general_option("ignore", "B7,M1,I4")
+        lint_config.rules.add_rule(MyUserCommitRule, MyUserCommitRule.id)
+        self.assertEqual(linter.required_fields, {"message", "parents"})
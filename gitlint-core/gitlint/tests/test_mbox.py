@@ -0,0 +1,74 @@
+from datetime import datetime, timedelta, timezone
+from io import BytesIO
+
+from gitlint.git import GitChangedFileStats
+from gitlint.mbox import iter_mbox_records
+from gitlint.tests.base import BaseTestCase
+
+
+class MboxTests(BaseTestCase):
+    def test_iter_mbox_records(self):
+        with open(self.get_sample_path("mbox/patches.mbox"), "rb") as mbox:
+            records = list(iter_mbox_records(mbox))
+
+        expected_message = (
+            "Updäte föo and add a file with a long name\n\n"
+            "Commït body that is long enough.\n"
+            "From the start, lines like this one aren't mistaken for the start of a patch."
+        )
+        expected = {
+            "message": expected_message,
+            "sha": "6f29bf81a8322a04071bb794666e48c443a90360",
+            "author_name": "Jöhn Doe",
+            "author_email": "john@doe.com",
+            "date": datetime(2023, 3, 10, 12, 30, tzinfo=timezone(timedelta(hours=1))),
+            "changed_files_stats": {
+                "föo.txt": GitChangedFileStats("föo.txt", 1, 1),
+                "bär baz.txt": GitChangedFileStats("bär baz.txt", 1, 0),
+            },
+        }
+        self.assertDictEqual(records[0], expected)
+
+        # In-body headers take precedence over the mail headers, binary files don't have line stats and lines in the
+        # diff that look like the signature separator are counted when they're part of a hunk
+        expected = {
+            "message": "WIP: Remove old files\n\nBödy",
+            "sha": "7e31cf6e33a8aee8ab1b54b4cdc9f1d9b6ba8472",
+            "author_name": "Jäne Doe",
+            "author_email": "jane@doe.com",
+            "date": datetime(2023, 3, 9, 10, 0, tzinfo=timezone(timedelta(hours=-5))),
+            "changed_files_stats": {
+                "image.png": GitChangedFileStats("image.png", None, None),
+                "öld.txt": GitChangedFileStats("öld.txt", 0, 2),
+            },
+        }
+        self.assertDictEqual(records[1], expected)
+
+        # Messages without a diff, in another charset, without a commit sha or date
+        expected = {
+            "message": "Message without diff\n\nBödy in latin-1 that is long enough",
+            "sha": None,
+            "author_name": "Bob",
+            "author_email": "bob@bar.com",
+            "date": None,
+            "changed_files_stats": {},
+        }
+        self.assertDictEqual(records[2], expected)
+        self.assertEqual(len(records), 3)
+
+    def test_iter_mbox_records_streaming(self):
+        # Patches are yielded as soon as the next patch starts, without reading the rest of the stream
+        patch = b"From 6f29bf81a8322a04071bb794666e48c443a90360 Mon Sep 17 00:00:00 2001\nSubject: T\xc3\xaftle %d\n\n"
+        lines_read = []
+
+        def mbox_lines():
+            for i in range(3):
+                for line in (patch % i).splitlines(keepends=True):
+                    lines_read.append(line)
+                    yield line
+
+        records = iter_mbox_records(mbox_lines())
+        self.assertEqual(next(records)["message"], "Tïtle 0")
+        self.assertEqual(len(lines_read), 4)
+        self.assertListEqual([record["message"] for record in records], ["Tïtle 1", "Tïtle 2"])
+        self.assertListEqual(list(iter_mbox_records(BytesIO(b""))), [])
@@ -0,0 +1,242 @@
+import logging
+import os
+import stat
+import tempfile
+from unittest.mock import patch
+
+from gitlint.config import LintConfig
+from gitlint.git import GitContext
+from gitlint.lint import GitLinter
+from gitlint.observers import (
+    Observer,
+    PrometheusTextfileObserver,
+    active_observers,
+    command_type,
+    observe,
+)
+from gitlint.rules import RuleViolation
+from gitlint.shell import git
+from gitlint.tests.base import BaseTestCase
+
+
+class RecordingObserver(Observer):
+    """Observer that records all hook calls. Durations are recorded separately, as they're not deterministic."""
+
+    def __init__(self):
+        self.calls = []
+        self.durations = []
+
+    def on_commit_start(self, commit):
+        self.calls.append(("commit_start", commit.message.title))
+
+    def on_rule(self, rule, _commit, duration, violations):
+        self.durations.append(duration)
+        self.calls.append(("rule", rule.id, None if violations is None else len(violations)))
+
+    def on_violation(self, _commit, violation):
+        self.calls.append(("violation", violation.rule_id, violation.line_nr))
+
+    def on_commit_end(self, _commit, violations, duration):
+        self.durations.append(duration)
+        self.calls.append(("commit_end", len(violations)))
+
+    def on_git_call(self, args, duration, stdout_bytes, exit_code):
+        self.durations.append(duration)
+        self.calls.append(("git_call", command_type(args), stdout_bytes, exit_code))
+
+    def on_cache_lookup(self, cache_key, hit):
+        self.calls.append(("cache_lookup", cache_key, hit))
+
+    def on_cache_populate(self, cache_key, duration):
+        self.durations.append(duration)
+        self.calls.append(("cache_populate", cache_key))
+
+
+class ObserverTests(BaseTestCase):
+    def test_command_type(self):
+        self.assertEqual(command_type(["git", "log", "-1", "--pretty=%H"]), "log")
+        self.assertEqual(command_type(["git", "--version"]), "--version")
+        self.assertEqual(command_type(["git", "-C", "/föo", "-c", "core.quotepath=false", "log", "-1"]), "log")
+        self.assertEqual(command_type(["git", "-C", "/föo"]), "-C")
+        self.assertEqual(command_type(["git"]), "git")
+        self.assertEqual(command_type(["föo", "bar"]), "föo")
+
+    def test_observe(self):
+        observer1, observer2 = Observer(), Observer()
+        self.assertEqual(active_observers(), ())
+        with observe(observer1):
+            self.assertEqual(active_observers(), (observer1,))
+            with observe(observer2):
+                self.assertEqual(active_observers(), (observer1, observer2))
+            self.assertEqual(active_observers(), (observer1,))
+        self.assertEqual(active_observers(), ())
+
+    def test_lint(self):
+        config = LintConfig()
+        config.set_general_option("ignore", "T1,T2,T3,T4,T6,T7,T8,B1,B2,B3,B4,B5,B7,B8,M1")
+        config.set_rule_option("ignore-body-lines", "regex", "^Ignöred")
+        commit = self.gitcommit("WIP: tïtle\n\nIgnöred line\nBödy")
+
+        observer = RecordingObserver()
+        with observe(observer):
+            violations = GitLinter(config).lint(commit)
+
+        self.assertListEqual(
+            violations, [RuleViolation("T5", "Title contains the word 'WIP' (case-insensitive)", "WIP: tïtle", 1)]
+        )
+        # fmt: off
+        self.assertListEqual(observer.calls, [
+            ("commit_start", "WIP: tïtle"),
+            ("rule", "I1", None), ("rule", "I2", None), ("rule", "I3", None), ("rule", "I4", None),
+            ("rule", "T5", 1),
+            ("rule", "B6", None),
+            ("violation", "T5", 1),
+            ("commit_end", 1),
+        ])
+        # fmt: on
+        self.assertEqual(len(observer.durations), 7)
+        self.assertTrue(all(isinstance(duration, float) and duration >= 0 for duration in observer.durations))
+
+    def test_lint_git(self):
+        # Debug logging formats the commit, which would fetch all lazily loaded commit properties
+        logging.getLogger("gitlint").setLevel(logging.INFO)
+        observer = RecordingObserver()
+        with patch("gitlint.git.sh") as sh, observe(observer):
+            sh.git.side_effect = [
+                "6f29bf81a8322a04071bb794666e48c443a90360\n",  # git rev-list
+                "test åuthor\x00test-email@föo.com\x002016-12-03 15:28:15 +0100\x00\ncommït-title\n\ncommït-body",
+                "#",  # git config --get core.commentchar
+            ]
+            gitcontext = GitContext.from_local_repository("fåke/path")
+            config = LintConfig()
+            config.set_general_option("ignore", "title-max-length,B5")
+            GitLinter(config).lint(gitcontext.commits[0])
+
+        cache_calls = [call for call in observer.calls if call[0].startswith("cache")]
+        # Parsing the commit message requires the comment char, which is retrieved while populating the message
+        self.assertListEqual(
+            cache_calls[:3],
+            [
+                ("cache_lookup", "message", False),
+                ("cache_lookup", "commentchar", False),
+                ("cache_populate", "commentchar"),
+            ],
+        )
+        self.assertIn(("cache_populate", "message"), cache_calls)
+        self.assertIn(("cache_lookup", "message", True), cache_calls)
+        self.assertEqual(len([call for call in cache_calls if call[0] == "cache_populate"]), 2)
+        # Git calls go through gitlint.git.sh (which is mocked here), so they're not observed
+        self.assertNotIn("git_call", [call[0] for call in observer.calls])
+
+    def test_lint_passed_observers(self):
+        # Callers that lint many commits look up the active observers once and pass them, the observers of git
+        # contexts (and their commits) are looked up once when the context is created
+        observer = RecordingObserver()
+        with observe(observer):
+            gitcontext = GitContext()
+        self.assertEqual(gitcontext.observers, (observer,))
+
+        with patch("gitlint.git.git_commentchar", return_value="#"):
+            commit = gitcontext.commit_from_msg("WIP: tïtle")
+        with patch("gitlint.lint.active_observers") as lint_active_observers:
+            GitLinter.lint_combined([GitLinter(LintConfig())], commit, observers=gitcontext.observers)
+        lint_active_observers.assert_not_called()
+        self.assertListEqual(
+            [call for call in observer.calls if call[0] != "rule"],
+            [
+                ("cache_lookup", "commentchar", False),
+                ("cache_populate", "commentchar"),
+                ("cache_lookup", "commentchar", True),
+                ("commit_start", "WIP: tïtle"),
+                ("violation", "T5", 1),
+                ("violation", "B6", 3),
+                ("commit_end", 2),
+            ],
+        )
+
+    def test_git_call(self):
+        observer = RecordingObserver()
+        with observe(observer):
+            result = git("--version")
+            git("rev-parse", _ok_code=[128], _cwd=tempfile.gettempdir())
+        self.assertListEqual(
+            observer.calls,
+            [("git_call", "--version", len(result.stdout.encode()), 0), ("git_call", "rev-parse", 0, 128)],
+        )
+
+    def test_no_observers(self):
+        # Without observers, rules, commits and git calls are not timed
+        with patch("gitlint.lint.time.perf_counter") as perf_counter, patch(
+            "gitlint.shell.time.perf_counter"
+        ) as shell_perf_counter:
+            GitLinter(LintConfig()).lint(self.gitcommit("WIP: tïtle"))
+            git("--version")
+        perf_counter.assert_not_called()
+        shell_perf_counter.assert_not_called()
+
+
+class PrometheusTextfileObserverTests(BaseTestCase):
+    def test_render(self):
+        observer = PrometheusTextfileObserver("föo.prom")
+        commit = self.gitcommit("WIP: tïtle")
+        violation = RuleViolation("T5", "Title contains the word 'WIP' (case-insensitive)", "WIP: tïtle", 1)
+        with observe(observer):
+            observer.on_commit_end(commit, [violation], 0.5)
+            observer.on_violation(commit, violation)
+            observer.on_git_call(["git", "log", "-1"], 0.25, 100, 0)
+            observer.on_git_call(["git", "log", "-1"], 0.25, 20, 0)
+
+        self.assertEqual(
+            observer.render(),
+            "# HELP gitlint_commits_total Number of linted commits.\n"
+            "# TYPE gitlint_commits_total counter\n"
+            "gitlint_commits_total 1\n"
+            "# HELP gitlint_commit_duration_seconds_total Time spent linting commits.\n"
+            "# TYPE gitlint_commit_duration_seconds_total counter\n"
+            "gitlint_commit_duration_seconds_total 0.5\n"
+            "# HELP gitlint_violations_total Number of violations per rule.\n"
+            "# TYPE gitlint_violations_total counter\n"
+            'gitlint_violations_total{rule="T5"} 1\n'
+            "# HELP gitlint_rule_calls_total Number of rule invocations.\n"
+            "# TYPE gitlint_rule_calls_total counter\n"
+            "# HELP gitlint_rule_duration_seconds_total Time spent in rule invocations.\n"
+            "# TYPE gitlint_rule_duration_seconds_total counter\n"
+            "# HELP gitlint_git_calls_total Number of git calls.\n"
+            "# TYPE gitlint_git_calls_total counter\n"
+            'gitlint_git_calls_total{command="log"} 2\n'
+            "# HELP gitlint_git_duration_seconds_total Wall time spent in git calls.\n"
+            "# TYPE gitlint_git_duration_seconds_total counter\n"
+            'gitlint_git_duration_seconds_total{command="log"} 0.5\n'
+            "# HELP gitlint_git_stdout_bytes_total Bytes read from the stdout of git calls.\n"
+            "# TYPE gitlint_git_stdout_bytes_total counter\n"
+            'gitlint_git_stdout_bytes_total{command="log"} 120\n',
+        )
+
+    def test_render_lint(self):
+        observer = PrometheusTextfileObserver("föo.prom", prefix="my_gitlint")
+        with observe(observer):
+            GitLinter(LintConfig()).lint(self.gitcommit('WIP: tïtle "quoted"\n\nBödy'))
+        metrics = observer.render()
+        self.assertIn("my_gitlint_commits_total 1\n", metrics)
+        self.assertIn('my_gitlint_violations_total{rule="T5"} 1\n', metrics)
+        self.assertIn('my_gitlint_violations_total{rule="B5"} 1\n', metrics)
+        self.assertIn('my_gitlint_rule_calls_total{rule="I1"} 1\n', metrics)
+        self.assertIn('my_gitlint_rule_calls_total{rule="B1"} 2\n', metrics)
+
+    def test_escape_label_values(self):
+        observer = PrometheusTextfileObserver("föo.prom")
+        observer.on_violation(None, RuleViolation('my-"rule"\\\n', "Föo"))
+        self.assertIn('gitlint_violations_total{rule="my-\\"rule\\"\\\\\\n"} 1\n', observer.render())
+
+    def test_write(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "gitlint.prom")
+            observer = PrometheusTextfileObserver(path)
+            observer.on_commit_end(None, [], 0.5)
+            observer.write()
+            observer.write()  # Overwrites the existing file
+
+            self.assertEqual(os.listdir(tmpdir), ["gitlint.prom"])
+            self.assertEqual(stat.S_IMODE(os.stat(path).st_mode), 0o644)
+            with open(path, encoding="UTF-8") as metrics_file:
+                self.assertEqual(metrics_file.read(), observer.render())
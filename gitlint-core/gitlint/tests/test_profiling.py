@@ -0,0 +1,143 @@
+import json
+import logging
+import os
+import tempfile
+from unittest.mock import patch
+
+from gitlint.config import LintConfig
+from gitlint.git import GitContext
+from gitlint.lint import GitLinter
+from gitlint.observers import active_observers
+from gitlint.profiling import MAX_SAMPLES, Profiler, TimingStats, percentile
+from gitlint.rules import TitleMaxLength
+from gitlint.tests.base import BaseTestCase
+
+
+class ProfilingTests(BaseTestCase):
+    def test_percentile(self):
+        self.assertEqual(percentile([], 50), 0.0)
+        self.assertEqual(percentile([1.0], 99), 1.0)
+        values = [float(i) for i in range(1, 101)]
+        self.assertEqual(percentile(values, 50), 50.0)
+        self.assertEqual(percentile(values, 95), 95.0)
+        self.assertEqual(percentile(values, 99), 99.0)
+        self.assertEqual(percentile(values, 0), 1.0)
+
+    def test_timing_stats(self):
+        stats = TimingStats("föo", violations=2)
+        for duration in [0.75, 0.25, 0.5]:
+            stats.add(duration)
+        self.assertDictEqual(
+            stats.as_dict(),
+            {
+                "name": "föo",
+                "calls": 3,
+                "total": 1.5,
+                "violations": 2,
+                "mean": 0.5,
+                "max": 0.75,
+                "p50": 0.5,
+                "p95": 0.75,
+                "p99": 0.75,
+            },
+        )
+
+    def test_timing_stats_bounded(self):
+        # Only a bounded sample of the durations is kept, the call count, total and maximum are exact
+        stats = TimingStats("föo")
+        for i in range(MAX_SAMPLES * 3):
+            stats.add(float(i))
+        self.assertEqual(len(stats.samples), MAX_SAMPLES)
+        self.assertEqual(stats.calls, MAX_SAMPLES * 3)
+        self.assertEqual(stats.total, sum(range(MAX_SAMPLES * 3)))
+        self.assertEqual(stats.max_duration, MAX_SAMPLES * 3 - 1)
+        self.assertTrue(set(stats.samples) <= set(range(MAX_SAMPLES * 3)))
+
+    def test_activate(self):
+        profiler = Profiler()
+        self.assertEqual(active_observers(), ())
+        with profiler.activate():
+            self.assertEqual(active_observers(), (profiler,))
+        self.assertEqual(active_observers(), ())
+        self.assertIsNotNone(profiler.end_time)
+
+    def test_lint(self):
+        commit = self.gitcommit("WIP: tïtle\n\nThis is a bödy that is long enough\nSecond bödy line")
+        config = LintConfig()
+        config.set_general_option("ignore", "T3")
+        profiler = Profiler()
+        with profiler.activate():
+            violations = GitLinter(config).lint(commit)
+            GitLinter(config).lint(commit)
+
+        self.assertEqual(profiler.commits, 2)
+        self.assertEqual(len(violations), 1)
+        # Line rules are profiled per line, commit rules per commit, configuration rules per commit
+        self.assertEqual(profiler.rules["T1"].calls, 2)
+        self.assertEqual(profiler.rules["T1"].name, "title-max-length")
+        self.assertEqual(profiler.rules["B1"].calls, 6)
+        self.assertEqual(profiler.rules["B6"].calls, 2)
+        self.assertEqual(profiler.rules["I1"].calls, 2)
+        self.assertEqual(profiler.rules["T5"].violations, 2)
+        self.assertEqual(profiler.rules["T1"].violations, 0)
+        # Rules that are ignored are not validated and hence not profiled
+        self.assertNotIn("T3", profiler.rules)
+
+    def test_lint_git_fetches(self):
+        # Debug logging formats the commit, which would fetch all lazily loaded commit properties
+        logging.getLogger("gitlint").setLevel(logging.INFO)
+        profiler = Profiler()
+        with patch("gitlint.git.sh") as sh, profiler.activate():
+            sh.git.side_effect = [
+                "6f29bf81a8322a04071bb794666e48c443a90360\n",  # git rev-list
+                "test åuthor\x00test-email@föo.com\x002016-12-03 15:28:15 +0100\x00\ncommït-title\n\ncommït-body",
+                "#",  # git config --get core.commentchar
+            ]
+            gitcontext = GitContext.from_local_repository("fåke/path")
+            GitLinter(LintConfig()).lint(gitcontext.commits[0])
+
+        self.assertEqual(profiler.git_fetches["message"].calls, 1)
+        self.assertEqual(profiler.git_fetches["commentchar"].calls, 1)
+        self.assertNotIn("changed_files_stats", profiler.git_fetches)
+
+    def test_no_profiler(self):
+        # When profiling is disabled, rules are validated without being timed
+        with patch("gitlint.lint.time.perf_counter") as perf_counter:
+            GitLinter(LintConfig()).lint(self.gitcommit("WIP: tïtle"))
+        perf_counter.assert_not_called()
+
+    def test_report(self):
+        profiler = Profiler()
+        profiler.record_commit()
+        profiler.record_rule(TitleMaxLength(), 0.002, ["violation"])
+        profiler.record_rule(TitleMaxLength(), 0.001)
+        profiler.record_git_fetch("message", 0.01)
+        profiler.end_time = profiler.start_time + 0.5
+
+        self.assertEqual(
+            profiler.report(),
+            "gitlint profile: 1 commit(s) linted in 500.00ms (times in ms)\n\n"
+            "Rule                                       Calls      Total     Mean      p50      p95      p99 Violations\n"
+            + "-" * 106
+            + "\n"
+            "T1 title-max-length                            2      3.000    1.500    1.000    2.000    2.000          1\n"
+            "\n"
+            "Git fetch                                  Calls      Total     Mean      p50      p95      p99\n"
+            + "-" * 95
+            + "\n"
+            "message                                        1     10.000   10.000   10.000   10.000   10.000",
+        )
+
+    def test_dump_json(self):
+        profiler = Profiler()
+        profiler.record_rule(TitleMaxLength(), 0.002, ["violation"])
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "pröfile.json")
+            profiler.dump_json(path)
+            with open(path, encoding="UTF-8") as json_file:
+                data = json.load(json_file)
+
+        self.assertEqual(data["commits"], 0)
+        self.assertEqual(data["rules"]["T1"]["violations"], 1)
+        self.assertEqual(data["rules"]["T1"]["p99"], 0.002)
+        self.assertDictEqual(data["git_fetches"], {})
@@ -0,0 +1,92 @@
+from io import StringIO
+
+from gitlint.config import LintConfig
+from gitlint.lint import GitLinter
+from gitlint.observers import observe
+from gitlint.progress import CLEAR_LINE, ProgressObserver, format_duration
+from gitlint.rules import BodyMaxLineLength, TitleMaxLength
+from gitlint.tests.base import BaseTestCase
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProgressTests(BaseTestCase):
+    def test_format_duration(self):
+        self.assertEqual(format_duration(0), "0:00:00")
+        self.assertEqual(format_duration(59.6), "0:01:00")
+        self.assertEqual(format_duration(3725), "1:02:05")
+
+    def test_is_supported(self):
+        self.assertFalse(ProgressObserver.is_supported(StringIO()))
+
+        class TTY(StringIO):
+            def isatty(self):
+                return True
+
+        self.assertTrue(ProgressObserver.is_supported(TTY()))
+
+    def test_progress(self):
+        stream = StringIO()
+        clock = FakeClock()
+        progress = ProgressObserver(1000, stream, refresh_interval=0.5, clock=clock)
+
+        # The first commit is always rendered
+        clock.now += 0.01
+        progress.on_rule(TitleMaxLength(), None, 0.004, None)
+        progress.on_rule(BodyMaxLineLength(), None, 0.001, None)
+        progress.on_commit_end(None, [], 0.01)
+        self.assertEqual(
+            stream.getvalue(),
+            CLEAR_LINE + "gitlint: [   1/1000]   0.1%, 100.0 commits/s, ETA 0:00:10, slowest rule: T1 (4.0ms)",
+        )
+
+        # Rate limiting: commits within the refresh interval are not rendered
+        for _ in range(49):
+            clock.now += 0.01
+            progress.on_rule(BodyMaxLineLength(), None, 0.001, None)
+            progress.on_commit_end(None, [], 0.01)
+        self.assertEqual(stream.getvalue().count(CLEAR_LINE), 1)
+
+        clock.now += 0.01
+        progress.on_rule(BodyMaxLineLength(), None, 0.001, None)
+        progress.on_commit_end(None, [], 0.01)
+        self.assertEqual(stream.getvalue().count(CLEAR_LINE), 2)
+        self.assertTrue(
+            stream.getvalue().endswith(
+                CLEAR_LINE + "gitlint: [  51/1000]   5.1%, 100.0 commits/s, ETA 0:00:09, slowest rule: B1 (51.0ms)"
+            )
+        )
+
+    def test_clear(self):
+        stream = StringIO()
+        progress = ProgressObserver(2, stream, clock=FakeClock())
+        progress.clear()  # Nothing to clear
+        self.assertEqual(stream.getvalue(), "")
+
+        progress.on_commit_end(None, [], 0.01)
+        progress.clear()
+        progress.clear()
+        self.assertEqual(stream.getvalue(), CLEAR_LINE + "gitlint: [1/2]  50.0%, 0.0 commits/s" + CLEAR_LINE)
+
+    def test_last_commit(self):
+        # The last commit is always rendered, regardless of the refresh interval
+        stream = StringIO()
+        clock = FakeClock()
+        progress = ProgressObserver(2, stream, refresh_interval=10, clock=clock)
+        with observe(progress):
+            clock.now += 1
+            GitLinter(LintConfig()).lint(self.gitcommit("WIP: tïtle\n\nBödy"))
+            clock.now += 1
+            GitLinter(LintConfig()).lint(self.gitcommit("WIP: tïtle\n\nBödy"))
+
+        lines = stream.getvalue().split(CLEAR_LINE)
+        self.assertEqual(len(lines), 3)
+        self.assertRegex(
+            lines[2], r"^gitlint: \[2/2\] 100\.0%, 1\.0 commits/s, slowest rule: [A-Z][0-9] \([0-9.]+ms\)$"
+        )
@@ -0,0 +1,72 @@
+import gzip
+import os
+import shutil
+import tempfile
+from unittest.mock import patch
+
+from gitlint.git import GitExitCodeError, _git
+from gitlint.recording import GitRecorder, GitReplayer, GitReplayError, use_git_backend
+from gitlint.shell import ErrorReturnCode, ShResult
+from gitlint.tests.base import BaseTestCase
+
+
+class RecordingTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.tmpdir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmpdir)
+        self.recording = os.path.join(self.tmpdir, "recording.json.gz")
+
+    def test_record_replay(self):
+        outputs = [
+            ShResult("git rev-parse HEAD", "sha1\n"),
+            ShResult("git rev-parse HEAD", "sha2\n"),
+            ShResult("git rev-list --stdin", "sha3\n"),
+            ErrorReturnCode("git log föo", "", b"fatal: bad revision 'f\xc3\xb6o'\n", 128),
+        ]
+        recorder = GitRecorder()
+        with patch("gitlint.shell.git", side_effect=outputs), use_git_backend(recorder):
+            self.assertEqual(_git("rev-parse", "HEAD", _cwd=self.tmpdir), "sha1\n")
+            self.assertEqual(_git("rev-parse", "HEAD", _cwd=self.tmpdir), "sha2\n")
+            self.assertEqual(_git("rev-list", "--stdin", _in="föo\n"), "sha3\n")
+            with self.assertRaises(GitExitCodeError) as recorded_error:
+                _git("log", "föo")
+        recorder.save(self.recording)
+
+        # Replays don't run git. Outputs of calls that were made multiple times are replayed in order, the last one is
+        # repeated when there are more calls than recorded outputs.
+        replayer = GitReplayer.load(self.recording)
+        with patch("gitlint.shell.git") as git, use_git_backend(replayer):
+            self.assertEqual(_git("rev-parse", "HEAD", _cwd=self.tmpdir), "sha1\n")
+            self.assertEqual(_git("rev-parse", "HEAD", _cwd=self.tmpdir), "sha2\n")
+            self.assertEqual(_git("rev-parse", "HEAD", _cwd=self.tmpdir), "sha2\n")
+            self.assertEqual(_git("rev-list", "--stdin", _in="föo\n"), "sha3\n")
+            with self.assertRaises(GitExitCodeError) as replayed_error:
+                _git("log", "föo")
+            self.assertEqual(str(replayed_error.exception), str(recorded_error.exception))
+            self.assertEqual(_git("log", "föo", _ok_code=[0, 128]).exit_code, 128)
+
+            # Calls are identified by their arguments, stdin and working directory
+            expected = f"'git rev-parse HEAD' is not part of {self.recording}."
+            with self.assertRaisesMessage(GitReplayError, expected):
+                _git("rev-parse", "HEAD")
+            expected = f"'git rev-list --stdin' is not part of {self.recording}."
+            with self.assertRaisesMessage(GitReplayError, expected):
+                _git("rev-list", "--stdin", _in="bär\n")
+        git.assert_not_called()
+
+        # Outside of `use_git_backend`, git is run as usual
+        with patch("gitlint.shell.git", return_value=ShResult("git rev-parse HEAD", "sha4\n")):
+            self.assertEqual(_git("rev-parse", "HEAD", _cwd=self.tmpdir), "sha4\n")
+
+    def test_load_invalid_recording(self):
+        with gzip.open(self.recording, "wt", encoding="UTF-8") as recording:
+            recording.write('{"version": 2, "calls": []}')
+        expected = f"{self.recording} is not a valid git recording: unsupported version 2"
+        with self.assertRaisesMessage(GitReplayError, expected):
+            GitReplayer.load(self.recording)
+
+        with gzip.open(self.recording, "wt", encoding="UTF-8") as recording:
+            recording.write('{"version": 1, "calls": [{"args": ["föo"]}]}')
+        with self.assertRaisesMessage(GitReplayError, f"{self.recording} is not a valid git recording: missing 'cwd'"):
+            GitReplayer.load(self.recording)
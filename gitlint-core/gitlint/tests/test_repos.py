@@ -0,0 +1,73 @@
+import os
+import shutil
+import tempfile
+
+from gitlint.config import LintConfigBuilder, LintConfigError
+from gitlint.repos import LinterCache, RepositoryTarget, lint_repositories
+from gitlint.tests.base import BaseTestCase
+
+
+class LinterCacheTests(BaseTestCase):
+    def setUp(self):
+        super().setUp()
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+    def repository(self, name, config=None):
+        path = os.path.join(self.root, name)
+        os.makedirs(path)
+        if config is not None:
+            with open(os.path.join(path, ".gitlint"), "w", encoding="UTF-8") as config_file:
+                config_file.write(config)
+        return path
+
+    def test_shared_linters(self):
+        repo1 = self.repository("repö1", "[title-max-length]\nline-length=20\n")
+        repo2 = self.repository("repö2", "[title-max-length]\nline-length=20\n")
+        repo3 = self.repository("repö3", "[title-max-length]\nline-length=30\n")
+        repo4 = self.repository("repö4")
+        repo5 = self.repository("repö5")
+
+        linters = LinterCache()
+        self.assertIs(linters.linter(repo1), linters.linter(repo2))
+        self.assertEqual(linters.linter(repo1).config.get_rule_option("title-max-length", "line-length"), 20)
+        self.assertEqual(linters.linter(repo3).config.get_rule_option("title-max-length", "line-length"), 30)
+        self.assertIs(linters.linter(repo4), linters.linter(repo5))
+        self.assertEqual(linters.linter(repo4).config.get_rule_option("title-max-length", "line-length"), 72)
+        self.assertEqual(len({id(linters.linter(repo)) for repo in (repo1, repo2, repo3, repo4, repo5)}), 3)
+
+    def test_overrides_and_config_path(self):
+        repo1 = self.repository("repö1", "[title-max-length]\nline-length=20\n")
+        repo2 = self.repository("repö2")
+        overrides = LintConfigBuilder()
+        overrides.set_option("general", "ignore", "T5")
+
+        # A config file passed to the cache is used for all repositories, instead of their own config files
+        config_path = os.path.join(self.root, "shared-config")
+        with open(config_path, "w", encoding="UTF-8") as config_file:
+            config_file.write("[general]\nignore=T1\n[title-max-length]\nline-length=40\n")
+        linters = LinterCache(overrides, config_path)
+        self.assertIs(linters.linter(repo1), linters.linter(repo2))
+        self.assertEqual(linters.linter(repo1).config.ignore, ["T5"])
+        self.assertEqual(linters.linter(repo1).config.get_rule_option("title-max-length", "line-length"), 40)
+
+    def test_directory_configs(self):
+        # Directory configs are looked up in the repository itself, so those linters are never shared
+        repo1 = self.repository("repö1", "[general]\ndirectory-configs=true\n")
+        repo2 = self.repository("repö2", "[general]\ndirectory-configs=true\n")
+        linters = LinterCache()
+        self.assertIsNot(linters.linter(repo1), linters.linter(repo2))
+        self.assertIs(linters.linter(repo1), linters.linter(repo1))
+        self.assertEqual(linters.linter(repo2).config.target, os.path.realpath(repo2))
+
+    def test_lint_repositories_errors(self):
+        repo1 = self.repository("repö1", "[föo]\nbar=1\n")
+        repo2 = self.repository("repö2")
+        targets = [RepositoryTarget(repo1), RepositoryTarget(repo2, "HEAD")]
+        results = list(lint_repositories(targets, LinterCache(), jobs=2))
+        self.assertListEqual([result.target for result in results], targets)
+        self.assertIsInstance(results[0].error, LintConfigError)
+        self.assertIsNone(results[0].linter)
+        self.assertIsNotNone(results[1].error)
+        self.assertIsNotNone(results[1].linter)
+        self.assertListEqual(results[1].results, [])
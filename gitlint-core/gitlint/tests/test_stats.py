@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+
+from gitlint.cache import PropertyCache, cache
+from gitlint.config import LintConfig
+from gitlint.lint import GitLinter
+from gitlint.observers import active_observers
+from gitlint.shell import git
+from gitlint.stats import RunStats
+from gitlint.tests.base import BaseTestCase
+
+
+class StatsTests(BaseTestCase):
+    def test_activate(self):
+        run_stats = RunStats()
+        self.assertEqual(active_observers(), ())
+        with run_stats.activate():
+            self.assertEqual(active_observers(), (run_stats,))
+        self.assertEqual(active_observers(), ())
+        self.assertIsNotNone(run_stats.end_time)
+
+    def test_shell(self):
+        run_stats = RunStats()
+        with run_stats.activate():
+            result = git("--version")
+            git("--version")
+
+        stats = run_stats.as_dict()["git_commands"]
+        self.assertEqual(list(stats.keys()), ["--version"])
+        self.assertEqual(stats["--version"]["calls"], 2)
+        self.assertEqual(stats["--version"]["stdout_bytes"], 2 * len(result.stdout.encode()))
+        self.assertGreater(stats["--version"]["duration"], 0)
+
+    def test_property_cache(self):
+        @dataclass
+        class MyClass(PropertyCache):
+            @property
+            @cache
+            def foo(self):
+                return "bår"
+
+        run_stats = RunStats()
+        obj = MyClass()
+        with run_stats.activate():
+            for _ in range(3):
+                self.assertEqual(obj.foo, "bår")
+        self.assertEqual(run_stats.as_dict()["cache"], {"foo": {"hits": 2, "misses": 1}})
+
+    def test_lint(self):
+        run_stats = RunStats()
+        with run_stats.activate():
+            GitLinter(LintConfig()).lint(self.gitcommit("WIP: tïtle"))
+            GitLinter(LintConfig()).lint(self.gitcommit("Merge: tïtle"))  # ignored commits are also counted
+        self.assertEqual(run_stats.commits, 2)
+
+        run_stats.end_time = run_stats.start_time + 0.5
+        self.assertEqual(run_stats.commits_per_second, 4.0)
+
+    def test_report(self):
+        run_stats = RunStats()
+        run_stats.record_commit()
+        run_stats.record_command(["git", "log", "-1"], 0.002, 120)
+        run_stats.record_command(["git", "log", "-1"], 0.004, 80)
+        run_stats.record_command(["git", "rev-list", "HEAD"], 0.001, 41)
+        run_stats.record_cache_lookup("message", hit=False)
+        run_stats.record_cache_lookup("message", hit=True)
+        run_stats.record_cache_lookup("commentchar", hit=True)
+        run_stats.end_time = run_stats.start_time + 0.25
+
+        self.assertEqual(
+            run_stats.report(),
+            "gitlint stats: 1 commit(s) linted in 250.00ms (4.0 commits/s)\n\n"
+            "Git command                Calls   Total ms  Stdout bytes\n" + "-" * 57 + "\n"
+            "log                            2       6.00           200\n"
+            "rev-list                       1       1.00            41\n"
+            "total                          3       7.00           241\n"
+            "\n"
+            "Cache key                   Hits  Misses\n" + "-" * 40 + "\n"
+            "commentchar                    1       0\n"
+            "message                        1       1",
+        )
+
+    def test_report_empty(self):
+        run_stats = RunStats()
+        run_stats.end_time = run_stats.start_time
+        self.assertEqual(run_stats.report(), "gitlint stats: 0 commit(s) linted in 0.00ms (0.0 commits/s)")
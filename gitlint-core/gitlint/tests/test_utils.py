@@ -1,4 +1,5 @@
-from unittest.mock import patch
+import logging
+from unittest.mock import MagicMock, patch
 
 from gitlint import utils
 from gitlint.tests.base import BaseTestCase
@@ -52,3 +53,17 @@ class UtilsTests(BaseTestCase):
         # assert fallback encoding is UTF-8 in case we set an unavailable encoding
         mock_env = {"LC_ALL": "foo"}
         self.assertEqual(utils.getpreferredencoding(), "UTF-8")
+
+    def test_lazy_str(self):
+        func = MagicMock(return_value="föo")
+        lazy_str = utils.LazyStr(func, "bår", 1)
+        func.assert_not_called()
+
+        self.assertEqual(str(lazy_str), "föo")
+        func.assert_called_once_with("bår", 1)
+
+        # func is only called when a log message is actually formatted
+        logger = logging.getLogger("gitlint.tests.lazy_str")
+        logger.setLevel(logging.INFO)
+        logger.debug("Lazy: %s", lazy_str)
+        func.assert_called_once()
@@ -0,0 +1,64 @@
+import os
+from pathlib import Path
+from unittest import skipUnless
+
+from gitlint.tests.base import BaseTestCase
+from gitlint.utils import PLATFORM_IS_WINDOWS
+from gitlint.watch import RefWatcher
+
+
+class RefWatcherTests(BaseTestCase):
+    @staticmethod
+    def create_git_dir(tmpdir):
+        git_dir = Path(tmpdir)
+        (git_dir / "refs" / "heads").mkdir(parents=True)
+        (git_dir / "logs").mkdir()
+        (git_dir / "HEAD").write_text("ref: refs/heads/main\n", encoding="utf-8")
+        return git_dir
+
+    def assert_watcher(self, watcher, git_dir):
+        # No changes
+        self.assertFalse(watcher.wait(timeout=0.1))
+
+        # Ref updates
+        (git_dir / "refs" / "heads" / "main").write_text("6f29bf81a8322a04071bb794666e48c443a90360\n")
+        self.assertTrue(watcher.wait(timeout=1))
+        self.assertFalse(watcher.wait(timeout=0.1))
+
+        # Bursts of changes are coalesced into a single change
+        for i in range(5):
+            (git_dir / "logs" / "HEAD").write_text(f"entry {i}\n" * (i + 1))
+        (git_dir / "packed-refs").write_text("25053ccec5e28e1bb8f7551fdbb5ab213ada2401 refs/heads/föo\n")
+        self.assertTrue(watcher.wait(timeout=1))
+        self.assertFalse(watcher.wait(timeout=0.1))
+
+        # New directories in refs/ are watched as well
+        (git_dir / "refs" / "heads" / "feature").mkdir()
+        self.assertFalse(watcher.wait(timeout=0.1))
+        (git_dir / "refs" / "heads" / "feature" / "bår").write_text("4da2656b0dadc76c7ee3fd0243a96cb64007f125\n")
+        self.assertTrue(watcher.wait(timeout=1))
+
+        # Changes to other files in the git dir are ignored, as are ref lock files
+        (git_dir / "index").write_text("föo")
+        (git_dir / "refs" / "heads" / "main.lock").write_text("4da2656b0dadc76c7ee3fd0243a96cb64007f125\n")
+        if watcher.mode == "inotify":
+            self.assertFalse(watcher.wait(timeout=0.1))
+
+    @skipUnless(hasattr(os, "O_CLOEXEC") and not PLATFORM_IS_WINDOWS, "inotify is only available on Linux")
+    def test_ref_watcher_inotify(self):
+        with self.tempdir() as tmpdir:
+            git_dir = self.create_git_dir(tmpdir)
+            watcher = RefWatcher(str(git_dir), debounce=0.05)
+            if watcher.mode != "inotify":  # pragma: no cover
+                self.skipTest("inotify not available")
+            try:
+                self.assert_watcher(watcher, git_dir)
+            finally:
+                watcher.close()
+
+    def test_ref_watcher_polling(self):
+        with self.tempdir() as tmpdir:
+            git_dir = self.create_git_dir(tmpdir)
+            watcher = RefWatcher(str(git_dir), debounce=0.05, poll_interval=0.01, use_inotify=False)
+            self.assertEqual(watcher.mode, "polling")
+            self.assert_watcher(watcher, git_dir)
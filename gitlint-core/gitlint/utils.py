@@ -2,6 +2,7 @@ import codecs
 import locale
 import os
 import platform
+from typing import Any, Callable
 
 # Note: While we can easily inline the logic related to the constants set in this module, we deliberately create
 # small functions that encapsulate that logic as this enables easy unit testing. In particular, by creating functions
@@ -69,3 +70,24 @@ TERMINAL_ENCODING = getpreferredencoding()
 # but that's not supported today.
 
 FILE_ENCODING = "UTF-8"
+
+########################################################################################################################
+# LazyStr
+# Log messages are only formatted when a log handler actually emits them, so passing objects as log arguments
+# (LOG.debug("%s", obj)) instead of formatting them upfront (LOG.debug(str(obj))) defers the cost of formatting.
+# LazyStr does the same for values that are expensive to compute (e.g. values that require calling git).
+
+
+class LazyStr:
+    """Log argument that defers calling `func` until the log message is formatted. Usage:
+    LOG.debug("Git version: %s", LazyStr(git_version))
+    """
+
+    __slots__ = ("func", "args")
+
+    def __init__(self, func: Callable[..., Any], *args: Any):
+        self.func = func
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.func(*self.args))
@@ -0,0 +1,215 @@
+"""
+Watches a git repository for ref updates (new commits, rebases, fetches, ...), used by `gitlint watch`.
+On Linux, inotify is used to get notified of changes. On other platforms (or when inotify is not available), the
+watcher falls back to periodically polling the modification times of the watched files.
+"""
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import select
+import struct
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+LOG = logging.getLogger(__name__)
+
+# Default time (in seconds) to wait for more ref updates after a change, so bursts of updates (e.g. a rebase that
+# rewrites many commits) are handled as a single change.
+DEFAULT_DEBOUNCE = 0.5
+DEFAULT_POLL_INTERVAL = 1.0
+
+# inotify constants, see inotify(7)
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_WATCH_MASK = IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+INOTIFY_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+class Inotify:
+    """Minimal ctypes wrapper around the Linux inotify API."""
+
+    def __init__(self) -> None:
+        libc_name = ctypes.util.find_library("c")
+        self._libc = ctypes.CDLL(libc_name, use_errno=True)
+        # Raises AttributeError when inotify is not available on this platform
+        self._libc.inotify_init1.argtypes = [ctypes.c_int]
+        self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        self.fd = self._libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.watches: Dict[int, str] = {}
+
+    def add_watch(self, path: str, mask: int = IN_WATCH_MASK) -> None:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), path)
+        self.watches[wd] = path
+
+    def read_events(self, timeout: Optional[float]) -> List[Tuple[str, int, str]]:
+        """Returns the (watched path, mask, name) of all events that occur within the given timeout.
+        Returns an empty list if no events occurred."""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return []
+
+        data = os.read(self.fd, 64 * 1024)
+        events = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, _, name_len = INOTIFY_EVENT_HEADER.unpack_from(data, offset)
+            offset += INOTIFY_EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + name_len].rstrip(b"\0"))
+            offset += name_len
+            if wd in self.watches:
+                events.append((self.watches[wd], mask, name))
+        return events
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class RefWatcher:
+    """Watches the refs of a git repository: the `refs` directory, `packed-refs` and `logs/HEAD`.
+    `wait()` blocks until refs have changed, coalescing bursts of changes into a single change."""
+
+    def __init__(
+        self,
+        git_dir: str,
+        common_dir: Optional[str] = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        use_inotify: bool = True,
+    ):
+        self.git_dir = git_dir
+        # For worktrees, refs and packed-refs live in the common git dir, while HEAD and its reflog are per worktree
+        self.common_dir = common_dir or git_dir
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.inotify: Optional[Inotify] = None
+
+        if use_inotify:
+            try:
+                self.inotify = Inotify()
+                self._add_inotify_watches(self.inotify)
+            except (OSError, AttributeError, TypeError) as e:
+                LOG.debug("inotify not available (%s), falling back to polling", e)
+                self.close()
+        self._signature = None if self.inotify else self.signature()
+
+    @property
+    def mode(self) -> str:
+        return "inotify" if self.inotify else "polling"
+
+    def _refs_dirs(self) -> Iterator[str]:
+        for dirpath, _, _ in os.walk(os.path.join(self.common_dir, "refs")):
+            yield dirpath
+
+    def _add_inotify_watches(self, inotify: Inotify) -> None:
+        # packed-refs and HEAD are updated by renaming lock files, so we need to watch their parent directories
+        for path in dict.fromkeys([self.git_dir, self.common_dir, os.path.join(self.git_dir, "logs")]):
+            if os.path.isdir(path):
+                inotify.add_watch(path)
+        for refs_dir in self._refs_dirs():
+            inotify.add_watch(refs_dir)
+
+    def _handle_event(self, inotify: Inotify, path: str, mask: int, name: str) -> bool:
+        """Handles an inotify event and returns whether it indicates that refs might have changed."""
+        full_path = os.path.join(path, name)
+        if mask & IN_ISDIR:
+            # New ref directories (e.g. refs/heads/feature/) need to be watched as well
+            if mask & (IN_CREATE | IN_MOVED_TO) and self._is_refs_path(full_path):
+                for dirpath, _, _ in os.walk(full_path):
+                    inotify.add_watch(dirpath)
+            return False
+
+        if self._is_refs_path(path):
+            return not name.endswith(".lock")
+        return full_path in (
+            os.path.join(self.common_dir, "packed-refs"),
+            os.path.join(self.git_dir, "HEAD"),
+            os.path.join(self.git_dir, "logs", "HEAD"),
+        )
+
+    def _is_refs_path(self, path: str) -> bool:
+        refs_dir = os.path.join(self.common_dir, "refs")
+        return path == refs_dir or path.startswith(refs_dir + os.sep)
+
+    def signature(self) -> Tuple[Tuple[str, int, int], ...]:
+        """Returns the (path, mtime, size) of all watched files, used to detect changes when polling."""
+        paths = [
+            os.path.join(self.common_dir, "packed-refs"),
+            os.path.join(self.git_dir, "HEAD"),
+            os.path.join(self.git_dir, "logs", "HEAD"),
+        ]
+        for refs_dir in self._refs_dirs():
+            paths.extend(entry.path for entry in os.scandir(refs_dir) if entry.is_file())
+
+        signature = []
+        for path in paths:
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def _wait_inotify(self, inotify: Inotify, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            remaining = None if deadline is None else max(0, deadline - time.monotonic())
+            events = inotify.read_events(remaining)
+            if not events:
+                return False
+            # Note: all events need to be handled, as some events (new directories) require additional watches
+            relevant_events = [event for event in events if self._handle_event(inotify, *event)]
+            if relevant_events:
+                break
+
+        # Coalesce bursts: keep handling events until no new events arrive for `debounce` seconds
+        events = inotify.read_events(self.debounce)
+        while events:
+            for event in events:
+                self._handle_event(inotify, *event)
+            events = inotify.read_events(self.debounce)
+        return True
+
+    def _wait_polling(self, timeout: Optional[float]) -> bool:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            signature = self.signature()
+            if signature != self._signature:
+                break
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(self.poll_interval)
+
+        # Coalesce bursts: wait until the watched files haven't changed for `debounce` seconds
+        while True:
+            time.sleep(self.debounce)
+            new_signature = self.signature()
+            if new_signature == signature:
+                break
+            signature = new_signature
+        self._signature = signature
+        return True
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until refs change (or until the timeout expires). Returns whether refs have changed."""
+        if self.inotify:
+            return self._wait_inotify(self.inotify, timeout)
+        return self._wait_polling(timeout)
+
+    def close(self) -> None:
+        if self.inotify:
+            self.inotify.close()
+            self.inotify = None